@@ -0,0 +1,40 @@
+"""Benchmarks for the row-id hashing of scikitplot.datasets exports.
+
+``stable_hash64_array`` still runs one BLAKE2b call per row in Python; the
+``per_row`` backend is the ``astype(str).map(stable_hash64)`` it replaces.
+"""
+
+import numpy as np
+
+from .common import Benchmark, safe_import
+
+with safe_import():
+    import pandas as pd
+
+with safe_import():
+    from scikitplot.datasets._data_export import stable_hash64, stable_hash64_array
+
+
+class StableHash64(Benchmark):
+    param_names = ["backend", "dtype", "n_rows"]
+    params = [
+        ["array", "per_row"],
+        ["object", "string[pyarrow]", "int64"],
+        [100_000],
+    ]
+
+    def setup(self, backend, dtype, n_rows):
+        if dtype == "int64":
+            self.values = pd.Series(np.arange(n_rows))
+        else:
+            ids = pd.Series([f"user-{i:08d}" for i in range(n_rows)])
+            self.values = ids if dtype == "object" else ids.astype(dtype)
+        if backend == "array":
+            self.func = lambda s: stable_hash64_array(
+                s if s.dtype != "int64" else s.astype(str)
+            )
+        else:
+            self.func = lambda s: s.astype(str).map(stable_hash64).to_numpy()
+
+    def time_stable_hash64(self, backend, dtype, n_rows):
+        self.func(self.values)
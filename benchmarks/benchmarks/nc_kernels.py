@@ -0,0 +1,151 @@
+"""Benchmarks for the scikitplot.nc kernels against their NumPy/SciPy equivalents."""
+
+import numpy as np
+
+from .common import Benchmark, safe_import
+
+with safe_import():
+    import scikitplot.nc as nc
+
+with safe_import():
+    import scipy.linalg
+    from scipy.spatial.distance import cdist
+
+
+def _rng():
+    return np.random.default_rng(1234)
+
+
+class RowNorms(Benchmark):
+    param_names = ["backend", "shape", "dtype"]
+    params = [
+        ["nc", "numpy"],
+        [(100_000, 16), (10_000, 512)],
+        ["float64", "float32"],
+    ]
+
+    def setup(self, backend, shape, dtype):
+        self.X = _rng().normal(size=shape).astype(dtype)
+        if backend == "nc":
+            self.func = nc.row_norms
+        else:
+            self.func = lambda X: np.sqrt(np.einsum("ij,ij->i", X, X))
+
+    def time_row_norms(self, backend, shape, dtype):
+        self.func(self.X)
+
+
+class PairwiseDistances(Benchmark):
+    param_names = ["backend", "metric", "n_samples"]
+    params = [
+        ["nc", "scipy"],
+        ["euclidean", "cosine", "manhattan"],
+        [500, 2000],
+    ]
+
+    def setup(self, backend, metric, n_samples):
+        rng = _rng()
+        self.X = rng.normal(size=(n_samples, 32))
+        self.Y = rng.normal(size=(n_samples // 2, 32))
+        if backend == "nc":
+            self.func = lambda X, Y: nc.pairwise_distances(X, Y, metric=metric)
+        else:
+            name = "cityblock" if metric == "manhattan" else metric
+            self.func = lambda X, Y: cdist(X, Y, metric=name)
+
+    def time_pairwise_distances(self, backend, metric, n_samples):
+        self.func(self.X, self.Y)
+
+
+class Cumsum(Benchmark):
+    param_names = ["backend", "axis", "dtype"]
+    params = [["nc", "numpy"], [None, 0, 1], ["float64", "int64"]]
+
+    def setup(self, backend, axis, dtype):
+        self.a = (_rng().normal(size=(1000, 1000)) * 100).astype(dtype)
+        self.func = nc.cumsum if backend == "nc" else np.cumsum
+
+    def time_cumsum(self, backend, axis, dtype):
+        self.func(self.a, axis=axis)
+
+
+class Histogram(Benchmark):
+    param_names = ["backend", "size", "bins"]
+    params = [["nc", "numpy"], [100_000, 10_000_000], [10, 1000]]
+
+    def setup(self, backend, size, bins):
+        self.a = _rng().normal(size=size)
+        self.func = nc.histogram if backend == "nc" else np.histogram
+
+    def time_histogram(self, backend, size, bins):
+        self.func(self.a, bins=bins)
+
+    def time_histogram_range(self, backend, size, bins):
+        self.func(self.a, bins=bins, range=(-1.0, 1.0))
+
+
+class Ordering(Benchmark):
+    param_names = ["backend", "size"]
+    params = [["nc", "numpy"], [10_000, 1_000_000]]
+
+    def setup(self, backend, size):
+        self.a = _rng().normal(size=size)
+        self.k = size // 10
+        self.mod = nc if backend == "nc" else np
+
+    def time_argsort(self, backend, size):
+        if self.mod is np:
+            np.argsort(self.a, kind="stable")
+        else:
+            nc.argsort(self.a)
+
+    def time_argpartition(self, backend, size):
+        self.mod.argpartition(self.a, self.k)
+
+    def time_argsort_2d_axis0(self, backend, size):
+        a = self.a.reshape(-1, 100)
+        if self.mod is np:
+            np.argsort(a, axis=0, kind="stable")
+        else:
+            nc.argsort(a, axis=0)
+
+
+class Decompositions(Benchmark):
+    param_names = ["backend", "n"]
+    params = [["nc", "numpy"], [16, 64, 128]]
+
+    def setup(self, backend, n):
+        A = _rng().normal(size=(n, n))
+        self.A = A
+        self.spd = A @ A.T + n * np.eye(n)
+        if backend == "nc":
+            self.svd, self.cholesky, self.eigh, self.det, self.lu = (
+                nc.svd,
+                nc.cholesky,
+                nc.eigh,
+                nc.det,
+                nc.lu,
+            )
+        else:
+            self.svd, self.cholesky, self.eigh, self.det = (
+                np.linalg.svd,
+                np.linalg.cholesky,
+                np.linalg.eigh,
+                np.linalg.det,
+            )
+            self.lu = scipy.linalg.lu
+
+    def time_svd(self, backend, n):
+        self.svd(self.A)
+
+    def time_cholesky(self, backend, n):
+        self.cholesky(self.spd)
+
+    def time_lu(self, backend, n):
+        self.lu(self.A)
+
+    def time_eigh(self, backend, n):
+        self.eigh(self.spd)
+
+    def time_det(self, backend, n):
+        self.det(self.A)
@@ -0,0 +1,52 @@
+"""Benchmarks for the multi-label encoders in scikitplot.preprocessing."""
+
+import numpy as np
+
+from .common import Benchmark, safe_import
+
+with safe_import():
+    import pandas as pd
+
+with safe_import():
+    from scikitplot.preprocessing import DummyCodeEncoder, GetDummies
+
+
+def _tags_frame(n_rows, n_labels, labels_per_row=4):
+    rng = np.random.default_rng(1234)
+    labels = np.array([f"tag{i}" for i in range(n_labels)], dtype=object)
+    picks = rng.integers(0, n_labels, size=(n_rows, labels_per_row))
+    return pd.DataFrame(
+        {
+            "tags": [",".join(row) for row in labels[picks]],
+            "topics": [",".join(row) for row in labels[picks[:, ::-1] // 2]],
+        }
+    )
+
+
+class MultiLabelEncoders(Benchmark):
+    param_names = ["encoder", "n_rows", "n_labels", "n_jobs"]
+    params = [
+        ["GetDummies", "DummyCodeEncoder"],
+        [100_000],
+        [100, 20_000],
+        [1, 4],
+    ]
+
+    def setup(self, encoder, n_rows, n_labels, n_jobs):
+        self.X = _tags_frame(n_rows, n_labels)
+        if encoder == "GetDummies":
+            self.enc = GetDummies(
+                columns=["tags", "topics"], sparse_output=True, n_jobs=n_jobs
+            )
+        else:
+            self.enc = DummyCodeEncoder(sep=",", n_jobs=n_jobs)
+        self.enc.fit(self.X)
+
+    def time_fit(self, encoder, n_rows, n_labels, n_jobs):
+        self.enc.fit(self.X)
+
+    def time_transform(self, encoder, n_rows, n_labels, n_jobs):
+        self.enc.transform(self.X)
+
+    def peakmem_transform(self, encoder, n_rows, n_labels, n_jobs):
+        self.enc.transform(self.X)
@@ -0,0 +1,88 @@
+"""Benchmarks for scikitplot.random KissGenerator against numpy.random.Generator."""
+
+import numpy as np
+
+from .common import Benchmark, safe_import
+
+with safe_import():
+    from scikitplot.random import KissGenerator
+
+
+SIZES = [10_000, 1_000_000]
+
+
+def _generator(kind):
+    if kind == "kiss":
+        return KissGenerator(1234)
+    return np.random.default_rng(1234)
+
+
+class Random(Benchmark):
+    param_names = ["generator", "size", "dtype"]
+    params = [["kiss", "numpy"], SIZES, ["float64", "float32"]]
+
+    def setup(self, generator, size, dtype):
+        self.gen = _generator(generator)
+        self.out = np.empty(size, dtype=dtype)
+
+    def time_random(self, generator, size, dtype):
+        self.gen.random(size, dtype=dtype)
+
+    def time_random_out(self, generator, size, dtype):
+        self.gen.random(dtype=self.out.dtype, out=self.out)
+
+
+class Normal(Benchmark):
+    param_names = ["generator", "size"]
+    params = [["kiss", "numpy"], SIZES]
+
+    def setup(self, generator, size):
+        self.gen = _generator(generator)
+        self.out = np.empty(size)
+
+    def time_normal(self, generator, size):
+        self.gen.normal(0.0, 1.0, size)
+
+    def time_standard_normal_out(self, generator, size):
+        self.gen.standard_normal(out=self.out)
+
+
+class Integers(Benchmark):
+    param_names = ["generator", "size", "high"]
+    # 2**62 + 1 is a worst case for rejection-based bounded integers.
+    params = [["kiss", "numpy"], SIZES, [100, 2**62 + 1]]
+
+    def setup(self, generator, size, high):
+        self.gen = _generator(generator)
+
+    def time_integers(self, generator, size, high):
+        self.gen.integers(0, high, size=size)
+
+
+class Permutation(Benchmark):
+    param_names = ["generator", "size"]
+    params = [["kiss", "numpy"], SIZES]
+
+    def setup(self, generator, size):
+        self.gen = _generator(generator)
+
+    def time_permutation(self, generator, size):
+        self.gen.permutation(size)
+
+    def time_choice_without_replacement(self, generator, size):
+        self.gen.choice(size, size=size // 10, replace=False)
+
+
+class ParallelFill(Benchmark):
+    param_names = ["workers"]
+    params = [[1, 2, 4]]
+
+    def setup(self, workers):
+        self.gen = KissGenerator(1234)
+        self.out = np.empty(8_000_000)
+
+    def time_random_out(self, workers):
+        self.gen.random(out=self.out, workers=workers)
+
+    def time_standard_normal_out(self, workers):
+        self.gen.standard_normal(out=self.out, workers=workers)
@@ -616,6 +616,7 @@ APIS_REFERENCE: dict[str, dict[str, any]] = {
                     "estimators.plot_learning_curve",
                     # Cluster estimators
                     "estimators.plot_elbow",
+                    "estimators.elbow_sweep",
                 ],
             },
             {
@@ -637,6 +638,7 @@ APIS_REFERENCE: dict[str, dict[str, any]] = {
                     "metrics.plot_calibration",
                     # Clustering metrics
                     "metrics.plot_silhouette",
+                    "metrics.approximate_silhouette",
                 ],
             },
             {
@@ -982,6 +984,8 @@ APIS_REFERENCE: dict[str, dict[str, any]] = {
                     "DEFAULT_CACHE_DIR",
                     "DEFAULT_MODEL",
                     "EmbeddingEngine",
+                    # _store
+                    "EmbeddingStore",
                     # _multimodal_embedding
                     "DEFAULT_AUDIO_MODEL",
                     "DEFAULT_IMAGE_MODEL",
@@ -1117,6 +1121,7 @@ APIS_REFERENCE: dict[str, dict[str, any]] = {
                     "SearchConfig",
                     "SearchResult",
                     "SimilarityIndex",
+                    "IndexBuildCache",
                 ],
             },
             {
@@ -1160,6 +1165,7 @@ APIS_REFERENCE: dict[str, dict[str, any]] = {
                 #     _get_submodule("scikitplot.corpus", "__init__")
                 # ),
                 "autosummary": [
+                    "AppendOnlyJSONLStorage",
                     "InMemoryStorage",
                     "JSONLStorage",
                     "QueryResult",
@@ -1505,6 +1511,14 @@ APIS_REFERENCE: dict[str, dict[str, any]] = {
                     "plot_roi",
                 ],
             },
+            {
+                "title": "Out-of-core Decile Tables",
+                "description": _get_submodule("scikitplot.decile", "_streaming"),
+                "autosummary": [
+                    "decile_table_streaming",
+                    "aggregate_over_ntiles_streaming",
+                ],
+            },
         ],
     },
     "scikitplot.exceptions": {
@@ -1777,6 +1791,7 @@ APIS_REFERENCE: dict[str, dict[str, any]] = {
                 ),
                 "autosummary": [
                     'MemoryMap',
+                    'ResidencyReport',
                     'mmap_region',
                 ],
                 # for inheritance-diagram
@@ -1784,6 +1799,15 @@ APIS_REFERENCE: dict[str, dict[str, any]] = {
                     "MemoryMap",
                 ],
             },
+            {
+                "title": "Shared arrays: zero-copy NumPy arrays across processes.",
+                "autosummary": [
+                    'SharedArray',
+                    'SharedArrayManager',
+                    'share_array',
+                    'attach_shared_array',
+                ],
+            },
         ],
     },
     "scikitplot.mlflow": {
@@ -0,0 +1,85 @@
+# scikitplot/annoy/_annoy/tests/test_batch_query.py
+#
+# flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests for the batched, multi-threaded ``Index.get_nns_by_vectors`` path.
+
+Row ``i`` of a batch query must equal the single-vector query for ``X[i]``,
+independent of the native thread count, and short rows must be padded with
+``-1`` / ``inf`` so the output stays rectangular.
+"""
+import numpy as np
+import pytest
+
+from scikitplot.annoy._annoy import annoylib as A
+
+DIM = 8
+N_ITEMS = 200
+
+
+def _built_index(metric="euclidean"):
+    rng = np.random.default_rng(0)
+    idx = A.Index(DIM, metric, seed=42)
+    for i in range(N_ITEMS):
+        idx.add_item(i, rng.normal(size=DIM).tolist())
+    idx.build(10)
+    return idx
+
+
+def _queries(n=40, dtype=np.float32):
+    return np.random.default_rng(1).normal(size=(n, DIM)).astype(dtype)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("n_jobs", [1, 3, -1])
+def test_batch_matches_single_vector_queries(dtype, n_jobs):
+    idx = _built_index()
+    X = _queries(dtype=dtype)
+    ids, dists = idx.get_nns_by_vectors(X, 5, include_distances=True, n_jobs=n_jobs)
+    assert ids.shape == dists.shape == (X.shape[0], 5)
+    assert ids.dtype == np.int64
+    assert dists.dtype == np.float64
+    for i, x in enumerate(X):
+        ref_ids, ref_dists = idx.get_nns_by_vector(
+            x.tolist(), 5, include_distances=True
+        )
+        assert ids[i].tolist() == ref_ids
+        np.testing.assert_allclose(dists[i], ref_dists, rtol=1e-6)
+
+
+def test_batch_is_thread_count_invariant():
+    idx = _built_index()
+    X = _queries(n=97)
+    serial = idx.get_nns_by_vectors(X, 7, n_jobs=1)
+    parallel = idx.get_nns_by_vectors(X, 7, n_jobs=4)
+    np.testing.assert_array_equal(serial, parallel)
+
+
+def test_batch_pads_short_rows():
+    idx = _built_index()
+    ids, dists = idx.get_nns_by_vectors(
+        _queries(n=3), N_ITEMS + 10, include_distances=True
+    )
+    assert ids.shape == (3, N_ITEMS + 10)
+    assert (ids[:, -10:] == -1).all()
+    assert np.isinf(dists[:, -10:]).all()
+
+
+def test_batch_accepts_1d_and_empty():
+    idx = _built_index()
+    x = _queries(n=1)[0]
+    assert idx.get_nns_by_vectors(x, 3).shape == (1, 3)
+    assert idx.get_nns_by_vectors(np.empty((0, DIM)), 3).shape == (0, 3)
+
+
+def test_batch_rejects_bad_input():
+    idx = _built_index()
+    with pytest.raises(ValueError):
+        idx.get_nns_by_vectors(np.zeros((2, DIM + 1)), 3)
+    with pytest.raises(ValueError):
+        idx.get_nns_by_vectors(np.zeros((2, DIM)), 0)
+    with pytest.raises(ValueError):
+        idx.get_nns_by_vectors(np.zeros((2, 2, DIM)), 3)
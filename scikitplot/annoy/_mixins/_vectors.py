@@ -17,6 +17,10 @@ implement:
 
 Optional backend surface:
 
+- ``get_nns_by_vectors(X: ndarray, n: int, search_k: int = -1, include_distances: bool = False, n_jobs: int | None = None)``
+  (batched, GIL-free multi-row query returning ``(n_queries, n)`` arrays padded
+  with id ``-1``; used by :meth:`~VectorOpsMixin.kneighbors` and
+  :meth:`~VectorOpsMixin.query_by_vector` when available)
 - ``get_n_trees() -> int`` (built-state detection)
 - ``get_n_items() -> int`` (graph sizing / defensive checks)
 - attribute/property ``f`` (dimension)
@@ -269,6 +273,158 @@ def _filter_and_slice_neighbors(
     return idx_arr[:n_neighbors], dists_arr[:n_neighbors]
 
 
+def _as_query_rows(X: Any) -> np.ndarray:
+    """
+    Coerce query vector(s) to a C-contiguous 2D floating array.
+
+    ``float32`` and ``float64`` inputs keep their dtype (so a batch-capable
+    backend can consume them without a copy); anything else becomes ``float64``.
+    """
+    Xv = np.asarray(X)  # noqa: N806
+    if Xv.ndim == 1:
+        Xv = Xv.reshape(1, -1)  # noqa: N806
+    if Xv.dtype not in (np.float32, np.float64):
+        return np.ascontiguousarray(Xv, dtype=np.float64)
+    return np.ascontiguousarray(Xv)
+
+
+def _query_rows(
+    backend: Any,
+    Xv: np.ndarray,  # noqa: N803
+    *,
+    n_request: int,
+    search_k: int,
+    n_jobs: int | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Run one ``n_request``-NN vector query per row of ``Xv``.
+
+    Uses the backend's batched ``get_nns_by_vectors`` when it exists (one call,
+    native threads, GIL released) and falls back to per-row
+    ``get_nns_by_vector`` calls otherwise.
+
+    Returns
+    -------
+    idx : numpy.ndarray of shape (n_queries, n_request), dtype intp
+        Neighbor ids; missing slots are ``-1``.
+    dists : numpy.ndarray of shape (n_queries, n_request), dtype float32
+        Neighbor distances; missing slots are ``inf``.
+    """
+    n_queries = int(Xv.shape[0])
+
+    get_nns_by_vectors = getattr(backend, "get_nns_by_vectors", None)
+    if callable(get_nns_by_vectors):
+        try:
+            idx, dists = get_nns_by_vectors(
+                Xv,
+                int(n_request),
+                search_k=search_k,
+                include_distances=True,
+                n_jobs=n_jobs,
+            )
+        except Exception as e:  # pragma: no cover
+            raise RuntimeError("Backend get_nns_by_vectors failed.") from e
+        idx_arr = np.asarray(idx, dtype=np.intp)
+        dists_arr = np.asarray(dists, dtype=np.float32)
+        if (
+            idx_arr.ndim != 2  # noqa: PLR2004
+            or idx_arr.shape[0] != n_queries
+            or idx_arr.shape[1] > n_request
+            or dists_arr.shape != idx_arr.shape
+        ):
+            raise RuntimeError(
+                "Backend get_nns_by_vectors returned unexpected shapes: "
+                f"idx={idx_arr.shape} dists={dists_arr.shape}, "
+                f"expected={(n_queries, n_request)}."
+            )
+        n_pad = n_request - int(idx_arr.shape[1])
+        if n_pad:
+            idx_arr = np.pad(idx_arr, ((0, 0), (0, n_pad)), constant_values=-1)
+            dists_arr = np.pad(dists_arr, ((0, 0), (0, n_pad)), constant_values=np.inf)
+        return idx_arr, dists_arr
+
+    idx_out = np.full((n_queries, n_request), -1, dtype=np.intp)
+    dists_out = np.full((n_queries, n_request), np.inf, dtype=np.float32)
+    for i in range(n_queries):
+        try:
+            idx, dists = backend.get_nns_by_vector(  # type: ignore[attr-defined]
+                Xv[i],
+                int(n_request),
+                search_k=search_k,
+                include_distances=True,
+            )
+        except Exception as e:  # pragma: no cover
+            raise RuntimeError("Backend get_nns_by_vector failed.") from e
+        m = min(len(idx), n_request)
+        idx_out[i, :m] = np.asarray(idx, dtype=np.intp)[:m]
+        dists_out[i, :m] = np.asarray(dists, dtype=np.float32)[:m]
+    return idx_out, dists_out
+
+
+def _select_neighbors(
+    idx: np.ndarray,
+    dists: np.ndarray,
+    *,
+    n_neighbors: int,
+    exclude_self: bool,
+    exclude_ids: frozenset[int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Apply exclusions row-wise and keep the first ``n_neighbors`` survivors.
+
+    Vectorized counterpart of :func:`_filter_and_slice_neighbors` for a
+    rectangular ``(n_queries, n_request)`` candidate block. Backend order is
+    preserved within each row; padding (id ``-1``) is never selected.
+
+    Raises
+    ------
+    ValueError
+        If any row has fewer than ``n_neighbors`` candidates left.
+    """
+    keep = idx >= 0
+    if exclude_self and idx.shape[1]:
+        # Same deterministic rule as query_by_vector: drop the first candidate
+        # only when its distance is exactly 0.0.
+        keep[:, 0] &= dists[:, 0] != 0.0
+    if exclude_ids:
+        excluded = np.fromiter(exclude_ids, dtype=np.intp, count=len(exclude_ids))
+        keep &= ~np.isin(idx, excluded)
+
+    counts = keep.sum(axis=1)
+    short = np.flatnonzero(counts < n_neighbors)
+    if short.size:
+        row = int(short[0])
+        raise ValueError(
+            "Backend did not return enough neighbors after applying exclusions. "
+            f"requested={n_neighbors}, returned={int(counts[row])} (query row {row})."
+        )
+
+    if keep[:, :n_neighbors].all():
+        return idx[:, :n_neighbors], dists[:, :n_neighbors]
+
+    # Stable sort on "not kept" moves survivors to the front in backend order.
+    order = np.argsort(~keep, axis=1, kind="stable")[:, :n_neighbors]
+    return (
+        np.take_along_axis(idx, order, axis=1),
+        np.take_along_axis(dists, order, axis=1),
+    )
+
+
+def _gather_vectors(
+    backend: Any,
+    idx: np.ndarray,
+    *,
+    n_features: int,
+    dtype: Any,
+) -> np.ndarray:
+    """Materialize ``backend.get_item`` vectors for ``idx``, fetching each id once."""
+    if idx.size == 0:
+        return np.empty((*idx.shape, n_features), dtype=dtype)
+    uniq, inverse = np.unique(idx, return_inverse=True)
+    table = np.asarray([backend.get_item(int(i)) for i in uniq], dtype=dtype)
+    return table[inverse.reshape(idx.shape)]
+
+
 class VectorOpsMixin:
     """
     User-facing neighbor queries for Annoy-like backends.
@@ -550,18 +706,16 @@ class VectorOpsMixin:
         n_request = n_neighbors_i + len(exclude_ids) + int(bool(exclude_self))
 
         with lock_for(self):
-            try:
-                idx, dists = backend.get_nns_by_vector(  # type: ignore[attr-defined]
-                    vector,
-                    int(n_request),
-                    search_k=search_k_i,
-                    include_distances=True,
-                )
-            except Exception as e:  # pragma: no cover
-                raise RuntimeError("Backend get_nns_by_vector failed.") from e
-
-            idx = np.asarray(idx, dtype=np.intp)
-            dists = np.asarray(dists, dtype=np.float32)
+            idx_rows, dists_rows = _query_rows(
+                backend,
+                _as_query_rows(vector),
+                n_request=int(n_request),
+                search_k=search_k_i,
+                n_jobs=None,
+            )
+            found = idx_rows[0] >= 0
+            idx = idx_rows[0][found]
+            dists = dists_rows[0][found]
 
             # Deterministic self-exclusion rule for vector queries.
             if exclude_self and dists.size and float(dists[0]) == 0.0:
@@ -670,6 +824,7 @@ class VectorOpsMixin:
         ensure_all_finite: bool | Literal["allow-nan"] = True,
         copy: bool = False,
         output_type: Literal["item", "vector"] = "vector",
+        n_jobs: int | None = None,
     ) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
         """
         Find k nearest neighbors for one or more query vectors.
@@ -697,6 +852,10 @@ class VectorOpsMixin:
             Input validation option forwarded to scikit-learn.
         output_type : {'item', 'vector'}, default='vector'
             If 'item', return neighbor ids. If 'vector', return neighbor vectors.
+        n_jobs : int or None, default=None
+            Native query threads for backends that provide the batched
+            ``get_nns_by_vectors`` path (``-1`` uses all cores; ``None`` uses the
+            backend default). Ignored by per-row backends.
 
         Returns
         -------
@@ -713,6 +872,13 @@ class VectorOpsMixin:
         ValueError
             If ``n_neighbors <= 0`` or any query yields too few neighbors after exclusions.
 
+        Notes
+        -----
+        All rows are answered by a single backend call when the backend exposes
+        ``get_nns_by_vectors`` (no per-row Python overhead); exclusions and the
+        ``n_neighbors`` slice are then applied to the whole candidate block with
+        vectorized NumPy operations.
+
         See Also
         --------
         query_by_vector : Per-query 1D interface.
@@ -721,9 +887,10 @@ class VectorOpsMixin:
         n_neighbors_i = _as_positive_int("n_neighbors", n_neighbors)
         search_k_i = _as_int("search_k", search_k)
 
-        Xv = np.asarray(X)  # noqa: N806
-        if Xv.ndim == 1:
-            Xv = Xv.reshape(1, -1)  # noqa: N806
+        backend = backend_for(self)
+        _raise_if_not_built(backend)
+
+        Xv = _as_query_rows(X)  # noqa: N806
 
         # Xv = _vectors_validate_2d(
         #     self,
@@ -732,35 +899,38 @@ class VectorOpsMixin:
         #     copy=copy,
         # )
 
-        distances = np.empty((Xv.shape[0], n_neighbors_i), dtype=np.float32)
+        exclude_ids = _normalize_exclude_ids(exclude_item_ids)
 
-        if output_type == "item":
-            neighbors: np.ndarray = np.empty(
-                (Xv.shape[0], n_neighbors_i), dtype=np.intp
-            )
-        else:
-            neighbors = np.empty(
-                (Xv.shape[0], n_neighbors_i, Xv.shape[1]), dtype=np.float32
+        # Request enough candidates to account for exclusions and possible self-drop.
+        n_request = n_neighbors_i + len(exclude_ids) + int(bool(exclude_self))
+
+        with lock_for(self):
+            idx, distances = _query_rows(
+                backend,
+                Xv,
+                n_request=n_request,
+                search_k=search_k_i,
+                n_jobs=n_jobs,
             )
+        idx, distances = _select_neighbors(
+            idx,
+            distances,
+            n_neighbors=n_neighbors_i,
+            exclude_self=exclude_self,
+            exclude_ids=exclude_ids,
+        )
 
-        for i in range(int(Xv.shape[0])):
-            neigh_i, dist_i = cast(
-                tuple[np.ndarray, np.ndarray],
-                self.query_vectors_by_vector(
-                    Xv[i],
-                    n_neighbors_i,
-                    search_k=search_k_i,
-                    include_distances=True,
-                    exclude_self=exclude_self,
-                    exclude_item_ids=exclude_item_ids,
-                    ensure_all_finite=ensure_all_finite,
-                    copy=copy,
+        if output_type == "item":
+            neighbors: np.ndarray = np.ascontiguousarray(idx, dtype=np.intp)
+        else:
+            with lock_for(self):
+                neighbors = _gather_vectors(
+                    backend,
+                    idx,
+                    n_features=int(Xv.shape[1]),
                     dtype=np.float32,
-                    output_type=output_type,
-                ),
-            )
-            neighbors[i] = neigh_i
-            distances[i] = dist_i
+                )
+        distances = np.ascontiguousarray(distances, dtype=np.float32)
 
         if include_distances:
             return neighbors, distances
@@ -778,6 +948,7 @@ class VectorOpsMixin:
         ensure_all_finite: bool | Literal["allow-nan"] = True,
         copy: bool = False,
         output_type: Literal["item", "vector"] = "item",
+        n_jobs: int | None = None,
     ) -> Any:
         """
         Compute the k-neighbors graph (CSR) for query vectors.
@@ -804,6 +975,8 @@ class VectorOpsMixin:
             Input validation option forwarded to scikit-learn.
         output_type : {'item'}, default='item'
             Must be 'item' for CSR construction.
+        n_jobs : int or None, default=None
+            Native query threads, forwarded to :meth:`kneighbors`.
 
         Returns
         -------
@@ -848,6 +1021,7 @@ class VectorOpsMixin:
                 ensure_all_finite=ensure_all_finite,
                 copy=copy,
                 output_type="item",
+                n_jobs=n_jobs,
             ),
         )
 
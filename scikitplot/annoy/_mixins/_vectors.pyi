@@ -188,6 +188,7 @@ class VectorOpsMixin:
         ensure_all_finite: bool | Literal["allow-nan"] = ...,
         copy: bool = ...,
         output_type: Literal["item"],
+        n_jobs: int | None = ...,
     ) -> NDArray[np.intp]: ...
     @overload
     def kneighbors(
@@ -202,6 +203,7 @@ class VectorOpsMixin:
         ensure_all_finite: bool | Literal["allow-nan"] = ...,
         copy: bool = ...,
         output_type: Literal["item"],
+        n_jobs: int | None = ...,
     ) -> tuple[NDArray[np.intp], NDArray[np.float32]]: ...
     @overload
     def kneighbors(
@@ -216,6 +218,7 @@ class VectorOpsMixin:
         ensure_all_finite: bool | Literal["allow-nan"] = ...,
         copy: bool = ...,
         output_type: Literal["vector"] = ...,
+        n_jobs: int | None = ...,
     ) -> NDArray[np.float32]: ...
     @overload
     def kneighbors(
@@ -230,6 +233,7 @@ class VectorOpsMixin:
         ensure_all_finite: bool | Literal["allow-nan"] = ...,
         copy: bool = ...,
         output_type: Literal["vector"] = ...,
+        n_jobs: int | None = ...,
     ) -> tuple[NDArray[np.float32], NDArray[np.float32]]: ...
     def kneighbors_graph(
         self,
@@ -243,4 +247,5 @@ class VectorOpsMixin:
         ensure_all_finite: bool | Literal["allow-nan"] = ...,
         copy: bool = ...,
         output_type: Literal["item"] = ...,
+        n_jobs: int | None = ...,
     ) -> Any: ...
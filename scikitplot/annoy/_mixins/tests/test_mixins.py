@@ -86,6 +86,54 @@ def test_vectors_kneighbors_sklearn_style():
     assert dists[0, 0] <= dists[0, 1] <= dists[0, 2]   # sorted ascending
 
 
+def test_vectors_kneighbors_exclusions_are_rowwise():
+    idx = _built(10)
+    X = np.asarray([[float(i)] * DIM for i in range(4)])
+    ids, _ = idx.kneighbors(X, 2, output_type="item", exclude_self=True)
+    assert ids.shape == (4, 2)
+    assert not (ids[:, 0] == np.arange(4)).any()   # exact self-match dropped
+    ids, _ = idx.kneighbors(X, 2, output_type="item", exclude_item_ids=[1])
+    assert not (ids == 1).any()
+
+
+def test_vectors_kneighbors_uses_batched_backend_path():
+    from scikitplot.annoy._mixins._vectors import VectorOpsMixin
+
+    data = np.arange(10, dtype=float)[:, None] * np.ones(DIM)
+
+    class _BatchBackend(VectorOpsMixin):
+        f = DIM
+        calls = 0
+
+        def get_n_trees(self):
+            return 1
+
+        def get_n_items(self):
+            return len(data)
+
+        def get_item(self, i):
+            return data[i]
+
+        def get_nns_by_vector(self, vector, n, search_k=-1, include_distances=False):
+            raise AssertionError("per-row path must not be used")
+
+        def get_nns_by_vectors(
+            self, X, n, search_k=-1, include_distances=False, n_jobs=None
+        ):
+            type(self).calls += 1
+            d = np.linalg.norm(X[:, None, :] - data[None, :, :], axis=2)
+            order = np.argsort(d, axis=1, kind="stable")[:, :n]
+            return order, np.take_along_axis(d, order, axis=1)
+
+    est = _BatchBackend()
+    ids, dists = est.kneighbors(data[:5], 3, output_type="item", n_jobs=2)
+    assert _BatchBackend.calls == 1
+    assert ids[:, 0].tolist() == list(range(5))
+    assert dists.dtype == np.float32
+    graph = est.kneighbors_graph(data[:5], 3)
+    assert graph.shape == (5, 10) and graph.nnz == 15
+
+
 # --------------------------------------------------------------------------- #
 # IndexIOMixin
 # --------------------------------------------------------------------------- #
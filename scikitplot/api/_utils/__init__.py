@@ -7,5 +7,6 @@ to work with the scikitplot library.
 # scikitplot/api/_utils/__init__.py
 
 # Your package/module initialization code goes here
+from ._curves import *
 from ._helpers import *
 from .validation import *
@@ -0,0 +1,369 @@
+"""
+Shared-sort engine for threshold curves (ROC, PR, KS, cumulative gain).
+
+Every threshold curve of a scored binary problem is a view of the same two
+cumulative counts -- true and false positives above each distinct score.
+:class:`ScoreCurves` sorts each score column once, accumulates those counts
+for all columns (classes and/or models) in one vectorized pass, and derives
+the individual curves from them on demand, so the curves of every class (or
+model) of one ``y_probas`` share a single sort.
+"""
+
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+# pylint: disable=import-error
+
+import warnings
+
+import numpy as np  # type: ignore[reportMissingImports]
+from sklearn.exceptions import UndefinedMetricWarning
+from sklearn.metrics import auc
+
+__all__ = ["ScoreCurves", "downsample_curve", "resolve_curves"]
+
+
+def downsample_curve(*arrays, n_points=None):
+    """
+    Thin parallel curve arrays to at most ``n_points`` points for plotting.
+
+    Points are picked evenly along the curve index (i.e. along the sorted
+    thresholds); the first and last points are always kept.
+
+    Parameters
+    ----------
+    *arrays : numpy.ndarray
+        Curve coordinates of equal length, e.g. ``fpr, tpr, thresholds``.
+    n_points : int or None, default=None
+        Maximum number of points to keep. ``None`` returns the arrays as-is.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The thinned arrays, in the order given.
+    """
+    if n_points is None or len(arrays[0]) <= n_points:
+        return arrays
+    if n_points < 2:  # noqa: PLR2004
+        raise ValueError(f"`n_points` must be >= 2, got {n_points}.")
+    keep = np.unique(np.linspace(0, len(arrays[0]) - 1, n_points).round().astype(int))
+    return tuple(a[keep] for a in arrays)
+
+
+def resolve_curves(curves, y_true, y_score):
+    """
+    Return ``curves``, or build :class:`ScoreCurves` of the inputs if None.
+
+    Parameters
+    ----------
+    curves : ScoreCurves or None
+        Precomputed curves of the same ``y_true``/``y_score``, e.g. one
+        instance shared by several plots of a model.
+    y_true, y_score : array-like
+        As for :class:`ScoreCurves`; only read when ``curves`` is None.
+
+    Returns
+    -------
+    ScoreCurves
+
+    Raises
+    ------
+    ValueError
+        If ``curves`` does not have the shape of ``y_score``.
+    """
+    if curves is None:
+        return ScoreCurves(y_true, y_score)
+    y_score = np.asarray(y_score)
+    if (curves.n_samples, curves.n_columns) != y_score.reshape(
+        y_score.shape[0], -1
+    ).shape:
+        raise ValueError(
+            f"`curves` shape ({curves.n_samples}, {curves.n_columns}) does not "
+            f"match `y_score` shape {y_score.shape}."
+        )
+    return curves
+
+
+class ScoreCurves:
+    """
+    Cumulative TP/FP counts of one or more score columns, sorted once.
+
+    Parameters
+    ----------
+    y_true : array-like of shape (n_samples,) or (n_samples, n_columns)
+        Binary (0/1 or bool) targets. A 1-D array is shared by every column.
+    y_score : array-like of shape (n_samples,) or (n_samples, n_columns)
+        Scores, one column per curve (a class, a model, or a model's class).
+
+    Attributes
+    ----------
+    n_samples : int
+        Number of rows.
+    n_columns : int
+        Number of score columns.
+    n_positives, n_negatives : numpy.ndarray of shape (n_columns,)
+        Class totals per column.
+
+    See Also
+    --------
+    ScoreCurves.from_models : Stack several models' ``predict_proba`` outputs.
+
+    Notes
+    -----
+    Column ``j`` is sorted by descending score (reverse of a stable ascending
+    sort, as scikit-learn does), and ``tps``/``fps`` are accumulated for all
+    columns at once. Curves are read off at the last row of every run of
+    equal scores, so each curve equals its scikit-learn counterpart
+    (:func:`~sklearn.metrics.roc_curve`,
+    :func:`~sklearn.metrics.precision_recall_curve`).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scikitplot.api._utils import ScoreCurves
+    >>> y = np.array([0, 0, 1, 1])
+    >>> curves = ScoreCurves(y, np.array([0.1, 0.4, 0.35, 0.8]))
+    >>> fpr, tpr, thresholds = curves.roc(0)
+    >>> fpr
+    array([0. , 0. , 0.5, 0.5, 1. ])
+    >>> float(curves.roc_auc(0))
+    0.75
+    """
+
+    def __init__(self, y_true, y_score):
+        y_score = np.asarray(y_score)
+        if y_score.ndim == 1:
+            y_score = y_score[:, None]
+        if y_score.ndim != 2:  # noqa: PLR2004
+            raise ValueError(
+                f"`y_score` must be 1-D or 2-D, got shape {y_score.shape}."
+            )
+        y_true = np.asarray(y_true)
+        if y_true.ndim == 1:
+            y_true = y_true[:, None]
+        if y_true.shape[0] != y_score.shape[0] or y_true.shape[1] not in (
+            1,
+            y_score.shape[1],
+        ):
+            raise ValueError(
+                f"Shape mismatch `y_true` shape {y_true.shape}, "
+                f"`y_score` shape {y_score.shape}"
+            )
+        y_true = np.broadcast_to(y_true.astype(bool, copy=False), y_score.shape)
+
+        self.n_samples, self.n_columns = y_score.shape
+        if self.n_samples == 0:
+            raise ValueError("`y_score` must contain at least one sample.")
+
+        # One sort per column; reversing a stable ascending sort matches
+        # scikit-learn's tie order.
+        order = np.argsort(y_score, axis=0, kind="stable")[::-1]
+        self._score = np.take_along_axis(y_score, order, axis=0)
+        # Vectorized cumulative counting over every column at once.
+        self._tps = np.cumsum(
+            np.take_along_axis(y_true, order, axis=0), axis=0, dtype=np.float64
+        )
+        self._fps = np.arange(1, self.n_samples + 1, dtype=np.float64)[:, None]
+        self._fps = self._fps - self._tps
+        # Last row of each run of equal scores.
+        self._last = np.empty(y_score.shape, dtype=bool)
+        self._last[:-1] = self._score[1:] != self._score[:-1]
+        self._last[-1] = True
+
+        self.n_positives = self._tps[-1].copy()
+        self.n_negatives = self._fps[-1].copy()
+        self.n_models = 1
+        self._micro = None
+
+    @classmethod
+    def from_models(cls, y_true, y_scores):
+        """
+        Build curves for several models' scores in a single pass.
+
+        Parameters
+        ----------
+        y_true : array-like of shape (n_samples,) or (n_samples, n_classes)
+            Binary targets, shared by every model.
+        y_scores : sequence of array-like of shape (n_samples, n_classes)
+            One score matrix per model, with identical shapes.
+
+        Returns
+        -------
+        ScoreCurves
+            Column ``m * n_classes + c`` holds model ``m``, class ``c``;
+            use :meth:`column` to compute it.
+        """
+        y_scores = [np.asarray(s) for s in y_scores]
+        y_scores = [s[:, None] if s.ndim == 1 else s for s in y_scores]
+        y_true = np.asarray(y_true)
+        if y_true.ndim == 2:  # noqa: PLR2004
+            y_true = np.tile(y_true, (1, len(y_scores)))
+        self = cls(y_true, np.hstack(y_scores))
+        self.n_models = len(y_scores)
+        return self
+
+    def column(self, model_index, class_index):
+        """Return the column index of ``class_index`` for ``model_index``."""
+        return model_index * (self.n_columns // self.n_models) + class_index
+
+    @property
+    def micro(self):
+        """:class:`ScoreCurves` of all columns pooled (micro-average)."""
+        if self._micro is None:
+            self._micro = ScoreCurves(self._pooled_true(), self._score.ravel())
+        return self._micro
+
+    def _pooled_true(self):
+        # Rebuild per-row labels from the cumulative counts of each column.
+        return np.diff(self._tps, axis=0, prepend=0.0).astype(bool).ravel()
+
+    def counts(self, j):
+        """
+        Return ``fps, tps, thresholds`` at each distinct score of column ``j``.
+
+        Thresholds are in decreasing order.
+        """
+        last = self._last[:, j]
+        return self._fps[last, j], self._tps[last, j], self._score[last, j]
+
+    def roc(self, j, *, drop_intermediate=True, n_points=None):
+        """
+        ROC curve of column ``j``.
+
+        Parameters
+        ----------
+        j : int
+            Column index.
+        drop_intermediate : bool, default=True
+            Drop collinear points, as :func:`~sklearn.metrics.roc_curve` does.
+        n_points : int or None, default=None
+            Down-sample the curve to at most this many points.
+
+        Returns
+        -------
+        fpr, tpr, thresholds : numpy.ndarray
+        """
+        fps, tps, thresholds = self.counts(j)
+        if drop_intermediate and fps.shape[0] > 2:  # noqa: PLR2004
+            keep = np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), True]
+            fps, tps, thresholds = fps[keep], tps[keep], thresholds[keep]
+        fps = np.r_[0.0, fps]
+        tps = np.r_[0.0, tps]
+        thresholds = np.r_[np.inf, thresholds.astype(np.float64, copy=False)]
+        fpr = self._rate(fps, "No negative samples in y_true, false positive")
+        tpr = self._rate(tps, "No positive samples in y_true, true positive")
+        return downsample_curve(fpr, tpr, thresholds, n_points=n_points)
+
+    @staticmethod
+    def _rate(counts, what):
+        if counts[-1] <= 0:
+            warnings.warn(
+                f"{what} value should be meaningless",
+                UndefinedMetricWarning,
+                stacklevel=3,
+            )
+            return np.full(counts.shape, np.nan)
+        return counts / counts[-1]
+
+    def roc_auc(self, j):
+        """Area under the ROC curve of column ``j``."""
+        fpr, tpr, _ = self.roc(j)
+        return auc(fpr, tpr)
+
+    def macro_roc(self, columns=None, *, n_points=None):
+        """
+        Macro-averaged ROC curve over ``columns`` (default: all).
+
+        Returns
+        -------
+        fpr, tpr : numpy.ndarray
+            The union of the columns' false positive rates and the mean of
+            their interpolated true positive rates.
+        roc_auc : float
+        """
+        columns = range(self.n_columns) if columns is None else columns
+        curves = [self.roc(j)[:2] for j in columns]
+        all_fpr = np.unique(np.concatenate([fpr for fpr, _ in curves]))
+        mean_tpr = np.mean([np.interp(all_fpr, fpr, tpr) for fpr, tpr in curves], 0)
+        roc_auc = auc(all_fpr, mean_tpr)
+        return (*downsample_curve(all_fpr, mean_tpr, n_points=n_points), roc_auc)
+
+    def precision_recall(self, j, *, n_points=None):
+        """
+        Precision-recall curve of column ``j``.
+
+        Returns
+        -------
+        precision, recall, thresholds : numpy.ndarray
+            As :func:`~sklearn.metrics.precision_recall_curve`: recall is
+            decreasing and the final ``(recall=0, precision=1)`` point has no
+            threshold, so ``thresholds`` is one shorter (also when
+            down-sampled).
+        """
+        fps, tps, thresholds = self.counts(j)
+        ps = tps + fps
+        precision = np.divide(tps, ps, out=np.zeros_like(tps), where=ps != 0)
+        if tps[-1] == 0:
+            warnings.warn(
+                "No positive class found in y_true, "
+                "recall is set to one for all thresholds.",
+                stacklevel=2,
+            )
+            recall = np.ones_like(tps)
+        else:
+            recall = tps / tps[-1]
+        precision = np.r_[precision[::-1], 1.0]
+        recall = np.r_[recall[::-1], 0.0]
+        thresholds = thresholds[::-1]
+        if n_points is None:
+            return precision, recall, thresholds
+        precision, recall, thresholds = downsample_curve(
+            precision, recall, np.r_[thresholds, np.nan], n_points=n_points
+        )
+        return precision, recall, thresholds[:-1]
+
+    def average_precision(self, j):
+        """Average precision of column ``j`` (step-wise PR area)."""
+        precision, recall, _ = self.precision_recall(j)
+        return max(0.0, float(-np.sum(np.diff(recall) * precision[:-1])))
+
+    def pr_auc(self, j):
+        """Trapezoidal area under the PR curve of column ``j``."""
+        precision, recall, _ = self.precision_recall(j)
+        return auc(recall, precision)
+
+    def ks(self, j):
+        """
+        Kolmogorov-Smirnov curve of column ``j``.
+
+        Returns
+        -------
+        thresholds : numpy.ndarray
+            Distinct scores, increasing.
+        pct_neg, pct_pos : numpy.ndarray
+            Fraction of negatives / positives scoring ``<= threshold``.
+        """
+        fps, tps, thresholds = self.counts(j)
+        # Rows scoring strictly above each threshold, from the preceding run.
+        neg = self.n_negatives[j] - np.r_[0.0, fps[:-1]]
+        pos = self.n_positives[j] - np.r_[0.0, tps[:-1]]
+        return (
+            thresholds[::-1],
+            neg[::-1] / self.n_negatives[j],
+            pos[::-1] / self.n_positives[j],
+        )
+
+    def cumulative_gain(self, j, *, n_points=None):
+        """
+        Cumulative gain curve of column ``j``.
+
+        Returns
+        -------
+        percentages, gains : numpy.ndarray
+            Fraction of samples considered (by descending score) and fraction
+            of positives captured, both starting at 0.
+        """
+        gains = np.r_[0.0, self._tps[:, j] / self.n_positives[j]]
+        percentages = np.arange(self.n_samples + 1) / float(self.n_samples)
+        return downsample_curve(percentages, gains, n_points=n_points)
+
@@ -14,6 +14,8 @@ enforcing Python 3-like behavior in Python 2.
 import numpy as np  # type: ignore[reportMissingImports]
 from sklearn.preprocessing import LabelEncoder  # type: ignore[reportMissingModuleSource]
 
+from ._curves import resolve_curves
+
 ## Define __all__ to specify the public interface of the module,
 ## not required default all belove func
 __all__ = ["binary_ks_curve", "cumulative_gain_curve", "validate_labels"]
@@ -77,7 +79,7 @@ def validate_labels(known_classes, passed_labels, argument_name):
         )
 
 
-def cumulative_gain_curve(y_true, y_score, pos_label=None):
+def cumulative_gain_curve(y_true, y_score, pos_label=None, *, curves=None):
     """
     Generate the data points necessary to plot the Cumulative Gain curve for binary classification tasks.
 
@@ -103,6 +105,12 @@ def cumulative_gain_curve(y_true, y_score, pos_label=None):
         `{0, 1}`, `{-1, 1}`, or a single unique class. If inference is not possible, a `ValueError`
         is raised.
 
+    curves : ~scikitplot.api._utils.ScoreCurves, optional, default=None
+        Precomputed single-column curves of the positive-class indicator and
+        ``y_score``, reused instead of sorting the scores again.
+
+        .. versionadded:: 0.5
+
     Returns
     -------
     percentages : numpy.ndarray of shape (n_points,)
@@ -132,9 +140,9 @@ def cumulative_gain_curve(y_true, y_score, pos_label=None):
       Multi-class problems are not supported and will result in a `ValueError`.
     - **Score Type:** The `y_score` array must contain continuous values. Binary scores (0/1) are
       not appropriate for plotting cumulative gain curves and will lead to incorrect results.
-    - **Performance:** The function sorts the scores, which contributes to a time complexity of
-      O(n log n), where `n` is the number of samples. For large datasets, this could be a
-      performance bottleneck.
+    - **Performance:** The scores are sorted once, O(n log n), through
+      :class:`~scikitplot.api._utils.ScoreCurves`, which derives the gains
+      from cumulative counts instead of re-sorting per threshold.
     - **Baseline Insertion:** A starting point of (0, 0) is included in both the `percentages` and `gains`
       arrays. This ensures that the cumulative gain curve starts at the origin, providing an accurate
       representation of the gain from zero instances considered.
@@ -218,37 +226,20 @@ def cumulative_gain_curve(y_true, y_score, pos_label=None):
             "not binary (0/1) scores. Provide non-thresholded scores."
         )
 
-    # Sort instances by their scores in descending order
-    sorted_indices = np.argsort(y_score)[::-1]
-    y_true = y_true[sorted_indices]
-    y_score = y_score[sorted_indices]
-
     # total number of positive instances
-    total_positives = float(np.sum(y_true))
-    if total_positives == 0:
+    if not np.any(y_true):
         raise ValueError(
             "The positive class does not appear in `y_true`, "
             "resulting in a gain of zero."
         )
 
-    # Compute cumulative gains (number of true positives as threshold decreases)
-    gains = np.cumsum(y_true)
-    # Normalize gains by the total number of positive instances
-    gains = gains / float(total_positives)
-
-    # Calculate the cumulative percentage of instances considered
-    percentages = np.arange(start=1, stop=len(y_true) + 1)
-    # Normalize percentages by the total number of instances
-    percentages = percentages / float(len(y_true))
-
-    # Insert (0, 0) as the starting point for baseline
-    gains = np.insert(gains, 0, [0])
-    percentages = np.insert(percentages, 0, [0])
+    # Cumulative gains from the shared sorted counts, with the (0, 0) baseline
+    percentages, gains = resolve_curves(curves, y_true, y_score).cumulative_gain(0)
 
     return percentages, gains
 
 
-def binary_ks_curve(y_true, y_probas):
+def binary_ks_curve(y_true, y_probas, *, curves=None):
     """
     Generate the data points necessary to plot the Kolmogorov-Smirnov (KS)
     curve for binary classification tasks.
@@ -271,6 +262,12 @@ def binary_ks_curve(y_true, y_probas):
         This array should contain continuous values representing
         the predicted probability of the positive class.
 
+    curves : ~scikitplot.api._utils.ScoreCurves, optional, default=None
+        Precomputed single-column curves of the positive-class indicator and
+        ``y_probas``, reused instead of sorting the probabilities again.
+
+        .. versionadded:: 0.5
+
     Returns
     -------
     thresholds : numpy.ndarray of shape (n_thresholds,)
@@ -312,9 +309,8 @@ def binary_ks_curve(y_true, y_probas):
       Multi-class problems are not supported and will result in a `ValueError`.
     - **Probability Scores:** The `y_probas` array must contain continuous values representing probabilities.
       Binary scores (0/1) are not appropriate for KS curve calculations.
-    - **Performance:** The function sorts the predicted probabilities for both classes, leading to a time
-      complexity of O(n log n) where `n` is the number of samples. Sorting could be a performance bottleneck
-      for very large datasets.
+    - **Performance:** The probabilities are sorted once, O(n log n), and the per-class
+      cumulative counts are vectorized through :class:`~scikitplot.api._utils.ScoreCurves`.
     - **Handling Edge Cases:** The function inserts thresholds of 0 and 1 if they are not already present to ensure
       that the KS curve starts and ends at the boundaries of the predicted probability range.
 
@@ -378,59 +374,11 @@ def binary_ks_curve(y_true, y_probas):
             f"{len(lb.classes_)} category/ies."
         )
 
-    # Separate probabilities for the two classes
-    # neg_prob = y_probas[y_true == 0]
-    # pos_prob = y_probas[y_true == 1]
-    idx = encoded_labels == 0
-
-    # Sort the predicted probabilities for both classes
-    data1 = np.sort(y_probas[idx])  # Probabilities for the negative class
-    data2 = np.sort(y_probas[~idx])  # Probabilities for the positive class
-    # data2 = np.sort(y_probas[np.logical_not(idx)])
-
-    # Initialize counters and lists to store results
-    ctr1, ctr2 = 0, 0
-    thresholds, pct1, pct2 = [], [], []
-
-    # Compute cumulative percentages for different thresholds
-    while ctr1 < len(data1) or ctr2 < len(data2):
-        # Check if data1 has no more elements
-        if ctr1 >= len(data1):
-            current = data2[ctr2]
-            while ctr2 < len(data2) and current == data2[ctr2]:
-                ctr2 += 1
-
-        # Check if data2 has no more elements
-        elif ctr2 >= len(data2):
-            current = data1[ctr1]
-            while ctr1 < len(data1) and current == data1[ctr1]:
-                ctr1 += 1
-
-        elif data1[ctr1] > data2[ctr2]:
-            current = data2[ctr2]
-            while ctr2 < len(data2) and current == data2[ctr2]:
-                ctr2 += 1
-
-        elif data1[ctr1] < data2[ctr2]:
-            current = data1[ctr1]
-            while ctr1 < len(data1) and current == data1[ctr1]:
-                ctr1 += 1
-
-        else:
-            current = data2[ctr2]
-            while ctr2 < len(data2) and current == data2[ctr2]:
-                ctr2 += 1
-            while ctr1 < len(data1) and current == data1[ctr1]:
-                ctr1 += 1
-
-        thresholds.append(current)
-        pct1.append(ctr1)
-        pct2.append(ctr2)
-
-    # Convert lists to numpy arrays
-    thresholds = np.asarray(thresholds)
-    pct1 = np.asarray(pct1) / float(len(data1))
-    pct2 = np.asarray(pct2) / float(len(data2))
+    # Cumulative percentages of the negative (pct1) and positive (pct2)
+    # class at every distinct threshold, from one shared sort of the scores
+    thresholds, pct1, pct2 = resolve_curves(
+        curves, encoded_labels == 1, y_probas
+    ).ks(0)
 
     # Insert boundary values if not present
     if thresholds[0] != 0:
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    average_precision_score,
+    precision_recall_curve,
+    roc_auc_score,
+    roc_curve,
+)
+
+from .._curves import ScoreCurves, downsample_curve
+from .._helpers import binary_ks_curve, cumulative_gain_curve
+
+
+def _data(n=2000, k=4, decimals=None, seed=0):
+    rng = np.random.default_rng(seed)
+    y_score = rng.random((n, k))
+    if decimals is not None:
+        y_score = y_score.round(decimals)  # heavy ties
+    y_true = (rng.random((n, k)) < y_score).astype(int)
+    return y_true, y_score
+
+
+class TestScoreCurves:
+    """ScoreCurves reproduces the per-column scikit-learn curves."""
+
+    @pytest.mark.parametrize("decimals", [None, 2])
+    def test_matches_sklearn(self, decimals):
+        y_true, y_score = _data(decimals=decimals)
+        curves = ScoreCurves(y_true, y_score)
+        for j in range(y_score.shape[1]):
+            for got, exp in zip(curves.roc(j), roc_curve(y_true[:, j], y_score[:, j])):
+                np.testing.assert_array_equal(got, exp)
+            for got, exp in zip(
+                curves.precision_recall(j),
+                precision_recall_curve(y_true[:, j], y_score[:, j]),
+            ):
+                np.testing.assert_array_equal(got, exp)
+            assert curves.roc_auc(j) == pytest.approx(
+                roc_auc_score(y_true[:, j], y_score[:, j])
+            )
+            assert curves.average_precision(j) == pytest.approx(
+                average_precision_score(y_true[:, j], y_score[:, j])
+            )
+
+    def test_micro_pools_all_columns(self):
+        y_true, y_score = _data(decimals=2)
+        micro = ScoreCurves(y_true, y_score).micro
+        for got, exp in zip(micro.roc(0), roc_curve(y_true.ravel(), y_score.ravel())):
+            np.testing.assert_array_equal(got, exp)
+
+    def test_from_models_maps_columns(self):
+        y_true, y_score = _data(k=3)
+        other = y_score[::-1].copy()
+        curves = ScoreCurves.from_models(y_true, [y_score, other])
+        assert curves.n_columns == 6
+        j = curves.column(1, 2)
+        np.testing.assert_array_equal(
+            curves.roc(j)[1], roc_curve(y_true[:, 2], other[:, 2])[1]
+        )
+
+    def test_one_dimensional_y_true_is_shared(self):
+        y_true, y_score = _data(k=2)
+        curves = ScoreCurves(y_true[:, 0], y_score)
+        np.testing.assert_array_equal(
+            curves.roc(1)[0], roc_curve(y_true[:, 0], y_score[:, 1])[0]
+        )
+
+    def test_ks_matches_brute_force(self):
+        y_true, y_score = _data(decimals=2)
+        y, s = y_true[:, 0], y_score[:, 0]
+        thresholds, pct_neg, pct_pos = ScoreCurves(y, s).ks(0)
+        np.testing.assert_array_equal(thresholds, np.unique(s))
+        le = s[None, :] <= thresholds[:, None]
+        np.testing.assert_allclose(pct_neg, le[:, y == 0].mean(1))
+        np.testing.assert_allclose(pct_pos, le[:, y == 1].mean(1))
+
+    def test_shape_mismatch_raises(self):
+        with pytest.raises(ValueError, match="Shape mismatch"):
+            ScoreCurves(np.zeros((5, 2)), np.zeros((5, 3)))
+
+
+class TestHelpers:
+    """Curve helpers built on the shared engine."""
+
+    def test_binary_ks_curve(self):
+        y_true, y_score = _data(k=1, decimals=2)
+        y, s = y_true[:, 0], y_score[:, 0]
+        thresholds, pct1, pct2, ks, at, classes = binary_ks_curve(y, s)
+        assert thresholds[0] == 0 and thresholds[-1] == 1
+        assert ks == pytest.approx(np.max(pct1 - pct2))
+        assert pct1[np.searchsorted(thresholds, at)] - pct2[
+            np.searchsorted(thresholds, at)
+        ] == pytest.approx(ks)
+        np.testing.assert_array_equal(classes, [0, 1])
+        shared = ScoreCurves(y == 1, s)
+        for got, exp in zip(
+            binary_ks_curve(y, s, curves=shared), (thresholds, pct1, pct2, ks, at)
+        ):
+            np.testing.assert_array_equal(got, exp)
+
+    def test_cumulative_gain_curve(self):
+        y_true, y_score = _data(k=1)
+        y, s = y_true[:, 0], y_score[:, 0]
+        percentages, gains = cumulative_gain_curve(y, s)
+        order = np.argsort(-s)
+        np.testing.assert_allclose(gains[1:], np.cumsum(y[order]) / y.sum())
+        assert percentages[0] == gains[0] == 0 and percentages[-1] == 1
+        shared = ScoreCurves(y == 1, s)
+        for got, exp in zip(
+            cumulative_gain_curve(y, s, curves=shared), (percentages, gains)
+        ):
+            np.testing.assert_array_equal(got, exp)
+        with pytest.raises(ValueError, match="does not match"):
+            cumulative_gain_curve(y, s, curves=ScoreCurves(y_true, y_score[:, [0, 0]]))
+
+
+def test_downsample_curve_keeps_endpoints():
+    x = np.linspace(0, 1, 1001)
+    xs, ys = downsample_curve(x, x**2, n_points=50)
+    assert len(xs) == len(ys) == 50
+    assert xs[0] == 0 and xs[-1] == 1
+    assert downsample_curve(x, n_points=None)[0] is x
+    y_true, y_score = _data(k=1)
+    precision, recall, thresholds = ScoreCurves(y_true, y_score).precision_recall(
+        0, n_points=20
+    )
+    assert len(precision) == len(recall) == len(thresholds) + 1 <= 20
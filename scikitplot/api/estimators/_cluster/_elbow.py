@@ -17,12 +17,27 @@ enforcing Python 3-like behavior in Python 2.
 # pylint: disable=import-error
 # pylint: disable=broad-exception-caught
 
+import contextlib
+import os
+import shutil
+import tempfile
 import time
+import tracemalloc
 
+import joblib  # type: ignore[reportMissingModuleSource]
 import numpy as np  # type: ignore[reportMissingImports]
-from sklearn.base import clone  # type: ignore[reportMissingModuleSource]
 from joblib import Parallel, delayed  # type: ignore[reportMissingModuleSource]
+from sklearn.base import clone  # type: ignore[reportMissingModuleSource]
+from sklearn.cluster import (  # type: ignore[reportMissingModuleSource]
+    MiniBatchKMeans,
+)
+from sklearn.utils import (  # type: ignore[reportMissingModuleSource]
+    Bunch,
+    check_random_state,
+)
 
+from ...._docstrings import _docstring
+from ....utils._matplotlib import save_plot_decorator
 from ..._utils.validation import (
     validate_plotting_kwargs_decorator,
     # validate_shapes_decorator,
@@ -30,63 +45,317 @@ from ..._utils.validation import (
     # validate_y_probas_decorator,
     # validate_y_probas_bounds_decorator,
 )
-from ....utils._matplotlib import save_plot_decorator
-from ...._docstrings import _docstring
 
 ## Define __all__ to specify the public interface of the module, not required default all above func
 __all__ = [
-    # '_clone_and_score_clusterer',
+    "elbow_sweep",
     "plot_elbow",
 ]
 
 
-def _clone_and_score_clusterer(clf, X, n_clusters):
+def _fit_and_score_clusterer(
+    clf, X, n_clusters, *, sample=None, init=None, track_memory=True
+):
+    """
+    Fit one K of an elbow sweep and measure it.
+
+    Clone ``clf`` with ``n_clusters``, optionally fit it on the rows
+    ``sample`` of ``X`` (always scoring on all of ``X``), seed the centroids
+    with ``init``, and record the peak memory traced during the fit.
+
+    Returns
+    -------
+    score : float
+    fit_time : float
+        Seconds spent fitting and scoring.
+    peak_memory : int or None
+        Peak bytes allocated while fitting and scoring (``tracemalloc``), or
+        None when ``track_memory=False``.
+    centers : numpy.ndarray or None
+        The fitted ``cluster_centers_``, if the clusterer exposes them.
+    """
+    tracing = track_memory and tracemalloc.is_tracing()
+    if track_memory and not tracing:
+        tracemalloc.start()
+    elif tracing and hasattr(tracemalloc, "reset_peak"):  # Python >= 3.9
+        tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0] if track_memory else 0
+    start = time.perf_counter()
+    try:
+        clf = clone(clf)
+        clf.n_clusters = n_clusters
+        if init is not None:
+            clf.init, clf.n_init = init, 1
+        clf.fit(X if sample is None else X[sample])
+        score = clf.score(X)
+        fit_time = time.perf_counter() - start
+        peak_memory = (
+            max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+            if track_memory
+            else None
+        )
+    finally:
+        if track_memory and not tracing:
+            tracemalloc.stop()
+    return score, fit_time, peak_memory, getattr(clf, "cluster_centers_", None)
+
+
+def _add_centers(centers, X, n_new, random_state, n_candidates=4096):
+    """Extend ``centers`` by ``n_new`` rows of ``X`` chosen by D^2 sampling."""
+    rng = check_random_state(random_state)
+    idx = rng.choice(X.shape[0], size=min(X.shape[0], n_candidates), replace=False)
+    candidates = np.asarray(X[np.sort(idx)], dtype=np.float64)
+    d2 = ((candidates[:, None, :] - centers[None, :, :]) ** 2).sum(-1).min(1)
+    for _ in range(n_new):
+        total = d2.sum()
+        pick = (
+            rng.choice(len(d2), p=d2 / total) if total > 0 else rng.randint(len(d2))
+        )
+        centers = np.vstack([centers, candidates[pick]])
+        d2 = np.minimum(d2, ((candidates - candidates[pick]) ** 2).sum(1))
+    return centers
+
+
+def _find_knee(sse, patience, tol):
     """
-    Clones and scores a clusterer instance.
+    Locate the knee of a decreasing SSE curve.
 
-    This function fits the given clusterer instance on the provided data and scores the clustering performance.
+    The knee is the first point after which every step lowers the SSE by
+    less than ``tol`` times the total reduction of the curve, provided at
+    least ``patience`` such steps have been observed.
+
+    Returns
+    -------
+    int or None
+        Position of the knee in ``sse``, or None if the curve has not
+        (clearly) flattened yet.
+    """
+    sse = np.asarray(sse, dtype=np.float64)
+    if len(sse) <= patience or sse[0] <= sse[-1]:
+        return None
+    small = -np.diff(sse) < tol * (sse[0] - sse[-1])
+    # flat[i]: every step from point i onwards is small
+    flat = np.logical_and.accumulate(small[::-1])[::-1]
+    if not flat.any():
+        return None
+    knee = int(np.argmax(flat))
+    return knee if len(small) - knee >= patience else None
+
+
+def _as_minibatch(clf):
+    """Return a :class:`~sklearn.cluster.MiniBatchKMeans` mirroring ``clf``."""
+    if isinstance(clf, MiniBatchKMeans):
+        return clf
+    shared = ("init", "n_init", "random_state", "verbose")
+    params = clf.get_params() if hasattr(clf, "get_params") else {}
+    return MiniBatchKMeans(
+        n_clusters=getattr(clf, "n_clusters", 8),
+        **{k: params[k] for k in shared if k in params},
+    )
+
+
+@contextlib.contextmanager
+def _shared_memmap(X, n_jobs):
+    """
+    Expose ``X`` to worker processes as one read-only memmap.
+
+    The array is dumped once; joblib then ships only the file reference to
+    each task instead of pickling the data. Single-job runs, memmaps and
+    non-ndarray inputs (e.g. sparse matrices) are passed through unchanged.
+    """
+    if (
+        joblib.effective_n_jobs(n_jobs) == 1
+        or type(X) is not np.ndarray  # noqa: E721
+    ):
+        yield X
+        return
+    folder = tempfile.mkdtemp(prefix="scikitplot_elbow_")
+    try:
+        path = os.path.join(folder, "X.mmap")
+        joblib.dump(X, path)
+        yield joblib.load(path, mmap_mode="r")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def elbow_sweep(
+    clf,
+    X,
+    cluster_ranges=None,
+    *,
+    n_jobs=1,
+    warm_start=False,
+    subsample=None,
+    minibatch=False,
+    early_stopping=False,
+    patience=3,
+    tol=0.05,
+    track_memory=True,
+    random_state=None,
+):
+    """
+    Fit a clusterer for each K of an elbow curve and collect its scores.
 
     Parameters
     ----------
     clf : object
-        Clusterer instance that implements `fit`, `fit_predict`,
-        and `score` methods, and an `n_clusters` hyperparameter.
-        Example: :class:`sklearn.cluster.KMeans` instance.
+        A clusterer instance with ``fit`` and ``score`` methods and an
+        ``n_clusters`` hyperparameter, e.g. :class:`sklearn.cluster.KMeans`.
+
+    X : array-like of shape (n_samples, n_features)
+        The data to cluster. Scores are always computed on all of ``X``.
+
+    cluster_ranges : list of int or None, optional, default=range(1, 12, 2)
+        Values of ``n_clusters`` to evaluate (sorted ascending).
+
+    n_jobs : int, optional, default=1
+        Number of K values fitted concurrently. With more than one job, a
+        NumPy ``X`` is dumped once to a read-only memmap shared by the
+        worker processes.
+
+    warm_start : bool, optional, default=False
+        Seed each K with the K-1 centroids plus new centers drawn by
+        D^2 sampling (``n_init=1``). Warm-started K values depend on each
+        other and are therefore fitted sequentially. Requires a clusterer
+        with ``init`` and ``cluster_centers_`` (KMeans-like).
+
+    subsample : int, float or None, optional, default=None
+        Fit each K on a random subsample of this many rows (int) or this
+        fraction of rows (float). The same rows are used for every K.
 
-    X : array-like, shape (n_samples, n_features)
-        Data to cluster, where `n_samples` is the number of samples
-        and `n_features` is the number of features.
+    minibatch : bool, optional, default=False
+        Fit :class:`~sklearn.cluster.MiniBatchKMeans` with the ``init``,
+        ``n_init`` and ``random_state`` of ``clf`` instead of ``clf``.
 
-    n_clusters : int
-        Number of clusters.
+    early_stopping : bool, optional, default=False
+        Stop as soon as the knee is found, i.e. once ``patience`` consecutive
+        steps each lowered the SSE by less than ``tol`` times the total
+        reduction so far. K values are evaluated in waves of ``n_jobs``, so
+        up to ``n_jobs - 1`` extra values may be fitted past that point.
+
+    patience : int, optional, default=3
+        Number of flat steps required past the knee.
+
+    tol : float, optional, default=0.05
+        Relative SSE reduction below which a step counts as flat.
+
+    track_memory : bool, optional, default=True
+        Record the peak traced memory of each fit with :mod:`tracemalloc`.
+
+    random_state : int, RandomState instance or None, optional, default=None
+        Seeds the subsample and the warm-start center draws.
 
     Returns
     -------
-    score : float
-        Score of the clusters.
-
-    time : float
-        Number of seconds it took to fit the clusterer.
+    result : :class:`~sklearn.utils.Bunch`
+        With the fields:
+
+        - ``n_clusters`` : list of the K values actually fitted.
+        - ``scores`` : ``clf.score(X)`` per K (negative SSE for KMeans).
+        - ``fit_time`` : seconds per K.
+        - ``peak_memory`` : peak traced bytes per K (None if not tracked).
+        - ``knee`` : the first K after which every step lowers the SSE by
+          less than ``tol`` of the total reduction (at least ``patience``
+          such steps), or None.
+        - ``stopped_early`` : whether ``early_stopping`` cut the sweep.
 
     Examples
     --------
     >>> from sklearn.cluster import KMeans
     >>> from sklearn.datasets import load_iris
+    >>> from scikitplot.api.estimators import elbow_sweep
     >>> X, _ = load_iris(return_X_y=True)
-    >>> kmeans = KMeans(n_clusters=3, random_state=0)
-    >>> clone_and_score_clusterer(kmeans, X, n_clusters=3)
-    (score, time)
+    >>> res = elbow_sweep(KMeans(random_state=0), X, range(1, 11))
+    >>> res.knee
+    3
+    """
+    if cluster_ranges is None:
+        cluster_ranges = range(1, 12, 2)
+    cluster_ranges = sorted(cluster_ranges)
 
-    Notes
-    -----
-    The `score` value is based on the clusterer's scoring method,
-    and the `time` represents the fitting duration.
+    if not hasattr(clf, "n_clusters"):
+        raise TypeError(
+            '"n_clusters" attribute not in classifier. Cannot plot elbow method.'
+        )
+    if minibatch:
+        clf = _as_minibatch(clf)
+    if warm_start and not hasattr(clf, "init"):
+        raise ValueError(
+            "`warm_start=True` requires a clusterer with an `init` parameter, "
+            f"got {type(clf).__name__}."
+        )
 
-    """
-    start = time.time()
-    clf = clone(clf)
-    clf.n_clusters = n_clusters
-    return clf.fit(X).score(X), time.time() - start
+    rng = check_random_state(random_state)
+    n_samples = X.shape[0]
+    sample = None
+    if subsample is not None:
+        size = (
+            int(np.ceil(subsample * n_samples))
+            if isinstance(subsample, float)
+            else int(subsample)
+        )
+        if not 0 < size <= n_samples:
+            raise ValueError(
+                f"`subsample` must select between 1 and {n_samples} rows, "
+                f"got {subsample!r}."
+            )
+        if size < n_samples:
+            sample = np.sort(rng.choice(n_samples, size=size, replace=False))
+
+    def _warm_waves():
+        # Each K is seeded from the previous fit: strictly sequential.
+        X_fit = X if sample is None else X[sample]
+        centers = None
+        for k in cluster_ranges:
+            init = None
+            if centers is not None and k > len(centers):
+                init = _add_centers(centers, X_fit, k - len(centers), rng)
+            result = _fit_and_score_clusterer(
+                clf, X, k, sample=sample, init=init, track_memory=track_memory
+            )
+            centers = result[3]
+            yield [(k, result)]
+
+    def _parallel_waves():
+        # Independent K values, ``n_jobs`` at a time when stopping early.
+        wave = len(cluster_ranges)
+        if early_stopping:
+            wave = max(joblib.effective_n_jobs(n_jobs), 1)
+        with _shared_memmap(X, n_jobs) as X_shared, Parallel(
+            n_jobs=n_jobs
+        ) as parallel:
+            for start in range(0, len(cluster_ranges), wave):
+                ks = cluster_ranges[start : start + wave]
+                results = parallel(
+                    delayed(_fit_and_score_clusterer)(
+                        clf, X_shared, k, sample=sample, track_memory=track_memory
+                    )
+                    for k in ks
+                )
+                yield list(zip(ks, results))
+
+    done, scores, fit_times, peak_memory = [], [], [], []
+    stopped_early = False
+    for batch in _warm_waves() if warm_start else _parallel_waves():
+        for k, (score, fit_time, peak, _) in batch:
+            done.append(k)
+            scores.append(score)
+            fit_times.append(fit_time)
+            peak_memory.append(peak)
+        knee = _find_knee(np.absolute(scores), patience, tol)
+        if early_stopping and knee is not None:
+            stopped_early = len(done) < len(cluster_ranges)
+            break
+
+    knee = _find_knee(np.absolute(scores), patience, tol)
+    return Bunch(
+        n_clusters=done,
+        scores=np.asarray(scores, dtype=np.float64),
+        fit_time=np.asarray(fit_times, dtype=np.float64),
+        peak_memory=peak_memory,
+        knee=None if knee is None else done[knee],
+        stopped_early=stopped_early,
+    )
 
 
 @validate_plotting_kwargs_decorator
@@ -99,6 +368,11 @@ def plot_elbow(
     cluster_ranges=None,
     show_cluster_time=True,
     n_jobs=1,
+    warm_start=False,
+    subsample=None,
+    minibatch=False,
+    early_stopping=False,
+    random_state=None,
     title="Elbow Curves",
     title_fontsize="large",
     text_fontsize="medium",
@@ -127,6 +401,33 @@ def plot_elbow(
     n_jobs : int, optional, default=1
         The number of jobs to run in parallel.
 
+    warm_start : bool, optional, default=False
+        Seed each K with the previous K's centroids. See :func:`elbow_sweep`.
+
+        .. versionadded:: 0.5
+
+    subsample : int, float or None, optional, default=None
+        Fit each K on a random subsample of the rows. See :func:`elbow_sweep`.
+
+        .. versionadded:: 0.5
+
+    minibatch : bool, optional, default=False
+        Fit :class:`~sklearn.cluster.MiniBatchKMeans` instead of ``clf``.
+        See :func:`elbow_sweep`.
+
+        .. versionadded:: 0.5
+
+    early_stopping : bool, optional, default=False
+        Stop the sweep once it has clearly passed the knee, and mark the knee
+        on the plot. See :func:`elbow_sweep`.
+
+        .. versionadded:: 0.5
+
+    random_state : int, RandomState instance or None, optional, default=None
+        Seeds ``subsample`` and ``warm_start``.
+
+        .. versionadded:: 0.5
+
     title : str, optional, default="Elbow Plot"
         The title of the generated plot.
 
@@ -172,20 +473,19 @@ def plot_elbow(
       >>> );
 
     """
-    if cluster_ranges is None:
-        cluster_ranges = range(1, 12, 2)
-    else:
-        cluster_ranges = sorted(cluster_ranges)
-
-    if not hasattr(clf, "n_clusters"):
-        raise TypeError(
-            '"n_clusters" attribute not in classifier. Cannot plot elbow method.'
-        )
-
-    tuples = Parallel(n_jobs=n_jobs)(
-        delayed(_clone_and_score_clusterer)(clf, X, i) for i in cluster_ranges
+    sweep = elbow_sweep(
+        clf,
+        X,
+        cluster_ranges,
+        n_jobs=n_jobs,
+        warm_start=warm_start,
+        subsample=subsample,
+        minibatch=minibatch,
+        early_stopping=early_stopping,
+        track_memory=False,
+        random_state=random_state,
     )
-    clfs, times = zip(*tuples)
+    cluster_ranges, clfs, times = sweep.n_clusters, sweep.scores, sweep.fit_time
 
     ##################################################################
     ## Plotting
@@ -197,6 +497,8 @@ def plot_elbow(
     fig, ax = kwargs.get("fig"), kwargs.get("ax")
     ax.set_title(title, fontsize=title_fontsize)
     ax.plot(cluster_ranges, np.absolute(clfs), "b*-")
+    if early_stopping and sweep.knee is not None:
+        ax.axvline(sweep.knee, ls="--", lw=1, c="gray")
     ax.grid(True)
     ax.set_xlabel("Number of clusters", fontsize=text_fontsize)
     ax.set_ylabel("Sum of Squared Errors", fontsize=text_fontsize)
@@ -4,8 +4,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 from sklearn.cluster import KMeans
 from sklearn.datasets import load_iris as load_data
+from sklearn.datasets import make_blobs
 
-from scikitplot.api.estimators import plot_elbow
+from scikitplot.api.estimators import elbow_sweep, plot_elbow
 
 
 class TestPlotElbow(unittest.TestCase):
@@ -57,3 +58,73 @@ class TestPlotElbow(unittest.TestCase):
         np.random.seed(0)
         clf = KMeans()
         plot_elbow(clf, self.X, show_cluster_time=False)
+
+
+class TestElbowSweep(unittest.TestCase):
+    def setUp(self):
+        self.X, _ = make_blobs(
+            n_samples=3000, centers=4, n_features=5, random_state=0
+        )
+
+    def test_matches_independent_fits(self):
+        clf = KMeans(n_init=1, random_state=0)
+        res = elbow_sweep(clf, self.X, range(1, 6))
+        self.assertEqual(res.n_clusters, [1, 2, 3, 4, 5])
+        for k, score in zip(res.n_clusters, res.scores):
+            ref = KMeans(n_clusters=k, n_init=1, random_state=0).fit(self.X)
+            self.assertAlmostEqual(score, ref.score(self.X))
+        self.assertEqual(len(res.fit_time), 5)
+        self.assertTrue(all(m > 0 for m in res.peak_memory))
+
+    def test_parallel_matches_serial(self):
+        clf = KMeans(n_init=1, random_state=0)
+        serial = elbow_sweep(clf, self.X, range(1, 6))
+        parallel = elbow_sweep(clf, self.X, range(1, 6), n_jobs=2)
+        np.testing.assert_allclose(parallel.scores, serial.scores)
+
+    def test_early_stopping_finds_knee(self):
+        for kwargs in (
+            {},
+            {"n_jobs": 2},
+            {"warm_start": True},
+            {"minibatch": True, "subsample": 0.5},
+        ):
+            res = elbow_sweep(
+                KMeans(n_init=1, random_state=0),
+                self.X,
+                range(1, 21),
+                early_stopping=True,
+                random_state=0,
+                **kwargs,
+            )
+            self.assertEqual(res.knee, 4, kwargs)
+            self.assertTrue(res.stopped_early, kwargs)
+            self.assertLess(len(res.n_clusters), 20, kwargs)
+
+    def test_warm_start_seeds_previous_centers(self):
+        res = elbow_sweep(
+            KMeans(n_init=1, random_state=0),
+            self.X,
+            [1, 2, 4],
+            warm_start=True,
+            track_memory=False,
+            random_state=0,
+        )
+        self.assertEqual(res.n_clusters, [1, 2, 4])
+        self.assertTrue(np.all(np.diff(res.scores) > 0))
+        self.assertEqual(res.peak_memory, [None] * 3)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            elbow_sweep(KMeans(), self.X, subsample=0)
+        with self.assertRaises(TypeError):
+            elbow_sweep(object(), self.X)
+
+    def test_plot_elbow_early_stopping(self):
+        ax = plot_elbow(
+            KMeans(n_init=1, random_state=0),
+            self.X,
+            cluster_ranges=range(1, 21),
+            early_stopping=True,
+        )
+        self.assertLess(len(ax.get_lines()[0].get_xdata()), 20)
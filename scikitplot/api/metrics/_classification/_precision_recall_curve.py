@@ -25,10 +25,11 @@ import numpy as np  # type: ignore[reportMissingImports]
 import matplotlib.pyplot as plt  # type: ignore[reportMissingModuleSource]
 
 # Sigmoid and Softmax functions
-from sklearn.metrics import auc, average_precision_score, precision_recall_curve
+from sklearn.metrics import average_precision_score, precision_recall_curve
 from sklearn.preprocessing import label_binarize
 from sklearn.utils import deprecated
 
+from ..._utils._curves import downsample_curve, resolve_curves
 from ..._utils.validation import (
     validate_plotting_kwargs_decorator,
     validate_shapes_decorator,
@@ -224,6 +225,8 @@ def plot_precision_recall(
     pr_auc="pr_auc",
     ap_score=True,
     plot_chance_level=True,
+    n_points=None,
+    curves=None,
     ## additional params
     **kwargs,
 ):
@@ -313,6 +316,19 @@ def plot_precision_recall(
 
         .. versionadded:: 0.3.9
 
+    n_points : int, optional, default=None
+        Down-sample every drawn curve to at most this many points. Areas and
+        scores are still computed on the full curves.
+
+        .. versionadded:: 0.5
+
+    curves : ~scikitplot.api._utils.ScoreCurves, optional, default=None
+        Precomputed curves of ``y_true``/``y_probas`` in their one column per
+        class form, e.g. one instance shared with :func:`plot_roc` so the
+        scores are sorted only once. Built internally if None.
+
+        .. versionadded:: 0.5
+
     **kwargs: dict
         Generic keyword arguments.
 
@@ -364,15 +380,11 @@ def plot_precision_recall(
 
     """
 
-    def pr_auc_score(recall, precision, y_true, y_proba, pr_auc="pr_auc"):
+    def pr_auc_score(curves, i, pr_auc="pr_auc"):
         if pr_auc == "pr_auc":
-            score = auc(recall, precision)
+            score = curves.pr_auc(i)
         elif pr_auc == "average_precision":
-            score = average_precision_score(
-                y_true,
-                y_proba,
-                # pos_label=classes[i]
-            )
+            score = curves.average_precision(i)
         else:
             raise ValueError(
                 "Unsupported `pr_auc` scoring option, "
@@ -426,56 +438,39 @@ def plot_precision_recall(
     # )
     # Proceed with your plotting logic here
     fig, ax = kwargs.get("fig"), kwargs.get("ax")
-    # Initialize dictionaries to store
-    precision_dict, recall_dict = {}, {}
-    average_precision_dict = {}
+    # Sort each score column once and share the counts across all curves
+    curves = resolve_curves(curves, y_true, y_probas)
     line_kwargs = {"drawstyle": "steps-post"}
 
     # Loop for all classes to get different class
     for i, to_plot in enumerate(indices_to_plot):
-        precision_dict[i], recall_dict[i], _ = precision_recall_curve(
-            y_true[:, i],
-            y_probas[:, i],
-            # pos_label=classes[i]
-        )
-        # average_precision
-        average_precision_dict[i] = pr_auc_score(
-            recall=recall_dict[i],
-            precision=precision_dict[i],
-            y_true=y_true[:, i],
-            y_proba=y_probas[:, i],
-            pr_auc=pr_auc,
-        )
         # to plot
         if to_plot:
             if class_names is None:
                 class_names = classes
+            precision, recall, _ = curves.precision_recall(i, n_points=n_points)
+            # average_precision
+            average_precision = pr_auc_score(curves, i, pr_auc=pr_auc)
             color = plt.get_cmap(cmap)(float(i) / len(classes))
             # https://github.com/scikit-learn/scikit-learn/blob/main/sklearn/metrics/_plot/precision_recall_curve.py#L190
             ax.plot(
-                recall_dict[i],
-                precision_dict[i],
+                recall,
+                precision,
                 ls="-",
                 lw=2,
                 color=color,
                 label=(
                     f"Class {classes[i]} "
-                    f"(area = {average_precision_dict[i]:0>{digits}.{digits}f})"
+                    f"(area = {average_precision:0>{digits}.{digits}f})"
                 ),
                 **line_kwargs,
             )
 
     # Whether or to plot macro or micro
     if plot_micro:
-        precision, recall, _ = precision_recall_curve(y_true.ravel(), y_probas.ravel())
+        precision, recall, _ = curves.micro.precision_recall(0, n_points=n_points)
         # average_precision
-        average_precision = pr_auc_score(
-            recall=recall,
-            precision=precision,
-            y_true=y_true.ravel(),
-            y_proba=y_probas.ravel(),
-            pr_auc=pr_auc,
-        )
+        average_precision = pr_auc_score(curves.micro, 0, pr_auc=pr_auc)
         # to plot
         ax.plot(
             recall,
@@ -490,20 +485,20 @@ def plot_precision_recall(
     if plot_macro:
         # Compute macro-average ROC curve and ROC area
         # First aggregate all false positive rates
-        all_precision = np.unique(
-            np.concatenate([precision_dict[i] for i in range(len(classes))])
-        )
+        pr_curves = [curves.precision_recall(i)[:2] for i in range(len(classes))]
+        all_precision = np.unique(np.concatenate([p for p, _ in pr_curves]))
         # Then interpolate all ROC curves at this points
         mean_recall = np.zeros_like(all_precision)
-        for i in range(len(classes)):
-            mean_recall += np.interp(all_precision, precision_dict[i], recall_dict[i])
+        for precision, recall in pr_curves:
+            mean_recall += np.interp(all_precision, precision, recall)
         # Finally average it
         mean_recall /= len(classes)
-
-        # average_precision
-        average_precision = average_precision_score(
-            y_true.ravel(), y_probas.ravel(), average="macro"
+        mean_recall, all_precision = downsample_curve(
+            mean_recall, all_precision, n_points=n_points
         )
+
+        # average_precision (pooled over all classes)
+        average_precision = curves.micro.average_precision(0)
         ax.plot(
             mean_recall,
             all_precision,
@@ -515,7 +510,7 @@ def plot_precision_recall(
         )
 
     if ap_score:
-        average_precision = average_precision_score(y_true.ravel(), y_probas.ravel())
+        average_precision = curves.micro.average_precision(0)
         label = "Avg. precision={:0>{digits}.{digits}f}".format(
             average_precision, digits=digits
         )
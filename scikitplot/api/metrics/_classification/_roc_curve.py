@@ -27,6 +27,7 @@ from sklearn.metrics import auc, roc_curve
 from sklearn.preprocessing import label_binarize
 from sklearn.utils import deprecated
 
+from ..._utils._curves import downsample_curve, resolve_curves
 from ..._utils.validation import (
     validate_plotting_kwargs_decorator,
     validate_shapes_decorator,
@@ -239,6 +240,8 @@ def plot_roc(
     digits=4,
     plot_micro=True,
     plot_macro=False,
+    n_points=None,
+    curves=None,
     ## additional params
     **kwargs,
 ):
@@ -309,6 +312,19 @@ def plot_roc(
     plot_macro : bool, optional, default=False
         Whether to plot the macro-average ROC AUC curve.
 
+    n_points : int, optional, default=None
+        Down-sample every drawn curve to at most this many points. AUC values
+        are still computed on the full curves.
+
+        .. versionadded:: 0.5
+
+    curves : ~scikitplot.api._utils.ScoreCurves, optional, default=None
+        Precomputed curves of ``y_true``/``y_probas`` in their one column per
+        class form, e.g. one instance shared with :func:`plot_precision_recall` so the
+        scores are sorted only once. Built internally if None.
+
+        .. versionadded:: 0.5
+
     **kwargs: dict
         Generic keyword arguments.
 
@@ -405,28 +421,24 @@ def plot_roc(
     # )
     # Proceed with your plotting logic here
     fig, ax = kwargs.get("fig"), kwargs.get("ax")
-    # Initialize dictionaries to store
-    fpr_dict, tpr_dict = {}, {}
-    roc_auc_dict = {}
+    # Sort each score column once and share the counts across all curves
+    curves = resolve_curves(curves, y_true, y_probas)
     line_kwargs = {}
 
     # Loop for all classes to get different class
     for i, to_plot in enumerate(indices_to_plot):
-        fpr_dict[i], tpr_dict[i], _ = roc_curve(
-            y_true[:, i],
-            y_probas[:, i],
-            # pos_label=classes[i]
-        )
-        roc_auc_dict[i] = auc(fpr_dict[i], tpr_dict[i])
         # to plot
         if to_plot:
             if class_names is None:
                 class_names = classes
+            fpr, tpr, _ = curves.roc(i)
+            roc_auc = auc(fpr, tpr)
+            fpr, tpr = downsample_curve(fpr, tpr, n_points=n_points)
             color = plt.get_cmap(cmap)(float(i) / len(classes))
             # to plot
             ax.plot(
-                fpr_dict[i],
-                tpr_dict[i],
+                fpr,
+                tpr,
                 # fmt = '[marker][line][color]'
                 # marker='o',
                 ls="-",
@@ -434,14 +446,15 @@ def plot_roc(
                 lw=2,
                 label=(
                     f"Class {classes[i]} "
-                    f"(area = {roc_auc_dict[i]:0>{digits}.{digits}f})"
+                    f"(area = {roc_auc:0>{digits}.{digits}f})"
                 ),
             )
 
     # Whether or to plot macro or micro
     if plot_micro:
-        fpr, tpr, _ = roc_curve(y_true.ravel(), y_probas.ravel())
+        fpr, tpr, _ = curves.micro.roc(0)
         roc_auc = auc(fpr, tpr)
+        fpr, tpr = downsample_curve(fpr, tpr, n_points=n_points)
         # to plot
         ax.plot(
             fpr,
@@ -455,17 +468,9 @@ def plot_roc(
         )
 
     if plot_macro:
-        # Compute macro-average ROC curve and ROC area
-        # First aggregate all false positive rates
-        all_fpr = np.unique(np.concatenate([fpr_dict[i] for i in range(len(classes))]))
-        # Then interpolate all ROC curves at this points
-        mean_tpr = np.zeros_like(all_fpr)
-        for i in range(len(classes)):
-            mean_tpr += np.interp(all_fpr, fpr_dict[i], tpr_dict[i])
-
-        # Finally average it and compute AUC
-        mean_tpr /= len(classes)
-        roc_auc = auc(all_fpr, mean_tpr)
+        # Compute macro-average ROC curve and ROC area:
+        # mean of all class curves interpolated at the union of their FPRs
+        all_fpr, mean_tpr, roc_auc = curves.macro_roc(n_points=n_points)
         # to plot
         ax.plot(
             all_fpr,
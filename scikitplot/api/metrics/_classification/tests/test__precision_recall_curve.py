@@ -4,7 +4,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 from sklearn.datasets import load_iris as load_data
 from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import label_binarize
 
+from scikitplot.api._utils import ScoreCurves
 from scikitplot.api.metrics import (
     plot_precision_recall,
     plot_precision_recall_curve,
@@ -129,3 +131,19 @@ class TestPlotPrecisionRecall(unittest.TestCase):
         plot_precision_recall([0, 1], [[0.8, 0.2], [0.2, 0.8]])
         plot_precision_recall([0, "a"], [[0.8, 0.2], [0.2, 0.8]])
         plot_precision_recall(["b", "a"], [[0.8, 0.2], [0.2, 0.8]])
+
+    def test_shared_curves(self):
+        np.random.seed(0)
+        clf = LogisticRegression(max_iter=int(1e5))
+        clf.fit(self.X, self.y)
+        probas = clf.predict_proba(self.X)
+        curves = ScoreCurves(label_binarize(self.y, classes=[0, 1, 2]), probas)
+        expected = plot_precision_recall(self.y, probas, plot_macro=True).get_lines()
+        _, ax = plt.subplots(1, 1)
+        got = plot_precision_recall(self.y, probas, plot_macro=True, curves=curves, ax=ax)
+        assert len(got.get_lines()) == len(expected)
+        for line, ref in zip(got.get_lines(), expected):
+            np.testing.assert_array_equal(line.get_xydata(), ref.get_xydata())
+            assert line.get_label() == ref.get_label()
+        with self.assertRaisesRegex(ValueError, "does not match"):
+            plot_precision_recall(self.y, probas, curves=ScoreCurves(self.y == 0, probas[:, :2]))
@@ -9,6 +9,9 @@ e.g. confusion matrix, silhouette scores, etc.
 # scikitplot/api/metrics/_clustering/__init__.py
 
 # Your package/module initialization code goes here
+from ._silhouette import (
+    approximate_silhouette as approximate_silhouette,
+)
 from ._silhouette import (
     plot_silhouette as plot_silhouette,
 )
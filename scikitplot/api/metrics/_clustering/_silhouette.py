@@ -16,25 +16,305 @@ The imports below ensure consistent behavior across different Python versions by
 enforcing Python 3-like behavior in Python 2.
 """
 
-import numpy as np
-
 # import matplotlib as mpl
 import matplotlib.pyplot as plt
-
-# Sigmoid and Softmax functions
+import numpy as np
+from scipy.stats import norm
 from sklearn.metrics import (
+    pairwise_distances_chunked,
     silhouette_samples,
-    silhouette_score,
 )
 from sklearn.preprocessing import LabelEncoder
+from sklearn.utils import Bunch, check_array, check_random_state
 
 from ...._docstrings import _docstring
-from ..._utils.validation import validate_plotting_kwargs_decorator
 from ....utils._matplotlib import save_plot_decorator
+from ..._utils.validation import validate_plotting_kwargs_decorator
 
 ## Define __all__ to specify the public interface of the module,
 # not required default all above func
-__all__ = ["plot_silhouette"]
+__all__ = ["approximate_silhouette", "plot_silhouette"]
+
+# metric names understood by ``scikitplot.annoy.Index`` (neighbour ranking
+# under "angular" equals ranking under cosine distance)
+_ANN_METRICS = {
+    "euclidean": "euclidean",
+    "manhattan": "manhattan",
+    "cityblock": "manhattan",
+    "cosine": "angular",
+}
+
+
+def _per_cluster_sample(order, bounds, sizes, rng):
+    """Draw ``sizes[c]`` row indices of cluster ``c`` without replacement."""
+    parts = []
+    for c, size in enumerate(sizes):
+        members = order[bounds[c] : bounds[c + 1]]
+        if size < len(members):
+            members = rng.choice(members, size=size, replace=False)
+        parts.append(np.sort(members))
+    return np.concatenate(parts)
+
+
+def _mean_distances(X, rows, ref, weights, *, metric, working_memory, n_jobs):
+    """
+    Weighted mean distance of ``X[rows]`` to ``X[ref]``, chunked.
+
+    ``weights`` has shape (len(ref), n_columns); the result has shape
+    (len(rows), n_columns). Only one chunk of the distance matrix (bounded by
+    ``working_memory``) is held at a time.
+    """
+    if len(rows) == 0:
+        return np.empty((0, weights.shape[1]))
+    chunks = pairwise_distances_chunked(
+        X[rows],
+        X[ref],
+        reduce_func=lambda distances, start: distances @ weights,
+        metric=metric,
+        n_jobs=n_jobs,
+        working_memory=working_memory,
+    )
+    return np.vstack(list(chunks))
+
+
+def approximate_silhouette(
+    X,
+    cluster_labels,
+    *,
+    metric="euclidean",
+    sample_size=10_000,
+    reference_size=1_000,
+    method="chunked",
+    n_neighbors=10,
+    n_trees=10,
+    confidence=0.95,
+    working_memory=None,
+    n_jobs=None,
+    random_state=None,
+):
+    """
+    Estimate silhouette values and their mean from a stratified sample.
+
+    Exact silhouettes need all O(n^2) pairwise distances. Here silhouettes
+    are computed only for a stratified (per-cluster, proportional) sample of
+    ``sample_size`` rows, and each mean intra-/inter-cluster distance is
+    estimated against a reference sample of at most ``reference_size`` rows
+    per cluster, so the cost is O(sample_size * reference_size * n_clusters)
+    with bounded memory.
+
+    Parameters
+    ----------
+    X : array-like or sparse matrix of shape (n_samples, n_features)
+        Data that was clustered.
+
+    cluster_labels : array-like of shape (n_samples,)
+        Cluster label for each sample.
+
+    metric : str or callable, default='euclidean'
+        Any metric accepted by :func:`sklearn.metrics.pairwise_distances`
+        (not "precomputed").
+
+    sample_size : int, default=10_000
+        Number of rows whose silhouette is estimated, allocated to the
+        clusters in proportion to their size (at least one row each).
+
+    reference_size : int, default=1_000
+        Maximum number of rows per cluster used to estimate mean distances.
+
+    method : {'chunked', 'ann'}, default='chunked'
+        - 'chunked': mean distance to every cluster, computed in chunks.
+        - 'ann': the candidate nearest other clusters of each row are the
+          labels of its ``n_neighbors`` approximate nearest reference rows,
+          found with :class:`scikitplot.annoy.Index`; mean distances are
+          then computed to the own and candidate clusters only. Faster
+          with many clusters; requires dense ``X`` and a metric among
+          'euclidean', 'manhattan' and 'cosine'.
+
+    n_neighbors : int, default=10
+        Neighbours queried per row when ``method='ann'``.
+
+    n_trees : int, default=10
+        Trees built for the ANN index when ``method='ann'``.
+
+    confidence : float, default=0.95
+        Level of the confidence interval on the mean silhouette.
+
+    working_memory : int or None, default=None
+        Memory budget in MiB per distance chunk, see
+        :func:`sklearn.metrics.pairwise_distances_chunked`.
+
+    n_jobs : int or None, default=None
+        Parallel jobs for the distance computation and ANN queries.
+
+    random_state : int, RandomState instance or None, default=None
+        Seeds the samples and the ANN index.
+
+    Returns
+    -------
+    result : :class:`~sklearn.utils.Bunch`
+        With the fields:
+
+        - ``sample_indices`` : rows of ``X`` that were evaluated.
+        - ``silhouette_values`` : their estimated silhouette coefficients.
+        - ``cluster_labels`` : their cluster labels.
+        - ``silhouette_avg`` : stratified estimate of the mean silhouette
+          of all of ``X``.
+        - ``standard_error`` : its standard error.
+        - ``confidence_interval`` : ``(low, high)`` at ``confidence``.
+        - ``cluster_avg`` : estimated mean silhouette per cluster.
+        - ``classes`` : the cluster labels, in ``cluster_avg`` order.
+
+    Notes
+    -----
+    The confidence interval accounts for sampling the evaluated rows
+    (stratified, with finite population correction); the reference sample
+    adds a small extra error that shrinks as ``reference_size`` grows.
+    With ``sample_size >= n_samples`` and ``reference_size >= n_samples``
+    and ``method='chunked'``, the values equal
+    :func:`sklearn.metrics.silhouette_samples`.
+
+    Examples
+    --------
+    >>> from sklearn.cluster import KMeans
+    >>> from sklearn.datasets import make_blobs
+    >>> from scikitplot.api.metrics import approximate_silhouette
+    >>> X, _ = make_blobs(n_samples=100_000, centers=5, random_state=0)
+    >>> labels = KMeans(n_clusters=5, random_state=0).fit_predict(X)
+    >>> res = approximate_silhouette(X, labels, random_state=0)
+    >>> low, high = res.confidence_interval
+    """
+    if method not in ("chunked", "ann"):
+        raise ValueError(f"`method` must be 'chunked' or 'ann', got {method!r}.")
+    if metric == "precomputed":
+        raise ValueError("`approximate_silhouette` does not support 'precomputed'.")
+    if reference_size < 2 or sample_size < 1:  # noqa: PLR2004
+        raise ValueError(
+            "`sample_size` must be >= 1 and `reference_size` must be >= 2."
+        )
+    if not 0 < confidence < 1:
+        raise ValueError(f"`confidence` must be in (0, 1), got {confidence}.")
+
+    X = check_array(X, accept_sparse="csr" if method == "chunked" else False)
+    le = LabelEncoder()
+    codes = le.fit_transform(np.asanyarray(cluster_labels))
+    n_samples, n_clusters = len(codes), len(le.classes_)
+    if X.shape[0] != n_samples:
+        raise ValueError(
+            f"`X` has {X.shape[0]} rows but `cluster_labels` has {n_samples}."
+        )
+    if not 2 <= n_clusters <= n_samples - 1:  # noqa: PLR2004
+        raise ValueError(
+            f"Number of labels is {n_clusters}. Valid values are 2 to "
+            "n_samples - 1 (inclusive)"
+        )
+    rng = check_random_state(random_state)
+
+    counts = np.bincount(codes, minlength=n_clusters)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.r_[0, np.cumsum(counts)]
+
+    # Stratified evaluation sample (proportional allocation) and reference
+    # sample (equal size per cluster, for equally precise mean distances).
+    alloc = np.minimum(
+        counts, np.maximum(1, np.round(sample_size * counts / n_samples))
+    ).astype(int)
+    rows = _per_cluster_sample(order, bounds, alloc, rng)
+    ref_sizes = np.minimum(counts, reference_size)
+    ref = _per_cluster_sample(order, bounds, ref_sizes, rng)
+    row_codes, ref_codes = codes[rows], codes[ref]
+
+    # weights[j, c] = 1 / m_c for reference row j in cluster c
+    weights = np.zeros((len(ref), n_clusters))
+    weights[np.arange(len(ref)), ref_codes] = 1.0 / ref_sizes[ref_codes]
+
+    if method == "chunked":
+        mean_d = _mean_distances(
+            X,
+            rows,
+            ref,
+            weights,
+            metric=metric,
+            working_memory=working_memory,
+            n_jobs=n_jobs,
+        )
+    else:
+        if metric not in _ANN_METRICS:
+            raise ValueError(
+                f"`method='ann'` supports metrics {sorted(_ANN_METRICS)}, "
+                f"got {metric!r}."
+            )
+        # Compiled extension: imported only when the ANN path is requested.
+        from ....annoy import Index  # noqa: PLC0415
+
+        index = Index(X.shape[1], _ANN_METRICS[metric], seed=rng.randint(2**31 - 1))
+        index.add_items(X[ref])
+        index.build(n_trees, n_jobs=-1 if n_jobs is None else n_jobs)
+        neighbors = index.kneighbors(
+            X[rows],
+            min(n_neighbors + 1, len(ref)),
+            output_type="item",
+            include_distances=False,
+            n_jobs=n_jobs,
+        )
+        neighbors = np.where(neighbors < 0, 0, neighbors)
+        wanted = np.zeros((len(rows), n_clusters), dtype=bool)
+        wanted[np.arange(len(rows))[:, None], ref_codes[neighbors]] = True
+        wanted[np.arange(len(rows)), row_codes] = True
+        # rows whose neighbours all share their label: consider every cluster
+        wanted[wanted.sum(1) == 1] = True
+        mean_d = np.full((len(rows), n_clusters), np.inf)
+        for c in range(n_clusters):
+            sel = np.flatnonzero(wanted[:, c])
+            ref_c = ref[ref_codes == c]
+            mean_d[sel, c] = _mean_distances(
+                X,
+                rows[sel],
+                ref_c,
+                np.full((len(ref_c), 1), 1.0 / len(ref_c)),
+                metric=metric,
+                working_memory=working_memory,
+                n_jobs=n_jobs,
+            )[:, 0]
+
+    # Own-cluster mean excludes the zero self-distance when the row is also
+    # one of its cluster's reference rows.
+    idx = np.arange(len(rows))
+    m_own = ref_sizes[row_codes].astype(np.float64)
+    in_ref = np.isin(rows, ref)
+    intra = mean_d[idx, row_codes] * m_own / np.where(in_ref, m_own - 1, m_own)
+    mean_d[idx, row_codes] = np.inf
+    inter = mean_d.min(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = (inter - intra) / np.maximum(intra, inter)
+    # singleton clusters have silhouette 0, as in scikit-learn
+    values = np.nan_to_num(np.where(counts[row_codes] > 1, values, 0.0))
+
+    # Stratified mean with finite-population-corrected standard error
+    cluster_avg = np.bincount(row_codes, weights=values, minlength=n_clusters)
+    cluster_avg /= alloc
+    sq_dev = np.bincount(
+        row_codes, weights=(values - cluster_avg[row_codes]) ** 2, minlength=n_clusters
+    )
+    var = np.divide(sq_dev, alloc - 1, out=np.zeros(n_clusters), where=alloc > 1)
+    share = counts / n_samples
+    silhouette_avg = float(share @ cluster_avg)
+    standard_error = float(
+        np.sqrt(np.sum(share**2 * (1 - alloc / counts) * var / alloc))
+    )
+    z = norm.ppf(0.5 + confidence / 2)
+    return Bunch(
+        sample_indices=rows,
+        silhouette_values=values,
+        cluster_labels=le.classes_[row_codes],
+        silhouette_avg=silhouette_avg,
+        standard_error=standard_error,
+        confidence_interval=(
+            float(silhouette_avg - z * standard_error),
+            float(silhouette_avg + z * standard_error),
+        ),
+        cluster_avg=cluster_avg,
+        classes=le.classes_,
+    )
 
 
 @validate_plotting_kwargs_decorator
@@ -46,6 +326,11 @@ def plot_silhouette(
     cluster_labels,
     *,
     metric="euclidean",
+    sample_size=None,
+    reference_size=1_000,
+    approx_method="chunked",
+    confidence=0.95,
+    random_state=None,
     ## plotting params
     title="Silhouette Analysis",
     title_fontsize="large",
@@ -80,6 +365,34 @@ def plot_silhouette(
     copy : bool, optional, default=True
         Determines whether `fit` is used on `clf` or on a copy of `clf`.
 
+    sample_size : int or None, optional, default=None
+        If given, plot approximate silhouettes of a stratified sample of this
+        many rows instead of exact values for all rows, and shade the
+        ``confidence`` interval of the mean silhouette.
+        See :func:`approximate_silhouette`.
+
+        .. versionadded:: 0.5
+
+    reference_size : int, optional, default=1000
+        Rows per cluster used to estimate mean distances when sampling.
+
+        .. versionadded:: 0.5
+
+    approx_method : {'chunked', 'ann'}, optional, default='chunked'
+        Inter-cluster distance strategy when sampling.
+
+        .. versionadded:: 0.5
+
+    confidence : float, optional, default=0.95
+        Level of the confidence band on the mean silhouette when sampling.
+
+        .. versionadded:: 0.5
+
+    random_state : int, RandomState instance or None, optional, default=None
+        Seeds the samples when ``sample_size`` is given.
+
+        .. versionadded:: 0.5
+
     title : str, optional, default='Silhouette Analysis'
         Title of the generated plot.
 
@@ -157,9 +470,25 @@ def plot_silhouette(
 
     n_clusters = len(np.unique(cluster_labels))
 
-    silhouette_avg = silhouette_score(X, cluster_labels, metric=metric)
-
-    sample_silhouette_values = silhouette_samples(X, cluster_labels, metric=metric)
+    confidence_interval = None
+    if sample_size is None:
+        sample_silhouette_values = silhouette_samples(X, cluster_labels, metric=metric)
+        silhouette_avg = np.mean(sample_silhouette_values)
+    else:
+        approx = approximate_silhouette(
+            X,
+            cluster_labels,
+            metric=metric,
+            sample_size=sample_size,
+            reference_size=reference_size,
+            method=approx_method,
+            confidence=confidence,
+            random_state=random_state,
+        )
+        sample_silhouette_values = approx.silhouette_values
+        cluster_labels_encoded = cluster_labels_encoded[approx.sample_indices]
+        silhouette_avg = approx.silhouette_avg
+        confidence_interval = approx.confidence_interval
 
     ##################################################################
     ## Plotting
@@ -206,6 +535,17 @@ def plot_silhouette(
         linestyle="--",
         label="Silhouette score: {0:.{digits}f}".format(silhouette_avg, digits=digits),
     )
+    if confidence_interval is not None:
+        low, high = confidence_interval
+        ax.axvspan(
+            low,
+            high,
+            color="red",
+            alpha=0.15,
+            label="{0:.0%} CI: [{1:.{digits}f}, {2:.{digits}f}]".format(
+                confidence, low, high, digits=digits
+            ),
+        )
 
     # Set title, labels, and formatting
     ax.set_title(title, fontsize=title_fontsize)
@@ -217,7 +557,7 @@ def plot_silhouette(
     ax.set_yticks([])  # Clear the y-axis labels / ticks
 
     ax.set_xlim([-0.1, 1])
-    ax.set_ylim([0, len(X) + (n_clusters + 1) * 10 + 10])
+    ax.set_ylim([0, len(sample_silhouette_values) + (n_clusters + 1) * 10 + 10])
 
     # Display legend
     handles, _labels = ax.get_legend_handles_labels()
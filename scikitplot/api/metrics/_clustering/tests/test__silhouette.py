@@ -4,8 +4,11 @@ import matplotlib.pyplot as plt
 import numpy as np
 from sklearn.cluster import KMeans
 from sklearn.datasets import load_iris as load_data
+from sklearn.datasets import make_blobs
+from sklearn.metrics import silhouette_samples
 
 from scikitplot.api.metrics import (
+    approximate_silhouette,
     plot_silhouette,
 )
 
@@ -57,3 +60,56 @@ class TestPlotSilhouette(unittest.TestCase):
     def test_array_like(self):
         plot_silhouette(self.X.tolist(), self.y.tolist())
         plot_silhouette(self.X.tolist(), convert_labels_into_string(self.y))
+
+
+class TestApproximateSilhouette(unittest.TestCase):
+    def setUp(self):
+        self.X, self.labels = make_blobs(
+            n_samples=3000, centers=5, n_features=6, cluster_std=3, random_state=0
+        )
+        self.exact = silhouette_samples(self.X, self.labels)
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_full_sample_is_exact(self):
+        res = approximate_silhouette(
+            self.X, self.labels, sample_size=10**6, reference_size=10**6,
+            working_memory=1,
+        )
+        np.testing.assert_allclose(
+            res.silhouette_values, self.exact[res.sample_indices]
+        )
+        self.assertAlmostEqual(res.silhouette_avg, self.exact.mean())
+        self.assertEqual(res.standard_error, 0.0)
+
+    def test_sample_is_stratified_and_covers_mean(self):
+        for method in ("chunked", "ann"):
+            res = approximate_silhouette(
+                self.X, self.labels, sample_size=600, reference_size=300,
+                method=method, random_state=0,
+            )
+            self.assertEqual(len(res.sample_indices), 600)
+            np.testing.assert_array_equal(
+                np.bincount(res.cluster_labels), [120] * 5
+            )
+            low, high = res.confidence_interval
+            self.assertLess(low, high)
+            self.assertLess(abs(res.silhouette_avg - self.exact.mean()), 0.02)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            approximate_silhouette(self.X, self.labels, method="bogus")
+        with self.assertRaises(ValueError):
+            approximate_silhouette(
+                self.X, self.labels, method="ann", metric="chebyshev"
+            )
+        with self.assertRaises(ValueError):
+            approximate_silhouette(self.X, np.zeros(len(self.X)))
+
+    def test_plot_with_sample_size(self):
+        ax = plot_silhouette(
+            self.X, self.labels, sample_size=500, random_state=0
+        )
+        labels = [t.get_text() for t in ax.get_legend().get_texts()]
+        self.assertTrue(any(label.startswith("95% CI") for label in labels))
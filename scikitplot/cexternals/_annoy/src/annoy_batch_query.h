@@ -0,0 +1,170 @@
+// scikitplot/cexternals/_annoy/src/annoy_batch_query.h
+// Authors: The scikit-plots developers
+// SPDX-License-Identifier: BSD-3-Clause
+//
+// Batched, multi-threaded vector queries over the widened `_w` bridge.
+//
+// `get_nns_by_vector_w` answers ONE query per call, so a Python caller that
+// loops over the rows of a (n_queries, f) matrix pays interpreter, argument
+// conversion and list construction overhead per row. This header adds a
+// single entry point that:
+//
+//   * reads a row-major, C-contiguous (n_queries, f) float/double buffer,
+//   * fans the rows out over `resolve_n_jobs(n_jobs)` std::threads using a
+//     contiguous, deterministic row partition (thread t owns one block),
+//   * writes results straight into caller-preallocated (n_queries, n)
+//     id / distance buffers.
+//
+// It never touches the Python C-API and is therefore safe to call with the
+// GIL released. Queries are read-only on the index (same contract as
+// `get_nns_by_vector_w`); the caller must not mutate the index concurrently.
+//
+// Rows for which the index returns fewer than `n` neighbours (small indexes,
+// low search_k) are padded with id -1 and distance +inf, so the output stays
+// rectangular and the caller can detect short rows without a side channel.
+#ifndef ANNOY_BATCH_QUERY_H
+#define ANNOY_BATCH_QUERY_H
+
+#include "annoylib.h"
+
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <cstdlib>
+#include <limits>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace annoy_batch {
+
+// One worker: answer rows [row_begin, row_end). On the first failing row it
+// raises `failed` and stores the message in *error (first writer wins, under
+// `error_mutex`); other workers observe `failed` and stop early.
+template <typename TIn>
+inline void query_rows_w(
+    const Annoy::AnnoyIndexInterfaceBase* index,
+    const TIn* X, int f,
+    size_t row_begin, size_t row_end,
+    size_t n, int search_k,
+    int64_t* out_ids, double* out_dists,
+    std::atomic<bool>* failed, std::mutex* error_mutex,
+    char** error) noexcept {
+  try {
+    std::vector<double> query(static_cast<size_t>(f));
+    std::vector<uint64_t> result;
+    std::vector<double> distances;
+    result.reserve(n);
+    if (out_dists) distances.reserve(n);
+
+    for (size_t row = row_begin; row < row_end; ++row) {
+      if (failed->load(std::memory_order_relaxed)) return;
+
+      const TIn* src = X + row * static_cast<size_t>(f);
+      for (int j = 0; j < f; ++j) query[j] = static_cast<double>(src[j]);
+
+      char* row_error = NULL;
+      index->get_nns_by_vector_w(query.data(), n, search_k, &result,
+                                 out_dists ? &distances : NULL, &row_error);
+      if (row_error != NULL) {
+        std::lock_guard<std::mutex> guard(*error_mutex);
+        if (!failed->exchange(true) && error) {
+          *error = row_error;
+        } else {
+          free(row_error);
+        }
+        return;
+      }
+
+      int64_t* ids_row = out_ids + row * n;
+      const size_t got = result.size() < n ? result.size() : n;
+      for (size_t k = 0; k < got; ++k) ids_row[k] = static_cast<int64_t>(result[k]);
+      for (size_t k = got; k < n; ++k) ids_row[k] = -1;
+
+      if (out_dists) {
+        double* dists_row = out_dists + row * n;
+        for (size_t k = 0; k < got; ++k) dists_row[k] = distances[k];
+        for (size_t k = got; k < n; ++k) {
+          dists_row[k] = std::numeric_limits<double>::infinity();
+        }
+      }
+    }
+  } catch (const std::exception& e) {
+    std::lock_guard<std::mutex> guard(*error_mutex);
+    if (!failed->exchange(true) && error) *error = Annoy::dup_cstr(e.what());
+  } catch (...) {
+    std::lock_guard<std::mutex> guard(*error_mutex);
+    if (!failed->exchange(true) && error) {
+      *error = Annoy::dup_cstr("unknown error in get_nns_by_vectors_w");
+    }
+  }
+}
+
+// Answer `n_queries` vector queries in parallel.
+//
+// Parameters
+//   index      : built index (type-erased base pointer).
+//   X          : row-major (n_queries, f) query buffer (float or double).
+//   n          : neighbours per query (>= 1).
+//   search_k   : forwarded to get_nns_by_vector_w (-1 = default).
+//   n_jobs     : joblib-style thread count (-1 = all cores), see resolve_n_jobs.
+//   out_ids    : (n_queries, n) int64 buffer, padded with -1.
+//   out_dists  : (n_queries, n) double buffer padded with +inf, or NULL.
+//   error      : receives a malloc'd message on failure (caller frees).
+//
+// Returns true on success. On failure the output buffers are partially
+// written and must be discarded.
+template <typename TIn>
+inline bool get_nns_by_vectors_w(
+    const Annoy::AnnoyIndexInterfaceBase* index,
+    const TIn* X, size_t n_queries, int f,
+    size_t n, int search_k, int n_jobs,
+    int64_t* out_ids, double* out_dists,
+    char** error) noexcept {
+  if (index == NULL) {
+    if (error) *error = Annoy::dup_cstr("index not constructed");
+    return false;
+  }
+  if (n_queries == 0 || n == 0) return true;
+
+  std::atomic<bool> failed(false);
+  std::mutex error_mutex;
+
+  size_t n_threads = static_cast<size_t>(Annoy::resolve_n_jobs(n_jobs));
+  if (n_threads > n_queries) n_threads = n_queries;
+
+  if (n_threads <= 1) {
+    query_rows_w<TIn>(index, X, f, 0, n_queries, n, search_k,
+                      out_ids, out_dists, &failed, &error_mutex, error);
+    return !failed.load();
+  }
+
+  // Contiguous blocks: row ownership depends only on (n_queries, n_threads),
+  // so results are identical regardless of scheduling.
+  const size_t block = (n_queries + n_threads - 1) / n_threads;
+  std::vector<std::thread> workers;
+  try {
+    workers.reserve(n_threads);
+    for (size_t t = 0; t < n_threads; ++t) {
+      const size_t begin = t * block;
+      if (begin >= n_queries) break;
+      const size_t end = (begin + block < n_queries) ? begin + block : n_queries;
+      workers.emplace_back(query_rows_w<TIn>, index, X, f, begin, end, n,
+                           search_k, out_ids, out_dists, &failed,
+                           &error_mutex, error);
+    }
+  } catch (const std::exception& e) {
+    {
+      std::lock_guard<std::mutex> guard(error_mutex);
+      if (!failed.exchange(true) && error) *error = Annoy::dup_cstr(e.what());
+    }
+  }
+  for (auto& worker : workers) {
+    if (worker.joinable()) worker.join();
+  }
+  return !failed.load();
+}
+
+}  // namespace annoy_batch
+
+#endif  // ANNOY_BATCH_QUERY_H
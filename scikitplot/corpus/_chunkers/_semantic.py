@@ -27,7 +27,10 @@ MORPHOLOGICAL
 
 EMBEDDING
     Embeds candidate splits and merges adjacent splits whose cosine
-    similarity exceeds ``similarity_threshold``.  Uses
+    similarity exceeds ``similarity_threshold`` (or lies below a
+    ``breakpoint_percentile`` of the document's adjacent distances).
+    Embeddings stay NumPy arrays; all adjacent similarities of a document
+    come from one row-normalised dot product.  Uses
     ``sentence-transformers`` (``pip install sentence-transformers``).
     Non-deterministic (model weights may change across releases).
 
@@ -54,6 +57,8 @@ from dataclasses import dataclass, field  # noqa: F401
 from enum import Enum, unique
 from typing import Any, Callable, Final, Optional, Sequence  # noqa: F401
 
+import numpy as np
+
 from .._types import (  # noqa: F401
     Chunk,
     ChunkerConfig,
@@ -133,6 +138,12 @@ class SemanticChunkerConfig(ChunkerConfig):
         Cosine similarity threshold for EMBEDDING / HYBRID boundary merging.
         Adjacent chunks with similarity >= this value are merged.
         Range ``[0.0, 1.0]``.  Default ``0.85``.
+    breakpoint_percentile : float or None
+        When set, replaces ``similarity_threshold`` with a per-document
+        threshold: an adjacent pair is kept apart only when its cosine
+        distance is above this percentile of all adjacent distances in the
+        document (e.g. ``95.0`` keeps the 5 % sharpest topic shifts).
+        Range ``[0.0, 100.0]``.  Default ``None``.
     max_chunk_tokens : int or None
         Hard upper bound on tokens per semantic chunk.  Chunks exceeding
         this are forcibly split by the Layer 2 adapter.
@@ -165,6 +176,7 @@ class SemanticChunkerConfig(ChunkerConfig):
     model_name: str = "paraphrase-multilingual-mpnet-base-v2"
     model_version: str | None = None
     similarity_threshold: float = 0.85
+    breakpoint_percentile: float | None = None
     max_chunk_tokens: int | None = None
     min_chunk_tokens: int = 1
     include_offsets: bool = True
@@ -298,6 +310,12 @@ class SemanticChunker(MultilangMixin):
                 f"SemanticChunkerConfig.similarity_threshold must be in "
                 f"[0.0, 1.0], got {self._cfg.similarity_threshold!r}."
             )
+        pct = self._cfg.breakpoint_percentile
+        if pct is not None and not (0.0 <= pct <= 100.0):  # noqa: PLR2004
+            raise ValueError(
+                f"SemanticChunkerConfig.breakpoint_percentile must be in "
+                f"[0.0, 100.0] or None, got {pct!r}."
+            )
         if self._cfg.min_chunk_tokens < 1:
             raise ValueError(
                 f"SemanticChunkerConfig.min_chunk_tokens must be >= 1, "
@@ -354,8 +372,8 @@ class SemanticChunker(MultilangMixin):
             )
             return False
 
-    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
-        """Embed a list of texts, returning a parallel list of vectors.
+    def _embed_texts(self, texts: list[str]) -> np.ndarray:
+        """Embed a list of texts, returning one row per text.
 
         Parameters
         ----------
@@ -364,8 +382,8 @@ class SemanticChunker(MultilangMixin):
 
         Returns
         -------
-        list[list[float]]
-            One vector per text.
+        numpy.ndarray
+            ``float32`` array of shape ``(len(texts), dim)``.
 
         Raises
         ------
@@ -380,109 +398,120 @@ class SemanticChunker(MultilangMixin):
         vectors = self._embed_model.encode(
             texts,
             show_progress_bar=False,
-            convert_to_numpy=False,
+            convert_to_numpy=True,
         )
-        return [v.tolist() if hasattr(v, "tolist") else list(v) for v in vectors]
+        return np.atleast_2d(np.asarray(vectors, dtype=np.float32))
 
     # ------------------------------------------------------------------
     # Section B — Cosine similarity
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _cosine_similarity(a: list[float], b: list[float]) -> float:
+    def _cosine_similarity(a: Any, b: Any) -> float:
         """Compute cosine similarity between two dense vectors.
 
         Parameters
         ----------
-        a : list[float]
+        a : array-like
             Vector A.
-        b : list[float]
+        b : array-like
             Vector B.
 
         Returns
         -------
         float
-            Cosine similarity in ``[-1.0, 1.0]``.
+            Cosine similarity in ``[-1.0, 1.0]``; ``0.0`` for a zero vector.
+        """
+        return float(
+            SemanticChunker._adjacent_similarities(np.vstack([a, b]).astype(float))[0]
+        )
+
+    @staticmethod
+    def _adjacent_similarities(vectors: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every row with the next one.
+
+        Parameters
+        ----------
+        vectors : numpy.ndarray
+            Array of shape ``(n, dim)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Shape ``(n - 1,)``; pairs involving a zero vector score ``0.0``.
         """
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(y * y for y in b) ** 0.5
-        if norm_a == 0.0 or norm_b == 0.0:
-            return 0.0
-        return dot / (norm_a * norm_b)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        unit = np.divide(
+            vectors, norms, out=np.zeros_like(vectors), where=norms > 0.0
+        )
+        return np.einsum("ij,ij->i", unit[:-1], unit[1:])
 
     # ------------------------------------------------------------------
     # Section C — Boundary refinement (EMBEDDING / HYBRID)
     # ------------------------------------------------------------------
 
-    def _refine_boundaries(
+    def _merge_by_similarity(
         self,
         chunks: list[Chunk],
-    ) -> list[Chunk]:
-        """Merge adjacent chunks with high embedding similarity.
-
-        Adjacent chunks whose cosine similarity >= ``similarity_threshold``
-        are merged into a single chunk.  This reduces over-segmentation
-        from the morphological layer while preserving semantically distinct
-        boundaries.
+        vectors: np.ndarray,
+    ) -> tuple[list[Chunk], list[np.ndarray | None]]:
+        """Merge runs of similar adjacent chunks given their embeddings.
 
         Parameters
         ----------
         chunks : list[Chunk]
             Morphological chunks from Layer 2.
+        vectors : numpy.ndarray
+            One embedding row per chunk.
 
         Returns
         -------
-        list[Chunk]
-            Boundary-refined list (always non-empty for non-empty input).
+        tuple of (list[Chunk], list)
+            Merged chunks, and for each the embedding row when the chunk is
+            unchanged (reused downstream) or ``None`` when it was merged and
+            must be re-embedded.
         """
         if len(chunks) <= 1:
-            return chunks
+            return list(chunks), list(vectors[: len(chunks)])
 
-        texts = [c.text for c in chunks]
-        try:
-            vectors = self._embed_texts(texts)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning(
-                "SemanticChunker: embedding failed during boundary refinement "
-                "(%s). Returning unrefined morphological chunks.",
-                exc,
-            )
-            return chunks
-
-        merged: list[Chunk] = [chunks[0]]
-        merged_vecs: list[list[float]] = [vectors[0]]
-
-        for i in range(1, len(chunks)):
-            sim = self._cosine_similarity(merged_vecs[-1], vectors[i])
-            if sim >= self._cfg.similarity_threshold:
-                # Merge: concatenate text, keep start of first / end of last
-                prev = merged[-1]
-                curr = chunks[i]
-                new_text = prev.text + " " + curr.text
-                new_meta = {
-                    **dict(prev.metadata),
-                    "merged_from": [
-                        prev.metadata.get("chunk_index", -1),
-                        curr.metadata.get("chunk_index", i),
-                    ],
-                    "merge_similarity": round(sim, 4),
-                }
-                merged[-1] = Chunk(
-                    text=new_text,
-                    start_char=prev.start_char,
-                    end_char=curr.end_char,
+        sims = self._adjacent_similarities(vectors)
+        pct = self._cfg.breakpoint_percentile
+        if pct is None:
+            joined = sims >= self._cfg.similarity_threshold
+        else:
+            distances = 1.0 - sims
+            joined = distances <= np.percentile(distances, pct)
+        # Every pair that is not joined starts a new group.
+        starts = np.concatenate(([0], np.flatnonzero(~joined) + 1))
+        ends = np.append(starts[1:], len(chunks))
+
+        merged: list[Chunk] = []
+        merged_vecs: list[np.ndarray | None] = []
+        for lo, hi in zip(starts.tolist(), ends.tolist()):
+            if hi - lo == 1:
+                merged.append(chunks[lo])
+                merged_vecs.append(vectors[lo])
+                continue
+            # Merge: concatenate text, keep start of first / end of last
+            first, last = chunks[lo], chunks[hi - 1]
+            new_meta = {
+                **dict(first.metadata),
+                "merged_from": [
+                    chunks[i].metadata.get("chunk_index", i) for i in range(lo, hi)
+                ],
+                # Weakest link of the merged run.
+                "merge_similarity": round(float(sims[lo : hi - 1].min()), 4),
+            }
+            merged.append(
+                Chunk(
+                    text=" ".join(chunks[i].text for i in range(lo, hi)),
+                    start_char=first.start_char,
+                    end_char=last.end_char,
                     metadata=new_meta,
                 )
-                # Update the merged vector as the average
-                merged_vecs[-1] = [
-                    (a + b) / 2 for a, b in zip(merged_vecs[-1], vectors[i])
-                ]
-            else:
-                merged.append(chunks[i])
-                merged_vecs.append(vectors[i])
-
-        return merged
+            )
+            merged_vecs.append(None)
+        return merged, merged_vecs
 
     # ------------------------------------------------------------------
     # Section D — Public chunk() API
@@ -527,9 +556,101 @@ class SemanticChunker(MultilangMixin):
         3. Layer 1: ScriptSegmenter → ScriptSpan list.
         4. Layer 2: WritingSystemAdapter → per-script Chunk list.
         5. Min/max token filtering and enforcement.
-        6. EMBEDDING / HYBRID: boundary refinement via cosine similarity.
+        6. EMBEDDING / HYBRID: boundary refinement via vectorised cosine
+           similarity of adjacent chunks (runs above the threshold merge).
         7. MultilangMixin: enrich each chunk with MultilangChunkMeta.
         """
+        return self._chunk_many([text], [doc_id], extra_metadata)[0]
+
+    def _chunk_many(
+        self,
+        texts: list[str],
+        doc_ids: list[str | None],
+        extra_metadata: dict[str, Any] | None,
+    ) -> list[ChunkResult]:
+        """Run the :meth:`chunk` algorithm over several documents at once.
+
+        Layers 1-2 run per document; every embedding the documents need is
+        then requested in at most two model calls (candidate splits, then
+        merged chunks), instead of one call per document and per chunk.
+        """
+        backend = self._cfg.backend
+        prepared = [self._prepare_text(t) for t in texts]
+        layer2 = [p[2] for p in prepared]
+        vectors: list[list[np.ndarray | None]] = [[None] * len(c) for c in layer2]
+
+        # ── Step 6: Boundary refinement ───────────────────────────────────
+        use_model = False
+        if backend in (SemanticBackend.EMBEDDING, SemanticBackend.HYBRID):
+            use_model = self._load_embed_model()
+            if use_model:
+                # Single-chunk documents are only embedded when the vector
+                # is wanted later for the multilang embedding hook.
+                wanted = [
+                    i
+                    for i, c in enumerate(layer2)
+                    if len(c) > 1 or (c and self._ml_cfg.enabled)
+                ]
+                flat = [ch.text for i in wanted for ch in layer2[i]]
+                try:
+                    matrix = self._embed_texts(flat) if flat else None
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "SemanticChunker: embedding failed during boundary "
+                        "refinement (%s). Returning unrefined morphological chunks.",
+                        exc,
+                    )
+                    matrix = None
+                if matrix is not None:
+                    offset = 0
+                    for i in wanted:
+                        n = len(layer2[i])
+                        layer2[i], vectors[i] = self._merge_by_similarity(
+                            layer2[i], matrix[offset : offset + n]
+                        )
+                        offset += n
+            else:
+                logger.warning(
+                    "SemanticChunker: falling back to MORPHOLOGICAL "
+                    "because sentence-transformers is unavailable."
+                )
+
+        # Embeddings for the multilang hook: reuse refinement rows, embed
+        # merged (or not yet embedded) chunks in one call.
+        if use_model and self._ml_cfg.enabled:
+            missing = [
+                (i, j)
+                for i, vecs in enumerate(vectors)
+                for j, vec in enumerate(vecs)
+                if vec is None
+            ]
+            if missing:
+                try:
+                    fresh = self._embed_texts([layer2[i][j].text for i, j in missing])
+                    for (i, j), row in zip(missing, fresh):
+                        vectors[i][j] = row
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "SemanticChunker: per-chunk embedding failed (%s).", exc
+                    )
+
+        return [
+            self._finalize(
+                prep[0],
+                prep[1],
+                chunks,
+                vecs if use_model else None,
+                doc_id,
+                extra_metadata,
+            )
+            for prep, chunks, vecs, doc_id in zip(prepared, layer2, vectors, doc_ids)
+        ]
+
+    def _prepare_text(
+        self,
+        text: str,
+    ) -> tuple[str, PreprocessingTrace | None, list[Chunk]]:
+        """Validate, preprocess and run Layers 1-2 (steps 1-5 of :meth:`chunk`)."""
         if not isinstance(text, str):
             raise TypeError(f"text must be str, got {type(text).__name__!r}.")
         _validate_text_input(text, "SemanticChunker.chunk")
@@ -551,17 +672,19 @@ class SemanticChunker(MultilangMixin):
         if self._cfg.min_chunk_tokens > 1 or self._cfg.max_chunk_tokens is not None:
             layer2_chunks = self._enforce_token_limits(layer2_chunks)
 
-        # ── Step 6: Boundary refinement ───────────────────────────────────
+        return raw_text, preprocessing_trace, layer2_chunks
+
+    def _finalize(  # noqa: PLR0913, PLR0917
+        self,
+        raw_text: str,
+        preprocessing_trace: PreprocessingTrace | None,
+        layer2_chunks: list[Chunk],
+        vectors: list[np.ndarray | None] | None,
+        doc_id: str | None,
+        extra_metadata: dict[str, Any] | None,
+    ) -> ChunkResult:
+        """Multilang enrichment and result assembly (step 7 of :meth:`chunk`)."""
         backend = self._cfg.backend
-        if backend in (SemanticBackend.EMBEDDING, SemanticBackend.HYBRID):
-            model_ok = self._load_embed_model()
-            if model_ok:
-                layer2_chunks = self._refine_boundaries(layer2_chunks)
-            else:
-                logger.warning(
-                    "SemanticChunker: falling back to MORPHOLOGICAL "
-                    "because sentence-transformers is unavailable."
-                )
 
         # ── Step 7: Multilang enrichment ──────────────────────────────────
         final_chunks: list[Chunk] = []
@@ -600,22 +723,15 @@ class SemanticChunker(MultilangMixin):
                         ch.metadata.get("layer2_strategy") if ch.metadata else None
                     ),
                 )
-                # Attach embedding if EMBEDDING / HYBRID backend was used
-                if (
-                    backend in (SemanticBackend.EMBEDDING, SemanticBackend.HYBRID)
-                    and self._embed_model is not None
-                ):
-                    try:
-                        vec = self._embed_texts([ch.text])[0]
-                        ml_meta = ml_meta.with_embedding(
-                            vec,
-                            model_name=self._cfg.model_name,
-                            model_version=self._cfg.model_version,
-                        )
-                    except Exception as exc:  # noqa: BLE001
-                        logger.warning(
-                            "SemanticChunker: per-chunk embedding failed (%s).", exc
-                        )
+                # Attach embedding if EMBEDDING / HYBRID backend was used.
+                # Metadata stays JSON-friendly: list[float], not ndarray.
+                vec = vectors[idx] if vectors is not None else None
+                if vec is not None:
+                    ml_meta = ml_meta.with_embedding(
+                        vec.tolist(),
+                        model_name=self._cfg.model_name,
+                        model_version=self._cfg.model_version,
+                    )
 
                 enriched = self._ml_enrich_chunk(enriched, ml_meta)
 
@@ -736,6 +852,10 @@ class SemanticChunker(MultilangMixin):
     ) -> list[ChunkResult]:
         """Chunk a list of documents.
 
+        Equivalent to calling :meth:`chunk` on each text, but the embedding
+        model is called once for all candidate splits of all documents (and
+        once more for merged chunks) rather than per document.
+
         Parameters
         ----------
         texts : list[str]
@@ -764,11 +884,10 @@ class SemanticChunker(MultilangMixin):
                 f"doc_ids length ({len(doc_ids)}) must equal "
                 f"texts length ({len(texts)})."
             )
-        return [
-            self.chunk(
-                t,
-                doc_id=doc_ids[i] if doc_ids else None,
-                extra_metadata=extra_metadata,
-            )
-            for i, t in enumerate(texts)
-        ]
+        if not texts:
+            return []
+        return self._chunk_many(
+            texts,
+            list(doc_ids) if doc_ids else [None] * len(texts),
+            extra_metadata,
+        )
@@ -0,0 +1,117 @@
+"""Tests for scikitplot.corpus._chunkers._semantic (embedding-free paths)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from .._semantic import SemanticBackend, SemanticChunker, SemanticChunkerConfig
+from ..._types import Chunk, ChunkResult
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+class _FakeModel:
+    """Deterministic stand-in for a SentenceTransformer (counts calls)."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def encode(self, texts, show_progress_bar=False, convert_to_numpy=True):
+        self.calls += 1
+        # Texts mentioning "cat" point one way, everything else the other.
+        return np.array(
+            [[1.0, 0.0] if "cat" in t else [0.0, 1.0] for t in texts],
+            dtype=np.float32,
+        )
+
+
+def _chunker(**cfg) -> SemanticChunker:
+    chunker = SemanticChunker(
+        SemanticChunkerConfig(backend=SemanticBackend.EMBEDDING, **cfg)
+    )
+    chunker._embed_model = _FakeModel()
+    chunker._embed_model_loaded = True
+    return chunker
+
+
+def _chunks(*texts: str) -> list[Chunk]:
+    out, pos = [], 0
+    for i, t in enumerate(texts):
+        out.append(Chunk(text=t, start_char=pos, end_char=pos + len(t), metadata={"chunk_index": i}))
+        pos += len(t) + 1
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Vectorised similarity and merging
+# ---------------------------------------------------------------------------
+
+
+class TestSimilarity:
+    def test_adjacent_similarities_match_pairwise_cosine(self) -> None:
+        rng = np.random.default_rng(0)
+        vecs = rng.normal(size=(6, 8))
+        sims = SemanticChunker._adjacent_similarities(vecs)
+        expected = [
+            vecs[i] @ vecs[i + 1] / (np.linalg.norm(vecs[i]) * np.linalg.norm(vecs[i + 1]))
+            for i in range(5)
+        ]
+        np.testing.assert_allclose(sims, expected, rtol=1e-6)
+
+    def test_zero_vector_scores_zero(self) -> None:
+        assert SemanticChunker._cosine_similarity([0.0, 0.0], [1.0, 0.0]) == 0.0
+        assert SemanticChunker._cosine_similarity([2.0, 0.0], [1.0, 0.0]) == pytest.approx(1.0)
+
+
+class TestMergeBySimilarity:
+    def test_runs_above_threshold_are_merged(self) -> None:
+        chunker = _chunker()
+        chunks = _chunks("a cat", "the cat", "a dog", "cat again")
+        vecs = chunker._embed_texts([c.text for c in chunks])
+        merged, merged_vecs = chunker._merge_by_similarity(chunks, vecs)
+        assert [c.text for c in merged] == ["a cat the cat", "a dog", "cat again"]
+        assert merged[0].metadata["merged_from"] == [0, 1]
+        assert merged[0].metadata["merge_similarity"] == pytest.approx(1.0)
+        assert merged_vecs[0] is None
+        np.testing.assert_array_equal(merged_vecs[1], vecs[2])
+
+    def test_breakpoint_percentile_overrides_threshold(self) -> None:
+        chunker = _chunker(similarity_threshold=1.0, breakpoint_percentile=100.0)
+        chunks = _chunks("a cat", "a dog", "a cow")
+        vecs = chunker._embed_texts([c.text for c in chunks])
+        merged, _ = chunker._merge_by_similarity(chunks, vecs)
+        assert len(merged) == 1
+
+    def test_invalid_percentile_rejected(self) -> None:
+        with pytest.raises(ValueError, match="breakpoint_percentile"):
+            SemanticChunker(SemanticChunkerConfig(breakpoint_percentile=101.0))
+
+
+# ---------------------------------------------------------------------------
+# Batch API
+# ---------------------------------------------------------------------------
+
+
+class TestChunkBatch:
+    def test_batch_embeds_in_at_most_two_model_calls(self) -> None:
+        chunker = _chunker()
+        texts = [f"Document {i} about a cat. Another sentence here." for i in range(5)]
+        results = chunker.chunk_batch(texts, doc_ids=[f"d{i}" for i in range(5)])
+        assert len(results) == 5
+        assert all(isinstance(r, ChunkResult) for r in results)
+        assert [r.metadata["doc_id"] for r in results] == [f"d{i}" for i in range(5)]
+        assert chunker._embed_model.calls <= 2
+
+    def test_batch_matches_single_chunk_calls(self) -> None:
+        texts = ["One cat sat. One dog ran.", "Plain text only."]
+        batch = _chunker().chunk_batch(texts)
+        single = [_chunker().chunk(t) for t in texts]
+        assert [[c.text for c in r.chunks] for r in batch] == [
+            [c.text for c in r.chunks] for r in single
+        ]
+
+    def test_empty_batch(self) -> None:
+        assert _chunker().chunk_batch([]) == []
@@ -21,10 +21,13 @@ from __future__ import annotations
 from . import (
     _embedding,
     _multimodal_embedding,
+    _store,
 )
 from ._embedding import *  # noqa: F403
 from ._multimodal_embedding import *  # noqa: F403
+from ._store import *  # noqa: F403
 
 __all__ = []
 __all__ += _embedding.__all__
 __all__ += _multimodal_embedding.__all__
+__all__ += _store.__all__
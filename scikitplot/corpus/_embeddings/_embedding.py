@@ -49,6 +49,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import pathlib
+import sqlite3
 import threading
 from dataclasses import dataclass, field
 from timeit import default_timer as timer
@@ -67,6 +68,7 @@ import numpy as np
 import numpy.typing as npt
 
 from .._atomic import atomic_write_path
+from ._store import EmbeddingStore, text_keys
 
 logger = logging.getLogger(__name__)
 
@@ -445,6 +447,20 @@ class EmbeddingEngine:
     device : str or None, optional
         PyTorch device for sentence_transformers (``"cpu"``, ``"cuda"``,
         ``"mps"``). ``None`` lets the library choose. Default: ``None``.
+    cache_granularity : {"batch", "text"}, optional
+        Cache unit of :meth:`embed_with_cache`. ``"batch"`` (default) stores
+        one ``.npy`` file per exact text list. ``"text"`` keys every text
+        separately in an :class:`~scikitplot.corpus._embeddings._store.EmbeddingStore`
+        under ``cache_dir / "store"``, so only new or changed texts are
+        embedded on a refresh.
+
+        .. versionadded:: 0.5
+    cache_max_rows : int or None, optional
+        With ``cache_granularity="text"``, keep at most this many vectors
+        per model; least recently used ones are evicted. ``None`` (default)
+        is unbounded.
+
+        .. versionadded:: 0.5
 
     Attributes
     ----------
@@ -535,9 +551,12 @@ class EmbeddingEngine:
     show_progress_bar: bool = field(default=False)
     device: str | None = field(default=None)
     model_revision: str = field(default="")
+    cache_granularity: str = field(default="batch")
+    cache_max_rows: int | None = field(default=None)
 
     # Internal: lazily-initialised embed function + lock
     _embed_fn: EmbedFn | None = field(default=None, init=False, repr=False)
+    _store: EmbeddingStore | None = field(default=None, init=False, repr=False)
     _lock: threading.Lock = field(
         default_factory=threading.Lock, init=False, repr=False
     )
@@ -572,6 +591,11 @@ class EmbeddingEngine:
                 f" {[d.__name__ for d in _FLOAT_DTYPES]};"
                 f" got {self.dtype!r}."
             )
+        if self.cache_granularity not in ("batch", "text"):
+            raise ValueError(
+                "EmbeddingEngine: cache_granularity must be 'batch' or 'text';"
+                f" got {self.cache_granularity!r}."
+            )
         if self.cache_dir is None:
             object.__setattr__(self, "cache_dir", DEFAULT_CACHE_DIR)
 
@@ -690,6 +714,9 @@ class EmbeddingEngine:
         if not self.enable_cache:
             return self.embed(texts), False
 
+        if self.cache_granularity == "text":
+            return self._embed_with_store(texts)
+
         # Content-addressed key: identity is the texts + model/backend/params,
         # NOT the source path or mtime. ``input_path`` is advisory (diagnostics
         # / provenance) and no longer affects cache identity, so a missing or
@@ -776,6 +803,86 @@ class EmbeddingEngine:
     # Private
     # ------------------------------------------------------------------
 
+    def _embed_with_store(
+        self,
+        texts: list[str],
+    ) -> tuple[npt.NDArray[np.float32], bool]:
+        """
+        Per-text cached embedding: embed only the texts not in the store.
+
+        Store failures degrade to plain :meth:`embed` with a warning, like
+        the batch cache.
+
+        Returns
+        -------
+        embeddings : numpy.ndarray
+            Array of shape ``(len(texts), dim)``.
+        from_cache : bool
+            ``True`` if every row was served from the store.
+        """
+        # The batch key over zero texts identifies everything but the text.
+        namespace = _make_cache_key(
+            self.model_name,
+            [],
+            normalize=self.normalize,
+            dtype=np.dtype(self.dtype).name,
+            backend=self.backend,
+            model_revision=self.model_revision,
+        )
+        keys = text_keys(namespace, texts)
+        try:
+            store = self._get_store(namespace)
+            cached, found = store.get(keys)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            logger.warning(
+                "EmbeddingEngine: embedding store unavailable — embedding all"
+                " %d texts. %s",
+                len(texts),
+                exc,
+            )
+            return self.embed(texts), False
+
+        if found.all():
+            logger.info("EmbeddingEngine: loaded %d embeddings from store.", len(texts))
+            return cached.astype(self.dtype, copy=False), True
+
+        missing = np.flatnonzero(~found)
+        # Equal texts share a key: embed each distinct missing text once.
+        first = {}
+        for i in missing:
+            first.setdefault(keys[i], i)
+        fresh = self.embed([texts[i] for i in first.values()])
+        slot = {key: j for j, key in enumerate(first)}
+        if cached is None:
+            cached = np.zeros((len(texts), fresh.shape[1]), dtype=fresh.dtype)
+        result = cached.astype(self.dtype, copy=False)
+        result[missing] = fresh[[slot[keys[i]] for i in missing]]
+        logger.info(
+            "EmbeddingEngine: %d of %d embeddings served from store.",
+            len(texts) - len(missing),
+            len(texts),
+        )
+        try:
+            store.put(list(first), fresh)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            logger.warning("EmbeddingEngine: could not update embedding store. %s", exc)
+        return result, False
+
+    def _get_store(self, namespace: str) -> EmbeddingStore:
+        """Return the per-text store for ``namespace`` (created lazily)."""
+        directory = pathlib.Path(self.cache_dir) / "store" / namespace
+        store = self._store
+        if store is not None and store.directory == directory:
+            return store
+        with self._lock:
+            store = EmbeddingStore(
+                directory,
+                dtype=self.dtype,
+                max_rows=self.cache_max_rows,
+            )
+            object.__setattr__(self, "_store", store)
+        return store
+
     def _get_embed_fn(self) -> EmbedFn:
         """
         Lazily initialise and return the backend embed function.
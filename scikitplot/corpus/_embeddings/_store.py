@@ -0,0 +1,492 @@
+# scikitplot/corpus/_embeddings/_store.py
+#
+# flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+scikitplot.corpus._embeddings._store
+=====================================
+Per-text, content-addressed embedding store.
+
+The batch cache of :class:`~scikitplot.corpus._embeddings.EmbeddingEngine`
+keys one ``.npy`` file by the *whole* text list, so changing a single chunk in
+a 100k-chunk corpus recomputes every vector. :class:`EmbeddingStore` keys each
+row by its own text instead, so an incremental refresh embeds only new or
+changed chunks.
+
+Layout (one directory per model identity)::
+
+    index.sqlite        key -> row, last-use time; store metadata
+    vectors-<gen>.bin   append-only (n_rows, dim) matrix, memory-mapped
+
+Guarantees:
+
+- **Append-only data.** New rows are appended under SQLite's write lock, then
+  the file is ``fsync``-ed *before* the index rows are committed, so a crash
+  never leaves the index pointing at unwritten data. Bytes past the committed
+  row count are ignored and overwritten by the next append.
+- **Consistent reads.** Index lookups and matrix reads happen inside one read
+  transaction; compaction publishes a *new* generation file and switches to
+  it in a single commit, so readers never mix old row numbers with a new file.
+- **Bounded size.** ``max_rows`` evicts least recently used rows; once dead
+  rows exceed ``compact_ratio`` of the file it is compacted.
+
+Python compatibility:
+
+Python 3.8-3.15. ``numpy`` is required; :mod:`sqlite3` is standard library.
+"""  # noqa: D205, D400
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import logging
+import os
+import pathlib
+import sqlite3
+import time
+from typing import Any, Iterator, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from .._atomic import atomic_write_path
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "EmbeddingStore",
+]
+
+# SQLite's historical default limit on bound parameters per statement.
+_SQL_CHUNK = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    name  TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rows (
+    key       TEXT PRIMARY KEY,
+    row       INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rows_last_used ON rows (last_used);
+"""
+
+
+def text_keys(namespace: str, texts: Sequence[str]) -> list[str]:
+    """
+    Content-addressed key of every text within ``namespace``.
+
+    Parameters
+    ----------
+    namespace : str
+        Identity of everything but the text that affects the vector (model,
+        revision, backend, dtype, normalisation); see
+        :func:`~scikitplot.corpus._embeddings._embedding._make_cache_key`.
+    texts : sequence of str
+        Texts to key.
+
+    Returns
+    -------
+    list of str
+        32-character hex keys, one per text, in input order.
+    """
+    prefix = hashlib.sha256()
+    prefix.update(namespace.encode("utf-8"))
+    prefix.update(b"\x1e")
+    keys = []
+    for t in texts:
+        h = prefix.copy()
+        h.update(t.encode("utf-8"))
+        keys.append(h.hexdigest()[:32])
+    return keys
+
+
+def _chunks(seq: Sequence[Any], size: int = _SQL_CHUNK) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(seq), size):
+        yield seq[start : start + size]
+
+
+def _write_live_rows(
+    tmp: pathlib.Path, matrix: npt.NDArray[Any], live: Sequence[tuple[str, int]]
+) -> None:
+    """Write the ``live`` rows of ``matrix``, in order, to ``tmp``."""
+    with open(tmp, "wb") as fh:
+        for chunk in _chunks(live, 65536):
+            rows = np.fromiter((r for _, r in chunk), dtype=np.int64)
+            fh.write(np.ascontiguousarray(matrix[rows]).tobytes())
+
+
+class EmbeddingStore:
+    """
+    Append-only, memory-mapped per-text embedding rows with an LRU index.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Store directory (created if absent). Use one directory per model
+        identity: every row must have the same dimension and meaning.
+    dtype : numpy.dtype, optional
+        Row dtype. Default: ``numpy.float32``.
+    max_rows : int or None, optional
+        Keep at most this many rows; least recently used rows are evicted
+        after each :meth:`put`. ``None`` (default) is unbounded.
+    compact_ratio : float, optional
+        Compact the data file once dead (evicted) rows exceed this fraction
+        of it. Default: ``0.5``.
+    touch_interval : float, optional
+        Minimum age in seconds before :meth:`get` refreshes the LRU clock of
+        a row. Reads of recently used rows skip the write transaction, so
+        eviction order is only exact to within this interval. ``0`` refreshes
+        on every read. Default: ``60.0``.
+
+    Raises
+    ------
+    ValueError
+        If ``max_rows < 1``, ``compact_ratio`` is not in ``(0, 1]`` or
+        ``touch_interval < 0``.
+
+    See Also
+    --------
+    scikitplot.corpus._embeddings.EmbeddingEngine : Uses this store when
+        ``cache_granularity="text"``.
+
+    Notes
+    -----
+    **Thread and process safety:** every operation opens its own SQLite
+    connection; writers serialise on SQLite's write lock, so several
+    processes can share one store directory.
+
+    Examples
+    --------
+    >>> store = EmbeddingStore(tmp_path / "store")
+    >>> keys = text_keys("model-ns", ["a", "b"])
+    >>> store.put(keys, np.eye(2, dtype=np.float32))
+    >>> vectors, found = store.get(keys + ["missing"])
+    >>> found.tolist()
+    [True, True, False]
+    """
+
+    def __init__(
+        self,
+        directory: str | pathlib.Path,
+        *,
+        dtype: Any = np.float32,
+        max_rows: int | None = None,
+        compact_ratio: float = 0.5,
+        touch_interval: float = 60.0,
+    ) -> None:
+        if max_rows is not None and max_rows < 1:
+            raise ValueError(
+                f"EmbeddingStore: max_rows must be >= 1; got {max_rows!r}."
+            )
+        if not 0.0 < compact_ratio <= 1.0:
+            raise ValueError(
+                "EmbeddingStore: compact_ratio must be in (0, 1];"
+                f" got {compact_ratio!r}."
+            )
+        if touch_interval < 0:
+            raise ValueError(
+                "EmbeddingStore: touch_interval must be >= 0;"
+                f" got {touch_interval!r}."
+            )
+        self.directory = pathlib.Path(directory)
+        self.dtype = np.dtype(dtype)
+        self.max_rows = max_rows
+        self.compact_ratio = float(compact_ratio)
+        self.touch_interval = float(touch_interval)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self._transaction("IMMEDIATE") as conn:
+            # executescript() would commit implicitly; run statements singly.
+            for stmt in _SCHEMA.split(";"):
+                if stmt.strip():
+                    conn.execute(stmt)
+            conn.execute(
+                "INSERT OR IGNORE INTO meta VALUES ('dtype', ?)", (self.dtype.name,)
+            )
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('file', 'vectors-0.bin')")
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('n_rows', '0')")
+            stored = self._meta(conn)["dtype"]
+        if stored != self.dtype.name:
+            raise ValueError(
+                f"EmbeddingStore: {self.directory} holds {stored} rows, "
+                f"not {self.dtype.name}."
+            )
+
+    # ------------------------------------------------------------------
+    # SQLite plumbing
+    # ------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def _transaction(self, mode: str = "DEFERRED") -> Iterator[sqlite3.Connection]:
+        """Run a block in one explicit transaction (committed on success)."""
+        conn = sqlite3.connect(
+            str(self.directory / "index.sqlite"), timeout=60.0, isolation_level=None
+        )
+        try:
+            conn.execute(f"BEGIN {mode}")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection) -> dict[str, str]:
+        return dict(conn.execute("SELECT name, value FROM meta"))
+
+    @staticmethod
+    def _select(
+        conn: sqlite3.Connection, keys: Sequence[str], columns: str
+    ) -> Iterator[tuple[Any, ...]]:
+        """Yield ``(key, *columns)`` for the stored ``keys``, chunk by chunk."""
+        for chunk in _chunks(keys):
+            marks = ",".join("?" * len(chunk))
+            yield from conn.execute(
+                f"SELECT key, {columns} FROM rows WHERE key IN ({marks})",  # noqa: S608
+                list(chunk),
+            )
+
+    def _lookup(self, conn: sqlite3.Connection, keys: Sequence[str]) -> dict[str, int]:
+        return dict(self._select(conn, keys, "row"))
+
+    def _matrix(self, meta: dict[str, str]) -> npt.NDArray[Any] | None:
+        """Read-only memmap of the committed rows, or ``None`` when empty."""
+        n_rows = int(meta["n_rows"])
+        if n_rows == 0 or "dim" not in meta:
+            return None
+        return np.memmap(
+            self.directory / meta["file"],
+            dtype=self.dtype,
+            mode="r",
+            shape=(n_rows, int(meta["dim"])),
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def dim(self) -> int | None:
+        """Row dimension, or ``None`` before the first :meth:`put`."""
+        with self._transaction() as conn:
+            meta = self._meta(conn)
+        return int(meta["dim"]) if "dim" in meta else None
+
+    def get(
+        self,
+        keys: Sequence[str],
+        *,
+        touch: bool = True,
+    ) -> tuple[npt.NDArray[Any] | None, npt.NDArray[np.bool_]]:
+        """
+        Fetch the rows stored under ``keys``.
+
+        Parameters
+        ----------
+        keys : sequence of str
+            Row keys (see :func:`text_keys`).
+        touch : bool, optional
+            Refresh the LRU clock of the rows found that were last used more
+            than ``touch_interval`` seconds ago. Default: ``True``.
+
+        Returns
+        -------
+        vectors : numpy.ndarray or None
+            ``(len(keys), dim)`` array; rows of missing keys are zero.
+            ``None`` while the store is empty.
+        found : numpy.ndarray of bool
+            Per-key hit mask.
+        """
+        found = np.zeros(len(keys), dtype=bool)
+        rows: dict[str, int] = {}
+        stale: list[str] = []
+        with self._transaction() as conn:
+            meta = self._meta(conn)
+            cutoff = time.time() - self.touch_interval
+            for key, row, last_used in self._select(conn, keys, "row, last_used"):
+                rows[key] = row
+                if last_used <= cutoff:
+                    stale.append(key)
+            matrix = self._matrix(meta)
+            if matrix is None:
+                return None, found
+            out = np.zeros((len(keys), matrix.shape[1]), dtype=self.dtype)
+            positions = [i for i, k in enumerate(keys) if k in rows]
+            if positions:
+                src = np.fromiter((rows[keys[i]] for i in positions), dtype=np.int64)
+                out[positions] = matrix[src]
+                found[positions] = True
+            del matrix
+        # Only rows whose clock is stale need the write lock.
+        if touch and stale:
+            now = time.time()
+            with self._transaction("IMMEDIATE") as conn:
+                for chunk in _chunks(stale):
+                    marks = ",".join("?" * len(chunk))
+                    sql = f"UPDATE rows SET last_used = ? WHERE key IN ({marks})"  # noqa: S608
+                    conn.execute(sql, [now, *chunk])
+        return out, found
+
+    def put(self, keys: Sequence[str], vectors: npt.ArrayLike) -> int:
+        """
+        Append rows for the keys not stored yet.
+
+        Parameters
+        ----------
+        keys : sequence of str
+            Row keys, one per vector. Duplicates and already stored keys are
+            skipped (content addressing makes their rows identical).
+        vectors : array-like of shape (len(keys), dim)
+            Row values.
+
+        Returns
+        -------
+        int
+            Number of rows appended.
+
+        Raises
+        ------
+        ValueError
+            If shapes disagree with ``keys`` or with the stored dimension.
+        """
+        arr = np.ascontiguousarray(np.asarray(vectors), dtype=self.dtype)
+        if arr.ndim != 2 or arr.shape[0] != len(keys):  # noqa: PLR2004
+            raise ValueError(
+                f"EmbeddingStore.put: expected ({len(keys)}, dim) vectors;"
+                f" got shape {arr.shape}."
+            )
+        if not keys:
+            return 0
+        with self._transaction("IMMEDIATE") as conn:
+            meta = self._meta(conn)
+            dim = int(meta.get("dim", arr.shape[1]))
+            if arr.shape[1] != dim:
+                raise ValueError(
+                    f"EmbeddingStore.put: vectors have dim {arr.shape[1]};"
+                    f" store holds dim {dim}."
+                )
+            present = self._lookup(conn, keys)
+            first: dict[str, int] = {}
+            for i, k in enumerate(keys):
+                if k not in present and k not in first:
+                    first[k] = i
+            if not first:
+                return 0
+            n_rows = int(meta["n_rows"])
+            new = arr[list(first.values())]
+            path = self.directory / meta["file"]
+            path.touch()
+            # Overwrite anything past the committed rows (an interrupted
+            # append), then make the data durable before the index sees it.
+            with open(path, "r+b") as fh:
+                fh.seek(n_rows * dim * self.dtype.itemsize)
+                fh.write(new.tobytes())
+                fh.truncate()
+                fh.flush()
+                os.fsync(fh.fileno())
+            now = time.time()
+            conn.executemany(
+                "INSERT INTO rows VALUES (?, ?, ?)",
+                [(k, n_rows + j, now) for j, k in enumerate(first)],
+            )
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('dim', ?)", (str(dim),))
+            conn.execute(
+                "UPDATE meta SET value = ? WHERE name = 'n_rows'",
+                (str(n_rows + len(first)),),
+            )
+        if self.max_rows is not None:
+            self.evict(self.max_rows)
+        return len(first)
+
+    def evict(self, max_rows: int) -> int:
+        """
+        Drop least recently used rows until at most ``max_rows`` remain.
+
+        Compacts the data file afterwards when dead rows exceed
+        ``compact_ratio`` of it.
+
+        Returns
+        -------
+        int
+            Number of rows evicted.
+        """
+        with self._transaction("IMMEDIATE") as conn:
+            (live,) = conn.execute("SELECT COUNT(*) FROM rows").fetchone()
+            excess = live - max(0, int(max_rows))
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM rows WHERE key IN ("
+                    "SELECT key FROM rows ORDER BY last_used ASC, row ASC LIMIT ?)",
+                    (excess,),
+                )
+            n_rows = int(self._meta(conn)["n_rows"])
+        excess = max(excess, 0)
+        if excess:
+            logger.debug(
+                "EmbeddingStore: evicted %d rows from %s.", excess, self.directory
+            )
+        if n_rows and (n_rows - (live - excess)) / n_rows > self.compact_ratio:
+            self.compact()
+        return excess
+
+    def compact(self) -> None:
+        """Rewrite the data file with live rows only (new generation file)."""
+        with self._transaction("IMMEDIATE") as conn:
+            meta = self._meta(conn)
+            live: list[tuple[str, int]] = conn.execute(
+                "SELECT key, row FROM rows ORDER BY row"
+            ).fetchall()
+            matrix = self._matrix(meta)
+            old = self.directory / meta["file"]
+            gen = int(meta["file"].split("-")[1].split(".")[0]) + 1
+            name = f"vectors-{gen}.bin"
+            if matrix is not None:
+                atomic_write_path(
+                    self.directory / name,
+                    functools.partial(_write_live_rows, matrix=matrix, live=live),
+                )
+            del matrix
+            conn.executemany(
+                "UPDATE rows SET row = ? WHERE key = ?",
+                [(j, k) for j, (k, _) in enumerate(live)],
+            )
+            conn.execute("UPDATE meta SET value = ? WHERE name = 'file'", (name,))
+            conn.execute(
+                "UPDATE meta SET value = ? WHERE name = 'n_rows'", (str(len(live)),)
+            )
+        # OSError: still mapped elsewhere (Windows) or never written.
+        with contextlib.suppress(OSError):
+            old.unlink()
+        logger.debug(
+            "EmbeddingStore: compacted %s to %d rows.", self.directory, len(live)
+        )
+
+    @property
+    def n_dead(self) -> int:
+        """Rows in the data file that no key points to any more."""
+        with self._transaction() as conn:
+            n_rows = int(self._meta(conn)["n_rows"])
+            (live,) = conn.execute("SELECT COUNT(*) FROM rows").fetchone()
+        return n_rows - live
+
+    def __len__(self) -> int:
+        """Return the number of live rows."""
+        with self._transaction() as conn:
+            (live,) = conn.execute("SELECT COUNT(*) FROM rows").fetchone()
+        return int(live)
+
+    def __repr__(self) -> str:
+        """Return ``EmbeddingStore(directory=..., dtype=..., max_rows=...)``."""
+        return (
+            f"EmbeddingStore(directory={str(self.directory)!r},"
+            f" dtype={self.dtype.name!r}, max_rows={self.max_rows!r})"
+        )
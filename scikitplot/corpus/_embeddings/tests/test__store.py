@@ -0,0 +1,206 @@
+# corpus/_embeddings/tests/test__store.py
+#
+# flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests for scikitplot.corpus._embeddings._store.
+
+Covers
+------
+- text_keys: determinism, namespace separation
+- EmbeddingStore.put/get: round trip, duplicate and existing keys skipped,
+  dimension/shape validation, dtype pinning, reopen from disk
+- Torn appends: bytes past the committed row count are overwritten
+- EmbeddingStore.evict/compact: LRU order, dead-row accounting, new
+  generation file, values preserved
+- EmbeddingStore.get: only rows older than touch_interval are touched
+- EmbeddingEngine(cache_granularity="text"): only misses are embedded,
+  duplicates embedded once, from_cache flag, validation
+"""
+
+from __future__ import annotations
+
+import pathlib
+from typing import Any
+
+import numpy as np
+import pytest
+
+from .._embedding import EmbeddingEngine
+from .._store import EmbeddingStore, text_keys
+
+
+def _vecs(n: int, dim: int = 4, start: int = 0) -> np.ndarray:
+    return np.arange(start * dim, (start + n) * dim, dtype=np.float32).reshape(n, dim)
+
+
+# ===========================================================================
+# text_keys
+# ===========================================================================
+
+
+class TestTextKeys:
+    def test_deterministic_and_distinct(self) -> None:
+        a = text_keys("ns", ["x", "y", "x"])
+        assert a == text_keys("ns", ["x", "y", "x"])
+        assert a[0] == a[2] != a[1]
+        assert len(a[0]) == 32  # noqa: PLR2004
+
+    def test_namespace_changes_key(self) -> None:
+        assert text_keys("a", ["x"]) != text_keys("b", ["x"])
+
+
+# ===========================================================================
+# EmbeddingStore
+# ===========================================================================
+
+
+class TestEmbeddingStore:
+    def test_round_trip_and_misses(self, tmp_path: pathlib.Path) -> None:
+        store = EmbeddingStore(tmp_path)
+        assert store.get(["k"])[0] is None and store.dim is None
+        assert store.put(["a", "b"], _vecs(2)) == 2  # noqa: PLR2004
+        vectors, found = store.get(["b", "zz", "a"])
+        assert found.tolist() == [True, False, True]
+        np.testing.assert_array_equal(vectors[0], _vecs(2)[1])
+        np.testing.assert_array_equal(vectors[1], 0)
+        np.testing.assert_array_equal(vectors[2], _vecs(2)[0])
+        assert store.dim == 4  # noqa: PLR2004
+
+    def test_existing_and_duplicate_keys_skipped(self, tmp_path: pathlib.Path) -> None:
+        store = EmbeddingStore(tmp_path)
+        store.put(["a"], _vecs(1))
+        assert store.put(["a", "b", "b"], _vecs(3, start=5)) == 1
+        assert len(store) == 2  # noqa: PLR2004
+        vectors, _ = store.get(["a", "b"])
+        np.testing.assert_array_equal(vectors, np.vstack([_vecs(1), _vecs(1, start=6)]))
+
+    def test_validation(self, tmp_path: pathlib.Path) -> None:
+        store = EmbeddingStore(tmp_path)
+        store.put(["a"], _vecs(1))
+        with pytest.raises(ValueError, match="dim"):
+            store.put(["b"], _vecs(1, dim=3))
+        with pytest.raises(ValueError, match="vectors"):
+            store.put(["b", "c"], _vecs(1))
+        with pytest.raises(ValueError, match="float32"):
+            EmbeddingStore(tmp_path, dtype=np.float64)
+        with pytest.raises(ValueError):
+            EmbeddingStore(tmp_path / "x", max_rows=0)
+        with pytest.raises(ValueError):
+            EmbeddingStore(tmp_path / "y", compact_ratio=0.0)
+        with pytest.raises(ValueError, match="touch_interval"):
+            EmbeddingStore(tmp_path / "z", touch_interval=-1.0)
+
+    def test_reopen_and_torn_append(self, tmp_path: pathlib.Path) -> None:
+        EmbeddingStore(tmp_path).put(["a"], _vecs(1))
+        data = next(tmp_path.glob("vectors-*.bin"))
+        with open(data, "ab") as fh:  # an append that never committed
+            fh.write(b"\xff" * 7)
+        store = EmbeddingStore(tmp_path)
+        store.put(["b"], _vecs(1, start=1))
+        assert data.stat().st_size == 2 * 4 * 4
+        vectors, found = store.get(["a", "b"])
+        assert found.all()
+        np.testing.assert_array_equal(vectors, _vecs(2))
+
+    def test_lru_eviction_and_compaction(self, tmp_path: pathlib.Path) -> None:
+        store = EmbeddingStore(tmp_path, compact_ratio=0.9, touch_interval=0.0)
+        keys = [f"k{i}" for i in range(10)]
+        store.put(keys, _vecs(10))
+        store.get(keys[:3])  # most recently used
+        assert store.evict(5) == 5  # noqa: PLR2004
+        assert store.n_dead == 5  # noqa: PLR2004
+        _, found = store.get(keys, touch=False)
+        assert found[:3].all() and found.sum() == 5  # noqa: PLR2004
+        survivors = [k for k, f in zip(keys, found) if f]
+        before, _ = store.get(survivors)
+        store.compact()
+        assert store.n_dead == 0
+        assert [p.name for p in tmp_path.glob("vectors-*.bin")] == ["vectors-1.bin"]
+        after, found = store.get(survivors)
+        assert found.all()
+        np.testing.assert_array_equal(after, before)
+        store.put(["new"], _vecs(1, start=42))
+        np.testing.assert_array_equal(store.get(["new"])[0][0], _vecs(1, start=42)[0])
+
+    def test_get_touches_only_stale_rows(self, tmp_path: pathlib.Path) -> None:
+        store = EmbeddingStore(tmp_path, touch_interval=3600.0)
+        store.put(["a", "b"], _vecs(2))
+        with store._transaction() as conn:
+            conn.execute("UPDATE rows SET last_used = 0 WHERE key = 'a'")
+        store.get(["a", "b"])
+        with store._transaction() as conn:
+            used = dict(conn.execute("SELECT key, last_used FROM rows"))
+        assert used["a"] > 0
+        store.get(["b"])  # fresh: no write transaction, clock unchanged
+        with store._transaction() as conn:
+            assert dict(conn.execute("SELECT key, last_used FROM rows")) == used
+
+    def test_max_rows_evicts_on_put(self, tmp_path: pathlib.Path) -> None:
+        store = EmbeddingStore(tmp_path, max_rows=4)
+        store.put([f"k{i}" for i in range(6)], _vecs(6))
+        assert len(store) == 4  # noqa: PLR2004
+
+
+# ===========================================================================
+# EmbeddingEngine integration
+# ===========================================================================
+
+
+def _counting_engine(
+    tmp_path: pathlib.Path, **kwargs: Any
+) -> tuple[EmbeddingEngine, list]:
+    calls: list[list[str]] = []
+
+    def _fn(texts: list[str]) -> np.ndarray:
+        calls.append(list(texts))
+        return np.array([[len(t), ord(t[-1]), 1.0] for t in texts], dtype=np.float32)
+
+    engine = EmbeddingEngine(
+        backend="custom",
+        custom_fn=_fn,
+        cache_dir=tmp_path,
+        cache_granularity="text",
+        **kwargs,
+    )
+    return engine, calls
+
+
+class TestEmbeddingEngineTextCache:
+    def test_only_changed_texts_are_embedded(self, tmp_path: pathlib.Path) -> None:
+        engine, calls = _counting_engine(tmp_path)
+        texts = [f"chunk {i}" for i in range(50)]
+        first, cached = engine.embed_with_cache(texts, tmp_path / "src.txt")
+        assert cached is False and calls == [texts]
+        texts[7] = "edited!"
+        second, cached = engine.embed_with_cache(
+            texts + ["chunk 3"], tmp_path / "src.txt"
+        )
+        assert cached is False and calls[1] == ["edited!"]
+        np.testing.assert_array_equal(second[:7], first[:7])
+        np.testing.assert_array_equal(second[-1], first[3])
+        third, cached = engine.embed_with_cache(texts, tmp_path / "src.txt")
+        assert cached is True and len(calls) == 2  # noqa: PLR2004
+        np.testing.assert_array_equal(third, second[:-1])
+        assert not list(tmp_path.glob("*.npy"))  # no batch files
+
+    def test_duplicate_misses_embedded_once(self, tmp_path: pathlib.Path) -> None:
+        engine, calls = _counting_engine(tmp_path)
+        result, _ = engine.embed_with_cache(["a", "b", "a"], tmp_path / "src")
+        assert calls == [["a", "b"]]
+        np.testing.assert_array_equal(result[0], result[2])
+
+    def test_model_identity_separates_stores(self, tmp_path: pathlib.Path) -> None:
+        engine, _ = _counting_engine(tmp_path)
+        other, calls = _counting_engine(tmp_path, model_name="other", normalize=False)
+        engine.embed_with_cache(["x"], tmp_path / "src")
+        _, cached = other.embed_with_cache(["x"], tmp_path / "src")
+        assert cached is False and calls == [["x"]]
+
+    def test_rejects_unknown_granularity(self) -> None:
+        with pytest.raises(ValueError, match="cache_granularity"):
+            EmbeddingEngine(
+                backend="custom", custom_fn=lambda t: None, cache_granularity="row"
+            )
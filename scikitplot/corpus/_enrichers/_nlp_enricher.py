@@ -58,9 +58,13 @@ from __future__ import annotations
 import logging
 import math
 import re
+import threading
 import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import (  # noqa: F401
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
@@ -78,6 +82,9 @@ from .._chunkers._custom_tokenizer import (
     TokenizerProtocol,
 )
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -238,6 +245,86 @@ _SNOWBALL_LANGUAGES: frozenset[str] = frozenset(
 )
 
 
+# ---------------------------------------------------------------------------
+# Shared lookup caches (per process, shared by every NLPEnricher instance)
+# ---------------------------------------------------------------------------
+
+#: Stopword sets keyed by ``"|".join(sorted(langs))``.  Loading NLTK stopword
+#: lists is the slowest part of language resolution; every enricher instance
+#: (and every call) reuses the same frozensets.
+_SHARED_STOPWORDS: dict[str, frozenset[str]] = {}
+
+#: ``(backend_key, token) -> lemma/stem`` for the built-in NLTK backends.
+#: Natural-language token streams are Zipfian, so a small table removes most
+#: stemmer/lemmatiser calls.  Custom backends are never cached.
+_SHARED_LOOKUP: dict[tuple[str, str], str] = {}
+_SHARED_LOOKUP_MAX = 500_000
+_SHARED_LOCK = threading.Lock()
+
+#: Built-in stemmers that can run in a worker process (config is picklable).
+_POOLABLE_STEMMERS = frozenset({"porter", "snowball", "lancaster"})
+
+
+def _cached_lookup(
+    backend_key: str,
+    tokens: list[str],
+    backend: Any,
+    fn: Callable[[str], str],
+) -> list[str]:
+    """Map *tokens* through *fn*, memoising results in :data:`_SHARED_LOOKUP`.
+
+    Only genuine NLTK backends are memoised; anything else (a subclass from
+    another package, a test double) is called directly.
+    """
+    if not type(backend).__module__.startswith("nltk."):
+        return [fn(tok) for tok in tokens]
+    out: list[str] = []
+    fresh: dict[tuple[str, str], str] = {}
+    for tok in tokens:
+        key = (backend_key, tok)
+        value = _SHARED_LOOKUP.get(key)
+        if value is None:
+            value = fresh.get(key)
+            if value is None:
+                value = fresh[key] = fn(tok)
+        out.append(value)
+    if fresh:
+        with _SHARED_LOCK:
+            if len(_SHARED_LOOKUP) + len(fresh) > _SHARED_LOOKUP_MAX:
+                _SHARED_LOOKUP.clear()
+            _SHARED_LOOKUP.update(fresh)
+    return out
+
+
+#: Enrichers built inside pool workers, keyed by their reduced config.
+_WORKER_ENRICHERS: dict[str, NLPEnricher] = {}
+
+
+def _morphology_worker(
+    cfg_kwargs: dict[str, Any],
+    jobs: list[tuple[str, list[str]]],
+) -> list[tuple[list[str] | None, list[str] | None, list[str] | None]]:
+    """Run stemming / NLTK lemmatisation / YAKE for *jobs* in a pool worker.
+
+    *cfg_kwargs* is the reduced, picklable :class:`EnricherConfig` built by
+    :meth:`NLPEnricher._pool_config`; only the stages it enables are run.
+    """
+    key = repr(sorted(cfg_kwargs.items()))
+    enricher = _WORKER_ENRICHERS.get(key)
+    if enricher is None:
+        enricher = _WORKER_ENRICHERS[key] = NLPEnricher(EnricherConfig(**cfg_kwargs))
+    cfg = enricher.config
+    results = []
+    for text, tokens in jobs:
+        stems = enricher._stem(tokens) if cfg.stemmer else None
+        lemmas = enricher._lemmatize(tokens, None) if cfg.lemmatizer else None
+        keywords = (
+            enricher._keywords_yake(text) if cfg.keyword_extractor == "yake" else None
+        )
+        results.append((stems, lemmas, keywords))
+    return results
+
+
 # =====================================================================
 # Configuration
 # =====================================================================
@@ -361,6 +448,31 @@ class EnricherConfig:
         When ``True``, store lexical diversity (unique/total tokens) in
         document metadata.  Useful for LLM context quality assessment.
 
+    idf_source : str
+        IDF used by ``keyword_extractor="tfidf"`` and ``save_token_scores``:
+
+        * ``"document"`` (default) — within-document approximation, no
+          background corpus needed.
+        * ``"corpus"`` — BM25-style IDF from a document-frequency table
+          the enricher accumulates over every document it enriches
+          (updated in one pass per :meth:`NLPEnricher.enrich_documents`
+          call, before any keyword is scored).
+
+    spacy_models : dict[str, str] or None
+        Per-language spaCy model names, keyed by language (``"de"`` or
+        ``"german"``).  Documents are grouped by resolved language and each
+        group is parsed by its own model; languages not listed use
+        *spacy_model*.
+
+    batch_size : int
+        Documents per ``nlp.pipe`` batch on the spaCy path.
+
+    n_process : int
+        Worker processes.  Forwarded to ``nlp.pipe`` on the spaCy path, and
+        used for a process pool running NLTK stemming / lemmatisation and
+        YAKE keyword extraction.  ``1`` (default) keeps everything in the
+        calling process.
+
     Notes
     -----
     **User note:** For RAG pipelines:
@@ -432,6 +544,14 @@ class EnricherConfig:
     char_count: bool = False
     type_token_ratio: bool = False
 
+    # --- Batched execution ---
+    idf_source: Literal["document", "corpus"] = "document"
+    spacy_models: dict[str, str] | None = field(
+        default=None, hash=False, compare=False
+    )
+    batch_size: int = 256
+    n_process: int = 1
+
     def __post_init__(self) -> None:  # noqa: PLR0912
         valid_tokenizers = ("simple", "nltk", "spacy", "custom")
         if self.tokenizer not in valid_tokenizers:
@@ -462,6 +582,19 @@ class EnricherConfig:
             )
         if self.max_keywords < 1:
             raise ValueError(f"max_keywords must be >= 1, got {self.max_keywords}")
+        if self.idf_source not in ("document", "corpus"):
+            raise ValueError(
+                f"idf_source must be 'document' or 'corpus', got {self.idf_source!r}"
+            )
+        if self.spacy_models is not None and not isinstance(self.spacy_models, dict):
+            raise TypeError(
+                "spacy_models must be a dict mapping language to spaCy model "
+                f"name or None, got {type(self.spacy_models).__name__}"
+            )
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {self.batch_size}")
+        if self.n_process < 1:
+            raise ValueError(f"n_process must be >= 1, got {self.n_process}")
         if self.min_token_length < 0:
             raise ValueError(
                 f"min_token_length must be >= 0, got {self.min_token_length}"
@@ -526,7 +659,12 @@ class NLPEnricher:
 
     **Developer note:** All NLP backends are lazy-loaded and cached on
     ``self._*`` attributes.  The class is NOT thread-safe.  Use separate
-    instances per thread.
+    instances per thread.  With ``n_process > 1`` one process pool is
+    created on first use and kept for later calls; release it with
+    :meth:`close` or by using the enricher as a context manager.  Stopword sets and built-in NLTK stem/lemma
+    lookups live in process-wide caches shared by all instances; the
+    ``idf_source="corpus"`` document-frequency table is per instance
+    (see :meth:`reset_idf`).
 
     Examples
     --------
@@ -548,6 +686,44 @@ class NLPEnricher:
         self._nltk_lemmatizer: Any = None
         self._stemmer_obj: Any = None
         self._stopwords_cache: dict[str, frozenset[str]] = {}
+        self._spacy_by_model: dict[str, Any] = {}
+        self._yake_extractor: Any = None
+        # Corpus-level document frequencies (idf_source="corpus").
+        self._doc_freq: Counter[str] = Counter()
+        self._n_idf_docs: int = 0
+        # Morphology worker pool (n_process > 1), created on first use.
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Copies and pickles (pipeline workers) start without a pool.
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    def __enter__(self) -> Self:
+        """Return ``self``; :meth:`close` runs on exit."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Shut down the process pool."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the process pool (a later call starts a new one)."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def reset_idf(self) -> None:
+        """Forget the accumulated document-frequency table (``idf_source="corpus"``)."""
+        self._doc_freq.clear()
+        self._n_idf_docs = 0
+
+    def _update_doc_freq(self, token_lists: list[list[str]]) -> None:
+        """Add one batch of documents to the document-frequency table."""
+        for tokens in token_lists:
+            self._doc_freq.update({tok.lower() for tok in tokens})
+        self._n_idf_docs += len(token_lists)
 
     # ------------------------------------------------------------------
     # Public API
@@ -577,64 +753,71 @@ class NLPEnricher:
 
         Notes
         -----
-        **Developer note:** Documents are processed sequentially.
-        For large corpora, call in batches to control memory.
+        **Developer note:** Documents are processed as one batch.  spaCy
+        parsing goes through ``nlp.pipe`` (grouped by language, with the
+        configured ``batch_size`` / ``n_process``); with ``n_process > 1``
+        NLTK stemming / lemmatisation and YAKE run in a process pool.  With
+        ``idf_source="corpus"`` the document-frequency table is updated
+        from the whole batch before any keyword is scored.  For large
+        corpora, call in batches to control memory.
         """
-        out: list[Any] = []
-        n_enriched = 0
+        cfg = self.config
+        out: list[Any] = list(documents)
 
-        for doc in documents:
+        # ── Select documents and resolve their languages ──────────────────
+        todo: list[tuple[int, str, list[str]]] = []
+        for pos, doc in enumerate(documents):
             has_tokens = getattr(doc, "tokens", None) is not None
             if not overwrite and has_tokens:
-                out.append(doc)
                 continue
-
             text: str = (
                 getattr(doc, "normalized_text", None) or getattr(doc, "text", "") or ""
             )
             if not text.strip():
-                out.append(doc)
                 continue
+            todo.append((pos, text, self._resolve_languages(text)))
 
-            # Resolve language for this document
-            langs = self._resolve_languages(text)
-            stopwords = self._get_stopwords_for(langs)
+        texts = [text for _, text, _ in todo]
 
-            # Tokenize
-            raw_tokens, spacy_doc_obj = self._tokenize_with_spacy(text)
-            tokens = self._filter_tokens(raw_tokens, stopwords)
+        # ── Tokenize (spaCy via nlp.pipe when needed) ─────────────────────
+        parsed = self._tokenize_batch(texts, [langs for _, _, langs in todo])
+        token_lists = [
+            self._filter_tokens(raw_tokens, self._get_stopwords_for(langs))
+            for (raw_tokens, _), (_, _, langs) in zip(parsed, todo)
+        ]
+        if cfg.idf_source == "corpus":
+            # One pass over the batch before any keyword is scored.
+            self._update_doc_freq(token_lists)
 
-            # Stemming / lemmatization (mutually exclusive; stemmer takes priority)
-            lemmas: list[str] | None = None
-            stems: list[str] | None = None
-            if self.config.stemmer:
-                stems = self._stem(tokens)
-            elif self.config.lemmatizer:
-                lemmas = self._lemmatize(tokens, spacy_doc_obj)
+        # ── Stemming / lemmatization / keywords ───────────────────────────
+        morphology = self._morphology_batch(
+            texts, token_lists, [doc for _, doc in parsed]
+        )
 
-            keywords = self._extract_keywords(text, tokens)
+        for (pos, text, _), (_, spacy_doc_obj), tokens, (stems, lemmas, keywords) in zip(
+            todo, parsed, token_lists, morphology
+        ):
+            doc = documents[pos]
             token_scores: dict[str, float] | None = (
-                self._compute_tfidf_scores(tokens)
-                if self.config.save_token_scores
-                else None
+                self._compute_tfidf_scores(tokens) if cfg.save_token_scores else None
             )
 
             # Build extra metadata dict
             extra_meta: dict[str, Any] = {}
-            if self.config.pos_tags and spacy_doc_obj is not None:
+            if cfg.pos_tags and spacy_doc_obj is not None:
                 extra_meta["pos_tags"] = [
                     tok.tag_ for tok in spacy_doc_obj if not tok.is_space
                 ]
-            if self.config.ner_entities and spacy_doc_obj is not None:
+            if cfg.ner_entities and spacy_doc_obj is not None:
                 extra_meta["ner_entities"] = [
                     {"text": ent.text, "label": ent.label_}
                     for ent in spacy_doc_obj.ents
                 ]
-            if self.config.sentence_count:
+            if cfg.sentence_count:
                 extra_meta["sentence_count"] = self._count_sentences(text)
-            if self.config.char_count:
+            if cfg.char_count:
                 extra_meta["char_count"] = len(text)
-            if self.config.type_token_ratio and tokens:
+            if cfg.type_token_ratio and tokens:
                 extra_meta["type_token_ratio"] = round(
                     len(set(tokens)) / len(tokens), 4
                 )
@@ -654,9 +837,9 @@ class NLPEnricher:
                 existing_meta.update(extra_meta)
                 replace_kwargs["metadata"] = existing_meta
 
-            out.append(doc.replace(**replace_kwargs))
-            n_enriched += 1
+            out[pos] = doc.replace(**replace_kwargs)
 
+        n_enriched = len(todo)
         logger.info(
             "NLPEnricher: enriched=%d, skipped=%d, total=%d",
             n_enriched,
@@ -665,6 +848,144 @@ class NLPEnricher:
         )
         return out
 
+    # ------------------------------------------------------------------
+    # Batched stages
+    # ------------------------------------------------------------------
+
+    def _tokenize_batch(
+        self,
+        texts: list[str],
+        langs_list: list[list[str]],
+    ) -> list[tuple[list[str], Any]]:
+        """Tokenise *texts*, parsing with spaCy in batches when required.
+
+        Returns one ``(raw_tokens, spacy_doc_or_None)`` pair per text, the
+        same as calling :meth:`_tokenize_with_spacy` on each text.
+        """
+        cfg = self.config
+        needs_spacy = cfg.tokenizer != "custom" and (
+            cfg.tokenizer == "spacy" or cfg.pos_tags or cfg.ner_entities
+        )
+        if not needs_spacy or not texts:
+            return [self._tokenize_with_spacy(text) for text in texts]
+
+        spacy_docs: list[Any] = [None] * len(texts)
+        groups: dict[str, list[int]] = {}
+        for i, langs in enumerate(langs_list):
+            groups.setdefault(self._spacy_model_for(langs), []).append(i)
+        try:
+            for model, indices in groups.items():
+                nlp = self._get_spacy(model)
+                parsed = nlp.pipe(
+                    [texts[i] for i in indices],
+                    batch_size=cfg.batch_size,
+                    n_process=cfg.n_process,
+                )
+                for i, spacy_doc in zip(indices, parsed):
+                    spacy_docs[i] = spacy_doc
+        except Exception:  # noqa: BLE001
+            if cfg.tokenizer == "spacy":
+                raise
+            # POS/NER only: fall back to the per-text path, which degrades
+            # gracefully per document.
+            logger.debug("spaCy batch parsing failed; parsing per document.")
+            return [self._tokenize_with_spacy(text) for text in texts]
+        return [
+            self._tokenize_with_spacy(text, spacy_doc=spacy_doc)
+            for text, spacy_doc in zip(texts, spacy_docs)
+        ]
+
+    def _spacy_model_for(self, langs: list[str]) -> str:
+        """Return the spaCy model name for a document's resolved languages."""
+        cfg = self.config
+        if not cfg.spacy_models or not langs:
+            return cfg.spacy_model
+        table = getattr(self, "_spacy_model_table", None)
+        if table is None:
+            from .._chunkers._language_data import coerce_language  # noqa: PLC0415
+
+            table = {}
+            for lang, model in cfg.spacy_models.items():
+                for name in coerce_language(lang, default="english"):
+                    table[name] = model
+            self._spacy_model_table = table
+        return table.get(langs[0], cfg.spacy_model)
+
+    def _morphology_batch(
+        self,
+        texts: list[str],
+        token_lists: list[list[str]],
+        spacy_docs: list[Any],
+    ) -> list[tuple[list[str] | None, list[str] | None, list[str] | None]]:
+        """Return ``(stems, lemmas, keywords)`` per document.
+
+        Stemming and lemmatisation are mutually exclusive (stemmer takes
+        priority).  With ``n_process > 1`` the stages that only need
+        picklable, built-in backends run in the enricher's process pool;
+        everything else runs here.
+        """
+        cfg = self.config
+        pool_cfg = self._pool_config() if cfg.n_process > 1 and len(texts) > 1 else None
+        pooled: list[Any] = [(None, None, None)] * len(texts)
+        if pool_cfg is not None:
+            n_slices = min(len(texts), cfg.n_process * 4)
+            bounds = [len(texts) * k // n_slices for k in range(n_slices + 1)]
+            slices = [
+                list(zip(texts[lo:hi], token_lists[lo:hi]))
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+            ]
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=cfg.n_process)
+            pooled = [
+                item
+                for chunk in self._pool.map(
+                    _morphology_worker, [pool_cfg] * len(slices), slices
+                )
+                for item in chunk
+            ]
+
+        results = []
+        for text, tokens, spacy_doc, (p_stems, p_lemmas, p_kw) in zip(
+            texts, token_lists, spacy_docs, pooled
+        ):
+            lemmas: list[str] | None = None
+            stems: list[str] | None = None
+            if cfg.stemmer:
+                stems = p_stems if pool_cfg and pool_cfg["stemmer"] else self._stem(tokens)
+            elif cfg.lemmatizer:
+                lemmas = (
+                    p_lemmas
+                    if pool_cfg and pool_cfg["lemmatizer"]
+                    else self._lemmatize(tokens, spacy_doc)
+                )
+            if pool_cfg and pool_cfg["keyword_extractor"]:
+                keywords = p_kw
+            else:
+                keywords = self._extract_keywords(text, tokens)
+            results.append((stems, lemmas, keywords))
+        return results
+
+    def _pool_config(self) -> dict[str, Any] | None:
+        """Reduced :class:`EnricherConfig` kwargs for :func:`_morphology_worker`.
+
+        Returns ``None`` when no configured stage can run in a worker
+        process (custom callables and spaCy stay in the calling process).
+        """
+        cfg = self.config
+        stemmer = cfg.stemmer if cfg.stemmer in _POOLABLE_STEMMERS else None
+        lemmatizer = "nltk" if not cfg.stemmer and cfg.lemmatizer == "nltk" else None
+        keyword_extractor = "yake" if cfg.keyword_extractor == "yake" else None
+        if not (stemmer or lemmatizer or keyword_extractor):
+            return None
+        return {
+            "stemmer": stemmer,
+            "stemmer_language": cfg.stemmer_language,
+            "lemmatizer": lemmatizer,
+            "keyword_extractor": keyword_extractor,
+            "keyword_extractor_kwargs": cfg.keyword_extractor_kwargs,
+            "max_keywords": cfg.max_keywords,
+        }
+
     # ------------------------------------------------------------------
     # Language resolution
     # ------------------------------------------------------------------
@@ -743,6 +1064,8 @@ class NLPEnricher:
         cache_key = "|".join(sorted(langs))
         if cache_key in self._stopwords_cache:
             sw = self._stopwords_cache[cache_key]
+        elif cache_key in _SHARED_STOPWORDS:
+            sw = self._stopwords_cache[cache_key] = _SHARED_STOPWORDS[cache_key]
         else:
             from .._chunkers._language_data import (  # noqa: PLC0415
                 BUILTIN_LANG_STOPWORDS,
@@ -777,6 +1100,8 @@ class NLPEnricher:
 
             sw = frozenset(result)
             self._stopwords_cache[cache_key] = sw
+            with _SHARED_LOCK:
+                _SHARED_STOPWORDS[cache_key] = sw
 
         # Merge extra_stopwords
         extra = self.config.extra_stopwords
@@ -788,9 +1113,17 @@ class NLPEnricher:
     # Tokenisation
     # ------------------------------------------------------------------
 
-    def _tokenize_with_spacy(self, text: str) -> tuple:
+    def _tokenize_with_spacy(self, text: str, spacy_doc: Any = None) -> tuple:
         """Tokenise *text* and optionally return a spaCy Doc.
 
+        Parameters
+        ----------
+        text : str
+            Document text.
+        spacy_doc : spacy.Doc or None, optional
+            Doc already parsed from *text* (e.g. by ``nlp.pipe`` in
+            :meth:`_tokenize_batch`); parsed here when ``None`` and needed.
+
         Returns
         -------
         tuple[list[str], spacy.Doc or None]
@@ -813,13 +1146,11 @@ class NLPEnricher:
             return list(tokens), None
 
         if cfg.tokenizer == "spacy":
-            nlp = self._get_spacy()
-            doc = nlp(text)
+            doc = spacy_doc if spacy_doc is not None else self._get_spacy()(text)
             return [tok.text for tok in doc if not tok.is_space], doc
 
         # Need spaCy for POS/NER even with other tokenizers
-        spacy_doc = None
-        if cfg.pos_tags or cfg.ner_entities:
+        if spacy_doc is None and (cfg.pos_tags or cfg.ner_entities):
             try:
                 nlp = self._get_spacy()
                 spacy_doc = nlp(text)
@@ -951,7 +1282,7 @@ class NLPEnricher:
 
         if cfg.lemmatizer == "nltk":
             lem = self._get_nltk_lemmatizer()
-            return [lem.lemmatize(tok) for tok in tokens]
+            return _cached_lookup("nltk-wordnet", tokens, lem, lem.lemmatize)
 
         return None
 
@@ -984,7 +1315,11 @@ class NLPEnricher:
                 return [st(tok) for tok in tokens]
 
         stemmer = self._get_stemmer()
-        return [stemmer.stem(tok) for tok in tokens]
+        if cfg.stemmer == "snowball":
+            backend_key = f"snowball-{getattr(stemmer, 'language', '')}"
+        else:
+            backend_key = str(cfg.stemmer)
+        return _cached_lookup(backend_key, tokens, stemmer, stemmer.stem)
 
     # ------------------------------------------------------------------
     # Keyword extraction
@@ -1038,12 +1373,14 @@ class NLPEnricher:
         return sorted_terms[: self.config.max_keywords]
 
     def _keywords_tfidf(self, tokens: list[str]) -> list[str]:
-        """Top-N keywords by within-document TF-IDF score.
+        """Top-N keywords by TF-IDF score.
 
-        Uses a simplified IDF that treats rare terms (appearing once)
-        as more informative than high-frequency terms, without requiring
-        a background corpus.  This approximation works well for single-
-        document keyword extraction.
+        With ``idf_source="document"`` (default) uses a simplified IDF that
+        treats rare terms (appearing once) as more informative than
+        high-frequency terms, without requiring a background corpus.  This
+        approximation works well for single-document keyword extraction.
+        With ``idf_source="corpus"`` the IDF comes from the accumulated
+        document-frequency table (see :meth:`_idf`).
 
         Parameters
         ----------
@@ -1065,7 +1402,7 @@ class NLPEnricher:
 
         # TF = count / total; IDF = log(n / count) — higher for rare terms
         scores: dict[str, float] = {
-            term: (count / n) * math.log(1.0 + n / count)
+            term: (count / n) * self._idf(term, n, count)
             for term, count in freq.items()
         }
         sorted_terms = sorted(scores, key=scores.__getitem__, reverse=True)
@@ -1093,10 +1430,24 @@ class NLPEnricher:
             k = tok.lower()
             freq[k] = freq.get(k, 0) + 1
         return {
-            term: round((count / n) * math.log(1.0 + n / count), 4)
+            term: round((count / n) * self._idf(term, n, count), 4)
             for term, count in freq.items()
         }
 
+    def _idf(self, term: str, n_tokens: int, count: int) -> float:
+        """IDF weight of *term* for the configured ``idf_source``.
+
+        ``"corpus"`` uses the BM25 form
+        ``log(1 + (N - df + 0.5) / (df + 0.5))`` over the accumulated table
+        (always positive, and close to ``0`` for a term in every document);
+        ``"document"`` keeps the within-document approximation
+        ``log(1 + n / count)``.
+        """
+        if self.config.idf_source == "corpus" and self._n_idf_docs:
+            df = self._doc_freq.get(term, 0)
+            return math.log(1.0 + (self._n_idf_docs - df + 0.5) / (df + 0.5))
+        return math.log(1.0 + n_tokens / count)
+
     def _keywords_yake(self, text: str) -> list[str] | None:
         """Extract keywords using YAKE.
 
@@ -1115,14 +1466,15 @@ class NLPEnricher:
             logger.warning("YAKE not installed; falling back to frequency keywords.")
             return None
 
-        kwargs: dict[str, Any] = {
-            "top": self.config.max_keywords,
-            "dedupLim": 0.9,
-        }
-        if self.config.keyword_extractor_kwargs:
-            kwargs.update(self.config.keyword_extractor_kwargs)
-        extractor = yake.KeywordExtractor(**kwargs)
-        kws = extractor.extract_keywords(text)
+        if self._yake_extractor is None:
+            kwargs: dict[str, Any] = {
+                "top": self.config.max_keywords,
+                "dedupLim": 0.9,
+            }
+            if self.config.keyword_extractor_kwargs:
+                kwargs.update(self.config.keyword_extractor_kwargs)
+            self._yake_extractor = yake.KeywordExtractor(**kwargs)
+        kws = self._yake_extractor.extract_keywords(text)
         return [kw for kw, _score in kws]
 
     def _keywords_keybert(self, text: str) -> list[str] | None:
@@ -1176,9 +1528,15 @@ class NLPEnricher:
     # Lazy backend loaders
     # ------------------------------------------------------------------
 
-    def _get_spacy(self) -> Any:
+    def _get_spacy(self, model: str | None = None) -> Any:
         """Load and cache the spaCy NLP pipeline.
 
+        Parameters
+        ----------
+        model : str or None, optional
+            Model name; ``None`` means ``config.spacy_model``.  Additional
+            models (from ``config.spacy_models``) are cached separately.
+
         Returns
         -------
         spacy.Language
@@ -1191,9 +1549,18 @@ class NLPEnricher:
         OSError
             If the model is not installed.
         """
-        if self._spacy_nlp is not None:
-            return self._spacy_nlp
+        if model is not None and model != self.config.spacy_model:
+            if model not in self._spacy_by_model:
+                self._spacy_by_model[model] = self._load_spacy_model(model)
+            return self._spacy_by_model[model]
+
+        if self._spacy_nlp is None:
+            self._spacy_nlp = self._load_spacy_model(self.config.spacy_model)
+        return self._spacy_nlp
 
+    @staticmethod
+    def _load_spacy_model(model: str) -> Any:
+        """Import spaCy and load *model*, downloading it if missing."""
         try:
             import spacy  # type: ignore[import]  # noqa: PLC0415
         except ImportError as exc:
@@ -1203,16 +1570,15 @@ class NLPEnricher:
                 "Install: pip install spacy"
             ) from exc
 
-        model = self.config.spacy_model
         try:
-            self._spacy_nlp = spacy.load(model)
+            return spacy.load(model)
         except OSError:
             logger.info("spaCy model %r not found; attempting download.", model)
             try:
                 from spacy.cli import download  # type: ignore[import]  # noqa: PLC0415
 
                 download(model)
-                self._spacy_nlp = spacy.load(model)
+                return spacy.load(model)
             except Exception as exc:  # noqa: BLE001
                 # Broad catch is correct: spaCy download/load can raise OSError
                 # (model not found after download), SystemExit (CLI failure),
@@ -1224,8 +1590,6 @@ class NLPEnricher:
                     f"Install with: python -m spacy download {model}"
                 ) from exc
 
-        return self._spacy_nlp
-
     def _get_nltk_lemmatizer(self) -> Any:
         """Load and cache the NLTK WordNetLemmatizer.
 
@@ -28,6 +28,7 @@ Covers:
 
 from __future__ import annotations
 
+import copy
 import logging
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -645,3 +646,103 @@ class TestEnrichDocumentsEdgeCases:
         result = e.enrich_documents([doc])[0]
         assert result.metadata.get("source") == "unit_test"
         assert "char_count" in result.metadata
+
+
+# ===========================================================================
+# Batch engine: corpus IDF, config validation, pool gating
+# ===========================================================================
+
+
+class TestBatchEngine:
+    def test_corpus_idf_ranks_common_term_below_rare(self) -> None:
+        """A term present in every document must score below a rare one."""
+        e = NLPEnricher(EnricherConfig(
+            keyword_extractor="tfidf", idf_source="corpus", max_keywords=1,
+        ))
+        docs = [
+            _Doc("shared shared unique"),
+            _Doc("shared alpha"),
+            _Doc("shared beta"),
+        ]
+        out = e.enrich_documents(docs)
+        assert out[0].keywords == ["unique"]
+        assert e._n_idf_docs == 3
+        assert e._doc_freq["shared"] == 3
+
+    def test_document_idf_ignores_other_documents(self) -> None:
+        e = NLPEnricher(EnricherConfig(keyword_extractor="tfidf", max_keywords=1))
+        out = e.enrich_documents([_Doc("shared shared unique"), _Doc("shared alpha")])
+        assert out[0].keywords == ["shared"]
+        assert e._n_idf_docs == 0
+
+    def test_reset_idf_clears_table(self) -> None:
+        e = NLPEnricher(EnricherConfig(keyword_extractor="tfidf", idf_source="corpus"))
+        e.enrich_documents([_Doc("alpha beta"), _Doc("beta gamma")])
+        assert e._n_idf_docs == 2
+        e.reset_idf()
+        assert e._n_idf_docs == 0
+        assert not e._doc_freq
+
+    def test_batch_matches_one_document_at_a_time(self) -> None:
+        cfg = EnricherConfig(keyword_extractor="frequency")
+        texts = ["The quick brown fox jumps.", "Lazy dogs sleep all day long.", ""]
+        batch = NLPEnricher(cfg).enrich_documents([_Doc(t) for t in texts])
+        single = [NLPEnricher(cfg).enrich_documents([_Doc(t)])[0] for t in texts]
+        assert [d.tokens for d in batch] == [d.tokens for d in single]
+        assert [d.keywords for d in batch] == [d.keywords for d in single]
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            ({"idf_source": "global"}, "idf_source"),
+            ({"batch_size": 0}, "batch_size"),
+            ({"n_process": 0}, "n_process"),
+            ({"spacy_models": ["en"]}, "spacy_models"),
+        ],
+    )
+    def test_invalid_batch_config_rejected(self, kwargs: dict, match: str) -> None:
+        with pytest.raises((ValueError, TypeError), match=match):
+            EnricherConfig(**kwargs)
+
+    def test_pool_config_none_without_poolable_stage(self) -> None:
+        assert NLPEnricher(EnricherConfig(keyword_extractor="frequency"))._pool_config() is None
+        custom = EnricherConfig(stemmer="custom", custom_stemmer=lambda t: t)
+        assert NLPEnricher(custom)._pool_config() is None
+
+    def test_process_pool_reused_and_closed(self) -> None:
+        pools: list[Any] = []
+
+        class _Pool:
+            def __init__(self, max_workers: int) -> None:
+                self.closed = False
+                pools.append(self)
+
+            def map(self, fn: Any, *iterables: Any) -> Any:
+                return map(fn, *iterables)
+
+            def shutdown(self, wait: bool = True) -> None:
+                self.closed = True
+
+        def _worker(cfg: dict, items: list) -> list:
+            return [([t.upper() for t in tokens], None, None) for _, tokens in items]
+
+        mod = "scikitplot.corpus._enrichers._nlp_enricher"
+        cfg = EnricherConfig(stemmer="porter", n_process=2)
+        with patch(f"{mod}.ProcessPoolExecutor", _Pool), patch(
+            f"{mod}._morphology_worker", _worker
+        ):
+            with NLPEnricher(cfg) as enricher:
+                first = enricher.enrich_documents([_Doc("alpha beta"), _Doc("gamma")])
+                enricher.enrich_documents([_Doc("delta"), _Doc("epsilon")])
+                assert len(pools) == 1
+                assert not pools[0].closed
+                assert copy.deepcopy(enricher)._pool is None
+            assert pools[0].closed
+            assert enricher._pool is None
+        assert first[0].stems == ["ALPHA", "BETA"]
+
+    def test_pool_config_carries_builtin_stemmer(self) -> None:
+        cfg = NLPEnricher(EnricherConfig(stemmer="porter", n_process=2))._pool_config()
+        assert cfg is not None
+        assert cfg["stemmer"] == "porter"
+        assert cfg["lemmatizer"] is None
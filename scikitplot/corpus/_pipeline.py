@@ -14,7 +14,8 @@ High-level orchestration of the full corpus ingestion pipeline:
 This module provides :class:`CorpusPipeline`, which replaces the
 ``create.py`` entry point from remarx and extends it with:
 
-- Multi-file batch processing (``run_batch``)
+- Multi-file batch processing (``run_batch``), optionally concurrent and
+  streaming (``iter_batch``)
 - URL-based ingestion (``run_url``)
 - Optional embedding (disabled by default for speed)
 - Pluggable export formats (CSV, Parquet, JSON, JSONL, pickle, etc.)
@@ -44,9 +45,16 @@ dependencies are optional lazy imports.
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import pathlib
+import pickle
 import re  # MEDIUM-01b: stdlib, zero cost, no reason to defer
+import threading
+from collections import deque
+from collections.abc import Iterable, Sized
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field  # noqa: F401
 from timeit import default_timer as timer
 from typing import Any, Callable, Dict, Iterator, List, Optional, Union  # noqa: F401
@@ -281,8 +289,10 @@ class CorpusPipeline:
     Notes
     -----
     **Thread safety:** :class:`CorpusPipeline` is not thread-safe.
-    Run one instance per thread, or use :meth:`run_batch` (which
-    processes files sequentially, not in parallel).
+    Run one instance per thread, or use :meth:`run_batch` /
+    :meth:`iter_batch`, whose ``max_workers`` option parallelises only
+    the read → enrich stages and keeps embedding and export on the
+    calling thread.
 
     **Embedding and caching:** When ``embedding_engine`` is provided,
     embeddings are cached to disk using the source file path and mtime
@@ -585,6 +595,33 @@ class CorpusPipeline:
         Both routes call the same ``DocumentReader.create()`` factory so
         any future factory changes apply automatically here.
         """
+        prepared = self._prepare_source(input_path, filename_override=filename_override)
+        return self._finish_source(prepared, output_path=output_path, format=format)
+
+    def _prepare_source(
+        self,
+        input_path: pathlib.Path | str,
+        *,
+        filename_override: str | None = None,
+    ) -> _PreparedSource:
+        """
+        Run the read → chunk → filter → normalise → enrich stages of one source.
+
+        These stages touch only the source itself and per-call state, so
+        :meth:`iter_batch` runs them in worker threads or processes. The
+        embedding model and export targets are left to :meth:`_finish_source`.
+
+        Parameters
+        ----------
+        input_path : pathlib.Path or str
+            A local file path or an ``http(s)://`` URL string.
+        filename_override : str or None, optional
+            Override the ``input_path`` label (ignored for URL sources).
+
+        Returns
+        -------
+        _PreparedSource
+        """
         # MEDIUM-01b: `re` is now imported at module level; no deferred import needed.
         is_url = _is_url(input_path)
         start = timer()
@@ -595,6 +632,7 @@ class CorpusPipeline:
             log_name = source_str[:80]
         else:
             input_path = pathlib.Path(input_path)
+            source_str = str(input_path)
             source_label = str(input_path)
             log_name = input_path.name
 
@@ -648,39 +686,79 @@ class CorpusPipeline:
                     exc,
                 )
 
+        return _PreparedSource(
+            source=source_str,
+            is_url=is_url,
+            label=source_label,
+            log_name=log_name,
+            documents=documents,
+            n_read=n_read,
+            n_omitted=n_omitted,
+            elapsed=timer() - start,
+        )
+
+    def _finish_source(
+        self,
+        prepared: _PreparedSource,
+        *,
+        output_path: pathlib.Path | None = None,
+        format: ExportFormat | None = None,
+    ) -> PipelineResult:
+        """
+        Run the embed → export stages of a prepared source.
+
+        Always called from the thread that owns the pipeline, so the
+        embedding engine and exporters are never used concurrently.
+
+        Parameters
+        ----------
+        prepared : _PreparedSource
+            Output of :meth:`_prepare_source`.
+        output_path : pathlib.Path or None, optional
+            Explicit output file path override.
+        format : ExportFormat or None, optional
+            Override the pipeline-level ``format``.
+
+        Returns
+        -------
+        PipelineResult
+        """
+        start = timer()
+        documents = prepared.documents
+
         # URL sources pass embed input_path=None (no stable mtime for cache key).
         n_embedded = 0
         if self.embedding_engine is not None and documents:
-            embed_path = None if is_url else pathlib.Path(input_path)
+            embed_path = None if prepared.is_url else pathlib.Path(prepared.source)
             documents, n_embedded = self._embed_documents(documents, embed_path)
 
         # Output stem: sanitised URL slug or file stem.
-        if is_url:
-            stem = re.sub(r"[^\w.-]", "_", source_str)[:60]
+        if prepared.is_url:
+            stem = re.sub(r"[^\w.-]", "_", prepared.source)[:60]
         else:
-            stem = pathlib.Path(input_path).stem
+            stem = pathlib.Path(prepared.source).stem
 
         fmt = format if format is not None else self.format
         resolved_output = self._resolve_output_path(stem, output_path, fmt)
         if resolved_output is not None and fmt is not None:
             self._export(documents, resolved_output, fmt)
 
-        elapsed = timer() - start
+        elapsed = prepared.elapsed + timer() - start
         logger.info(
             "CorpusPipeline._run_source: %s — %d docs, %d omitted, %.1fs.",
-            log_name,
+            prepared.log_name,
             len(documents),
-            n_omitted,
+            prepared.n_omitted,
             elapsed,
         )
 
         return PipelineResult(
-            input_path=source_label,
+            input_path=prepared.label,
             output_path=resolved_output,
             format=fmt,
             documents=tuple(documents),
-            n_read=n_read,
-            n_omitted=n_omitted,
+            n_read=prepared.n_read,
+            n_omitted=prepared.n_omitted,
             n_embedded=n_embedded,
             elapsed_seconds=round(elapsed, 3),
         )
@@ -854,9 +932,12 @@ class CorpusPipeline:
         *,
         stop_on_error: bool = False,
         format: ExportFormat | None = None,
+        max_workers: int = 1,
+        executor: str = "auto",
+        max_pending: int | None = None,
     ) -> list[PipelineResult]:
         """
-        Process multiple sources sequentially.
+        Process multiple sources, sequentially or with a bounded worker pool.
 
         Each item may be a local file path **or** an ``http(s)://`` URL
         string.  Mixed lists (some paths, some URLs) are fully supported.
@@ -881,6 +962,13 @@ class CorpusPipeline:
         format : ExportFormat or None, optional
             Override the pipeline-level ``format`` for all sources
             in this batch.
+        max_workers : int, optional
+            Number of sources read concurrently.  ``1`` (default) keeps the
+            sequential behaviour.  See :meth:`iter_batch`.
+        executor : {"auto", "thread", "process"}, optional
+            Worker kind used when ``max_workers > 1``.  See :meth:`iter_batch`.
+        max_pending : int or None, optional
+            Bound on sources read ahead of export.  See :meth:`iter_batch`.
 
         Returns
         -------
@@ -893,13 +981,16 @@ class CorpusPipeline:
         ------
         TypeError
             If any element of *input_files* is not a ``str`` or
-            :class:`pathlib.Path`.
+            :class:`pathlib.Path`, or ``max_workers`` or ``max_pending`` is
+            not an ``int``.
         ValueError
             Re-raised from :meth:`_run_source` when ``stop_on_error=True``
-            and a source fails.
+            and a source fails, or when ``max_workers`` or ``max_pending``
+            is below 1 or ``executor`` is unknown.
 
         See Also
         --------
+        iter_batch : Streaming form that yields results one at a time.
         run : Process a single source (file or URL).
         run_url : Process one or more URLs directly (legacy entry point).
 
@@ -923,26 +1014,150 @@ class CorpusPipeline:
         >>> [r.input_path for r in results]
         ['local_report.pdf', 'https://...', 'https://...']
         """
-        results: list[PipelineResult] = []
-        total = len(input_files)
-
-        for idx, i_path in enumerate(input_files):
-            if not isinstance(i_path, (str, pathlib.Path)):
-                raise TypeError(
-                    f"CorpusPipeline.run_batch: input_files[{idx}] must be"
-                    f" str or pathlib.Path; got {type(i_path).__name__!r}."
-                )
-            # Build a human-readable label for logging without Path-wrapping URLs.
-            log_label = str(i_path) if _is_url(i_path) else pathlib.Path(i_path).name
-            logger.info(
-                "CorpusPipeline.run_batch: [%d/%d] %s.",
-                idx + 1,
-                total,
-                log_label,
+        results = list(
+            self.iter_batch(
+                input_files,
+                stop_on_error=stop_on_error,
+                format=format,
+                max_workers=max_workers,
+                executor=executor,
+                max_pending=max_pending,
+            )
+        )
+        logger.info(
+            "CorpusPipeline.run_batch: processed %d/%s sources, %d total documents.",
+            len(results),
+            len(input_files) if isinstance(input_files, Sized) else "?",
+            sum(r.n_documents for r in results),
+        )
+        return results
+
+    def iter_batch(
+        self,
+        input_files: Iterable[pathlib.Path | str],
+        *,
+        stop_on_error: bool = False,
+        format: ExportFormat | None = None,
+        max_workers: int = 1,
+        executor: str = "auto",
+        max_pending: int | None = None,
+    ) -> Iterator[PipelineResult]:
+        """
+        Process sources lazily, yielding one :class:`PipelineResult` at a time.
+
+        Streaming counterpart of :meth:`run_batch`: *input_files* may be any
+        iterable (including a generator over a very large directory walk)
+        and each result is yielded as soon as its source has been exported,
+        so a caller that drops results keeps memory flat regardless of the
+        number of sources.
+
+        With ``max_workers > 1`` the read → chunk → filter → normalise →
+        enrich stages run in a worker pool while embedding and export stay
+        on the calling thread, so the embedding model and the output files
+        are never used concurrently.  At most ``max_pending`` sources are
+        in flight between the two halves; reading stops until the oldest
+        one has been exported (backpressure).  Results are always yielded
+        in input order, whatever order the workers finish in.
+
+        Parameters
+        ----------
+        input_files : iterable of pathlib.Path or str
+            Sources to process, in order.  Same element rules as
+            :meth:`run_batch`.
+        stop_on_error : bool, optional
+            Re-raise the first failure (in input order) instead of logging
+            and skipping it.  Outstanding work is cancelled.
+        format : ExportFormat or None, optional
+            Override the pipeline-level ``format`` for all sources.
+        max_workers : int, optional
+            Number of sources read concurrently.  ``1`` (default) processes
+            sources sequentially, exactly like :meth:`run`.
+        executor : {"auto", "thread", "process"}, optional
+            Worker kind for ``max_workers > 1``.  ``"thread"`` suits URL and
+            other IO-bound readers, ``"process"`` CPU-bound readers (PDF,
+            OCR, audio/video transcription).  ``"auto"`` (default) routes
+            each source by kind: URLs and text-like files to threads,
+            suffixes in ``_CPU_BOUND_SUFFIXES`` to processes.  Process
+            workers receive a copy of the pipeline without its embedding
+            engine and progress callback; when that copy cannot be pickled
+            ``"auto"`` falls back to threads.
+        max_pending : int or None, optional
+            Maximum number of sources read ahead of export.  Defaults to
+            ``2 * max_workers``.
+
+        Returns
+        -------
+        iterator of PipelineResult
+            One per successfully processed source, in input order.
+
+        Raises
+        ------
+        TypeError
+            If an element of *input_files* is not a ``str`` or
+            :class:`pathlib.Path`, ``max_workers`` or ``max_pending`` is not
+            an ``int``, or ``executor="process"`` is requested for a
+            pipeline that cannot be pickled.
+        ValueError
+            If ``max_workers`` or ``max_pending`` is below 1, or
+            ``executor`` is unknown.
+
+        Examples
+        --------
+        >>> sources = Path("corpus/").rglob("*.pdf")
+        >>> for result in pipeline.iter_batch(sources, max_workers=8):
+        ...     print(result.input_path, result.n_documents)
+        """
+        if isinstance(max_workers, bool) or not isinstance(max_workers, int):
+            raise TypeError(f"max_workers must be an int >= 1; got {max_workers!r}.")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be an int >= 1; got {max_workers!r}.")
+        if executor not in _BATCH_EXECUTORS:
+            raise ValueError(
+                f"executor must be one of {sorted(_BATCH_EXECUTORS)}; got {executor!r}."
             )
+        if max_pending is None:
+            max_pending = 2 * max_workers
+        if isinstance(max_pending, bool) or not isinstance(max_pending, int):
+            raise TypeError(f"max_pending must be an int >= 1; got {max_pending!r}.")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be an int >= 1; got {max_pending!r}.")
+        # Validate eagerly, then hand back a lazy generator.
+        return self._iter_batch(
+            input_files,
+            stop_on_error=stop_on_error,
+            format=format,
+            max_workers=max_workers,
+            executor=executor,
+            max_pending=max_pending,
+        )
+
+    def _iter_batch(
+        self,
+        input_files: Iterable[pathlib.Path | str],
+        *,
+        stop_on_error: bool,
+        format: ExportFormat | None,
+        max_workers: int,
+        executor: str,
+        max_pending: int,
+    ) -> Iterator[PipelineResult]:
+        """Yield results for :meth:`iter_batch` (options already validated)."""
+        # Generators are processed as they are consumed; log them as "?".
+        total = len(input_files) if isinstance(input_files, Sized) else "?"
+        pools = _BatchPools(self, max_workers, executor)
+        pending: deque[tuple[pathlib.Path | str, str, Future]] = deque()
+        n_docs = 0
+
+        def _settle(
+            i_path: pathlib.Path | str,
+            log_label: str,
+            outcome: Callable[[], PipelineResult],
+        ) -> PipelineResult | None:
+            nonlocal n_docs
+            result = None
             try:
-                result = self._run_source(i_path, format=format)
-                results.append(result)
+                result = outcome()
+                n_docs += result.n_documents
             except Exception as exc:  # noqa: BLE001
                 if stop_on_error:
                     raise
@@ -952,18 +1167,59 @@ class CorpusPipeline:
                     type(exc).__name__,
                     exc,
                 )
-
             if self.progress_callback is not None:
-                done = sum(r.n_documents for r in results)
-                self.progress_callback(str(i_path), done, -1)
+                self.progress_callback(str(i_path), n_docs, -1)
+            return result
 
-        logger.info(
-            "CorpusPipeline.run_batch: processed %d/%d sources, %d total documents.",
-            len(results),
-            total,
-            sum(r.n_documents for r in results),
-        )
-        return results
+        def _drain_oldest() -> PipelineResult | None:
+            i_path, log_label, future = pending.popleft()
+            return _settle(
+                i_path,
+                log_label,
+                lambda: self._finish_source(future.result(), format=format),
+            )
+
+        try:
+            for idx, i_path in enumerate(input_files):
+                if not isinstance(i_path, (str, pathlib.Path)):
+                    raise TypeError(
+                        f"CorpusPipeline.run_batch: input_files[{idx}] must be"
+                        f" str or pathlib.Path; got {type(i_path).__name__!r}."
+                    )
+                # Build a human-readable label for logging without Path-wrapping URLs.
+                log_label = (
+                    str(i_path) if _is_url(i_path) else pathlib.Path(i_path).name
+                )
+                logger.info(
+                    "CorpusPipeline.run_batch: [%d/%s] %s.",
+                    idx + 1,
+                    total,
+                    log_label,
+                )
+                if max_workers == 1:
+                    result = _settle(
+                        i_path,
+                        log_label,
+                        functools.partial(self._run_source, i_path, format=format),
+                    )
+                    if result is not None:
+                        yield result
+                    continue
+
+                pending.append((i_path, log_label, pools.submit(i_path)))
+                while len(pending) >= max_pending:
+                    result = _drain_oldest()
+                    if result is not None:
+                        yield result
+
+            while pending:
+                result = _drain_oldest()
+                if result is not None:
+                    yield result
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+            pools.shutdown()
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -1140,6 +1396,164 @@ _FORMAT_SUFFIX: dict[ExportFormat, str] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Concurrent batch support (used by CorpusPipeline.iter_batch)
+# ---------------------------------------------------------------------------
+
+_BATCH_EXECUTORS = frozenset({"auto", "thread", "process"})
+
+#: Suffixes whose readers are CPU-bound (PDF layout, OCR, ASR, video
+#: decoding); ``executor="auto"`` sends these to worker processes.
+_CPU_BOUND_SUFFIXES = frozenset(
+    {
+        ".pdf",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".tif",
+        ".tiff",
+        ".bmp",
+        ".webp",
+        ".mp3",
+        ".wav",
+        ".flac",
+        ".ogg",
+        ".m4a",
+        ".mp4",
+        ".mkv",
+        ".avi",
+        ".mov",
+        ".webm",
+    }
+)
+
+
+@dataclass
+class _PreparedSource:
+    """Documents of one source after the read → enrich stages (picklable)."""
+
+    source: str
+    is_url: bool
+    label: str
+    log_name: str
+    documents: list[CorpusDocument]
+    n_read: int
+    n_omitted: int
+    elapsed: float
+
+
+#: Pipeline copy installed in each process worker by ``_init_batch_worker``.
+_WORKER_PIPELINE: CorpusPipeline | None = None
+
+
+def _init_batch_worker(pipeline: CorpusPipeline) -> None:
+    global _WORKER_PIPELINE  # noqa: PLW0603
+    _WORKER_PIPELINE = pipeline
+
+
+def _prepare_in_worker(input_path: pathlib.Path | str) -> _PreparedSource:
+    return _WORKER_PIPELINE._prepare_source(input_path)
+
+
+class _BatchPools:
+    """Lazily created thread / process pools for one :meth:`iter_batch` call."""
+
+    def __init__(self, pipeline: CorpusPipeline, max_workers: int, executor: str):
+        self._pipeline = pipeline
+        self._max_workers = max_workers
+        self._executor = executor
+        self._threads: ThreadPoolExecutor | None = None
+        self._processes: Executor | None = None
+        self._process_ok: bool | None = None
+        # Chunkers and enrichers load models lazily and are not thread-safe:
+        # each worker thread runs its own deep copy of the worker view, or,
+        # if the pipeline cannot be copied, the shared one under a lock.
+        self._local = threading.local()
+        self._copies: list[CorpusPipeline] = []
+        self._copy_ok: bool | None = None
+        self._shared_lock = threading.Lock()
+
+    def submit(self, input_path: pathlib.Path | str) -> Future:
+        if self._use_processes(input_path):
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    initializer=_init_batch_worker,
+                    initargs=(self._worker_view(),),
+                )
+            return self._processes.submit(_prepare_in_worker, input_path)
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="skplt_pipeline_",
+            )
+        return self._threads.submit(self._prepare_in_thread, input_path)
+
+    def shutdown(self) -> None:
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=True)
+        # Per-thread enricher copies may hold their own process pools.
+        for view in self._copies:
+            close = getattr(view.enricher, "close", None)
+            if close is not None:
+                close()
+
+    def _prepare_in_thread(self, input_path: pathlib.Path | str) -> _PreparedSource:
+        pipeline = getattr(self._local, "pipeline", None)
+        if pipeline is None and self._copy_ok is not False:
+            try:
+                pipeline = copy.deepcopy(self._worker_view())
+                self._copies.append(pipeline)
+                self._copy_ok = True
+            except Exception as exc:  # noqa: BLE001
+                logger.info(
+                    "CorpusPipeline.iter_batch: pipeline cannot be copied per"
+                    " thread (%s); serialising its read → enrich stages.",
+                    exc,
+                )
+                self._copy_ok = False
+            self._local.pipeline = pipeline
+        if pipeline is None:
+            with self._shared_lock:
+                return self._pipeline._prepare_source(input_path)
+        return pipeline._prepare_source(input_path)
+
+    def _use_processes(self, input_path: pathlib.Path | str) -> bool:
+        if self._executor == "thread":
+            return False
+        if self._executor == "auto" and (
+            _is_url(input_path)
+            or pathlib.Path(input_path).suffix.lower() not in _CPU_BOUND_SUFFIXES
+        ):
+            return False
+        if self._process_ok is None:
+            try:
+                pickle.dumps(self._worker_view())
+                self._process_ok = True
+            except Exception as exc:  # noqa: BLE001
+                if self._executor == "process":
+                    raise TypeError(
+                        "CorpusPipeline.iter_batch: executor='process' requires a"
+                        f" picklable pipeline; {type(exc).__name__}: {exc}"
+                    ) from exc
+                logger.info(
+                    "CorpusPipeline.iter_batch: pipeline is not picklable (%s);"
+                    " using threads for CPU-bound sources.",
+                    exc,
+                )
+                self._process_ok = False
+        return self._process_ok
+
+    def _worker_view(self) -> CorpusPipeline:
+        # Workers only run the read → enrich stages; never ship the
+        # embedding model or the caller's callback to another process.
+        view = copy.copy(self._pipeline)
+        view.embedding_engine = None
+        view.progress_callback = None
+        return view
+
+
 # ---------------------------------------------------------------------------
 # Convenience functions (replace remarx create.py)
 # ---------------------------------------------------------------------------
@@ -21,6 +21,16 @@ where ``score`` is **cosine similarity in the closed interval ``[-1.0, 1.0]``**
 index-ascending tie breaking. This makes ``semantic_threshold`` comparisons and
 hybrid fusion identical across backends.
 
+Batched queries
+---------------
+:meth:`ANNBackend.query_batch` answers a whole ``(n_queries, dim)`` matrix in
+one call and returns rectangular NumPy arrays ``(ids, scores)`` of shape
+``(n_queries, k)`` under the same score contract, row by row. Rows with fewer
+than ``k`` hits (small index, zero-norm query) are padded with id ``-1`` and
+score ``-inf``. Brute force runs blocked matrix products with
+``argpartition`` top-``k``; Annoy, FAISS and Voyager use their native batch
+search.
+
 Backend selection order
 ------------------------
 ``select_backend("auto")`` resolves the first *available* backend in
@@ -30,6 +40,17 @@ available pure-``numpy`` ``bruteforce`` floor. An explicitly named backend that
 is unavailable raises :class:`RuntimeError` with an actionable message rather
 than silently degrading.
 
+Persistence and incremental updates
+-----------------------------------
+Every backend can :meth:`~ANNBackend.save` its built index into a directory
+and :meth:`~ANNBackend.load` it back, and can :meth:`~ANNBackend.add` rows to
+a built index without rebuilding it. Annoy indexes are immutable once built,
+so :class:`AnnoyBackend` keeps added rows in an exact brute-force *delta
+segment* merged into every query; :attr:`~ANNBackend.n_pending` reports its
+size so the caller can decide when to compact with a full :meth:`build`.
+These hooks back the on-disk build cache in
+:mod:`scikitplot.corpus._similarity._cache`.
+
 Notes
 -----
 **Developer note:** All semantic backends require ``numpy``. Native ANN
@@ -39,7 +60,9 @@ semantic capability because ``bruteforce`` is the guaranteed floor.
 
 from __future__ import annotations
 
+import json
 import logging
+import pathlib
 from typing import Any, Sequence
 
 logger = logging.getLogger(__name__)
@@ -100,6 +123,43 @@ def _validate_query_vector(np: Any, vector: Any, dim: int) -> Any:
     return qe
 
 
+def _validate_query_matrix(np: Any, matrix: Any, dim: int) -> Any:
+    """Coerce, dimension-check, and finiteness-check a batch of queries.
+
+    Returns a C-contiguous ``(n_queries, dim)`` ``float32`` matrix; a 1-D
+    input is treated as a single query.
+
+    Raises
+    ------
+    ValueError
+        If *matrix* is not 1-D/2-D, its width does not match the index
+        dimension, or it contains non-finite (NaN/Inf) values.
+    """
+    qs = np.asarray(matrix, dtype=np.float32)
+    if qs.ndim == 1:  # ruff: ignore[magic-value-comparison]
+        qs = qs.reshape(1, -1)
+    if qs.ndim != 2:  # ruff: ignore[magic-value-comparison]
+        raise ValueError(
+            f"query matrix must be 2-D (n_queries, dim), got shape {qs.shape}"
+        )
+    if qs.shape[1] != dim:
+        raise ValueError(
+            f"query vectors have dimension {qs.shape[1]}, "
+            f"but the index was built with dimension {dim}"
+        )
+    if not np.all(np.isfinite(qs)):
+        raise ValueError("query matrix contains NaN or infinite values")
+    return np.ascontiguousarray(qs)
+
+
+def _padded_batch(np: Any, n_queries: int, k: int) -> tuple[Any, Any]:
+    """All-padding ``(ids, scores)`` arrays for a batch result."""
+    return (
+        np.full((n_queries, k), -1, dtype=np.int64),
+        np.full((n_queries, k), -np.inf, dtype=np.float64),
+    )
+
+
 def _validate_embeddings(np: Any, embeddings: Any) -> Any:
     """Coerce to a finite 2-D ``float32`` matrix or raise.
 
@@ -123,6 +183,45 @@ def _validate_embeddings(np: Any, embeddings: Any) -> Any:
     return embs
 
 
+def _normalize_rows(np: Any, embs: Any) -> Any:
+    """Unit-normalise rows, preserving zero rows as zero."""
+    norms = np.linalg.norm(embs, axis=1, keepdims=True)
+    norms = np.where(norms == 0.0, 1.0, norms)
+    return np.ascontiguousarray(embs / norms, dtype=np.float32)
+
+
+def _validate_added(np: Any, embeddings: Any, dim: int) -> Any:
+    """Validate rows passed to :meth:`ANNBackend.add` against a built index."""
+    if not dim:
+        raise RuntimeError("add() requires a built index; call build() first")
+    embs = _validate_embeddings(np, embeddings)
+    if embs.shape[1] != dim:
+        raise ValueError(
+            f"embeddings have dimension {embs.shape[1]}, "
+            f"but the index was built with dimension {dim}"
+        )
+    return embs
+
+
+def _write_meta(directory: Any, meta: dict[str, Any]) -> pathlib.Path:
+    """Create *directory* and write the backend ``meta.json`` into it."""
+    path = pathlib.Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+    return path
+
+
+def _read_meta(directory: Any, name: str) -> tuple[pathlib.Path, dict[str, Any]]:
+    """Read ``meta.json`` and check it was written by backend *name*."""
+    path = pathlib.Path(directory)
+    meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+    if meta.get("backend") != name:
+        raise ValueError(
+            f"{path} holds a {meta.get('backend')!r} index, not {name!r}"
+        )
+    return path, meta
+
+
 def _resolve_annoy_index_cls(impl: str) -> tuple[Any, str]:
     """Resolve the requested Annoy ``Index`` class.
 
@@ -184,6 +283,7 @@ class ANNBackend:
     """
 
     name: str = "base"
+    _dim: int = 0
 
     @classmethod
     def is_available(cls) -> bool:
@@ -211,6 +311,70 @@ class ANNBackend:
         """
         raise NotImplementedError
 
+    def query_batch(self, matrix: Any, k: int) -> tuple[Any, Any]:
+        """Answer many queries at once.
+
+        Parameters
+        ----------
+        matrix : array-like of shape (n_queries, dim)
+            Query vectors (a 1-D vector is one query).
+        k : int
+            Neighbours per query.
+
+        Returns
+        -------
+        ids : numpy.ndarray of shape (n_queries, k), dtype int64
+            Row indices, best first; ``-1`` pads rows with fewer hits.
+        scores : numpy.ndarray of shape (n_queries, k), dtype float64
+            Cosine scores matching *ids*; ``-inf`` in padded slots.
+
+        Notes
+        -----
+        Row ``i`` holds the same hits as ``query(matrix[i], k)``. This
+        fallback loops over :meth:`query`; backends override it with a
+        native batch path.
+        """
+        np = _require_numpy()
+        qs = _validate_query_matrix(np, matrix, self._dim)
+        k = max(1, int(k))
+        ids, scores = _padded_batch(np, qs.shape[0], k)
+        for r, vector in enumerate(qs):
+            for j, (i, score) in enumerate(self.query(vector, k)[:k]):
+                ids[r, j] = i
+                scores[r, j] = score
+        return ids, scores
+
+    def add(self, embeddings: Any) -> None:
+        """Append rows to a built index without rebuilding it.
+
+        New rows get the next consecutive row indices. Backends that cannot
+        extend their index raise :class:`NotImplementedError`; callers then
+        fall back to a full :meth:`build`.
+
+        Parameters
+        ----------
+        embeddings : numpy.ndarray
+            ``(n_new, dim)`` matrix with the dimension of the built index.
+        """
+        raise NotImplementedError
+
+    @property
+    def n_pending(self) -> int:
+        """Rows added since the last build that bypass the ANN structure.
+
+        Such rows are served exactly from a delta segment; ``0`` for backends
+        whose :meth:`add` extends the index itself.
+        """
+        return 0
+
+    def save(self, directory: Any) -> None:
+        """Persist the built index into *directory* (created if needed)."""
+        raise NotImplementedError
+
+    def load(self, directory: Any) -> None:
+        """Restore an index written by :meth:`save` with the same settings."""
+        raise NotImplementedError
+
     def __repr__(self) -> str:  # pragma: no cover - trivial
         return f"{type(self).__name__}(name={self.name!r})"
 
@@ -246,10 +410,26 @@ class BruteForceBackend(ANNBackend):
         np = _require_numpy()
         embs = _validate_embeddings(np, embeddings)
         self._dim = int(embs.shape[1])
-        norms = np.linalg.norm(embs, axis=1, keepdims=True)
-        # Preserve zero rows as zero (they can never be a cosine match).
-        norms = np.where(norms == 0.0, 1.0, norms)
-        self._normed = embs / norms
+        # Zero rows stay zero (they can never be a cosine match).
+        self._normed = _normalize_rows(np, embs)
+
+    def add(self, embeddings: Any) -> None:
+        np = _require_numpy()
+        embs = _validate_added(np, embeddings, self._dim)
+        self._normed = np.concatenate([self._normed, _normalize_rows(np, embs)])
+
+    def save(self, directory: Any) -> None:
+        np = _require_numpy()
+        path = _write_meta(directory, {"backend": self.name, "dim": self._dim})
+        np.save(str(path / "normed.npy"), self._normed)
+
+    def load(self, directory: Any) -> None:
+        np = _require_numpy()
+        path, meta = _read_meta(directory, self.name)
+        # Memory-mapped: the matrix is paged in on demand and shared between
+        # processes serving the same cached build.
+        self._normed = np.load(str(path / "normed.npy"), mmap_mode="r")
+        self._dim = int(meta["dim"])
 
     def query(self, vector: Any, k: int) -> list[tuple[int, float]]:
         np = _require_numpy()
@@ -257,14 +437,93 @@ class BruteForceBackend(ANNBackend):
         norm_q = float(np.linalg.norm(qe))
         if norm_q == 0.0:
             return []
-        sims = self._normed @ (qe / norm_q)
-        sims = np.clip(sims, -1.0, 1.0)
-        k = max(0, min(int(k), sims.shape[0]))
-        if k == 0:
-            return []
-        # Descending score, index-ascending ties: stable argsort on -sims.
-        order = np.argsort(-sims, kind="stable")[:k]
-        return [(int(i), float(sims[i])) for i in order]
+        return _exact_top_k(np, self._normed, qe / norm_q, k)
+
+    def query_batch(self, matrix: Any, k: int) -> tuple[Any, Any]:
+        np = _require_numpy()
+        qs = _validate_query_matrix(np, matrix, self._dim)
+        return _exact_top_k_batch(np, self._normed, qs, max(1, int(k)))
+
+
+def _exact_top_k(
+    np: Any,
+    normed: Any,
+    unit_query: Any,
+    k: int,
+) -> list[tuple[int, float]]:
+    """Exact cosine top-``k`` over unit rows, index-ascending ties."""
+    sims = np.clip(normed @ unit_query, -1.0, 1.0)
+    k = max(0, min(int(k), sims.shape[0]))
+    if k == 0:
+        return []
+    # Descending score, index-ascending ties: stable argsort on -sims.
+    order = np.argsort(-sims, kind="stable")[:k]
+    return [(int(i), float(sims[i])) for i in order]
+
+
+# Upper bound on the (block_rows, n_docs) float32 similarity block that
+# _exact_top_k_batch materialises at once.
+_BATCH_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def _top_k_rows(np: Any, sims: Any, k: int) -> Any:
+    """Row-wise top-``k`` column indices of *sims*, best first.
+
+    Descending score with index-ascending ties, i.e. the first ``k`` entries
+    of a stable argsort on ``-sims`` — but in ``O(n)`` per row through
+    :func:`numpy.argpartition` instead of a full sort.
+    """
+    n = sims.shape[1]
+    if k < n:
+        part = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        kth = np.take_along_axis(sims, part, axis=1).min(axis=1)
+        # argpartition picks arbitrarily among scores tied with the k-th best;
+        # such rows are re-ranked with a stable sort to keep the lowest ids.
+        tied = np.count_nonzero(sims >= kth[:, None], axis=1) > k
+        for r in np.flatnonzero(tied):
+            part[r] = np.argsort(-sims[r], kind="stable")[:k]
+    else:
+        part = np.broadcast_to(np.arange(n), sims.shape).copy()
+    top = np.take_along_axis(sims, part, axis=1)
+    order = np.lexsort((part, -top))  # along the last axis, row by row
+    return np.take_along_axis(part, order, axis=1)
+
+
+def _exact_top_k_batch(np: Any, normed: Any, qs: Any, k: int) -> tuple[Any, Any]:
+    """Exact cosine top-``k`` for every row of *qs* over unit rows *normed*.
+
+    The similarity matrix is computed in row blocks bounded by
+    :data:`_BATCH_BLOCK_BYTES`; zero-norm queries yield padded rows.
+    """
+    m, n = qs.shape[0], normed.shape[0]
+    ids, scores = _padded_batch(np, m, k)
+    width = min(k, n)
+    if m == 0 or width == 0:
+        return ids, scores
+    unit = _normalize_rows(np, qs)
+    live = np.linalg.norm(qs, axis=1) > 0.0
+    block = max(1, _BATCH_BLOCK_BYTES // (4 * n))
+    for start in range(0, m, block):
+        stop = min(start + block, m)
+        sims = np.clip(unit[start:stop] @ normed.T, -1.0, 1.0)
+        top = _top_k_rows(np, sims, width)
+        ids[start:stop, :width] = top
+        scores[start:stop, :width] = np.take_along_axis(sims, top, axis=1)
+    ids[~live] = -1
+    scores[~live] = -np.inf
+    return ids, scores
+
+
+def _merge_batches(np: Any, *parts: tuple[Any, Any], k: int) -> tuple[Any, Any]:
+    """Merge per-row ``(ids, scores)`` batches into the best ``k`` per row."""
+    ids = np.concatenate([p[0] for p in parts], axis=1)
+    scores = np.concatenate([p[1] for p in parts], axis=1)
+    # Padding (-inf) sorts last; real hits by descending score, then id.
+    order = np.lexsort((ids, -scores))[:, :k]
+    return (
+        np.take_along_axis(ids, order, axis=1),
+        np.take_along_axis(scores, order, axis=1),
+    )
 
 
 # =====================================================================
@@ -335,6 +594,8 @@ class AnnoyBackend(ANNBackend):
         self._index: Any = None
         self._dim: int = 0
         self._resolved_impl: str | None = None
+        self._n_items: int = 0  # rows inside the Annoy forest
+        self._pending: Any = None  # unit rows added after build (delta segment)
 
     @classmethod
     def is_available(cls) -> bool:
@@ -379,15 +640,105 @@ class AnnoyBackend(ANNBackend):
                 index.add_item(i, embs[i].tolist())
         index.build(self._n_trees)
         self._index = index
+        self._n_items = n
+        self._pending = None
+
+    def add(self, embeddings: Any) -> None:
+        # A built Annoy forest is immutable: new rows go to an exact delta
+        # segment until the caller compacts with a full build().
+        if self._metric not in ("angular", "cosine"):
+            raise NotImplementedError(
+                f"incremental add needs a cosine metric, not {self._metric!r}"
+            )
+        np = _require_numpy()
+        normed = _normalize_rows(np, _validate_added(np, embeddings, self._dim))
+        if self._pending is not None:
+            normed = np.concatenate([self._pending, normed])
+        self._pending = normed
+
+    @property
+    def n_pending(self) -> int:
+        return 0 if self._pending is None else int(self._pending.shape[0])
+
+    def save(self, directory: Any) -> None:
+        np = _require_numpy()
+        meta = {
+            "backend": self.name,
+            "dim": self._dim,
+            "impl": self._resolved_impl,
+            "metric": self._metric,
+            "n_items": self._n_items,
+        }
+        path = _write_meta(directory, meta)
+        self._index.save(str(path / "index.ann"))
+        if self._pending is not None:
+            np.save(str(path / "pending.npy"), self._pending)
+
+    def load(self, directory: Any) -> None:
+        np = _require_numpy()
+        path, meta = _read_meta(directory, self.name)
+        if meta["metric"] != self._metric:
+            raise ValueError(
+                f"saved index uses metric {meta['metric']!r}, not {self._metric!r}"
+            )
+        index_cls, impl_name = _resolve_annoy_index_cls(meta["impl"] or self._impl)
+        self._resolved_impl = impl_name
+        self._dim = int(meta["dim"])
+        index = self._construct(index_cls)
+        index.load(str(path / "index.ann"))  # memory-mapped, not copied
+        self._index = index
+        self._n_items = int(meta["n_items"])
+        pending = path / "pending.npy"
+        self._pending = np.load(str(pending)) if pending.exists() else None
 
     def query(self, vector: Any, k: int) -> list[tuple[int, float]]:
         np = _require_numpy()
         qe = _validate_query_vector(np, vector, self._dim)
-        if float(np.linalg.norm(qe)) == 0.0:
+        norm_q = float(np.linalg.norm(qe))
+        if norm_q == 0.0:
             return []
         k = max(1, int(k))
         ids, dists = self._nns(qe.tolist(), k)
-        return [(int(i), self._distance_to_score(float(d))) for i, d in zip(ids, dists)]
+        hits = [(int(i), self._distance_to_score(float(d))) for i, d in zip(ids, dists)]
+        if self._pending is None:
+            return hits
+        offset = self._n_items
+        hits += [
+            (offset + i, score)
+            for i, score in _exact_top_k(np, self._pending, qe / norm_q, k)
+        ]
+        hits.sort(key=lambda hit: (-hit[1], hit[0]))
+        return hits[:k]
+
+    def query_batch(self, matrix: Any, k: int) -> tuple[Any, Any]:
+        np = _require_numpy()
+        qs = _validate_query_matrix(np, matrix, self._dim)
+        k = max(1, int(k))
+        m = qs.shape[0]
+        batch = getattr(self._index, "get_nns_by_vectors", None)
+        if batch is not None:
+            # Cython Index: one GIL-free call for the whole matrix; short rows
+            # come back padded with id -1 / distance inf.
+            ids, dists = batch(qs, k, self._search_k, include_distances=True)
+            ids = np.asarray(ids, dtype=np.int64)
+        else:
+            ids, _ = _padded_batch(np, m, k)
+            dists = np.full((m, k), np.inf)
+            for r in range(m):
+                row_ids, row_dists = self._nns(qs[r].tolist(), k)
+                ids[r, : len(row_ids)] = row_ids[:k]
+                dists[r, : len(row_dists)] = row_dists[:k]
+        scores = self._distances_to_scores(np, np.asarray(dists, dtype=np.float64))
+        dead = (ids < 0) | (np.linalg.norm(qs, axis=1) == 0.0)[:, None]
+        ids[dead] = -1
+        scores[dead] = -np.inf
+        if self._pending is not None:
+            delta_ids, delta_scores = _exact_top_k_batch(np, self._pending, qs, k)
+            delta_ids[delta_ids >= 0] += self._n_items
+            ids, scores = _merge_batches(
+                np, (ids, scores), (delta_ids, delta_scores), k=k
+            )
+        return ids, scores
 
     def _nns(self, vec: Sequence[float], k: int) -> tuple[Any, Any]:
         """Call ``get_nns_by_vector`` tolerating both known signatures."""
@@ -397,6 +748,12 @@ class AnnoyBackend(ANNBackend):
         except TypeError:  # variant without a positional search_k
             return get(vec, k, include_distances=True)
 
+    def _distances_to_scores(self, np: Any, dists: Any) -> Any:
+        """Vectorised :meth:`_distance_to_score` over an array."""
+        if self._metric in ("angular", "cosine"):
+            return np.clip(1.0 - dists * dists / 2.0, -1.0, 1.0)
+        return 1.0 / (1.0 + np.maximum(dists, 0.0))
+
     def _distance_to_score(self, d: float) -> float:
         """Convert an Annoy distance to the unified cosine score in [-1, 1]."""
         if self._metric in ("angular", "cosine"):
@@ -441,13 +798,27 @@ class FaissBackend(ANNBackend):
 
         embs = _validate_embeddings(np, embeddings)
         self._dim = int(embs.shape[1])
-        norms = np.linalg.norm(embs, axis=1, keepdims=True)
-        norms = np.where(norms == 0.0, 1.0, norms)
-        normed = np.ascontiguousarray(embs / norms, dtype=np.float32)
         index = faiss.IndexFlatIP(self._dim)
-        index.add(normed)
+        index.add(_normalize_rows(np, embs))
         self._index = index
 
+    def add(self, embeddings: Any) -> None:
+        np = _require_numpy()
+        self._index.add(_normalize_rows(np, _validate_added(np, embeddings, self._dim)))
+
+    def save(self, directory: Any) -> None:
+        import faiss  # type: ignore[import]  # noqa: PLC0415
+
+        path = _write_meta(directory, {"backend": self.name, "dim": self._dim})
+        faiss.write_index(self._index, str(path / "index.faiss"))
+
+    def load(self, directory: Any) -> None:
+        import faiss  # type: ignore[import]  # noqa: PLC0415
+
+        path, meta = _read_meta(directory, self.name)
+        self._index = faiss.read_index(str(path / "index.faiss"))
+        self._dim = int(meta["dim"])
+
     def query(self, vector: Any, k: int) -> list[tuple[int, float]]:
         np = _require_numpy()
         qe = _validate_query_vector(np, vector, self._dim)
@@ -464,6 +835,24 @@ class FaissBackend(ANNBackend):
             out.append((int(idx), max(-1.0, min(1.0, float(score)))))
         return out
 
+    def query_batch(self, matrix: Any, k: int) -> tuple[Any, Any]:
+        np = _require_numpy()
+        qs = _validate_query_matrix(np, matrix, self._dim)
+        k = max(1, int(k))
+        ids, scores = _padded_batch(np, qs.shape[0], k)
+        live = np.flatnonzero(np.linalg.norm(qs, axis=1) > 0.0)
+        width = min(k, self._index.ntotal)
+        if live.size and width:
+            found_scores, found = self._index.search(
+                _normalize_rows(np, qs[live]), width
+            )
+            found = found.astype(np.int64)
+            found_scores = np.clip(found_scores.astype(np.float64), -1.0, 1.0)
+            found_scores[found < 0] = -np.inf
+            ids[live, :width] = found
+            scores[live, :width] = found_scores
+        return ids, scores
+
 
 # =====================================================================
 # Voyager
@@ -502,6 +891,23 @@ class VoyagerBackend(ANNBackend):
         index.add_items(embs)
         self._index = index
 
+    def add(self, embeddings: Any) -> None:
+        np = _require_numpy()
+        embs = _validate_added(np, embeddings, self._dim)
+        start = len(self._index)
+        self._index.add_items(embs, ids=list(range(start, start + embs.shape[0])))
+
+    def save(self, directory: Any) -> None:
+        path = _write_meta(directory, {"backend": self.name, "dim": self._dim})
+        self._index.save(str(path / "index.voy"))
+
+    def load(self, directory: Any) -> None:
+        import voyager  # type: ignore[import]  # noqa: PLC0415
+
+        path, meta = _read_meta(directory, self.name)
+        self._index = voyager.Index.load(str(path / "index.voy"))
+        self._dim = int(meta["dim"])
+
     def query(self, vector: Any, k: int) -> list[tuple[int, float]]:
         np = _require_numpy()
         qe = _validate_query_vector(np, vector, self._dim)
@@ -514,6 +920,22 @@ class VoyagerBackend(ANNBackend):
             for i, dist in zip(ids, distances)
         ]
 
+    def query_batch(self, matrix: Any, k: int) -> tuple[Any, Any]:
+        np = _require_numpy()
+        qs = _validate_query_matrix(np, matrix, self._dim)
+        k = max(1, int(k))
+        ids, scores = _padded_batch(np, qs.shape[0], k)
+        live = np.flatnonzero(np.linalg.norm(qs, axis=1) > 0.0)
+        # Voyager raises rather than returning short rows when k > n_items.
+        width = min(k, len(self._index))
+        if live.size and width:
+            found, distances = self._index.query(qs[live], k=width)
+            ids[live, :width] = found.astype(np.int64)
+            scores[live, :width] = np.clip(
+                1.0 - distances.astype(np.float64), -1.0, 1.0
+            )
+        return ids, scores
+
 
 # =====================================================================
 # Selection
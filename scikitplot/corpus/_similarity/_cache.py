@@ -0,0 +1,359 @@
+# scikitplot/corpus/_similarity/_cache.py
+#
+# flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+r"""
+Persistent, content-addressed cache for :class:`SimilarityIndex` builds.
+
+Building a :class:`~scikitplot.corpus._similarity.SimilarityIndex` tokenises
+every document, assembles the BM25 postings and trains a dense ANN index. All
+three are pure functions of the document contents and the search
+configuration, so :class:`IndexBuildCache` persists them on disk and a rebuild
+over the same documents restores them instead of recomputing.
+
+Key scheme
+----------
+Every document gets a *document key* (a hash of its tokens or text and its
+embedding bytes). Build keys are **chained**: starting from a fingerprint of
+the configuration (resolved backend, Annoy parameters, text field),
+``chain[i] = sha256(chain[i - 1] || doc_key[i])``. The key of a build over
+``n`` documents is ``chain[n]``, so the key of every *prefix* of the corpus is
+known for free. A rebuild over ``old_docs + new_docs`` therefore finds the
+cached ``old_docs`` build and only adds ``new_docs`` incrementally.
+
+Layout
+------
+``<cache_dir>/cache.sqlite``
+    One row per cached build: key, configuration fingerprint, number of
+    documents, size on disk and last-use time (LRU clock).
+``<cache_dir>/builds/<key>/``
+    The build payload written by the index (token lists, BM25 arrays,
+    embeddings and backend files). Directories are staged under a unique
+    temporary name and published with a single :func:`os.replace`, so readers
+    never observe a partial build.
+
+Eviction
+--------
+After every store the least recently used builds are removed until the total
+size is at most ``max_bytes``. The entry just stored is never evicted.
+
+Notes
+-----
+**Developer note:** The cache never stores the documents themselves — the
+index keeps references to the caller's objects — only state derived from them.
+Only :mod:`sqlite3` from the standard library is required.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import pathlib
+import shutil
+import sqlite3
+import tempfile
+import time
+from typing import Callable, Iterator, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "DEFAULT_INDEX_CACHE_DIR",
+    "IndexBuildCache",
+]
+
+StrPath = Union[str, "os.PathLike[str]"]
+
+#: Default location of the on-disk build cache.
+DEFAULT_INDEX_CACHE_DIR: pathlib.Path = (
+    pathlib.Path.home() / ".cache" / "scikitplot" / "similarity"
+)
+
+# Bump when the payload layout written by SimilarityIndex changes; old entries
+# then simply stop matching and age out through LRU eviction.
+_CACHE_KEY_SCHEMA = "v1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS builds (
+    key       TEXT PRIMARY KEY,
+    config_fp TEXT NOT NULL,
+    n_docs    INTEGER NOT NULL,
+    nbytes    INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS builds_config ON builds (config_fp, n_docs);
+"""
+
+
+def hash_fields(*fields: bytes) -> str:
+    """SHA-256 over length-prefixed *fields* (unambiguous concatenation)."""
+    h = hashlib.sha256()
+    for f in fields:
+        h.update(len(f).to_bytes(8, "little"))
+        h.update(f)
+    return h.hexdigest()
+
+
+def chain_keys(
+    config_fp: str,
+    doc_keys: Sequence[str],
+    *,
+    start: str | None = None,
+) -> list[str]:
+    """Return the chained build keys for every prefix of *doc_keys*.
+
+    Parameters
+    ----------
+    config_fp : str
+        Configuration fingerprint seeding the chain.
+    doc_keys : sequence of str
+        Per-document content keys, in index order.
+    start : str or None, optional
+        Build key to continue from (the key of the documents already
+        indexed). ``None`` starts from the empty corpus.
+
+    Returns
+    -------
+    list of str
+        ``len(doc_keys) + 1`` keys; element ``i`` addresses a build over the
+        first ``i`` documents after *start* (element ``0`` is *start* itself,
+        or the empty corpus).
+    """
+    if start is None:
+        start = hash_fields(_CACHE_KEY_SCHEMA.encode(), config_fp.encode())
+    keys = [start]
+    for dk in doc_keys:
+        keys.append(hash_fields(keys[-1].encode(), dk.encode()))
+    return keys
+
+
+def _dir_size(path: pathlib.Path) -> int:
+    """Total size in bytes of the regular files below *path*."""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+class IndexBuildCache:
+    """On-disk LRU store of :class:`SimilarityIndex` build payloads.
+
+    Parameters
+    ----------
+    cache_dir : str, os.PathLike or None, optional
+        Root directory. ``None`` uses :data:`DEFAULT_INDEX_CACHE_DIR`.
+    max_bytes : int, optional
+        Size cap for all cached builds. Least recently used builds are evicted
+        once it is exceeded. Default 2 GiB.
+
+    Notes
+    -----
+    **User note:** Share one cache between processes by pointing them at the
+    same directory; publication is atomic and the metadata lives in SQLite::
+
+        index = SimilarityIndex(cache="~/.cache/my-project/index")
+        index.build(documents)  # cold: builds and stores
+        index.build(documents + new_documents)  # warm: adds new docs only
+
+    Examples
+    --------
+    >>> cache = IndexBuildCache(tmp_path, max_bytes=64 * 2**20)  # doctest: +SKIP
+    >>> SimilarityIndex(cache=cache).build(docs)  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        cache_dir: StrPath | None = None,
+        *,
+        max_bytes: int = 2 * 1024**3,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0, got {max_bytes}")
+        root = DEFAULT_INDEX_CACHE_DIR if cache_dir is None else cache_dir
+        self.cache_dir = pathlib.Path(root).expanduser()
+        self.max_bytes = int(max_bytes)
+        self._builds_dir = self.cache_dir / "builds"
+        self._builds_dir.mkdir(parents=True, exist_ok=True)
+        self._db_path = self.cache_dir / "cache.sqlite"
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success and always close it."""
+        conn = sqlite3.connect(str(self._db_path), timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def path_for(self, key: str) -> pathlib.Path:
+        """Directory holding the payload of build *key*."""
+        return self._builds_dir / key
+
+    def lookup(
+        self,
+        config_fp: str,
+        chain: Sequence[str],
+    ) -> tuple[int, pathlib.Path] | None:
+        """Find the longest cached prefix of a chained build.
+
+        Parameters
+        ----------
+        config_fp : str
+            Configuration fingerprint the chain was seeded with.
+        chain : sequence of str
+            Output of :func:`chain_keys`.
+
+        Returns
+        -------
+        (int, pathlib.Path) or None
+            Number of documents covered and the payload directory of the
+            longest cached prefix (possibly the full build), or ``None``.
+        """
+        n_total = len(chain) - 1
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, n_docs FROM builds "
+                "WHERE config_fp = ? AND n_docs <= ? AND n_docs > 0 "
+                "ORDER BY n_docs DESC",
+                (config_fp, n_total),
+            ).fetchall()
+            for key, n_docs in rows:
+                if chain[n_docs] != key:
+                    continue
+                path = self.path_for(key)
+                if not path.is_dir():
+                    conn.execute("DELETE FROM builds WHERE key = ?", (key,))
+                    continue
+                conn.execute(
+                    "UPDATE builds SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                return int(n_docs), path
+        return None
+
+    # ------------------------------------------------------------------
+    # Store / evict
+    # ------------------------------------------------------------------
+
+    def store(
+        self,
+        key: str,
+        config_fp: str,
+        n_docs: int,
+        writer: Callable[[pathlib.Path], None],
+    ) -> pathlib.Path:
+        """Publish a build payload under *key*.
+
+        Parameters
+        ----------
+        key : str
+            Build key (``chain_keys(...)[n_docs]``).
+        config_fp : str
+            Configuration fingerprint.
+        n_docs : int
+            Number of documents covered by the build.
+        writer : callable
+            ``writer(staging_dir)`` writes the payload into an empty directory.
+
+        Returns
+        -------
+        pathlib.Path
+            The published payload directory. If another writer published the
+            same key first, its (identical) payload is kept.
+        """
+        target = self.path_for(key)
+        staging = pathlib.Path(
+            tempfile.mkdtemp(dir=str(self._builds_dir), prefix=f".{key}.")
+        )
+        try:
+            writer(staging)
+            nbytes = _dir_size(staging)
+            try:
+                os.replace(staging, target)
+            except OSError:
+                # A concurrent writer published the same content first.
+                if not target.is_dir():
+                    raise
+                shutil.rmtree(staging, ignore_errors=True)
+                nbytes = _dir_size(target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO builds VALUES (?, ?, ?, ?, ?)",
+                (key, config_fp, int(n_docs), nbytes, time.time()),
+            )
+        self._enforce_limit(keep=key)
+        return target
+
+    def discard(self, key: str) -> None:
+        """Remove build *key* (e.g. a corrupt payload)."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM builds WHERE key = ?", (key,))
+        shutil.rmtree(self.path_for(key), ignore_errors=True)
+
+    def _enforce_limit(self, keep: str | None = None) -> None:
+        """Evict least recently used builds until under ``max_bytes``."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, nbytes FROM builds ORDER BY last_used ASC"
+            ).fetchall()
+            total = sum(nbytes for _key, nbytes in rows)
+            for key, nbytes in rows:
+                if total <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                conn.execute("DELETE FROM builds WHERE key = ?", (key,))
+                shutil.rmtree(self.path_for(key), ignore_errors=True)
+                total -= nbytes
+                logger.debug("IndexBuildCache: evicted %s (%d bytes)", key, nbytes)
+
+    def clear(self) -> None:
+        """Remove every cached build."""
+        with self._connect() as conn:
+            keys = [k for (k,) in conn.execute("SELECT key FROM builds")]
+            conn.execute("DELETE FROM builds")
+        for key in keys:
+            shutil.rmtree(self.path_for(key), ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    @property
+    def total_bytes(self) -> int:
+        """Size on disk of all cached builds."""
+        with self._connect() as conn:
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(nbytes), 0) FROM builds"
+            ).fetchone()
+        return int(total)
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            (n,) = conn.execute("SELECT COUNT(*) FROM builds").fetchone()
+        return int(n)
+
+    def __repr__(self) -> str:
+        return (
+            f"IndexBuildCache(cache_dir={str(self.cache_dir)!r}, "
+            f"max_bytes={self.max_bytes})"
+        )
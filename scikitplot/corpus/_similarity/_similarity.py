@@ -33,13 +33,21 @@ Supports Python 3.8 through 3.15.
 
 from __future__ import annotations
 
+import contextlib
+import heapq
+import json
 import logging
 import math
+import os
+import pathlib
 import re
+from array import array
 from collections import Counter  # noqa: F401
 from dataclasses import dataclass, field
 from typing import Any, Sequence
 
+from ._cache import IndexBuildCache, chain_keys, hash_fields
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -217,6 +225,38 @@ def _get_text(doc: Any, use_normalized: bool) -> str:
     return getattr(doc, "text", "")
 
 
+def _get_tokens(doc: Any, use_normalized: bool) -> list[str]:
+    """Keyword tokens of a document, preferring pre-computed ``tokens``."""
+    tokens = getattr(doc, "tokens", None)
+    if tokens is None:
+        tokens = _tokenize_simple(_get_text(doc, use_normalized))
+    return tokens
+
+
+def _doc_cache_key(doc: Any, use_normalized: bool) -> str:
+    """Content key of one document for the on-disk build cache.
+
+    Covers exactly what the index derives from the document: its tokens (or
+    the text they are computed from) and its embedding.
+    """
+    tokens = getattr(doc, "tokens", None)
+    if tokens is not None:
+        content = b"t" + json.dumps(list(tokens), ensure_ascii=False).encode()
+    else:
+        content = b"s" + _get_text(doc, use_normalized).encode("utf-8", "replace")
+    embedding = getattr(doc, "embedding", None)
+    if embedding is None:
+        vector = b""
+    else:
+        try:
+            import numpy as np  # noqa: PLC0415
+
+            vector = b"e" + np.asarray(embedding, dtype=np.float32).tobytes()
+        except Exception:  # noqa: BLE001 - malformed: dense is disabled anyway
+            vector = b"?"
+    return hash_fields(content, vector)
+
+
 # =====================================================================
 # BM25 sparse index (pure Python, no deps)
 # =====================================================================
@@ -231,69 +271,205 @@ class _BM25Index:
         Term frequency saturation.
     b : float
         Length normalisation factor.
+
+    Notes
+    -----
+    **Developer note:** The index is an inverted index in CSR layout built on
+    stdlib :class:`array.array` buffers (no NumPy dependency).  Postings for
+    the term with row ``r`` of ``_vocab`` live in
+    ``_indices[_indptr[r]:_indptr[r + 1]]`` (int32 document indices, ascending)
+    with matching ``_weights`` (float32).  Each weight is the complete BM25
+    contribution of one occurrence of the term in the query,
+    ``idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))``, so the
+    document-length normalisation and IDF are paid once at build time and a
+    query only walks the postings of its own terms.  Query cost therefore
+    scales with the number of matching postings, not with corpus size.
     """
 
     def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
         self.k1 = k1
         self.b = b
-        self._doc_freqs: dict[str, int] = {}
-        self._doc_lens: list[int] = []
-        self._doc_tfs: list[dict[str, int]] = []
+        self._vocab: dict[str, int] = {}
+        self._indptr: array = array("q", [0])
+        self._indices: array = array("i")
+        self._weights: array = array("f")
+        self._doc_lens: array = array("i")
         self._avgdl: float = 0.0
         self._n_docs: int = 0
 
     def build(self, token_lists: Sequence[list[str]]) -> None:
         """Build index from pre-tokenised document lists."""
-        self._n_docs = len(token_lists)
-        self._doc_freqs = {}
-        self._doc_lens = []
-        self._doc_tfs = []
-
-        for tokens in token_lists:
+        n = len(token_lists)
+        self._n_docs = n
+        self._doc_lens = array("i", (len(tokens) for tokens in token_lists))
+        total = sum(self._doc_lens)
+        # An all-empty corpus has no length to normalise by; any positive
+        # avgdl keeps the norms finite (there are no postings to weight).
+        self._avgdl = total / n if total else 1.0
+
+        # Term -> [(doc_index, tf), ...]; documents are visited in order, so
+        # every postings list comes out sorted by document index.
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for i, tokens in enumerate(token_lists):
             tf: dict[str, int] = {}
             for t in tokens:
                 tf[t] = tf.get(t, 0) + 1
-            self._doc_tfs.append(tf)
-            self._doc_lens.append(len(tokens))
-            for term in set(tokens):
-                self._doc_freqs[term] = self._doc_freqs.get(term, 0) + 1
+            for term, count in tf.items():
+                plist = postings.get(term)
+                if plist is None:
+                    postings[term] = [(i, count)]
+                else:
+                    plist.append((i, count))
+
+        k1, b, avgdl = self.k1, self.b, self._avgdl
+        # Precomputed per-document length normalisation (BM25 denominator).
+        norms = [k1 * (1 - b + b * dl / avgdl) for dl in self._doc_lens]
+
+        vocab: dict[str, int] = {}
+        indptr = array("q", [0])
+        indices = array("i")
+        weights = array("f")
+        for term, plist in postings.items():
+            df = len(plist)
+            idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+            vocab[term] = len(vocab)
+            for i, tf in plist:
+                indices.append(i)
+                weights.append(idf * tf * (k1 + 1) / (tf + norms[i]))
+            indptr.append(len(indices))
 
-        total = sum(self._doc_lens)
-        self._avgdl = total / self._n_docs if self._n_docs else 1.0
+        self._vocab = vocab
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+
+    @property
+    def n_postings(self) -> int:
+        """Total number of ``(term, document)`` postings in the index."""
+        return len(self._indices)
+
+    def doc_freq(self, term: str) -> int:
+        """Return the number of indexed documents containing *term*."""
+        row = self._vocab.get(term)
+        if row is None:
+            return 0
+        return self._indptr[row + 1] - self._indptr[row]
+
+    def _scores(self, query_tokens: Sequence[str]) -> dict[int, float]:
+        """Accumulate BM25 scores over the postings of *query_tokens*.
+
+        A term repeated in the query contributes once per occurrence.
+        """
+        vocab = self._vocab
+        indptr = self._indptr
+        indices = self._indices
+        weights = self._weights
+        qtf: dict[int, int] = {}
+        for term in query_tokens:
+            row = vocab.get(term)
+            if row is not None:
+                qtf[row] = qtf.get(row, 0) + 1
+
+        scores: dict[int, float] = {}
+        get = scores.get
+        for row, count in qtf.items():
+            for j in range(indptr[row], indptr[row + 1]):
+                i = indices[j]
+                scores[i] = get(i, 0.0) + count * weights[j]
+        return scores
 
     def query(
         self,
         query_tokens: list[str],
         top_k: int = 10,
     ) -> list[tuple[int, float]]:
-        """Return ``(doc_index, bm25_score)`` pairs, sorted desc."""
-        scores: list[float] = [0.0] * self._n_docs
-        n = self._n_docs
+        """Return ``(doc_index, bm25_score)`` pairs, sorted desc.
 
-        for term in query_tokens:
-            df = self._doc_freqs.get(term, 0)
-            if df == 0:
-                continue
-            idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
-            for i in range(n):
-                tf = self._doc_tfs[i].get(term, 0)
-                if tf == 0:
-                    continue
-                dl = self._doc_lens[i]
-                num = tf * (self.k1 + 1)
-                den = tf + self.k1 * (1 - self.b + self.b * dl / self._avgdl)
-                scores[i] += idf * num / den
+        Ties are broken by ascending document index.  Only documents with a
+        positive score are returned.
+        """
+        if top_k < 1 or not self._n_docs:
+            return []
+        scores = self._scores(query_tokens)
+        hits = [(i, s) for i, s in scores.items() if s > 0]
+        # Partial selection: O(m log k) over the m matching documents.
+        return heapq.nsmallest(top_k, hits, key=lambda x: (-x[1], x[0]))
+
+    def query_batch(
+        self,
+        queries: Sequence[list[str]],
+        top_k: int = 10,
+    ) -> list[list[tuple[int, float]]]:
+        """Run :meth:`query` for each token list in *queries*.
+
+        Returns one result list per query, in input order.
+        """
+        return [self.query(tokens, top_k=top_k) for tokens in queries]
+
+    # CSR buffers persisted by save()/load(), with their array typecodes.
+    _ARRAYS = (
+        ("_indptr", "q"),
+        ("_indices", "i"),
+        ("_weights", "f"),
+        ("_doc_lens", "i"),
+    )
+
+    def save(self, directory: Any) -> None:
+        """Write the built index into *directory* as raw ``array`` buffers."""
+        path = pathlib.Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "k1": self.k1,
+            "b": self.b,
+            "avgdl": self._avgdl,
+            "n_docs": self._n_docs,
+            "itemsize": {code: array(code).itemsize for _, code in self._ARRAYS},
+            "vocab": list(self._vocab),  # dict order == CSR row order
+        }
+        (path / "bm25.json").write_text(json.dumps(meta), encoding="utf-8")
+        for name, _code in self._ARRAYS:
+            with open(path / f"bm25{name}.bin", "wb") as fh:
+                getattr(self, name).tofile(fh)
+
+    @classmethod
+    def load(cls, directory: Any) -> _BM25Index:
+        """Restore an index written by :meth:`save`.
 
-        # Sort by score descending, take top_k
-        indexed = [(i, s) for i, s in enumerate(scores) if s > 0]
-        indexed.sort(key=lambda x: x[1], reverse=True)
-        return indexed[:top_k]
+        Raises
+        ------
+        ValueError
+            If the buffers were written on a platform with different
+            ``array`` item sizes.
+        """
+        path = pathlib.Path(directory)
+        meta = json.loads((path / "bm25.json").read_text(encoding="utf-8"))
+        index = cls(k1=meta["k1"], b=meta["b"])
+        for name, code in cls._ARRAYS:
+            buf = array(code)
+            if meta["itemsize"][code] != buf.itemsize:
+                raise ValueError(f"incompatible BM25 buffer item size for {code!r}")
+            buf.frombytes((path / f"bm25{name}.bin").read_bytes())
+            setattr(index, name, buf)
+        index._vocab = {term: row for row, term in enumerate(meta["vocab"])}
+        index._avgdl = float(meta["avgdl"])
+        index._n_docs = int(meta["n_docs"])
+        return index
 
 
 # =====================================================================
 # SimilarityIndex
 # =====================================================================
 
+# An Annoy forest cannot grow; rows added incrementally are served from an
+# exact delta segment until it exceeds this fraction of the corpus, at which
+# point the dense index is rebuilt in one pass.
+_COMPACT_RATIO = 0.25
+
+
+def _batch_row_hits(ids: Any, scores: Any) -> list[tuple[int, float]]:
+    """``(row, score)`` pairs of one ``query_batch`` row, padding dropped."""
+    return [(int(i), float(s)) for i, s in zip(ids, scores) if i >= 0]
+
 
 class SimilarityIndex:
     """Multi-mode similarity index over ``CorpusDocument`` collections.
@@ -302,6 +478,14 @@ class SimilarityIndex:
     ----------
     config : SearchConfig or None, optional
         Default search configuration.  Can be overridden per query.
+    cache : IndexBuildCache, str, os.PathLike or None, optional
+        Persistent build cache (a path creates an :class:`IndexBuildCache`
+        there).  When set, :meth:`build` restores token lists, BM25 postings,
+        embeddings and the dense index of a previously built corpus from disk,
+        and reuses the longest cached prefix of a grown corpus so that only the
+        new documents are added.  Default ``None`` (no caching).
+
+        .. versionadded:: 0.5
 
     Notes
     -----
@@ -311,6 +495,10 @@ class SimilarityIndex:
         index.build(documents)
         results = index.search("What did Hamlet say about death?")
 
+    Grow it with :meth:`add` instead of rebuilding::
+
+        index.add(new_documents)
+
     **Developer note:** The index stores references to the original
     documents.  If documents are mutated after building, results
     are undefined.
@@ -331,14 +519,21 @@ class SimilarityIndex:
     def __init__(
         self,
         config: SearchConfig | None = None,
+        *,
+        cache: IndexBuildCache | str | os.PathLike | None = None,
     ) -> None:
         self.config = config or SearchConfig()
+        if cache is not None and not isinstance(cache, IndexBuildCache):
+            cache = IndexBuildCache(cache)
+        self.cache = cache
         self._documents: list[Any] = []
         self._bm25: _BM25Index | None = None
         self._token_lists: list[list[str]] = []
         self._embeddings: Any = None  # np.ndarray or None
         self._backend: Any = None  # ANNBackend or None (dense index)
         self._generation: int = 0  # bumped on every successful build()
+        self._config_fp: str | None = None  # cache fingerprint of the build
+        self._cache_key: str | None = None  # cache key of the current contents
 
     # ------------------------------------------------------------------
     # Build
@@ -361,18 +556,28 @@ class SimilarityIndex:
         if not documents:
             raise ValueError("Cannot build index from empty documents.")
 
-        self._documents = list(documents)
+        if self.cache is not None:
+            self._build_cached(list(documents))
+        else:
+            self._build_full(list(documents))
+
+        self._generation += 1
+        logger.info(
+            "SimilarityIndex: built with %d documents "
+            "(dense=%s, backend=%s, sparse=True, generation=%d)",
+            len(self._documents),
+            self._embeddings is not None,
+            self.backend_name,
+            self._generation,
+        )
+
+    def _build_full(self, documents: list[Any]) -> None:
+        """Build every component from scratch."""
+        self._documents = documents
         use_norm = self.config.use_normalized_text
 
         # Build keyword index (always — needed for KEYWORD and HYBRID)
-        self._token_lists = []
-        for doc in self._documents:
-            # Prefer pre-computed tokens
-            tokens = getattr(doc, "tokens", None)
-            if tokens is None:
-                text = _get_text(doc, use_norm)
-                tokens = _tokenize_simple(text)
-            self._token_lists.append(tokens)
+        self._token_lists = [_get_tokens(doc, use_norm) for doc in documents]
 
         self._bm25 = _BM25Index()
         self._bm25.build(self._token_lists)
@@ -408,30 +613,221 @@ class SimilarityIndex:
                     # degrade a deliberately requested backend.
                     self._build_ann_backend(self._embeddings)
 
+    def _build_cached(self, documents: list[Any]) -> None:
+        """Build through :attr:`cache`, reusing the longest cached prefix."""
+        use_norm = self.config.use_normalized_text
+        config_fp = self._config_fingerprint()
+        chain = chain_keys(
+            config_fp, [_doc_cache_key(doc, use_norm) for doc in documents]
+        )
+        restored = 0
+        hit = self.cache.lookup(config_fp, chain)
+        if hit is not None:
+            n_cached, path = hit
+            try:
+                self._restore(documents[:n_cached], path)
+            except Exception as exc:  # noqa: BLE001 - corrupt/incompatible entry
+                logger.warning("SimilarityIndex: discarding cached build: %s", exc)
+                self.cache.discard(chain[n_cached])
+            else:
+                restored = n_cached
+                logger.debug(
+                    "SimilarityIndex: restored %d/%d documents from %s",
+                    n_cached,
+                    len(documents),
+                    path,
+                )
+        if restored == 0:
+            self._build_full(documents)
+        elif restored < len(documents):
+            self._extend(documents[restored:])
+        self._config_fp = config_fp
+        self._cache_key = chain[-1]
+        if restored < len(documents):
+            self._store()
+
+    def _config_fingerprint(self) -> str:
+        """Hash of every setting that shapes the cached build payload."""
+        cfg = self.config
+        try:
+            backend = self._select_backend().name
+        except RuntimeError:
+            # Unavailable explicit backend: only raises if dense is built.
+            backend = cfg.backend
+        bm25 = _BM25Index()
+        fields = {
+            "backend": backend,
+            "use_normalized_text": cfg.use_normalized_text,
+            "bm25": [bm25.k1, bm25.b],
+        }
+        if backend == "annoy":
+            fields.update(
+                (name, getattr(cfg, name))
+                for name in (
+                    "annoy_n_trees",
+                    "annoy_metric",
+                    "annoy_impl",
+                    "annoy_dtype",
+                    "annoy_index_dtype",
+                )
+            )
+        return hash_fields(json.dumps(fields, sort_keys=True).encode())
+
+    def _restore(self, documents: list[Any], path: pathlib.Path) -> None:
+        """Load a cached build payload for *documents* from *path*."""
+        manifest = json.loads((path / "manifest.json").read_text(encoding="utf-8"))
+        if manifest["n_docs"] != len(documents):
+            raise ValueError(
+                f"cached build has {manifest['n_docs']} documents, "
+                f"expected {len(documents)}"
+            )
+        token_lists = json.loads((path / "tokens.json").read_text(encoding="utf-8"))
+        bm25 = _BM25Index.load(path / "bm25")
+        embeddings = backend = None
+        if manifest["dense"]:
+            import numpy as np  # noqa: PLC0415
+
+            embeddings = np.load(str(path / "embeddings.npy"), mmap_mode="r")
+            backend = self._select_backend()
+            try:
+                backend.load(path / "backend")
+            except (NotImplementedError, FileNotFoundError):
+                backend.build(embeddings)
+        self._documents = documents
+        self._token_lists = token_lists
+        self._bm25 = bm25
+        self._embeddings = embeddings
+        self._backend = backend
+
+    def _write_payload(self, path: pathlib.Path) -> None:
+        """Write the current build into an empty cache directory."""
+        dense = self._embeddings is not None
+        (path / "tokens.json").write_text(
+            json.dumps(self._token_lists, ensure_ascii=False), encoding="utf-8"
+        )
+        self._bm25.save(path / "bm25")
+        if dense:
+            import numpy as np  # noqa: PLC0415
+
+            np.save(str(path / "embeddings.npy"), self._embeddings)
+            # Backends without save() are rebuilt from embeddings.npy on restore.
+            with contextlib.suppress(NotImplementedError):
+                self._backend.save(path / "backend")
+        # Written last: a payload without a manifest is never restored.
+        manifest = {"n_docs": len(self._documents), "dense": dense}
+        (path / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+    def _store(self) -> None:
+        """Publish the current build to :attr:`cache` (best effort)."""
+        try:
+            self.cache.store(
+                self._cache_key,
+                self._config_fp,
+                len(self._documents),
+                self._write_payload,
+            )
+        except Exception as exc:  # noqa: BLE001 - caching must not fail a build
+            logger.warning("SimilarityIndex: could not cache build: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Incremental update
+    # ------------------------------------------------------------------
+
+    def add(self, documents: Sequence[Any]) -> None:
+        """Append documents to the index without rebuilding it.
+
+        Token lists of the existing documents are reused and new embeddings
+        are added to the dense backend in place (Annoy serves them from an
+        exact delta segment until it is compacted).  Equivalent to
+        :meth:`build` over the old documents followed by *documents*.
+
+        Parameters
+        ----------
+        documents : Sequence[CorpusDocument]
+            Documents to append.  On an unbuilt index this is :meth:`build`.
+
+        Notes
+        -----
+        **Developer note:** BM25 IDF and average document length depend on
+        the whole corpus, so the postings are rebuilt from the stored token
+        lists; only tokenisation of the new documents is paid.
+
+        .. versionadded:: 0.5
+        """
+        documents = list(documents)
+        if not documents:
+            return
+        if not self._documents:
+            self.build(documents)
+            return
+        self._extend(documents)
+        if self.cache is not None and self._cache_key is not None:
+            use_norm = self.config.use_normalized_text
+            self._cache_key = chain_keys(
+                self._config_fp,
+                [_doc_cache_key(doc, use_norm) for doc in documents],
+                start=self._cache_key,
+            )[-1]
+            self._store()
         self._generation += 1
         logger.info(
-            "SimilarityIndex: built with %d documents "
-            "(dense=%s, backend=%s, sparse=True, generation=%d)",
+            "SimilarityIndex: added %d documents (total=%d, pending=%d, "
+            "generation=%d)",
+            len(documents),
             len(self._documents),
-            self._embeddings is not None,
-            self.backend_name,
+            self._backend.n_pending if self._backend is not None else 0,
             self._generation,
         )
 
-    def _build_ann_backend(self, embeddings: Any) -> None:
-        """Build the dense ANN index via the centralized backend selector.
+    def _extend(self, documents: list[Any]) -> None:
+        """Append *documents* to every component of a built index."""
+        use_norm = self.config.use_normalized_text
+        self._documents = self._documents + documents
+        self._token_lists = self._token_lists + [
+            _get_tokens(doc, use_norm) for doc in documents
+        ]
+        self._bm25 = _BM25Index()
+        self._bm25.build(self._token_lists)
 
-        The backend is chosen from :class:`SearchConfig.backend`
-        (default ``"auto"`` → Annoy when available, else FAISS, Voyager, or
-        exact brute-force).  Selecting an explicitly named backend that is not
-        installed raises :class:`RuntimeError` here — a deliberately requested
-        backend must not be silently downgraded.
-        """
+        if self._embeddings is None:
+            # Dense search needs every document embedded, as in build().
+            return
+        new = [getattr(doc, "embedding", None) for doc in documents]
+        if any(e is None for e in new):
+            logger.warning("Dense index disabled: added documents lack embeddings.")
+            self._backend = None
+            self._embeddings = None
+            return
+        import numpy as np  # noqa: PLC0415
+
+        try:
+            added = np.vstack(new).astype(np.float32)
+            stacked = np.concatenate([self._embeddings, added])
+        except Exception as exc:  # noqa: BLE001 - tolerate malformed data
+            logger.warning("Failed to stack embeddings; SEMANTIC disabled: %s", exc)
+            self._backend = None
+            self._embeddings = None
+            return
+        self._embeddings = stacked
+        try:
+            self._backend.add(added)
+        except NotImplementedError:
+            self._build_ann_backend(stacked)
+            return
+        except ValueError as exc:
+            logger.warning("Dense index disabled (invalid embeddings): %s", exc)
+            self._backend = None
+            self._embeddings = None
+            return
+        if self._backend.n_pending > _COMPACT_RATIO * len(self._documents):
+            self._build_ann_backend(stacked)
+
+    def _select_backend(self) -> Any:
+        """Unbuilt ANN backend selected by :attr:`config`."""
         from ._backends import select_backend  # noqa: PLC0415
 
         cfg = self.config
-        # Config errors (unknown/unavailable explicit backend) propagate.
-        backend = select_backend(
+        return select_backend(
             cfg.backend,
             annoy_metric=cfg.annoy_metric,
             annoy_n_trees=cfg.annoy_n_trees,
@@ -440,6 +836,18 @@ class SimilarityIndex:
             annoy_dtype=cfg.annoy_dtype,
             annoy_index_dtype=cfg.annoy_index_dtype,
         )
+
+    def _build_ann_backend(self, embeddings: Any) -> None:
+        """Build the dense ANN index via the centralized backend selector.
+
+        The backend is chosen from :class:`SearchConfig.backend`
+        (default ``"auto"`` → Annoy when available, else FAISS, Voyager, or
+        exact brute-force).  Selecting an explicitly named backend that is not
+        installed raises :class:`RuntimeError` here — a deliberately requested
+        backend must not be silently downgraded.
+        """
+        # Config errors (unknown/unavailable explicit backend) propagate.
+        backend = self._select_backend()
         try:
             backend.build(embeddings)
         except ValueError as exc:
@@ -497,6 +905,76 @@ class SimilarityIndex:
         else:
             raise ValueError(f"Unknown match_mode: {cfg.match_mode!r}")
 
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        *,
+        config: SearchConfig | None = None,
+        query_embeddings: Any | None = None,
+    ) -> list[list[SearchResult]]:
+        """Run :meth:`search` for many queries at once.
+
+        In SEMANTIC and HYBRID mode the dense candidates of all queries are
+        fetched with a single :meth:`ANNBackend.query_batch` call (one blocked
+        matrix product for brute force, one native batch search otherwise)
+        instead of one backend query per text, which is what multi-query
+        evaluation and fusion re-ranking spend most of their time on.
+
+        Parameters
+        ----------
+        queries : Sequence[str]
+            Query texts.
+        config : SearchConfig or None, optional
+            Override default config for every query.
+        query_embeddings : array-like of shape (n_queries, dim) or None
+            Pre-computed query embeddings, one row per query.  Required for
+            SEMANTIC mode.
+
+        Returns
+        -------
+        list[list[SearchResult]]
+            One result list per query, in input order; each list equals
+            ``search(queries[i], config=config,
+            query_embedding=query_embeddings[i])``.
+
+        Raises
+        ------
+        ValueError
+            If the number of embedding rows does not match ``len(queries)``.
+
+        Notes
+        -----
+        .. versionadded:: 0.5
+        """
+        cfg = config or self.config
+        queries = list(queries)
+        if cfg.match_mode not in ("semantic", "hybrid"):
+            return [self.search(q, config=cfg) for q in queries]
+        if query_embeddings is None:
+            return [self.search(q, config=cfg) for q in queries]
+        import numpy as np  # noqa: PLC0415
+
+        embeddings = np.asarray(query_embeddings, dtype=np.float32)
+        if embeddings.ndim != 2 or embeddings.shape[0] != len(queries):  # noqa: PLR2004
+            raise ValueError(
+                f"query_embeddings must have shape ({len(queries)}, dim), "
+                f"got {embeddings.shape}"
+            )
+        if self._backend is None or self._embeddings is None or not queries:
+            return [
+                self.search(q, config=cfg, query_embedding=e)
+                for q, e in zip(queries, embeddings)
+            ]
+        if cfg.match_mode == "semantic":
+            run, fetch_k = self._search_semantic, cfg.top_k
+        else:
+            run, fetch_k = self._search_hybrid, self._hybrid_fetch_k(cfg)
+        ids, scores = self._backend.query_batch(embeddings, max(1, fetch_k))
+        return [
+            run(query, embeddings[r], cfg, _batch_row_hits(ids[r], scores[r]))
+            for r, query in enumerate(queries)
+        ]
+
     # ------------------------------------------------------------------
     # STRICT search
     # ------------------------------------------------------------------
@@ -572,6 +1050,7 @@ class SimilarityIndex:
         query: str,
         query_embedding: Any | None,
         cfg: SearchConfig,
+        hits: Sequence[tuple[int, float]] | None = None,
     ) -> list[SearchResult]:
         """Dense vector cosine similarity search via the unified backend.
 
@@ -580,6 +1059,8 @@ class SimilarityIndex:
         owned by the selected :class:`~._backends.ANNBackend`, so this method
         only applies the semantic threshold and wraps hits in
         :class:`SearchResult`.  Scores are cosine similarity in ``[-1, 1]``.
+        *hits* are ``(row, score)`` pairs precomputed by a batched backend
+        query (:meth:`search_batch`); when given, the backend is not queried.
         """
         if self._embeddings is None or self._backend is None:
             logger.warning(
@@ -595,8 +1076,10 @@ class SimilarityIndex:
                 "which auto-embeds the query."
             )
 
+        if hits is None:
+            hits = self._backend.query(query_embedding, cfg.top_k)
         results: list[SearchResult] = []
-        for idx, score in self._backend.query(query_embedding, cfg.top_k):
+        for idx, score in hits[: cfg.top_k]:
             if score < cfg.semantic_threshold:
                 continue
             results.append(
@@ -619,10 +1102,15 @@ class SimilarityIndex:
         query: str,
         query_embedding: Any | None,
         cfg: SearchConfig,
+        hits: Sequence[tuple[int, float]] | None = None,
     ) -> list[SearchResult]:
-        """Reciprocal rank fusion of BM25 + dense vector."""
+        """Reciprocal rank fusion of BM25 + dense vector.
+
+        *hits* are precomputed dense ``(row, score)`` candidates, as in
+        :meth:`_search_semantic`.
+        """
         # Fetch more candidates for fusion
-        fetch_k = min(cfg.top_k * 3, len(self._documents))
+        fetch_k = self._hybrid_fetch_k(cfg)
 
         kw_cfg = SearchConfig(
             top_k=fetch_k,
@@ -639,7 +1127,9 @@ class SimilarityIndex:
                 semantic_threshold=0.0,
                 use_normalized_text=cfg.use_normalized_text,
             )
-            semantic_results = self._search_semantic(query, query_embedding, sem_cfg)
+            semantic_results = self._search_semantic(
+                query, query_embedding, sem_cfg, hits
+            )
 
         # Reciprocal rank fusion
         rrf_scores: dict[str, float] = {}
@@ -746,6 +1236,51 @@ class SimilarityIndex:
             out.append((doc_id if doc_id is not None else str(idx), float(score)))
         return out
 
+    def query_batch(
+        self,
+        vectors: Any,
+        k: int | None = None,
+    ) -> list[list[tuple[str, float]]]:
+        """Batched :meth:`query`: one backend call for many query vectors.
+
+        Parameters
+        ----------
+        vectors : array-like of shape (n_queries, dim)
+            Query embeddings.
+        k : int or None, optional
+            Neighbours per query.  Defaults to ``config.top_k``.
+
+        Returns
+        -------
+        list of list of (str, float)
+            One ``(doc_id, cosine_score)`` list per query row, best first.
+
+        Raises
+        ------
+        ValueError
+            If the vector width mismatches the index or values are non-finite.
+
+        Notes
+        -----
+        .. versionadded:: 0.5
+        """
+        if self._backend is None or self._embeddings is None:
+            return [[] for _ in range(len(vectors))]
+        top = int(k) if k is not None else self.config.top_k
+        ids, scores = self._backend.query_batch(vectors, top)
+        out: list[list[tuple[str, float]]] = []
+        for r in range(ids.shape[0]):
+            row: list[tuple[str, float]] = []
+            for idx, score in _batch_row_hits(ids[r], scores[r]):
+                doc_id = getattr(self._documents[idx], "doc_id", None)
+                row.append((doc_id if doc_id is not None else str(idx), score))
+            out.append(row)
+        return out
+
+    def _hybrid_fetch_k(self, cfg: SearchConfig) -> int:
+        """Candidates per leg fetched for HYBRID fusion."""
+        return min(cfg.top_k * 3, len(self._documents))
+
     def __repr__(self) -> str:
         return (
             f"SimilarityIndex("
@@ -20,6 +20,9 @@ Coverage targets
   (``scikitplot.annoy.Index`` high-level and ``scikitplot.annoy._annoy.Index``
   Cython) via injected fakes, the ``1 - d**2/2`` angular→cosine recovery,
   ``dtype`` / ``index_dtype`` passthrough, and ``impl='auto'`` fallback.
+* ``query_batch`` — ``(ids, scores)`` arrays equal to per-row ``query`` for
+  brute force (blocked, tie-exact), Annoy (native and per-row) and the
+  base-class fallback; ``-1`` / ``-inf`` padding.
 * :class:`SimilarityIndex` — the ``query(vector, k) -> [(doc_id, score)]``
   seam consumed by :mod:`scikitplot.mcp`, ``backend_name``, and graceful
   degradation to sparse when embeddings are non-finite.
@@ -293,6 +296,76 @@ class TestAnnoyBackend:
         assert fb._resolved_impl == "cython"
 
 
+# ===================================================================== #
+# query_batch: rectangular (ids, scores) arrays, row i == query(row i)
+# ===================================================================== #
+def _rows_equal_single(backend, queries, k):
+    ids, scores = backend.query_batch(queries, k)
+    assert ids.shape == scores.shape == (len(queries), k)
+    assert ids.dtype == np.int64 and scores.dtype == np.float64
+    for r, q in enumerate(queries):
+        single = backend.query(q, k)
+        n = len(single)
+        assert ids[r, :n].tolist() == [i for i, _ in single]
+        np.testing.assert_allclose(scores[r, :n], [s for _, s in single], atol=1e-6)
+        assert (ids[r, n:] == -1).all() and np.isneginf(scores[r, n:]).all()
+
+
+class TestQueryBatch:
+    def test_bruteforce_matches_single_queries(self, monkeypatch):
+        rng = np.random.default_rng(0)
+        embs = rng.normal(size=(300, 5)).astype(np.float32)
+        embs[10] = embs[20] = embs[30]  # exact ties must keep index order
+        queries = np.vstack([rng.normal(size=(40, 5)), embs[30], np.zeros(5)])
+        bf = B.BruteForceBackend()
+        bf.build(embs)
+        # Force several similarity blocks.
+        monkeypatch.setattr(B, "_BATCH_BLOCK_BYTES", 4 * 300 * 7)
+        _rows_equal_single(bf, queries.astype(np.float32), k=6)
+        _rows_equal_single(bf, queries.astype(np.float32), k=400)  # k > n pads
+
+    def test_tied_boundary_keeps_lowest_ids(self):
+        bf = B.BruteForceBackend()
+        bf.build(np.ones((50, 2), dtype=np.float32))
+        ids, _ = bf.query_batch(np.ones((3, 2), dtype=np.float32), 4)
+        assert ids.tolist() == [[0, 1, 2, 3]] * 3
+
+    def test_validation(self):
+        bf = B.BruteForceBackend()
+        bf.build(EMB)
+        with pytest.raises(ValueError):
+            bf.query_batch(np.ones((2, 3), dtype=np.float32), 1)
+        with pytest.raises(ValueError):
+            bf.query_batch(np.array([[np.inf, 0.0]]), 1)
+        ids, _ = bf.query_batch(Q, 2)  # 1-D input is one query
+        assert ids.shape == (1, 2)
+
+    @pytest.mark.parametrize("fake_annoy", [(True, True)], indirect=True)
+    def test_annoy_per_row_fallback(self, fake_annoy):
+        ab = B.select_backend("annoy", annoy_impl="highlevel")
+        ab.build(EMB)
+        _rows_equal_single(ab, np.vstack([EMB, np.zeros(2)]), k=3)
+
+    @pytest.mark.skipif(
+        not B.AnnoyBackend.is_available(), reason="native annoy not importable"
+    )
+    def test_annoy_native_batch_with_delta_segment(self):
+        rng = np.random.default_rng(3)
+        embs = rng.normal(size=(200, 8)).astype(np.float32)
+        ab = B.AnnoyBackend(impl="cython", n_trees=20, search_k=100_000)
+        ab.build(embs[:150])
+        ab.add(embs[150:])
+        _rows_equal_single(ab, embs[::7], k=5)
+
+    def test_fallback_loops_query(self):
+        class _Single(B.BruteForceBackend):
+            query_batch = B.ANNBackend.query_batch
+
+        sb = _Single()
+        sb.build(EMB)
+        _rows_equal_single(sb, EMB, k=5)
+
+
 # ===================================================================== #
 # SimilarityIndex end-to-end + the MCP query() seam
 # ===================================================================== #
@@ -322,6 +395,21 @@ class TestSimilarityIndexSeam:
         assert isinstance(seam[0][1], float)
         assert all(isinstance(d, str) for d, _ in seam)
 
+    @pytest.mark.parametrize("mode", ["semantic", "hybrid"])
+    def test_search_batch_matches_search(self, mode):
+        cfg = SearchConfig(match_mode=mode, top_k=2, backend="bruteforce")
+        idx = SimilarityIndex(cfg)
+        idx.build(self._docs())
+        texts = ["alpha", "delta", "gamma"]
+        vecs = np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 0.0]])
+        batch = idx.search_batch(texts, query_embeddings=vecs)
+        assert batch == [
+            idx.search(t, query_embedding=v) for t, v in zip(texts, vecs)
+        ]
+        assert idx.query_batch(vecs, k=2) == [idx.query(v, k=2) for v in vecs]
+        with pytest.raises(ValueError):
+            idx.search_batch(texts, query_embeddings=vecs[:2])
+
     def test_query_seam_empty_without_dense(self):
         idx = SimilarityIndex(SearchConfig(match_mode="keyword", top_k=2))
         idx.build([_Doc("k0", "qubit"), _Doc("k1", "logic")])
@@ -0,0 +1,239 @@
+# corpus/_similarity/tests/test__cache.py
+#
+# flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Tests for corpus._similarity._cache and incremental SimilarityIndex builds
+==========================================================================
+
+Coverage targets
+----------------
+* :func:`chain_keys` — prefix keys, continuation via ``start``.
+* :class:`IndexBuildCache` — longest-prefix lookup, atomic store, LRU
+  eviction under ``max_bytes``, discard of corrupt entries.
+* Backend ``save`` / ``load`` / ``add`` round trips (brute-force and, when the
+  native extension is importable, Annoy with its delta segment).
+* :class:`SimilarityIndex` — warm rebuild restores instead of rebuilding,
+  prefix reuse, :meth:`SimilarityIndex.add` equivalence with a full build.
+
+Run with::
+
+    pytest corpus/_similarity/tests/test__cache.py -v
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from scikitplot.corpus._similarity import (
+    IndexBuildCache,
+    SearchConfig,
+    SimilarityIndex,
+)
+from scikitplot.corpus._similarity import _backends as B
+from scikitplot.corpus._similarity._cache import chain_keys
+
+
+class _Doc:
+    def __init__(self, doc_id, text, embedding=None):
+        self.doc_id = doc_id
+        self.text = text
+        self.embedding = embedding
+
+
+def _docs(n, dim=8, seed=0):
+    rng = np.random.default_rng(seed)
+    words = [f"w{i}" for i in range(50)]
+    return [
+        _Doc(
+            f"d{i}",
+            " ".join(rng.choice(words, 12)),
+            rng.normal(size=dim).astype(np.float32),
+        )
+        for i in range(n)
+    ]
+
+
+def _ids(results):
+    return [(r.doc.doc_id, round(r.score, 5)) for r in results]
+
+
+# ===================================================================== #
+# Keys and the store
+# ===================================================================== #
+class TestIndexBuildCache:
+    def test_chain_keys_prefix_and_continuation(self):
+        full = chain_keys("cfg", ["a", "b", "c"])
+        assert len(full) == 4
+        assert chain_keys("cfg", ["a", "b"]) == full[:3]
+        assert chain_keys("cfg", ["c"], start=full[2]) == full[2:]
+        assert chain_keys("other", ["a"])[1] != full[1]
+
+    def test_lookup_returns_longest_prefix(self, tmp_path):
+        cache = IndexBuildCache(tmp_path)
+        chain = chain_keys("cfg", ["a", "b", "c", "d"])
+        for n in (1, 3):
+            cache.store(chain[n], "cfg", n, lambda p: (p / "x").write_bytes(b"1"))
+        n, path = cache.lookup("cfg", chain)
+        assert n == 3 and path == cache.path_for(chain[3])
+        assert cache.lookup("cfg", chain_keys("cfg", ["z"])) is None
+        assert cache.lookup("other", chain) is None
+
+    def test_lru_eviction(self, tmp_path):
+        cache = IndexBuildCache(tmp_path, max_bytes=250)
+        keys = chain_keys("cfg", ["a", "b", "c"])[1:]
+
+        def payload(p):
+            (p / "blob").write_bytes(b"x" * 100)
+
+        cache.store(keys[0], "cfg", 1, payload)
+        cache.store(keys[1], "cfg", 2, payload)
+        cache.lookup("cfg", chain_keys("cfg", ["a"]))  # touch keys[0]
+        cache.store(keys[2], "cfg", 3, payload)
+        assert len(cache) == 2 and cache.total_bytes == 200
+        assert not cache.path_for(keys[1]).exists()
+        assert cache.path_for(keys[0]).is_dir()
+
+    def test_failed_writer_leaves_nothing(self, tmp_path):
+        cache = IndexBuildCache(tmp_path)
+
+        def boom(p):
+            (p / "partial").write_bytes(b"x")
+            raise OSError("disk full")
+
+        with pytest.raises(OSError):
+            cache.store("k", "cfg", 1, boom)
+        assert len(cache) == 0
+        assert list((tmp_path / "builds").iterdir()) == []
+
+    def test_rejects_negative_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            IndexBuildCache(tmp_path, max_bytes=-1)
+
+
+# ===================================================================== #
+# Backend persistence and incremental add
+# ===================================================================== #
+def _backends():
+    out = [B.BruteForceBackend]
+    if B.AnnoyBackend.is_available():
+        out.append(lambda: B.AnnoyBackend(n_trees=20, search_k=100_000))
+    return out
+
+
+class TestBackendPersistence:
+    @pytest.mark.parametrize("make", _backends())
+    def test_save_load_round_trip(self, make, tmp_path):
+        embs = np.random.default_rng(1).normal(size=(60, 6)).astype(np.float32)
+        built = make()
+        built.build(embs)
+        built.save(tmp_path / "idx")
+        loaded = make()
+        loaded.load(tmp_path / "idx")
+        assert loaded.query(embs[5], 5) == built.query(embs[5], 5)
+
+    @pytest.mark.parametrize("make", _backends())
+    def test_add_matches_full_build(self, make):
+        embs = np.random.default_rng(2).normal(size=(80, 6)).astype(np.float32)
+        grown = make()
+        grown.build(embs[:60])
+        grown.add(embs[60:])
+        exact = B.BruteForceBackend()
+        exact.build(embs)
+        for row in (3, 65, 79):
+            got = grown.query(embs[row], 1)
+            assert got[0][0] == row
+            assert got[0][1] == pytest.approx(exact.query(embs[row], 1)[0][1])
+
+    def test_add_rejects_dimension_mismatch(self):
+        bf = B.BruteForceBackend()
+        bf.build(np.eye(3, dtype=np.float32))
+        with pytest.raises(ValueError):
+            bf.add(np.ones((1, 4), dtype=np.float32))
+
+    def test_load_rejects_other_backend(self, tmp_path):
+        bf = B.BruteForceBackend()
+        bf.build(np.eye(3, dtype=np.float32))
+        bf.save(tmp_path)
+        (tmp_path / "meta.json").write_text('{"backend": "faiss", "dim": 3}')
+        with pytest.raises(ValueError):
+            B.BruteForceBackend().load(tmp_path)
+
+
+# ===================================================================== #
+# SimilarityIndex through the cache
+# ===================================================================== #
+class TestSimilarityIndexCache:
+    cfg = SearchConfig(backend="bruteforce", match_mode="hybrid", top_k=5)
+
+    def test_warm_build_restores(self, tmp_path, monkeypatch):
+        docs = _docs(40)
+        cold = SimilarityIndex(self.cfg, cache=tmp_path)
+        cold.build(docs)
+        assert len(cold.cache) == 1
+
+        def _no_full_build(self, documents):
+            raise AssertionError("expected a cache hit")
+
+        monkeypatch.setattr(SimilarityIndex, "_build_full", _no_full_build)
+        warm = SimilarityIndex(self.cfg, cache=tmp_path)
+        warm.build(docs)
+        assert warm.index_generation == 1
+        assert _ids(warm.search("w1 w2 w3")) == _ids(cold.search("w1 w2 w3"))
+        assert warm.query(docs[7].embedding, 3) == cold.query(docs[7].embedding, 3)
+
+    def test_prefix_reuse_and_add_match_full_build(self, tmp_path):
+        docs = _docs(50)
+        reference = SimilarityIndex(self.cfg)
+        reference.build(docs)
+
+        SimilarityIndex(self.cfg, cache=tmp_path).build(docs[:30])
+        grown = SimilarityIndex(self.cfg, cache=tmp_path)
+        grown.build(docs)
+        added = SimilarityIndex(self.cfg)
+        added.build(docs[:30])
+        added.add(docs[30:])
+
+        for index in (grown, added):
+            assert index.n_documents == 50
+            assert _ids(index.search("w4 w9")) == _ids(reference.search("w4 w9"))
+            assert index.query(docs[42].embedding, 3) == reference.query(
+                docs[42].embedding, 3
+            )
+        assert len(grown.cache) == 2
+
+    def test_add_is_cached(self, tmp_path):
+        docs = _docs(20)
+        index = SimilarityIndex(self.cfg, cache=tmp_path)
+        index.build(docs[:10])
+        index.add(docs[10:])
+        assert index.index_generation == 2
+        hit = index.cache.lookup(index._config_fp, [None] * 20 + [index._cache_key])
+        assert hit is not None and hit[0] == 20
+
+    def test_corrupt_entry_is_rebuilt(self, tmp_path):
+        docs = _docs(10)
+        SimilarityIndex(self.cfg, cache=tmp_path).build(docs)
+        for manifest in tmp_path.glob("builds/*/manifest.json"):
+            manifest.write_text("{not json")
+        index = SimilarityIndex(self.cfg, cache=tmp_path)
+        index.build(docs)
+        assert index.has_embeddings and index.n_documents == 10
+
+    def test_sparse_only_documents(self, tmp_path):
+        docs = [_Doc(f"d{i}", f"alpha beta {i}") for i in range(5)]
+        SimilarityIndex(self.cfg, cache=tmp_path).build(docs)
+        warm = SimilarityIndex(self.cfg, cache=tmp_path)
+        warm.build(docs)
+        assert not warm.has_embeddings
+        assert warm.search("alpha", config=SearchConfig(match_mode="keyword"))
+
+    def test_add_without_embeddings_disables_dense(self):
+        index = SimilarityIndex(self.cfg)
+        index.build(_docs(5))
+        index.add([_Doc("x", "no vector")])
+        assert not index.has_embeddings and index.n_documents == 6
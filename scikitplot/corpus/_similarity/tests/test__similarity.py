@@ -15,7 +15,8 @@ Coverage targets
 * :func:`_tokenize_simple` — unicode, empty, punctuation.
 * :func:`_get_text` — normalised-text preference, fallback.
 * :class:`_BM25Index` — build + query: empty query, single-term,
-  multi-term IDF, top-k clipping, zero-score filtering.
+  multi-term IDF, top-k clipping, zero-score filtering, agreement of the
+  inverted postings with reference BM25, tie order, batch queries.
 * :class:`SimilarityIndex` — build (empty raises), strict search
   (case-sensitive/insensitive, top_k), keyword/BM25 search, semantic
   brute-force (no ANN libs), hybrid RRF fusion, ``n_documents`` /
@@ -253,6 +254,11 @@ class TestBM25Index:
         result = idx.query(["hello"])
         assert result == []
 
+    def test_build_all_empty_documents(self) -> None:
+        idx = self._build([[], []])
+        assert idx.n_postings == 0
+        assert idx.query(["hello"]) == []
+
     def test_query_returns_empty_for_empty_query(self) -> None:
         idx = self._build([["hello", "world"], ["foo", "bar"]])
         assert idx.query([]) == []
@@ -304,6 +310,65 @@ class TestBM25Index:
         results = idx.query(["test"])
         assert len(results) == 1
 
+    @staticmethod
+    def _reference_scores(
+        token_lists: list[list[str]], query: list[str], k1: float = 1.5, b: float = 0.75
+    ) -> dict[int, float]:
+        """Textbook per-document BM25, used as the oracle for the postings index."""
+        import math
+
+        n = len(token_lists)
+        avgdl = sum(map(len, token_lists)) / n
+        scores: dict[int, float] = {}
+        for term in query:
+            df = sum(term in tokens for tokens in token_lists)
+            if df == 0:
+                continue
+            idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+            for i, tokens in enumerate(token_lists):
+                tf = tokens.count(term)
+                if tf:
+                    den = tf + k1 * (1 - b + b * len(tokens) / avgdl)
+                    scores[i] = scores.get(i, 0.0) + idf * tf * (k1 + 1) / den
+        return scores
+
+    def test_postings_match_reference_scores(self) -> None:
+        rng = np.random.default_rng(0)
+        vocab = [f"w{j}" for j in range(30)]
+        corpus = [
+            list(rng.choice(vocab, size=int(rng.integers(1, 15))))
+            for _ in range(60)
+        ]
+        idx = self._build(corpus)
+        for query in (["w1"], ["w2", "w7", "w29"], ["w3", "w3", "zzz"]):
+            ref = self._reference_scores(corpus, query)
+            got = dict(idx.query(query, top_k=len(corpus)))
+            assert got.keys() == ref.keys()
+            for i, score in ref.items():
+                assert got[i] == pytest.approx(score, rel=1e-5)
+
+    def test_ties_broken_by_doc_index(self) -> None:
+        idx = self._build([["x", "y"], ["z"], ["x", "y"], ["x", "y"]])
+        assert [i for i, _ in idx.query(["x"], top_k=2)] == [0, 2]
+
+    def test_postings_only_for_present_terms(self) -> None:
+        idx = self._build([["a", "a", "b"], ["b", "c"], ["c"]])
+        assert idx.n_postings == 5
+        assert idx.doc_freq("a") == 1
+        assert idx.doc_freq("c") == 2
+        assert idx.doc_freq("missing") == 0
+
+    def test_query_batch_matches_single_queries(self) -> None:
+        idx = self._build([
+            ["machine", "learning", "data"],
+            ["cooking", "recipe", "food"],
+            ["data", "food", "science"],
+        ])
+        queries = [["data"], ["food", "recipe"], [], ["nothing"]]
+        batch = idx.query_batch(queries, top_k=2)
+        assert batch == [idx.query(q, top_k=2) for q in queries]
+        assert batch[2] == [] and batch[3] == []
+
 
 # ===========================================================================
 # SimilarityIndex — build
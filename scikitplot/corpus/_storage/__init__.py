@@ -5,7 +5,7 @@ Persistence layer for :class:`~scikitplot.corpus._schema.CorpusDocument`
 collections.
 
 Provides a pluggable storage backend contract (:class:`StorageBase`) and
-three built-in implementations:
+four built-in implementations:
 
 :class:`InMemoryStorage`
     Thread-safe dict store. No dependencies. Testing and prototyping only.
@@ -14,6 +14,11 @@ three built-in implementations:
     Append-friendly JSONL flat-file store. Atomic writes, zero
     dependencies beyond stdlib.
 
+:class:`AppendOnlyJSONLStorage`
+    Append-only JSONL store for large corpora. Offset and secondary indexes
+    persisted beside the file; reads seek to matching records only;
+    superseded records are reclaimed by background compaction.
+
 :class:`SQLiteStorage`
     SQLite-backed store via stdlib ``sqlite3``. Full-text search via
     FTS5. No external dependencies.
@@ -27,6 +27,8 @@ Design invariants:
   is the caller's responsibility for ``InMemoryStorage`` and
   ``JSONLStorage`` (SQLiteStorage uses WAL and is safer for concurrent
   writes).
+* ``AppendOnlyJSONLStorage`` never rewrites in place: updates and deletions
+  are appended, and a background compaction reclaims dead records.
 
 Python compatibility:
 
@@ -45,9 +47,9 @@ import pathlib
 import sqlite3
 import threading
 from dataclasses import dataclass, field  # noqa: F401
-from typing import Any, Dict, Iterator, List, Optional, Sequence  # noqa: F401
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence  # noqa: F401
 
-from .._atomic import atomic_write_path
+from .._atomic import atomic_write_bytes, atomic_write_path
 from .._schema import (  # noqa: F401
     ChunkingStrategy,
     CorpusDocument,
@@ -58,6 +60,7 @@ from .._schema import (  # noqa: F401
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "AppendOnlyJSONLStorage",
     "InMemoryStorage",
     "JSONLStorage",
     "QueryResult",
@@ -150,6 +153,7 @@ class StorageBase(abc.ABC):
     --------
     InMemoryStorage : Dict-backed, testing only.
     JSONLStorage    : Flat JSONL file, zero dependencies.
+    AppendOnlyJSONLStorage : Append-only JSONL with a persisted offset index.
     SQLiteStorage   : SQLite with FTS5, no external dependencies.
     """
 
@@ -569,6 +573,666 @@ class JSONLStorage(StorageBase):
         return f"JSONLStorage(path={self._path!r}, n_docs={len(self._index)})"
 
 
+# ===========================================================================
+# AppendOnlyJSONLStorage
+# ===========================================================================
+
+#: Sidecar index format version (bumped on incompatible layout changes).
+_SIDECAR_FORMAT = 1
+
+#: Tombstone / batch-marker keys. Neither carries ``doc_id``, so a plain
+#: :class:`JSONLStorage` reading the same file skips them as malformed lines.
+_TOMBSTONE_KEY = "__tombstone__"
+_BATCH_KEY = "__batch__"
+
+#: Bytes of the data file echoed into the sidecar to detect a replaced file.
+_SIDECAR_TAIL_BYTES = 64
+
+#: Dead bytes below which automatic compaction never triggers.
+_MIN_COMPACT_BYTES = 1 << 20
+
+
+class _JSONLEntry(NamedTuple):
+    """Location and filterable fields of one live record in the data file."""
+
+    seq: int
+    offset: int
+    length: int
+    input_path: str | None
+    source_type: str | None
+    section_type: str | None
+    language: str | None
+    collection_id: str | None
+
+
+#: Fields with a persisted secondary index (value -> ordered doc_id set).
+_SECONDARY_FIELDS = ("collection_id", "language", "source_type")
+
+
+class AppendOnlyJSONLStorage(StorageBase):
+    """
+    Append-only JSONL store with a persisted offset index.
+
+    Every write — new document, update, or deletion — is appended to the
+    data file; nothing is ever rewritten in place. An in-memory index maps
+    each ``doc_id`` to the byte offset and length of its latest record, and
+    secondary indexes on ``collection_id``, ``language`` and ``source_type``
+    map each value to its documents. ``get`` and ``query`` therefore seek
+    straight to the records they return: filtering and counting never
+    deserialise a document, and memory holds offsets rather than records.
+
+    The index is checkpointed to a sidecar file (``<path>.idx``). On open the
+    sidecar is loaded and only the records appended after the checkpoint are
+    replayed, so reopening a large corpus does not rescan it. A missing,
+    stale or corrupt sidecar falls back to a full scan.
+
+    Superseded and deleted records stay on disk as dead bytes until
+    :meth:`compact` rewrites the live records into a fresh file. Compaction
+    runs without blocking readers or writers except for a short final
+    catch-up, and starts automatically in a background thread once dead bytes
+    exceed ``compact_threshold`` of the file.
+
+    Parameters
+    ----------
+    path : pathlib.Path or str
+        Path to the ``.jsonl`` data file. Created if absent. A file written by
+        :class:`JSONLStorage` can be opened directly.
+    checkpoint_every : int, optional
+        Persist the sidecar index after this many appended records.
+        Default: ``10_000``.
+    compact_threshold : float or None, optional
+        Fraction of dead bytes in the data file that triggers a background
+        compaction. ``None`` disables automatic compaction. Default: ``0.5``.
+
+    Notes
+    -----
+    **Durability:** each ``save``/``save_batch``/``delete`` is ``fsync``-ed
+    before it becomes visible in memory. ``save_batch`` is prefixed with a
+    batch marker; a batch cut short by a crash is discarded on reload, so a
+    batch is all-or-nothing. A partial trailing line is truncated on open.
+
+    **Concurrency:** safe for concurrent use from threads of one process. Use
+    one writing process per file.
+
+    See Also
+    --------
+    JSONLStorage : Whole-file JSONL store, rewritten on every update.
+
+    Examples
+    --------
+    >>> store = AppendOnlyJSONLStorage(Path("corpus.jsonl"))
+    >>> store.save_batch(docs)
+    >>> store.query(StorageQuery(language="en", limit=10)).total
+    42
+    >>> store.close()
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path | str,
+        *,
+        checkpoint_every: int = 10_000,
+        compact_threshold: float | None = 0.5,
+    ) -> None:
+        if checkpoint_every < 1:
+            raise ValueError(
+                f"checkpoint_every must be >= 1, got {checkpoint_every!r}."
+            )
+        if compact_threshold is not None and not 0.0 < compact_threshold <= 1.0:
+            raise ValueError(
+                f"compact_threshold must be in (0, 1] or None, got {compact_threshold!r}."
+            )
+        self._path = pathlib.Path(path)
+        self._index_path = self._path.with_name(self._path.name + ".idx")
+        self._checkpoint_every = checkpoint_every
+        self._compact_threshold = compact_threshold
+        self._lock: threading.RLock = threading.RLock()
+        self._compact_lock: threading.Lock = threading.Lock()
+        self._compactor: threading.Thread | None = None
+        self._entries: dict[str, _JSONLEntry] = {}
+        self._secondary: dict[str, dict[str, dict[str, None]]] = {
+            name: {} for name in _SECONDARY_FIELDS
+        }
+        self._seq = 0
+        self._data_size = 0
+        self._dead_bytes = 0
+        self._unsaved = 0
+        self._open()
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _index_secondary(self, doc_id: str, entry: _JSONLEntry) -> None:
+        for name in _SECONDARY_FIELDS:
+            value = getattr(entry, name)
+            if value:
+                self._secondary[name].setdefault(value, {})[doc_id] = None
+
+    def _unindex_secondary(self, doc_id: str, entry: _JSONLEntry) -> None:
+        for name in _SECONDARY_FIELDS:
+            value = getattr(entry, name)
+            bucket = self._secondary[name].get(value) if value else None
+            if bucket is not None:
+                bucket.pop(doc_id, None)
+                if not bucket:
+                    del self._secondary[name][value]
+
+    def _apply_record(self, data: dict[str, Any], offset: int, length: int) -> None:
+        """Point ``data["doc_id"]`` at the record stored at ``offset``."""
+        doc_id = data["doc_id"]
+        old = self._entries.get(doc_id)
+        if old is None:
+            seq = self._seq
+            self._seq += 1
+        else:
+            # An update keeps the document's position: ``_entries`` stays in
+            # ``seq`` order because assigning an existing key does not move it.
+            seq = old.seq
+            self._dead_bytes += old.length
+            self._unindex_secondary(doc_id, old)
+        entry = _JSONLEntry(
+            seq,
+            offset,
+            length,
+            data.get("input_path"),
+            data.get("source_type"),
+            data.get("section_type"),
+            data.get("language"),
+            data.get("collection_id"),
+        )
+        self._entries[doc_id] = entry
+        self._index_secondary(doc_id, entry)
+
+    def _apply_tombstone(self, doc_id: str, length: int) -> None:
+        self._dead_bytes += length
+        old = self._entries.pop(doc_id, None)
+        if old is not None:
+            self._dead_bytes += old.length
+            self._unindex_secondary(doc_id, old)
+
+    def _apply_line(self, data: Any, offset: int, length: int) -> None:
+        if isinstance(data, dict) and "doc_id" in data:
+            self._apply_record(data, offset, length)
+        elif isinstance(data, dict) and _TOMBSTONE_KEY in data:
+            self._apply_tombstone(data[_TOMBSTONE_KEY], length)
+        else:
+            raise KeyError("doc_id")
+
+    # ------------------------------------------------------------------
+    # Open / replay / sidecar
+    # ------------------------------------------------------------------
+
+    def _open(self) -> None:
+        """Load the sidecar checkpoint (if valid) and replay the tail."""
+        if not self._path.exists():
+            if self._index_path.exists():
+                self._index_path.unlink()
+            return
+        start = self._load_sidecar()
+        n_replayed = self._replay(start)
+        logger.info(
+            "AppendOnlyJSONLStorage: opened %s with %d documents "
+            "(checkpoint=%d bytes, replayed %d records).",
+            self._path,
+            len(self._entries),
+            start,
+            n_replayed,
+        )
+
+    def _file_tail(self, size: int) -> str:
+        """Hex of the last data-file bytes before ``size`` (replacement check)."""
+        if size <= 0:
+            return ""
+        start = max(0, size - _SIDECAR_TAIL_BYTES)
+        with self._path.open("rb") as fh:
+            fh.seek(start)
+            return fh.read(size - start).hex()
+
+    def _load_sidecar(self) -> int:
+        """Restore the checkpointed index; return the data offset it covers.
+
+        Returns ``0`` (full scan) when the sidecar is missing, unreadable, of a
+        different format, or does not describe the current data file.
+        """
+        if not self._index_path.exists():
+            return 0
+        try:
+            with self._index_path.open(encoding="utf-8") as fh:
+                state = json.load(fh)
+            if state.get("format") != _SIDECAR_FORMAT:
+                raise ValueError(f"unsupported format {state.get('format')!r}")
+            size = int(state["data_size"])
+            if size > self._path.stat().st_size or self._file_tail(size) != state["tail"]:
+                raise ValueError("data file changed since checkpoint")
+            for seq, row in enumerate(state["entries"]):
+                doc_id, offset, length, *fields = row
+                entry = _JSONLEntry(seq, offset, length, *fields)
+                self._entries[doc_id] = entry
+                self._index_secondary(doc_id, entry)
+            self._seq = len(self._entries)
+            self._dead_bytes = int(state["dead_bytes"])
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning(
+                "AppendOnlyJSONLStorage: ignoring sidecar index %s (%s); "
+                "rebuilding from %s.",
+                self._index_path,
+                exc,
+                self._path,
+            )
+            self._entries = {}
+            self._secondary = {name: {} for name in _SECONDARY_FIELDS}
+            self._seq = 0
+            self._dead_bytes = 0
+            return 0
+        self._data_size = size
+        return size
+
+    def _replay(self, start: int) -> int:
+        """Apply records from byte ``start`` to EOF; return the number applied.
+
+        A trailing partial line, or a ``save_batch`` whose records did not all
+        reach disk, is truncated away so the next append starts on a clean
+        line boundary.
+        """
+        n = 0
+        offset = start
+        truncate_at: int | None = None
+        batch_start = 0
+        batch: list[tuple[Any, int, int]] = []
+        batch_left = 0
+        with self._path.open("rb") as fh:
+            fh.seek(start)
+            for lineno, raw in enumerate(fh, start=1):
+                length = len(raw)
+                if not raw.endswith(b"\n"):
+                    truncate_at = batch_start if batch_left else offset
+                    break
+                try:
+                    data = json.loads(raw) if raw.strip() else None
+                except ValueError as exc:
+                    data = exc
+                if isinstance(data, dict) and _BATCH_KEY in data:
+                    batch_start, batch, batch_left = offset, [], int(data[_BATCH_KEY])
+                    self._dead_bytes += length
+                elif batch_left:
+                    batch.append((data, offset, length))
+                    batch_left -= 1
+                    if not batch_left:
+                        for item in batch:
+                            n += self._replay_one(*item, lineno=lineno)
+                elif data is not None:
+                    n += self._replay_one(data, offset, length, lineno=lineno)
+                else:
+                    self._dead_bytes += length
+                offset += length
+            else:
+                if batch_left:
+                    truncate_at = batch_start
+        if truncate_at is not None:
+            logger.warning(
+                "AppendOnlyJSONLStorage: discarding incomplete write at byte %d "
+                "of %s.",
+                truncate_at,
+                self._path,
+            )
+            with self._path.open("r+b") as fh:
+                fh.truncate(truncate_at)
+            offset = truncate_at
+        self._data_size = offset
+        return n
+
+    def _replay_one(self, data: Any, offset: int, length: int, *, lineno: int) -> int:
+        try:
+            if isinstance(data, Exception):
+                raise data
+            self._apply_line(data, offset, length)
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning(
+                "AppendOnlyJSONLStorage: skipping malformed record at byte %d "
+                "(line %d after checkpoint) in %s: %s.",
+                offset,
+                lineno,
+                self._path,
+                exc,
+            )
+            self._dead_bytes += length
+            return 0
+        return 1
+
+    def _write_sidecar(self) -> None:
+        """Atomically checkpoint the index (caller holds ``_lock``)."""
+        state = {
+            "format": _SIDECAR_FORMAT,
+            "data_size": self._data_size,
+            "dead_bytes": self._dead_bytes,
+            "tail": self._file_tail(self._data_size),
+            "entries": [[doc_id, *entry[1:]] for doc_id, entry in self._entries.items()],
+        }
+        payload = json.dumps(state, ensure_ascii=False, separators=(",", ":"))
+        atomic_write_bytes(self._index_path, payload.encode("utf-8"), suffix=".idx")
+        self._unsaved = 0
+
+    # ------------------------------------------------------------------
+    # Append / read primitives
+    # ------------------------------------------------------------------
+
+    def _append(self, payload: bytes) -> int:
+        """Durably append ``payload``; return its start offset.
+
+        On failure the file is truncated back to its previous size, so a
+        failed write never leaves a half-written record behind.
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        offset = self._data_size
+        with self._path.open("ab") as fh:
+            try:
+                fh.write(payload)
+                fh.flush()
+                os.fsync(fh.fileno())
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    fh.truncate(offset)
+                raise
+        self._data_size = offset + len(payload)
+        return offset
+
+    def _after_append(self, n_records: int) -> None:
+        self._unsaved += n_records
+        if self._unsaved >= self._checkpoint_every:
+            self._write_sidecar()
+        threshold = self._compact_threshold
+        if (
+            threshold is not None
+            and self._dead_bytes >= _MIN_COMPACT_BYTES
+            and self._dead_bytes >= threshold * self._data_size
+        ):
+            self.compact(wait=False)
+
+    def _read(self, entries: Sequence[_JSONLEntry]) -> dict[int, dict[str, Any]]:
+        """Read records by offset, in file order (caller holds ``_lock``).
+
+        A handle is opened per call rather than kept open, so no descriptor
+        outlives the call and compaction can always replace the file.
+        """
+        out: dict[int, dict[str, Any]] = {}
+        if not entries:
+            return out
+        with self._path.open("rb") as fh:
+            for entry in sorted(entries, key=lambda entry: entry.offset):
+                fh.seek(entry.offset)
+                out[entry.offset] = json.loads(fh.read(entry.length))
+        return out
+
+    @staticmethod
+    def _encode(data: Any) -> bytes:
+        return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+    # ------------------------------------------------------------------
+    # StorageBase contract
+    # ------------------------------------------------------------------
+
+    def save(self, doc: CorpusDocument) -> None:  # noqa: D417
+        """
+        Append ``doc``; a later record for the same ``doc_id`` supersedes it.
+
+        Parameters
+        ----------
+        doc : CorpusDocument
+        """
+        data = _doc_to_dict(doc)
+        line = self._encode(data)
+        with self._lock:
+            offset = self._append(line)
+            self._apply_record(data, offset, len(line))
+            self._after_append(1)
+
+    def save_batch(self, docs: Sequence[CorpusDocument]) -> None:  # noqa: D417
+        """
+        Append a batch with a single write and ``fsync`` (all-or-nothing).
+
+        Every document is serialised before anything is written, so an
+        unserialisable document persists nothing. If a ``doc_id`` occurs more
+        than once, the last occurrence wins.
+
+        Parameters
+        ----------
+        docs : sequence of CorpusDocument
+        """
+        if not docs:
+            return
+        records = [_doc_to_dict(doc) for doc in docs]
+        lines = [self._encode(data) for data in records]
+        marker = self._encode({_BATCH_KEY: len(lines)})
+        with self._lock:
+            offset = self._append(marker + b"".join(lines))
+            self._dead_bytes += len(marker)
+            offset += len(marker)
+            for data, line in zip(records, lines):
+                self._apply_record(data, offset, len(line))
+                offset += len(line)
+            self._after_append(len(lines))
+
+    def delete(self, doc_id: str) -> bool:  # noqa: D417
+        """
+        Delete a document by appending a tombstone.
+
+        Parameters
+        ----------
+        doc_id : str
+
+        Returns
+        -------
+        bool
+            ``True`` if the document existed.
+        """
+        line = self._encode({_TOMBSTONE_KEY: doc_id})
+        with self._lock:
+            if doc_id not in self._entries:
+                return False
+            self._append(line)
+            self._apply_tombstone(doc_id, len(line))
+            self._after_append(1)
+        return True
+
+    def get(self, doc_id: str) -> CorpusDocument | None:  # noqa: D417
+        """
+        Retrieve a document by ``doc_id`` with a single seek and read.
+
+        Parameters
+        ----------
+        doc_id : str
+        """
+        with self._lock:
+            entry = self._entries.get(doc_id)
+            if entry is None:
+                return None
+            data = self._read([entry])[entry.offset]
+        return _dict_to_doc(data)
+
+    def _candidates(self, q: StorageQuery) -> list[_JSONLEntry]:
+        """Resolve the filters against the indexes (caller holds ``_lock``)."""
+        buckets = [
+            self._secondary[name].get(getattr(q, name), {})
+            for name in _SECONDARY_FIELDS
+            if getattr(q, name)
+        ]
+        if buckets:
+            buckets.sort(key=len)
+            ids = [i for i in buckets[0] if all(i in b for b in buckets[1:])]
+            entries = sorted(
+                (self._entries[i] for i in ids), key=lambda entry: entry.seq
+            )
+        else:
+            entries = list(self._entries.values())
+        if q.input_path:
+            entries = [e for e in entries if e.input_path == q.input_path]
+        if q.section_type:
+            entries = [e for e in entries if e.section_type == q.section_type]
+        return entries
+
+    def query(self, q: StorageQuery) -> QueryResult:  # noqa: D417
+        """
+        Filter documents through the offset and secondary indexes.
+
+        Only the requested page is read from disk and deserialised.
+        Full-text search is not supported and is ignored.
+
+        Parameters
+        ----------
+        q : StorageQuery
+        """
+        with self._lock:
+            matching = self._candidates(q)
+            page = matching[q.offset : q.offset + q.limit] if q.limit > 0 else []
+            raw = self._read(page)
+
+        docs: list[CorpusDocument] = []
+        for entry in page:
+            data = raw[entry.offset]
+            try:
+                docs.append(_dict_to_doc(data))
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "AppendOnlyJSONLStorage.query: skipping malformed record %r: %s.",
+                    data.get("doc_id", "?"),
+                    exc,
+                )
+        return QueryResult(documents=docs, total=len(matching), query=q)
+
+    def count(self) -> int:
+        """Return total stored document count in O(1)."""
+        with self._lock:
+            return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @property
+    def dead_bytes(self) -> int:
+        """Bytes of superseded, deleted or malformed records in the data file."""
+        with self._lock:
+            return self._dead_bytes
+
+    def flush(self) -> None:
+        """Checkpoint the sidecar index now."""
+        with self._lock:
+            if self._path.exists():
+                self._write_sidecar()
+
+    def compact(self, *, wait: bool = True) -> threading.Thread | None:
+        """
+        Rewrite the data file with only the live records.
+
+        Live records are copied to a staging file without holding the store
+        lock; records appended meanwhile are then copied under the lock and
+        the staging file atomically replaces the data file. Readers and
+        writers are blocked only for that final catch-up.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Compact in the calling thread (default). With ``False`` the
+            compaction runs in a daemon thread, which is returned; a call
+            while a compaction is already running returns ``None``.
+
+        Returns
+        -------
+        threading.Thread or None
+            The background thread when ``wait=False``.
+        """
+        if wait:
+            with self._compact_lock:
+                self._compact()
+            return None
+        if not self._compact_lock.acquire(blocking=False):
+            return None
+
+        def _run() -> None:
+            try:
+                self._compact()
+            except Exception:  # noqa: BLE001
+                logger.exception(
+                    "AppendOnlyJSONLStorage: background compaction of %s failed.",
+                    self._path,
+                )
+            finally:
+                self._compact_lock.release()
+
+        thread = threading.Thread(
+            target=_run, name="AppendOnlyJSONLStorage-compact", daemon=True
+        )
+        self._compactor = thread
+        thread.start()
+        return thread
+
+    def _compact(self) -> None:
+        """Compaction body (caller holds ``_compact_lock``)."""
+        with self._lock:
+            if not self._path.exists():
+                return
+            snapshot = list(self._entries.items())
+            snapshot_size = self._data_size
+            before = snapshot_size
+
+        held = False
+        compacted: dict[str, int] = {}
+
+        def _write(tmp: pathlib.Path) -> None:
+            nonlocal held
+            with tmp.open("wb") as out, self._path.open("rb") as src:
+                # Phase 1 (unlocked): bytes below ``snapshot_size`` never change.
+                for doc_id, entry in snapshot:
+                    src.seek(entry.offset)
+                    compacted[doc_id] = out.tell()
+                    out.write(src.read(entry.length))
+                # Phase 2 (locked): copy what was appended meanwhile verbatim.
+                self._lock.acquire()
+                held = True
+                src.seek(snapshot_size)
+                out.write(src.read(self._data_size - snapshot_size))
+
+        try:
+            atomic_write_path(self._path, _write, suffix=".jsonl")
+            self._entries = {}
+            self._secondary = {name: {} for name in _SECONDARY_FIELDS}
+            for seq, (doc_id, entry) in enumerate(snapshot):
+                entry = entry._replace(seq=seq, offset=compacted[doc_id])  # noqa: PLW2901
+                self._entries[doc_id] = entry
+                self._index_secondary(doc_id, entry)
+            self._seq = len(snapshot)
+            self._dead_bytes = 0
+            # The catch-up tail sits right after the live records; replaying it
+            # from there applies the concurrent writes with their new offsets.
+            self._replay(sum(entry.length for _, entry in snapshot))
+            self._write_sidecar()
+        finally:
+            if held:
+                self._lock.release()
+        logger.info(
+            "AppendOnlyJSONLStorage: compacted %s from %d to %d bytes.",
+            self._path,
+            before,
+            self._data_size,
+        )
+
+    def close(self) -> None:
+        """Wait for a running compaction and checkpoint the index."""
+        thread = self._compactor
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            if self._path.exists():
+                self._write_sidecar()
+
+    def __repr__(self) -> str:  # noqa: D105
+        return (
+            f"AppendOnlyJSONLStorage(path={self._path!r}, "
+            f"n_docs={len(self._entries)}, dead_bytes={self._dead_bytes})"
+        )
+
+
 # ===========================================================================
 # SQLiteStorage
 # ===========================================================================
@@ -2,7 +2,8 @@
 tests/test__storage.py
 ========================
 Tests for scikitplot.corpus._storage.
-All three backends are covered: InMemoryStorage, JSONLStorage, SQLiteStorage.
+All four backends are covered: InMemoryStorage, JSONLStorage,
+AppendOnlyJSONLStorage, SQLiteStorage.
 """
 from __future__ import annotations
 
@@ -12,6 +13,7 @@ import tempfile
 import pytest
 
 from .._storage import (  # noqa: F401
+    AppendOnlyJSONLStorage,
     InMemoryStorage,
     JSONLStorage,
     QueryResult,
@@ -215,6 +217,163 @@ class TestJSONLStorage(BackendContract):
         assert "JSONLStorage" in repr(self.store)
 
 
+class TestAppendOnlyJSONLStorage(BackendContract):
+    def setup_method(self, method) -> None:
+        tmp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.path = tmp_dir / "corpus.jsonl"
+        self.store = AppendOnlyJSONLStorage(self.path, compact_threshold=None)
+
+    def _reopen(self) -> AppendOnlyJSONLStorage:
+        return AppendOnlyJSONLStorage(self.path, compact_threshold=None)
+
+    def test_update_appends_instead_of_rewriting(self) -> None:
+        doc = self._fresh_doc()
+        self.store.save(doc)
+        size = self.path.stat().st_size
+        self.store.save(doc.replace(normalized_text="v2"))
+        assert self.path.stat().st_size > size
+        assert self.store.dead_bytes == size
+        assert self._reopen().get(doc.doc_id).normalized_text == "v2"
+
+    def test_delete_appends_tombstone(self) -> None:
+        docs = [self._fresh_doc(i) for i in range(3)]
+        self.store.save_batch(docs)
+        assert self.store.delete(docs[1].doc_id) is True
+        assert self.store.delete(docs[1].doc_id) is False
+        assert self.store.get(docs[1].doc_id) is None
+        for store in (self.store, self._reopen()):
+            assert store.count() == 2
+            assert store.query(StorageQuery(collection_id="col1")).total == 2
+
+    def test_secondary_indexes_and_query_order(self) -> None:
+        docs = [
+            _make_doc(chunk_index=i, language=lang, collection_id=col)
+            for i, (lang, col) in enumerate(
+                [("en", "a"), ("de", "a"), ("en", "b"), ("en", "a")]
+            )
+        ]
+        self.store.save_batch(docs)
+        # Moving doc 0 to another language keeps its position in query order.
+        self.store.save(docs[0].replace(language="fr"))
+        self.store.save(docs[0].replace(language="en"))
+        result = self.store.query(StorageQuery(language="en", collection_id="a"))
+        assert [d.doc_id for d in result.documents] == [
+            docs[0].doc_id, docs[3].doc_id,
+        ]
+        assert self.store.query(StorageQuery(language="fr")).total == 0
+        assert self.store.query(StorageQuery(source_type="book")).total == 0
+
+    def test_query_reads_only_the_page(self, monkeypatch) -> None:
+        self.store.save_batch([self._fresh_doc(i) for i in range(10)])
+        reads = []
+        real = self.store._read
+        monkeypatch.setattr(
+            self.store, "_read", lambda entries: reads.extend(entries) or real(entries)
+        )
+        result = self.store.query(StorageQuery(limit=3, offset=4))
+        assert result.total == 10 and len(result.documents) == 3
+        assert len(reads) == 3
+
+    def test_sidecar_checkpoint_and_tail_replay(self) -> None:
+        docs = [self._fresh_doc(i) for i in range(4)]
+        self.store.save_batch(docs[:2])
+        self.store.flush()
+        self.store.save_batch(docs[2:])  # after the checkpoint: replayed
+        reopened = self._reopen()
+        assert reopened.count() == 4
+        assert reopened.get(docs[3].doc_id).text == docs[3].text
+
+    def test_stale_sidecar_is_rebuilt(self) -> None:
+        docs = [self._fresh_doc(i) for i in range(3)]
+        self.store.save_batch(docs)
+        self.store.close()
+        # Replace the data file behind the sidecar's back.
+        JSONLStorage(self.path).save_batch([docs[0].replace(normalized_text="x")])
+        assert self._reopen().get(docs[0].doc_id).normalized_text == "x"
+
+    def test_incomplete_batch_is_discarded(self) -> None:
+        self.store.save(self._fresh_doc(0))
+        self.store.save_batch([self._fresh_doc(1), self._fresh_doc(2)])
+        data = self.path.read_bytes()
+        self.path.write_bytes(data[: data.rindex(b"{")])  # cut the last record
+        reopened = self._reopen()
+        assert reopened.count() == 1
+        reopened.save(self._fresh_doc(3))
+        assert self._reopen().count() == 2
+
+    def test_failed_append_is_rolled_back(self, monkeypatch) -> None:
+        from .. import _storage as _stg
+
+        self.store.save(self._fresh_doc(0))
+        size = self.path.stat().st_size
+
+        def _boom(*_a, **_k):
+            raise OSError("injected disk failure")
+
+        monkeypatch.setattr(_stg.os, "fsync", _boom)
+        doc = self._fresh_doc(1)
+        with pytest.raises(OSError):
+            self.store.save(doc)
+        assert self.store.get(doc.doc_id) is None
+        assert self.path.stat().st_size == size
+
+    def test_compact_drops_dead_records(self) -> None:
+        docs = [self._fresh_doc(i) for i in range(5)]
+        self.store.save_batch(docs)
+        for doc in docs:
+            self.store.save(doc.replace(normalized_text="updated"))
+        self.store.delete(docs[0].doc_id)
+        self.store.compact()
+        assert self.store.dead_bytes == 0
+        for store in (self.store, self._reopen()):
+            assert store.count() == 4
+            assert [d.doc_id for d in store.query(StorageQuery()).documents] == [
+                d.doc_id for d in docs[1:]
+            ]
+            assert store.get(docs[2].doc_id).normalized_text == "updated"
+
+    def test_background_compaction_keeps_concurrent_writes(self) -> None:
+        store = AppendOnlyJSONLStorage(self.path, compact_threshold=None)
+        docs = [self._fresh_doc(i) for i in range(50)]
+        store.save_batch(docs)
+        store.save_batch(docs)  # every first copy is now dead
+        thread = store.compact(wait=False)
+        extra = [self._fresh_doc(i) for i in range(50, 60)]
+        for doc in extra:
+            store.save(doc)
+        thread.join()
+        store.close()
+        reopened = self._reopen()
+        assert reopened.count() == 60
+        assert all(reopened.get(d.doc_id) is not None for d in docs + extra)
+
+    def test_automatic_compaction(self, monkeypatch) -> None:
+        from .. import _storage as _stg
+
+        monkeypatch.setattr(_stg, "_MIN_COMPACT_BYTES", 0)
+        store = AppendOnlyJSONLStorage(self.path, compact_threshold=0.5)
+        doc = self._fresh_doc()
+        for _ in range(4):
+            store.save(doc)
+        store.close()
+        assert store.count() == 1
+        assert store.dead_bytes < self.path.stat().st_size
+
+    def test_reads_files_written_by_jsonl_storage(self) -> None:
+        docs = [self._fresh_doc(i) for i in range(3)]
+        JSONLStorage(self.path).save_batch(docs)
+        assert self._reopen().count() == 3
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            AppendOnlyJSONLStorage(self.path, checkpoint_every=0)
+        with pytest.raises(ValueError):
+            AppendOnlyJSONLStorage(self.path, compact_threshold=1.5)
+
+    def test_repr(self) -> None:
+        assert "AppendOnlyJSONLStorage" in repr(self.store)
+
+
 class TestSQLiteStorage(BackendContract):
     def setup_method(self) -> None:
         self.store = SQLiteStorage(":memory:")
@@ -381,6 +381,135 @@ class TestCorpusPipelineRunBatch:
         assert len(results) == 2
 
 
+class TestCorpusPipelineConcurrentBatch:
+
+    def test_threaded_batch_matches_sequential(self, tmp_path: pathlib.Path) -> None:
+        files = [
+            _write_txt(tmp_path, f"d{i}.txt", f"Content number {i} here.")
+            for i in range(6)
+        ]
+        pipeline = CorpusPipeline()
+        sequential = pipeline.run_batch(files)
+        threaded = pipeline.run_batch(files, max_workers=3, executor="thread")
+        assert [r.input_path for r in threaded] == [str(f) for f in files]
+        assert [r.n_documents for r in threaded] == [
+            r.n_documents for r in sequential
+        ]
+
+    def test_threaded_batch_gives_each_thread_its_own_enricher(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        import threading
+        import time
+
+        class _LazyEnricher:
+            """Loads a 'model' on first use; not safe to share across threads."""
+
+            seen: list[tuple[int, int]] = []
+            overlaps: list[int] = []
+
+            def __init__(self) -> None:
+                self._model: dict | None = None
+                self._active = 0
+
+            def enrich_documents(self, documents: list) -> list:
+                self._active += 1
+                if self._active > 1:
+                    _LazyEnricher.overlaps.append(id(self))
+                if self._model is None:
+                    time.sleep(0.01)  # widen the race window of the lazy load
+                    self._model = {"owner": threading.get_ident()}
+                _LazyEnricher.seen.append((id(self), threading.get_ident()))
+                assert self._model["owner"] == threading.get_ident()
+                time.sleep(0.01)
+                self._active -= 1
+                return documents
+
+        files = [
+            _write_txt(tmp_path, f"d{i}.txt", f"Content number {i} here.")
+            for i in range(8)
+        ]
+        enricher = _LazyEnricher()
+        pipeline = CorpusPipeline(enricher=enricher)
+        results = pipeline.run_batch(files, max_workers=3, executor="thread")
+        assert len(results) == len(files)
+        assert _LazyEnricher.overlaps == []
+        assert enricher._model is None  # the caller's instance is untouched
+        owners: dict[int, int] = {}
+        for obj, thread in _LazyEnricher.seen:
+            assert owners.setdefault(obj, thread) == thread
+
+    def test_threaded_batch_skips_failures_in_order(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        good = [_write_txt(tmp_path, f"g{i}.txt", f"Good content {i}.") for i in range(3)]
+        bad = tmp_path / "missing.txt"
+        calls: list[str] = []
+        pipeline = CorpusPipeline(progress_callback=lambda s, d, t: calls.append(s))
+        results = pipeline.run_batch(
+            [good[0], bad, good[1], good[2]], max_workers=2, executor="thread"
+        )
+        assert [r.input_path for r in results] == [str(f) for f in good]
+        assert calls == [str(good[0]), str(bad), str(good[1]), str(good[2])]
+
+    def test_threaded_batch_stop_on_error_reraises(
+        self, tmp_path: pathlib.Path
+    ) -> None:
+        good = _write_txt(tmp_path, "good.txt", "Good content here.")
+        pipeline = CorpusPipeline()
+        with pytest.raises(Exception):
+            pipeline.run_batch(
+                [good, tmp_path / "missing.txt"],
+                max_workers=2,
+                stop_on_error=True,
+            )
+
+    def test_iter_batch_streams_generator_input(self, tmp_path: pathlib.Path) -> None:
+        for i in range(5):
+            _write_txt(tmp_path, f"d{i}.txt", f"Content {i}.")
+        pipeline = CorpusPipeline()
+        stream = pipeline.iter_batch(
+            sorted(tmp_path.glob("*.txt")).__iter__(), max_workers=2, max_pending=1
+        )
+        first = next(stream)
+        assert isinstance(first, PipelineResult)
+        assert len(list(stream)) == 4
+
+    def test_iter_batch_exports_each_source(self, tmp_path: pathlib.Path) -> None:
+        files = [_write_txt(tmp_path, f"d{i}.txt", f"Content {i}.") for i in range(3)]
+        out = tmp_path / "out"
+        pipeline = CorpusPipeline(output_path=out, format=ExportFormat.JSONL)
+        results = list(pipeline.iter_batch(files, max_workers=2))
+        assert [r.output_path for r in results] == [out / f"d{i}.jsonl" for i in range(3)]
+        assert all(r.output_path.exists() for r in results)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_workers": 0},
+            {"executor": "fork"},
+            {"max_workers": 2, "max_pending": 0},
+        ],
+    )
+    def test_iter_batch_rejects_bad_options(self, kwargs: dict) -> None:
+        pipeline = CorpusPipeline()
+        with pytest.raises(ValueError):
+            pipeline.run_batch([], **kwargs)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_workers": True},
+            {"max_workers": 2.0},
+            {"max_workers": 2, "max_pending": "4"},
+        ],
+    )
+    def test_iter_batch_rejects_non_int_options(self, kwargs: dict) -> None:
+        pipeline = CorpusPipeline()
+        with pytest.raises(TypeError):
+            pipeline.run_batch([], **kwargs)
+
+
 # ===========================================================================
 # create_corpus — convenience wrapper
 # ===========================================================================
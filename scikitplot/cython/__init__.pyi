@@ -292,6 +292,7 @@ def compile_and_load_result(
     lock_timeout_s: float = ...,
     language: str | None = ...,
     security_policy: SecurityPolicy | None = ...,
+    object_cache: bool = ...,
 ) -> BuildResult: ...
 def compile_and_load(
     source: str, *, module_name: str | None = ..., **kwargs: Any
@@ -599,6 +600,8 @@ def build_extension_module_result(
     lock_timeout_s: float = ...,
     language: str | None = ...,
     build_timeout_s: float | None = ...,
+    object_cache: bool = ...,
+    import_module: bool = ...,
 ) -> BuildResult: ...
 def build_extension_package_from_code_result(
     modules: Mapping[str, str],
@@ -747,6 +750,7 @@ def cython_import_all_result(
     recursive: bool = ...,
     collect: bool = ...,
     only: Sequence[str] | None = ...,
+    workers: int | None = ...,
     **kwargs: Any,
 ) -> BatchBuildResult: ...
 
@@ -125,6 +125,7 @@ from ._cache import (
 )
 from ._loader import import_extension
 from ._lock import build_lock
+from ._objcache import install_object_cache
 from ._result import BuildResult, PackageBuildResult
 from ._utils import sanitize
 
@@ -465,6 +466,8 @@ def build_extension_module_result(  # noqa: PLR0912
     lock_timeout_s: float = 60.0,
     language: str | None = None,
     build_timeout_s: float | None = None,
+    object_cache: bool = False,
+    import_module: bool = True,
 ) -> BuildResult:
     """
     Compile and import an extension module, with deterministic caching.
@@ -524,6 +527,14 @@ def build_extension_module_result(  # noqa: PLR0912
         default compiler behavior.
     build_timeout_s : float | None, default=None
         None
+    object_cache : bool, default=False
+        If True, reuse compiled object files for unchanged translation units
+        across builds (see :mod:`scikitplot.cython._objcache`).  Does not affect
+        the cache key.
+    import_module : bool, default=True
+        If False, only build and publish the cache entry; the returned result
+        carries no module.  Used by parallel batch builds, whose workers must
+        not execute module initialisation code.
 
     Returns
     -------
@@ -695,10 +706,22 @@ def build_extension_module_result(  # noqa: PLR0912
                 extra_compile_args=list(extra_compile_args or []),
                 extra_link_args=list(extra_link_args or []),
             )
+            meta = read_meta(build_dir) or {}
+            if not import_module:
+                return BuildResult(
+                    key=key,
+                    module_name=name,
+                    build_dir=build_dir,
+                    artifact_path=ext_path,
+                    used_cache=True,
+                    created_utc=meta.get("created_utc"),
+                    fingerprint=meta.get("fingerprint"),
+                    source_sha256=meta.get("source_sha256"),
+                    meta=meta,
+                )
             module = import_extension(
                 name=name, path=ext_path, key=key, build_dir=build_dir
             )
-            meta = read_meta(build_dir) or {}
             return BuildResult(
                 module=module,
                 key=key,
@@ -757,6 +780,8 @@ def build_extension_module_result(  # noqa: PLR0912
                     verbose=verbose,
                     extra_sources=stage_extra_sources,
                     language=language,
+                    object_cache_root=cache_root if object_cache else None,
+                    fingerprint=fp,
                 ),
                 timeout_s=build_timeout_s,
                 what=f"compile[{name}]",
@@ -810,10 +835,22 @@ def build_extension_module_result(  # noqa: PLR0912
             if html is not None:
                 _open_annotation_in_browser(html.as_uri())
 
+        meta = read_meta(build_dir) or {}
+        if not import_module:
+            return BuildResult(
+                key=key,
+                module_name=name,
+                build_dir=build_dir,
+                artifact_path=ext_path,
+                used_cache=used_cache,
+                created_utc=meta.get("created_utc"),
+                fingerprint=meta.get("fingerprint"),
+                source_sha256=meta.get("source_sha256"),
+                meta=meta,
+            )
         module = import_extension(
             name=name, path=ext_path, key=key, build_dir=build_dir
         )
-        meta = read_meta(build_dir) or {}
         return BuildResult(
             module=module,
             key=key,
@@ -1243,8 +1280,14 @@ def _compile(  # noqa: PLR0912
     verbose: int,
     extra_sources: list[Path],
     language: str | None,
+    object_cache_root: Path | None = None,
+    fingerprint: Mapping[str, Any] | None = None,
 ) -> Path:
-    """Compile the extension module into build_dir."""
+    """Compile the extension module into build_dir.
+
+    With ``object_cache_root`` set, object files are reused from (and added
+    to) the content-addressed store under that root (CYTHON-PERF-002).
+    """
     # NOTE:
     # Cython compilation failures are frequently reported to stdout/stderr
     # (and may not be included in the raised exception message). To provide
@@ -1448,6 +1491,22 @@ def _compile(  # noqa: PLR0912
 
     cmd.finalize_options = _guarded_finalize
 
+    if object_cache_root is not None:
+        # build_ext creates its compiler inside run(); hook it just before the
+        # extensions are compiled, again on the INSTANCE only.
+        _orig_build_extensions = cmd.build_extensions
+
+        def _cached_build_extensions() -> None:
+            install_object_cache(
+                cmd.compiler,
+                cache_root=object_cache_root,
+                fingerprint=fingerprint or {},
+                staging_dir=build_dir,
+            )
+            _orig_build_extensions()
+
+        cmd.build_extensions = _cached_build_extensions
+
     try:
         dist.run_command("build_ext")
     except SystemExit as e:
@@ -0,0 +1,227 @@
+# scikitplot/cython/_objcache.py
+#
+# Flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Content-addressed object-file cache for runtime builds (ccache-style).
+
+A module cache entry is keyed by its *inputs*, so any change (a flag, a
+support file, a new toolchain) rebuilds every translation unit of that entry.
+Most of those units are unchanged between builds — shared ``extra_sources``
+linked into many kernels, or the same kernel rebuilt after ``purge_cache`` /
+``force_rebuild``.  This cache stores compiled objects under
+``<cache_root>/.objects`` keyed by:
+
+- the **preprocessed** translation unit, so every header it includes is part
+  of the key (the same guarantee ccache's preprocessor mode gives);
+- the compiler command and arguments;
+- the toolchain fingerprint from :func:`._cache.runtime_fingerprint`.
+
+Paths of the private staging directory are normalized out of the key, so a
+rebuild in a fresh staging directory still hits.
+
+The cache hooks ``CCompiler.compile`` of the build_ext command instance and
+only supports ``compiler_type == 'unix'`` (GCC/Clang), where a preprocessor
+run is cheap and reliable; other compilers build normally.  It is opt-in
+(``object_cache=True``) and never changes the module cache key.  Entries are
+written atomically, so concurrent builds in several processes may share one
+object store.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from hashlib import sha256
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from ._cache import make_cache_key
+
+__all__ = [
+    "install_object_cache",
+    "object_cache_dir",
+]
+
+#: Directory (under the cache root) holding cached object files.  The leading
+#: dot keeps it out of cache-entry iteration, which only accepts key names.
+OBJECT_CACHE_DIRNAME = ".objects"
+
+#: Placeholder substituted for the staging directory before hashing.
+_STAGING_PLACEHOLDER = "<staging>"
+
+
+def object_cache_dir(cache_root: Path) -> Path:
+    """
+    Return the object-store directory for a cache root.
+
+    Parameters
+    ----------
+    cache_root : pathlib.Path
+        Resolved cache root.
+
+    Returns
+    -------
+    pathlib.Path
+        ``cache_root / '.objects'`` (not created).
+    """
+    return Path(cache_root) / OBJECT_CACHE_DIRNAME
+
+
+def _object_key(
+    compiler: Any,
+    source: str,
+    *,
+    macros: Any,
+    include_dirs: Sequence[str] | None,
+    debug: bool,
+    extra_preargs: Sequence[str] | None,
+    extra_postargs: Sequence[str] | None,
+    fingerprint: Mapping[str, Any],
+    staging: str,
+) -> str | None:
+    """Key one translation unit by its preprocessed text; None if unavailable."""
+    fd, tmp = tempfile.mkstemp(suffix=".i")
+    os.close(fd)
+    # Remove the placeholder so the preprocessor's "newer than output" check
+    # cannot skip the run when the compiler is not in force mode.
+    Path(tmp).unlink()
+    try:
+        compiler.preprocess(
+            source,
+            output_file=tmp,
+            macros=macros,
+            include_dirs=include_dirs,
+            extra_preargs=extra_preargs,
+            extra_postargs=extra_postargs,
+        )
+        text = Path(tmp).read_bytes()
+    except Exception:  # noqa: BLE001 - any failure just disables reuse
+        return None
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+
+    placeholder = _STAGING_PLACEHOLDER.encode("utf-8")
+    text = text.replace(staging.encode("utf-8"), placeholder)
+
+    def _norm(args: Sequence[str] | None) -> list[str]:
+        return [str(a).replace(staging, _STAGING_PLACEHOLDER) for a in args or []]
+
+    return make_cache_key(
+        {
+            "fingerprint": dict(fingerprint),
+            "compiler_so": _norm(getattr(compiler, "compiler_so", None)),
+            "compiler_cxx": _norm(getattr(compiler, "compiler_cxx", None)),
+            "suffix": Path(source).suffix,
+            "debug": bool(debug),
+            "extra_preargs": _norm(extra_preargs),
+            "extra_postargs": _norm(extra_postargs),
+            "preprocessed_sha256": sha256(text).hexdigest(),
+        }
+    )
+
+
+def _store_object(obj: Path, target: Path) -> None:
+    """Atomically copy a freshly built object into the store (best-effort)."""
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=".tmp-", suffix=".o", dir=target.parent)
+        os.close(fd)
+        try:
+            shutil.copyfile(obj, tmp)
+            os.replace(tmp, target)
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def install_object_cache(
+    compiler: Any,
+    *,
+    cache_root: Path,
+    fingerprint: Mapping[str, Any],
+    staging_dir: Path,
+) -> bool:
+    """
+    Wrap ``compiler.compile`` so unchanged translation units are reused.
+
+    Parameters
+    ----------
+    compiler : distutils.ccompiler.CCompiler
+        Compiler instance owned by a ``build_ext`` command.
+    cache_root : pathlib.Path
+        Resolved cache root; objects live in :func:`object_cache_dir`.
+    fingerprint : Mapping[str, Any]
+        Toolchain fingerprint (see :func:`._cache.runtime_fingerprint`).
+    staging_dir : pathlib.Path
+        Build directory whose path is normalized out of cache keys.
+
+    Returns
+    -------
+    bool
+        True if the hook was installed, False for unsupported compilers.
+    """
+    if getattr(compiler, "compiler_type", None) != "unix":
+        return False
+    if getattr(compiler, "_scikitplot_object_cache", False):
+        return True
+
+    store = object_cache_dir(cache_root)
+    staging = str(staging_dir)
+    original = compiler.compile
+
+    def compile(  # noqa: A001, PLR0913
+        sources: Sequence[str],
+        output_dir: str | None = None,
+        macros: Any = None,
+        include_dirs: Sequence[str] | None = None,
+        debug: bool = False,
+        extra_preargs: Sequence[str] | None = None,
+        extra_postargs: Sequence[str] | None = None,
+        depends: Sequence[str] | None = None,
+    ) -> list[str]:
+        objects = compiler.object_filenames(sources, output_dir=output_dir or "")
+        misses: list[tuple[str, str, str | None]] = []
+        for src, obj in zip(sources, objects):
+            key = _object_key(
+                compiler,
+                src,
+                macros=macros,
+                include_dirs=include_dirs,
+                debug=debug,
+                extra_preargs=extra_preargs,
+                extra_postargs=extra_postargs,
+                fingerprint=fingerprint,
+                staging=staging,
+            )
+            cached = store / key[:2] / f"{key}.o" if key is not None else None
+            if cached is not None and cached.is_file():
+                Path(obj).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(cached, obj)
+            else:
+                misses.append((src, obj, key))
+
+        if misses:
+            original(
+                [src for src, _, _ in misses],
+                output_dir=output_dir,
+                macros=macros,
+                include_dirs=include_dirs,
+                debug=debug,
+                extra_preargs=extra_preargs,
+                extra_postargs=extra_postargs,
+                depends=depends,
+            )
+            for _, obj, key in misses:
+                if key is not None and Path(obj).is_file():
+                    _store_object(Path(obj), store / key[:2] / f"{key}.o")
+        return objects
+
+    compiler.compile = compile
+    compiler._scikitplot_object_cache = True
+    return True
@@ -28,8 +28,11 @@ the current Python process. Do not compile or import untrusted sources.
 
 from __future__ import annotations
 
+import dataclasses
+import multiprocessing
 import os
 import shutil
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from pathlib import Path
 from types import ModuleType
 from typing import Any, Mapping, Sequence
@@ -443,7 +446,9 @@ def compile_and_load_result(  # noqa: D417
     lock_timeout_s: float = 60.0,
     language: str | None = None,
     security_policy: Any | None = None,
+    object_cache: bool = False,
     _trusted_include_dirs: PathLikeSeq = None,
+    _import_module: bool = True,
 ) -> BuildResult:
     """
     Compile and import a Cython extension module from source text.
@@ -483,6 +488,11 @@ def compile_and_load_result(  # noqa: D417
         Max seconds to wait for the per-key build lock.
     language : {'c', 'c++'} or None, default=None
         Optional language override.
+    object_cache : bool, default=False
+        Reuse compiled object files for unchanged translation units (GCC/Clang
+        only).  Objects are keyed by the preprocessed source, the compiler
+        command and the runtime toolchain fingerprint, and stored under
+        ``<cache_dir>/.objects``.
 
     Returns
     -------
@@ -561,6 +571,8 @@ def compile_and_load_result(  # noqa: D417
         include_cwd=include_cwd,
         lock_timeout_s=lock_timeout_s,
         language=lang2,
+        object_cache=object_cache,
+        import_module=_import_module,
     )
 
 
@@ -1256,6 +1268,7 @@ def cython_import_all_result(
     recursive: bool = False,
     collect: bool = False,
     only: Sequence[str] | None = None,
+    workers: int | None = None,
     **kwargs: Any,
 ) -> BatchBuildResult:
     r"""
@@ -1282,8 +1295,13 @@ def cython_import_all_result(
     only : Sequence[str] or None, default=None
         If given, restrict the batch to these stems (e.g. a resume token from a
         prior :class:`BatchBuildError`).
+    workers : int or None, default=None
+        If greater than 1, compile up to ``workers`` candidates concurrently in
+        a process pool, then import them in order in this process.  ``None``
+        or ``1`` builds and imports one file at a time.
     **kwargs : dict
-        Passed to :func:`cython_import_result`.
+        Passed to :func:`cython_import_result`.  Under ``workers`` they must be
+        picklable.
 
     Returns
     -------
@@ -1297,7 +1315,26 @@ def cython_import_all_result(
     BatchBuildError
         Under the fail-fast policy (``collect=False``) when an item fails; the
         exception's ``result`` attribute holds the partial :class:`BatchBuildResult`.
+    ValueError
+        If ``workers`` is less than 1.
+
+    Notes
+    -----
+    Parallel builds (CYTHON-PERF-002) only warm the cache: each worker
+    compiles and atomically publishes its entry under the usual per-key
+    :func:`build_lock`, so duplicate keys and concurrent processes are still
+    serialized, and workers never run module initialisation code.  The parent
+    then imports every candidate in directory order from the cache, so
+    ``successes``, ``committed``, failure order and the fail-fast resume token
+    are exactly those of a sequential run; ``used_cache`` reports whether the
+    worker had to compile.  Under fail-fast, builds after the first failing
+    candidate that have not started are cancelled.  Wall time approaches that
+    of the slowest single build.  Combine with ``object_cache=True`` to also
+    reuse compiled objects of shared sources.
     """
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
     root = Path(directory).expanduser().resolve()
     if not root.exists():
         raise FileNotFoundError(str(root))
@@ -1311,9 +1348,22 @@ def cython_import_all_result(
     failures: list[BatchFailure] = []
     policy = "collect" if collect else "fail_fast"
 
+    prebuilt: dict[int, bool | BaseException] = {}
+    if workers is not None and workers > 1 and len(candidates) > 1:
+        prebuilt = _prebuild_parallel(
+            candidates, workers=workers, collect=collect, kwargs=kwargs
+        )
+
     for index, f in enumerate(candidates):
         try:
-            successes[f.stem] = cython_import_result(f, **kwargs)
+            outcome = prebuilt.get(index)
+            if isinstance(outcome, BaseException):
+                # Replay the worker's failure at this candidate's position.
+                raise outcome
+            result = cython_import_result(f, **kwargs)
+            if outcome is not None:
+                result = dataclasses.replace(result, used_cache=outcome)
+            successes[f.stem] = result
         except BaseException as exc:  # noqa: BLE001 - reported structurally
             failures.append(
                 BatchFailure(
@@ -1347,6 +1397,56 @@ def cython_import_all_result(
     )
 
 
+def _prebuild_pyx(pyx_path: Path, kwargs: Mapping[str, Any]) -> bool:
+    """Process-pool task: build and publish one ``.pyx`` without importing it."""
+    return cython_import_result(pyx_path, _import_module=False, **kwargs).used_cache
+
+
+def _build_pool(workers: int) -> Executor:
+    """Return the process pool used by parallel batch builds."""
+    # "spawn" avoids forking a parent that may hold threads or locks.
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _prebuild_parallel(
+    candidates: Sequence[Path],
+    *,
+    workers: int,
+    collect: bool,
+    kwargs: Mapping[str, Any],
+) -> dict[int, bool | BaseException]:
+    """
+    Build candidates concurrently; map candidate index to outcome.
+
+    The outcome is the worker's ``used_cache`` flag or the exception it
+    raised.  Under fail-fast (``collect=False``) candidates after the earliest
+    failure are cancelled when still pending and are absent from the mapping.
+    """
+    outcomes: dict[int, bool | BaseException] = {}
+    first_failure: int | None = None
+    with _build_pool(min(workers, len(candidates))) as pool:
+        futures = {
+            pool.submit(_prebuild_pyx, f, dict(kwargs)): i
+            for i, f in enumerate(candidates)
+        }
+        for fut in as_completed(futures):
+            if fut.cancelled():
+                continue
+            i = futures[fut]
+            try:
+                outcomes[i] = fut.result()
+            except BaseException as exc:  # noqa: BLE001 - replayed by the caller
+                outcomes[i] = exc
+                if not collect and (first_failure is None or i < first_failure):
+                    first_failure = i
+                    for other, j in futures.items():
+                        if j > i:
+                            other.cancel()
+    return outcomes
+
+
 def cython_import_all(
     directory: str | Path,
     *,
@@ -114,3 +114,64 @@ class TestMissingDir:
     def test_missing_directory_raises(self, tmp_path: Path) -> None:
         with pytest.raises(FileNotFoundError):
             cython_import_all_result(tmp_path / "nope", collect=True)
+
+
+class TestParallelWorkers:
+    """CYTHON-PERF-002: parallel warm-up keeps sequential batch semantics."""
+
+    @staticmethod
+    def _patches(fail: set[str]):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from .._result import BuildResult
+
+        built: list[str] = []
+
+        def _prebuild(f: Path, kwargs):
+            if f.stem in fail:
+                raise ValueError(f"boom-{f.stem}")
+            built.append(f.stem)
+            return False
+
+        def _import(f: Path, **kwargs):
+            assert f.stem in built  # imports only ever follow a worker build
+            return BuildResult(key=f.stem, used_cache=True)
+
+        return built, [
+            mock.patch.object(_public, "_build_pool", lambda n: ThreadPoolExecutor(n)),
+            mock.patch.object(_public, "_prebuild_pyx", _prebuild),
+            mock.patch.object(_public, "cython_import_result", _import),
+        ]
+
+    def test_parallel_success_is_ordered_and_reports_compiles(self, tmp_path: Path) -> None:
+        _make_pyx(tmp_path, "c", "a", "b")
+        built, patches = self._patches(set())
+        with patches[0], patches[1], patches[2]:
+            res = cython_import_all_result(tmp_path, collect=True, workers=3)
+        assert sorted(built) == ["a", "b", "c"]
+        assert list(res.successes) == ["a", "b", "c"]
+        assert res.committed == ["a", "b", "c"]
+        # Worker compiled, so the parent's cache hit is reported as a build.
+        assert all(r.used_cache is False for r in res.successes.values())
+
+    def test_parallel_collect_records_worker_failures_in_order(self, tmp_path: Path) -> None:
+        _make_pyx(tmp_path, "a", "b", "c")
+        _, patches = self._patches({"b"})
+        with patches[0], patches[1], patches[2]:
+            res = cython_import_all_result(tmp_path, collect=True, workers=2)
+        assert list(res.successes) == ["a", "c"]
+        assert [f.name for f in res.failures] == ["b"]
+        assert res.failures[0].error_type == "ValueError"
+
+    def test_parallel_fail_fast_keeps_resume_token(self, tmp_path: Path) -> None:
+        _make_pyx(tmp_path, "a", "b", "c")
+        _, patches = self._patches({"b"})
+        with patches[0], patches[1], patches[2]:
+            with pytest.raises(BatchBuildError) as ei:
+                cython_import_all_result(tmp_path, collect=False, workers=2)
+        assert ei.value.result.committed == ["a"]
+        assert ei.value.resume_token == ("c",)
+
+    def test_invalid_workers(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            cython_import_all_result(tmp_path, workers=0)
@@ -0,0 +1,85 @@
+# scikitplot/cython/tests/test__objcache.py
+#
+# Flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Tests for the content-addressed object cache (CYTHON-PERF-002).
+
+A fake ``unix`` compiler stands in for distutils: ``preprocess`` copies the
+source (so the preprocessed text *is* the source) and ``compile`` writes one
+object per source while counting invocations.  This exercises key derivation,
+staging-path normalization and store/reuse without a toolchain.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from .._objcache import install_object_cache, object_cache_dir
+
+
+class _FakeUnixCompiler:
+    compiler_type = "unix"
+    compiler_so = ["cc", "-O2"]
+    compiler_cxx = ["c++"]
+
+    def __init__(self) -> None:
+        self.compiled: list[str] = []
+
+    def object_filenames(self, sources, output_dir=""):
+        return [str(Path(output_dir) / (Path(s).stem + ".o")) for s in sources]
+
+    def preprocess(self, source, output_file=None, **kwargs):
+        Path(output_file).write_bytes(Path(source).read_bytes())
+
+    def compile(self, sources, output_dir=None, **kwargs):
+        objects = self.object_filenames(sources, output_dir=output_dir or "")
+        for src, obj in zip(sources, objects):
+            self.compiled.append(Path(src).name)
+            Path(obj).parent.mkdir(parents=True, exist_ok=True)
+            Path(obj).write_bytes(b"OBJ:" + Path(src).read_bytes())
+        return objects
+
+
+def _build(tmp_path: Path, staging: str, sources: dict[str, str]):
+    stage = tmp_path / staging
+    stage.mkdir()
+    paths = []
+    for name, text in sources.items():
+        p = stage / name
+        p.write_text(text.replace("{stage}", str(stage)), encoding="utf-8")
+        paths.append(str(p))
+    cc = _FakeUnixCompiler()
+    assert install_object_cache(
+        cc, cache_root=tmp_path / "cache", fingerprint={"cc": "fake"}, staging_dir=stage
+    )
+    objects = cc.compile(paths, output_dir=str(stage / "build"))
+    return cc, objects
+
+
+def test_second_build_in_new_staging_dir_reuses_objects(tmp_path: Path) -> None:
+    srcs = {"a.c": 'const char *f = "{stage}/a.c";', "b.c": "int b;"}
+    first, _ = _build(tmp_path, "s1", srcs)
+    assert sorted(first.compiled) == ["a.c", "b.c"]
+    second, objects = _build(tmp_path, "s2", srcs)
+    assert second.compiled == []  # staging path normalized out of the key
+    assert all(Path(o).is_file() for o in objects)
+
+
+def test_changed_source_misses(tmp_path: Path) -> None:
+    _build(tmp_path, "s1", {"a.c": "int a;", "b.c": "int b;"})
+    cc, _ = _build(tmp_path, "s2", {"a.c": "int a = 1;", "b.c": "int b;"})
+    assert cc.compiled == ["a.c"]
+
+
+def test_unsupported_compiler_is_left_alone(tmp_path: Path) -> None:
+    cc = _FakeUnixCompiler()
+    cc.compiler_type = "msvc"
+    original = cc.compile
+    assert not install_object_cache(
+        cc, cache_root=tmp_path, fingerprint={}, staging_dir=tmp_path
+    )
+    assert cc.compile == original
+    assert not object_cache_dir(tmp_path).exists()
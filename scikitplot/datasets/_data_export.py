@@ -16,6 +16,11 @@ Key features:
 - Safer filtering:
   - required_cols controls which columns must be non-null (avoid destructive dropna over all columns).
   - optional query for row filtering.
+- Arrow engine (``--engine arrow``, requires pyarrow):
+  - multithreaded CSV/Parquet record-batch scans with column projection and
+    predicate pushdown (``--filter``) instead of a pandas query;
+  - streaming hash/stratified sampling with bounded memory;
+  - incremental Parquet writes with ``--row-group-size``.
 - Traceability:
   - writes manifest JSON describing exact export parameters and row counts.
 - Friendly sizing:
@@ -122,6 +127,22 @@ Examples
 >>>     --chunksize 50000 \
 >>>     --format parquet \
 >>>     --write-manifest
+
+7) Arrow engine: pushed-down filters, streaming stratified sample, sized row groups:
+
+>>> python data_export.py \
+>>>     --input huge.parquet \
+>>>     --output-dir data/subsets \
+>>>     --sizes 100000 \
+>>>     --strategy stratified \
+>>>     --strata-cols country_code \
+>>>     --within hash \
+>>>     --id-col id \
+>>>     --engine arrow \
+>>>     --filter 'price > 0' \
+>>>     --filter 'fuel_category == "Diesel"' \
+>>>     --row-group-size 65536 \
+>>>     --format parquet
 """
 
 from __future__ import annotations
@@ -129,13 +150,14 @@ from __future__ import annotations
 import argparse
 import dataclasses
 import hashlib
-import heapq
+import itertools
 import json
 import logging
 import math
+import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, Sequence  # noqa: F401
+from typing import TYPE_CHECKING, Iterator, Literal, Sequence  # noqa: F401
 from urllib.parse import urlparse
 
 import numpy as np
@@ -223,6 +245,210 @@ def stable_hash64(text: str) -> int:
     return int.from_bytes(h.digest(), byteorder="big", signed=False)
 
 
+def _arrow_digests(values: object) -> list[bytes]:
+    """Hash an Arrow string/binary column straight from its value buffers."""
+    import pyarrow as pa  # noqa: PLC0415
+
+    if not isinstance(values, (pa.Array, pa.ChunkedArray)):
+        values = pa.array(values)
+    chunks = values.chunks if isinstance(values, pa.ChunkedArray) else [values]
+
+    blake2b = hashlib.blake2b
+    digests: list[bytes] = []
+    for chunk in chunks:
+        if chunk.null_count:
+            raise ValueError(
+                "stable_hash64_array: column contains nulls; drop or fill them first"
+            )
+        t = chunk.type
+        if not (
+            pa.types.is_string(t)
+            or pa.types.is_large_string(t)
+            or pa.types.is_binary(t)
+            or pa.types.is_large_binary(t)
+        ):
+            # Non-string Arrow types: format element-wise like the object path.
+            digests.extend(
+                blake2b(str(v).encode("utf-8"), digest_size=8).digest()
+                for v in chunk.to_pylist()
+            )
+            continue
+        # UTF-8 bytes are hashed in place through a memoryview of the data
+        # buffer, without decoding to str.
+        _, offsets_buf, data_buf = chunk.buffers()
+        large = pa.types.is_large_string(t) or pa.types.is_large_binary(t)
+        start = chunk.offset
+        offsets = np.frombuffer(offsets_buf, dtype=np.int64 if large else np.int32)[
+            start : start + len(chunk) + 1
+        ].tolist()
+        data = memoryview(data_buf) if data_buf is not None else memoryview(b"")
+        digests.extend(
+            blake2b(data[a:b], digest_size=8).digest()
+            for a, b in zip(offsets[:-1], offsets[1:])
+        )
+    return digests
+
+
+def _is_arrow_backed(values: object) -> bool:
+    """Return True for pyarrow arrays and pyarrow-backed pandas arrays."""
+    if type(values).__module__.split(".", 1)[0] == "pyarrow":
+        return True
+    dtype = getattr(values, "dtype", None)
+    if isinstance(dtype, pd.StringDtype):
+        return str(dtype.storage).startswith("pyarrow")
+    return type(dtype).__name__ == "ArrowDtype"
+
+
+def stable_hash64_array(values: object) -> np.ndarray:
+    """
+    Compute :func:`stable_hash64` for a whole column at once.
+
+    Parameters
+    ----------
+    values : array-like
+        Column to hash: a pandas Series/Index/ExtensionArray, a pyarrow
+        Array/ChunkedArray, a NumPy array (object, fixed-width ``U``/``S``
+        or any other dtype) or a sequence.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``uint64`` array of the input's shape with
+        ``out[i] == stable_hash64(str(values[i]))``, except that ``bytes``
+        elements are read as UTF-8 text:
+        ``out[i] == stable_hash64(values[i].decode("utf-8"))``. Both match
+        ``Series.astype(str).map(stable_hash64)``.
+
+    Raises
+    ------
+    ValueError
+        If a pyarrow or pandas ``string`` column contains missing values.
+
+    See Also
+    --------
+    stable_hash64
+
+    Notes
+    -----
+    Output is bit-identical to calling :func:`stable_hash64` per element,
+    but the per-row Python overhead is reduced to one BLAKE2b call. The
+    hashing itself still runs one ``hashlib`` call per row (there is no
+    native kernel), so on ID-like columns this is about 1.5x faster than
+    ``values.astype(str).map(stable_hash64)``:
+
+    - Arrow ``string``/``binary`` columns (including pandas
+      ``string[pyarrow]``) are hashed straight from their UTF-8 data buffer,
+      with no ``str`` objects created.
+    - ``S`` arrays, Arrow ``binary`` columns and ``bytes`` elements are
+      taken to be UTF-8 text and hashed without decoding, as
+      ``Series.astype(str)`` would decode them. Bytes that are not valid
+      UTF-8 are hashed as-is, where ``astype(str)`` would raise.
+    - ``str`` elements are encoded as UTF-8; any other element is formatted
+      with ``str()`` first, matching ``Series.astype(str)`` on object columns.
+
+    The 8-byte digests are joined and reinterpreted as big-endian integers in
+    a single ``numpy.frombuffer`` call instead of one ``int.from_bytes`` per
+    row.
+
+    Examples
+    --------
+    >>> h = stable_hash64_array(["a", "b"])
+    >>> int(h[0]) == stable_hash64("a")
+    True
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        values = values.array
+
+    shape: tuple[int, ...]
+    if _is_arrow_backed(values):
+        digests = _arrow_digests(values)
+        shape = (len(digests),)
+    else:
+        if isinstance(values, pd.api.extensions.ExtensionArray):
+            if isinstance(values.dtype, pd.StringDtype) and values.isna().any():
+                raise ValueError(
+                    "stable_hash64_array: column contains nulls; drop or fill them first"
+                )
+            arr = values.to_numpy(dtype=object)
+        else:
+            arr = np.asarray(values)
+        shape = arr.shape
+        flat = arr.ravel()
+
+        blake2b = hashlib.blake2b
+        if flat.dtype.kind == "S":
+            digests = [blake2b(b, digest_size=8).digest() for b in flat.tolist()]
+        elif flat.dtype.kind == "U":
+            digests = [
+                blake2b(s.encode("utf-8"), digest_size=8).digest()
+                for s in flat.tolist()
+            ]
+        else:
+            if flat.dtype.kind != "O":
+                flat = flat.astype(object)
+            digests = []
+            append = digests.append
+            for v in flat:
+                t = type(v)
+                if t is bytes:
+                    b = v
+                elif t is str:
+                    b = v.encode("utf-8")
+                else:
+                    b = str(v).encode("utf-8")
+                append(blake2b(b, digest_size=8).digest())
+
+    if not digests:
+        return np.empty(shape, dtype=np.uint64)
+    # Big-endian matches ``int.from_bytes(..., byteorder="big")``.
+    out = np.frombuffer(b"".join(digests), dtype=">u8").astype(np.uint64)
+    return out.reshape(shape)
+
+
+def _hash_id_column(values: pd.Series) -> np.ndarray:
+    """Return ``values.astype(str).map(stable_hash64)`` as a uint64 array."""
+    dtype = values.dtype
+    if dtype == object or (
+        pd.api.types.is_string_dtype(dtype) and not values.isna().any()
+    ):
+        return stable_hash64_array(values)
+    return stable_hash64_array(values.astype(str))
+
+
+def _smallest_hash_positions(hashes: np.ndarray, n: int) -> np.ndarray:
+    """
+    Return positions of the ``n`` smallest hashes, ordered by (hash, position).
+
+    Parameters
+    ----------
+    hashes : numpy.ndarray
+        1-D ``uint64`` hashes.
+    n : int
+        Number of positions to return (clipped to ``len(hashes)``).
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer positions; ties keep their original order.
+
+    Notes
+    -----
+    ``numpy.partition`` finds the n-th smallest value in O(len), so only the
+    candidates ``<=`` it are sorted, not the whole column.  The result equals
+    the first ``n`` entries of a stable argsort.
+    """
+    m = len(hashes)
+    if n <= 0 or m == 0:
+        return np.empty(0, dtype=np.intp)
+    if n < m:
+        kth = np.partition(hashes, n - 1)[n - 1]
+        candidates = np.flatnonzero(hashes <= kth)
+    else:
+        candidates = np.arange(m)
+    order = np.argsort(hashes[candidates], kind="stable")
+    return candidates[order[:n]]
+
+
 def _ensure_cols_exist(df: pd.DataFrame, cols: Sequence[str]) -> None:
     """
     Validate that requested columns exist in a DataFrame.
@@ -721,7 +947,11 @@ def sample_hash_full(df: pd.DataFrame, *, n: int, id_col: str) -> pd.DataFrame:
 
     See Also
     --------
-    stable_hash64
+    stable_hash64_array
+
+    Notes
+    -----
+    Equal hashes keep their original row order.
     """
     if n < 0:
         raise ValueError("n must be non-negative")
@@ -729,9 +959,8 @@ def sample_hash_full(df: pd.DataFrame, *, n: int, id_col: str) -> pd.DataFrame:
         raise ValueError(f"n={n} exceeds dataset size={len(df)}")
     _ensure_cols_exist(df, [id_col])
 
-    hashes = df[id_col].astype(str).map(stable_hash64)
-    idx = hashes.sort_values(kind="mergesort").index[:n]
-    return df.loc[idx].reset_index(drop=True)
+    pos = _smallest_hash_positions(_hash_id_column(df[id_col]), n)
+    return df.iloc[pos].reset_index(drop=True)
 
 
 def sample_random(df: pd.DataFrame, *, n: int, seed: int) -> pd.DataFrame:
@@ -1145,6 +1374,87 @@ class StreamStats:
     rows_seen_eligible: int
 
 
+def _take_rows(rows: object, pos: np.ndarray) -> object:
+    """Gather rows by position from a DataFrame or a pyarrow Table/RecordBatch."""
+    if isinstance(rows, pd.DataFrame):
+        return rows.iloc[pos].reset_index(drop=True)
+    import pyarrow as pa  # noqa: PLC0415
+
+    taken = rows.take(pa.array(pos, type=pa.int64()))
+    return taken if isinstance(taken, pa.Table) else pa.Table.from_batches([taken])
+
+
+def _concat_rows(first: object, second: object) -> object:
+    """Concatenate two row containers of the same kind (see `_take_rows`)."""
+    if isinstance(first, pd.DataFrame):
+        return pd.concat([first, second], ignore_index=True)
+    import pyarrow as pa  # noqa: PLC0415
+
+    return pa.concat_tables([first, second])
+
+
+class _HashTopN:
+    """
+    Bounded top-N of rows by (stable hash, arrival order).
+
+    Parameters
+    ----------
+    n : int
+        Number of rows to keep.
+
+    Notes
+    -----
+    Chunks are merged with :func:`_smallest_hash_positions` (an
+    argpartition-style selection) instead of pushing rows one at a time
+    through a heap.  Once ``n`` rows are held, a chunk row is a candidate
+    only if its hash is strictly below the current n-th smallest, so later
+    chunks usually contribute a handful of rows.  Kept rows stay sorted by
+    (hash, arrival), so ties always resolve to the earliest row and the
+    result is identical for any ``chunksize``.
+
+    Rows may be pandas DataFrames or pyarrow Tables/RecordBatches; kept rows
+    use the same kind as the pushed chunks.
+    """
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self._hashes = np.empty(0, dtype=np.uint64)
+        self._rows: object | None = None
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def push(self, chunk: object, hashes: np.ndarray) -> None:
+        """Offer one chunk of rows with their precomputed uint64 hashes."""
+        if self.n == 0 or len(chunk) == 0:
+            return
+        if len(self._hashes) == self.n:
+            eligible = np.flatnonzero(hashes < self._hashes[-1])
+            if len(eligible) == 0:
+                return
+            chunk = _take_rows(chunk, eligible)  # noqa: PLW2901
+            hashes = hashes[eligible]  # noqa: PLW2901
+
+        pos = _smallest_hash_positions(hashes, self.n)
+        new_rows = _take_rows(chunk, pos)
+        if self._rows is None:
+            self._hashes = hashes[pos]
+            self._rows = new_rows
+            return
+
+        # Stable merge: kept rows precede the chunk, so they win ties.
+        merged = np.concatenate([self._hashes, hashes[pos]])
+        keep = np.argsort(merged, kind="stable")[: self.n]
+        self._hashes = merged[keep]
+        self._rows = _take_rows(_concat_rows(self._rows, new_rows), keep)
+
+    def result(self) -> object:
+        """Return the kept rows in ascending hash order (empty DataFrame if none)."""
+        if self._rows is None:
+            return pd.DataFrame()
+        return self._rows
+
+
 def sample_hash_csv_stream(  # noqa: PLR0912
     source: str,
     *,
@@ -1198,7 +1508,9 @@ def sample_hash_csv_stream(  # noqa: PLR0912
 
     Notes
     -----
-    - Keeps the `n` smallest hashes using a bounded heap; deterministic and memory-bounded w.r.t. n.
+    - Keeps the `n` smallest hashes in a bounded top-N buffer merged per chunk;
+      deterministic, independent of `chunksize`, and memory-bounded w.r.t. n.
+    - Each chunk's ids are hashed in one batch by :func:`stable_hash64_array`.
     - Query is evaluated per chunk.
 
     Examples
@@ -1219,8 +1531,7 @@ def sample_hash_csv_stream(  # noqa: PLR0912
         if missing:
             raise KeyError(f"usecols is missing required columns: {missing}")
 
-    heap: list[tuple[int, int, dict]] = []
-    counter = 0
+    top = _HashTopN(n)
 
     rows_seen_total = 0
     rows_seen_eligible = 0
@@ -1250,66 +1561,665 @@ def sample_hash_csv_stream(  # noqa: PLR0912
         rows_seen_eligible += len(chunk)
 
         # Compute hashes for the chunk (strict, deterministic)
-        h = chunk[id_col].astype(str).map(stable_hash64)
-
-        # Only consider chunk-local best candidates to reduce heap churn
-        k = min(n, len(chunk))
-        idx_best = h.nsmallest(k, keep="first").index
-
-        for idx in idx_best:
-            row = chunk.loc[idx]
-            hh = int(h.loc[idx])
-
-            # heap stores (-hash, counter, row_dict)
-            item = (-hh, counter, row.to_dict())
-            counter += 1
-
-            if len(heap) < n:
-                heapq.heappush(heap, item)
-            elif item[0] > heap[0][0]:
-                heapq.heapreplace(heap, item)
+        top.push(chunk, _hash_id_column(chunk[id_col]))
 
     if n == 0:
         return pd.DataFrame(), StreamStats(
             rows_seen_total=rows_seen_total, rows_seen_eligible=rows_seen_eligible
         )
 
-    if len(heap) < n:
+    if len(top) < n:
         raise ValueError(
-            f"Not enough eligible rows after filters/query. needed={n}, got={len(heap)}"
+            f"Not enough eligible rows after filters/query. needed={n}, got={len(top)}"
         )
 
-    # Convert heap to DataFrame, sorted by hash asc (deterministic output order)
-    rows = [it[2] for it in heap]
-    out = pd.DataFrame(rows)
-    out["_hash64__"] = out[id_col].astype(str).map(stable_hash64)
-    out = (
-        out.sort_values("_hash64__", kind="mergesort")
-        .head(n)
-        .drop(columns=["_hash64__"])
-        .reset_index(drop=True)
-    )
+    # Rows are kept sorted by hash asc (deterministic output order)
+    out = top.result()
 
     return out, StreamStats(
         rows_seen_total=rows_seen_total, rows_seen_eligible=rows_seen_eligible
     )
 
 
+# -----------------------------
+# Sampling (Arrow streaming engine)
+# -----------------------------
+StreamStrategy = Literal["hash", "linspace", "stratified"]
+
+#: Default record-batch size for the Arrow engine.
+ARROW_BATCH_SIZE = 131_072
+
+#: Default Parquet row-group size for incremental Arrow writes.
+PARQUET_ROW_GROUP_SIZE = 1_048_576
+
+
+def _import_pyarrow() -> object:
+    """Import pyarrow or raise an informative ImportError."""
+    try:
+        import pyarrow as pa  # noqa: PLC0415
+        import pyarrow.dataset  # noqa: F401, PLC0415
+    except ImportError as e:
+        raise ImportError(
+            "The Arrow streaming engine requires pyarrow (pip install pyarrow)."
+        ) from e
+    return pa
+
+
+def _arrow_filter_expression(
+    filters: object | None,
+    required_cols: Sequence[str] | None,
+) -> object | None:
+    """
+    Combine user filters and non-null requirements into one Arrow expression.
+
+    Parameters
+    ----------
+    filters : pyarrow.compute.Expression, list of tuple or None
+        Expression, or DNF tuples as accepted by ``pandas.read_parquet``
+        (e.g. ``[("price", ">", 1000), ("fuel", "in", ["Diesel"])]``).
+    required_cols : sequence of str or None
+        Columns that must be non-null.
+
+    Returns
+    -------
+    pyarrow.compute.Expression or None
+        Conjunction of all conditions, or None if there are none.
+    """
+    _import_pyarrow()
+    import pyarrow.compute as pc  # noqa: PLC0415
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    exprs = []
+    if filters is not None:
+        if isinstance(filters, pc.Expression):
+            exprs.append(filters)
+        else:
+            # Public since pyarrow 10; older releases only have the private name.
+            to_expression = (
+                getattr(pq, "filters_to_expression", None)
+                or pq._filters_to_expression  # noqa: SLF001
+            )
+            exprs.append(to_expression(list(filters)))
+    exprs.extend(pc.field(c).is_valid() for c in dict.fromkeys(required_cols or []))
+
+    if not exprs:
+        return None
+    expr = exprs[0]
+    for e in exprs[1:]:
+        expr = expr & e
+    return expr
+
+
+#: ``pandas.read_csv`` default ``na_values``; Arrow CSV scans read the same
+#: cells as missing so streamed samples match the in-memory ones.
+_CSV_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+def _arrow_dataset(
+    source: str,
+    *,
+    input_format: InputFormat = "auto",
+    csv_sep: str = ",",
+    csv_encoding: str | None = None,
+) -> tuple[object, InputFormat]:
+    """Open `source` as a pyarrow dataset; return it with the resolved format."""
+    _import_pyarrow()
+    import pyarrow.dataset as ds  # noqa: PLC0415
+
+    fmt: InputFormat = _infer_format(source) if input_format == "auto" else input_format
+    if fmt == "csv":
+        import pyarrow.csv as pacsv  # noqa: PLC0415
+
+        file_format = ds.CsvFileFormat(
+            parse_options=pacsv.ParseOptions(delimiter=csv_sep),
+            read_options=pacsv.ReadOptions(encoding=csv_encoding or "utf8"),
+            # Arrow keeps empty/"NA" string cells as text by default.
+            convert_options=pacsv.ConvertOptions(
+                null_values=_CSV_NULL_VALUES, strings_can_be_null=True
+            ),
+        )
+    elif fmt == "parquet":
+        file_format = ds.ParquetFileFormat()
+    else:
+        raise ValueError(f"Unsupported input_format: {input_format}")
+    return ds.dataset(source, format=file_format), fmt
+
+
+class _ArrowScan:
+    """
+    Projected, filtered record-batch scans over one CSV/Parquet source.
+
+    Parquet scans push the filter into the reader, which skips row groups by
+    their statistics; the total row count comes from file metadata.  CSV has
+    no statistics to skip by, so a CSV scan parses every row once, counts it,
+    and filters the batch right after parsing.  Either way rows arrive in
+    file order, which the samplers rely on for determinism.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        *,
+        input_format: InputFormat,
+        columns: Sequence[str] | None,
+        filters: object | None,
+        required_cols: Sequence[str] | None,
+        batch_size: int,
+        use_threads: bool,
+        csv_sep: str,
+        csv_encoding: str | None,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.dataset, self.fmt = _arrow_dataset(
+            source, input_format=input_format, csv_sep=csv_sep, csv_encoding=csv_encoding
+        )
+        self.columns = list(columns) if columns is not None else None
+        if self.columns is not None:
+            missing = [c for c in self.columns if c not in self.dataset.schema.names]
+            if missing:
+                raise KeyError(f"Missing columns: {missing}")
+        self.filter = _arrow_filter_expression(filters, required_cols)
+        self.batch_size = int(batch_size)
+        self.use_threads = bool(use_threads)
+        self.rows_seen_total = 0
+        self.rows_seen_eligible = 0
+
+    @property
+    def names(self) -> list[str]:
+        """Projected column names."""
+        return self.columns if self.columns is not None else self.dataset.schema.names
+
+    def empty(self) -> object:
+        """Return a zero-row table with the projected schema."""
+        return self.dataset.schema.empty_table().select(self.names)
+
+    def count(self) -> int:
+        """Count eligible rows (metadata-only for unfiltered Parquet)."""
+        return int(self.dataset.count_rows(filter=self.filter))
+
+    def batches(self, columns: Sequence[str] | None = None) -> Iterator[object]:
+        """Yield non-empty filtered tables; `columns` narrows the projection."""
+        import pyarrow as pa  # noqa: PLC0415
+
+        cols = list(columns) if columns is not None else self.columns
+        self.rows_seen_total = 0
+        self.rows_seen_eligible = 0
+        post_filter = self.fmt == "csv" and self.filter is not None
+        if self.fmt == "parquet":
+            self.rows_seen_total = int(self.dataset.count_rows())
+
+        scanner = self.dataset.scanner(
+            columns=None if post_filter else cols,
+            filter=None if post_filter else self.filter,
+            batch_size=self.batch_size,
+            use_threads=self.use_threads,
+        )
+        for batch in scanner.to_batches():
+            table = pa.Table.from_batches([batch])
+            if self.fmt == "csv":
+                self.rows_seen_total += table.num_rows
+            if post_filter:
+                table = table.filter(self.filter)
+                if cols is not None:
+                    table = table.select(cols)
+            if table.num_rows:
+                self.rows_seen_eligible += table.num_rows
+                yield table
+
+    def stats(self) -> StreamStats:
+        """Statistics of the last completed scan."""
+        return StreamStats(
+            rows_seen_total=self.rows_seen_total,
+            rows_seen_eligible=self.rows_seen_eligible,
+        )
+
+
+def iter_record_batches(
+    source: str,
+    *,
+    input_format: InputFormat = "auto",
+    columns: Sequence[str] | None = None,
+    filters: object | None = None,
+    required_cols: Sequence[str] | None = None,
+    batch_size: int = ARROW_BATCH_SIZE,
+    use_threads: bool = True,
+    csv_sep: str = ",",
+    csv_encoding: str | None = None,
+) -> Iterator[object]:
+    """
+    Stream a CSV/Parquet source as filtered, projected pyarrow tables.
+
+    Parameters
+    ----------
+    source : str
+        Local path or filesystem URI of a CSV or Parquet file or directory.
+    input_format : {'auto', 'csv', 'parquet'}, default='auto'
+        Input format selection. If 'auto', inferred from suffix.
+    columns : sequence of str or None, default=None
+        Column projection; only these columns are decoded.
+    filters : pyarrow.compute.Expression, list of tuple or None, default=None
+        Row predicate, pushed down to the reader where the format allows.
+        DNF tuples follow ``pandas.read_parquet(filters=...)``.
+    required_cols : sequence of str or None, default=None
+        Columns that must be non-null (added to the predicate).
+    batch_size : int, default=131_072
+        Maximum rows per batch.
+    use_threads : bool, default=True
+        Decode batches on Arrow's thread pool.
+    csv_sep : str, default=','
+        CSV delimiter.
+    csv_encoding : str or None, default=None
+        CSV encoding (UTF-8 if None).
+
+    Yields
+    ------
+    pyarrow.Table
+        Non-empty single-batch tables in file order.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    KeyError
+        If a projected column does not exist.
+
+    See Also
+    --------
+    sample_arrow_stream
+
+    Notes
+    -----
+    Memory is bounded by ``batch_size`` times the number of batches Arrow reads
+    ahead, independent of the input size.
+
+    Examples
+    --------
+    >>> # for t in iter_record_batches("big.parquet", columns=["id"],
+    >>> #                              filters=[("price", ">", 0)]):
+    >>> #     ...
+    """
+    scan = _ArrowScan(
+        source,
+        input_format=input_format,
+        columns=columns,
+        filters=filters,
+        required_cols=required_cols,
+        batch_size=batch_size,
+        use_threads=use_threads,
+        csv_sep=csv_sep,
+        csv_encoding=csv_encoding,
+    )
+    yield from scan.batches()
+
+
+def _strata_keys(table: object, strata_cols: Sequence[str]) -> pd.Index:
+    """Convert the strata columns of one batch into a (Multi)Index of keys."""
+    if len(strata_cols) == 1:
+        return pd.Index(table.column(strata_cols[0]).to_pandas())
+    return pd.MultiIndex.from_frame(table.select(list(strata_cols)).to_pandas())
+
+
+def _stream_strata_sizes(scan: _ArrowScan, strata_cols: Sequence[str]) -> pd.Series:
+    """First pass of streaming stratified sampling: rows per stratum, key-sorted."""
+    sizes: pd.Series | None = None
+    for table in scan.batches(columns=list(strata_cols)):
+        if len(strata_cols) == 1:
+            vc = table.column(strata_cols[0]).to_pandas().value_counts(dropna=False)
+        else:
+            vc = table.select(list(strata_cols)).to_pandas().value_counts(dropna=False)
+        sizes = vc if sizes is None else sizes.add(vc, fill_value=0)
+    if sizes is None:
+        return pd.Series([], dtype=int)
+    # Same key order as ``groupby(strata_cols, dropna=False, sort=True)``.
+    return sizes.astype(np.int64).sort_index()
+
+
+def _stream_select_stratified(  # noqa: PLR0912
+    scan: _ArrowScan,
+    *,
+    n: int,
+    id_col: str | None,
+    strata_cols: Sequence[str],
+    within: WithinGroupStrategy,
+    allocation: StrataAllocation,
+) -> object:
+    """Two-pass streaming counterpart of :func:`sample_stratified`."""
+    import pyarrow as pa  # noqa: PLC0415
+
+    group_sizes = _stream_strata_sizes(scan, strata_cols)
+    alloc = allocate_strata(group_sizes, n=n, allocation=allocation)
+    alloc = alloc.reindex(group_sizes.index).astype(int)
+    key_index = group_sizes.index
+
+    # Per stratum: ("all", parts) | ("linspace", parts, positions) | ("hash", top)
+    plans: list[tuple] = []
+    for size, k in zip(group_sizes.tolist(), alloc.tolist()):
+        if k <= 0:
+            plans.append(("skip",))
+        elif k >= size:
+            plans.append(("all", []))
+        elif within == "hash":
+            plans.append(("hash", _HashTopN(int(k))))
+        else:
+            plans.append(("linspace", [], _linspace_positions(population=size, n=k)))
+    seen = np.zeros(len(plans), dtype=np.int64)
+
+    for table in scan.batches():
+        codes = key_index.get_indexer(_strata_keys(table, strata_cols))
+        if (codes < 0).any():
+            raise ValueError("Stratum keys changed between streaming passes")
+        hashes = (
+            stable_hash64_array(table.column(id_col)) if within == "hash" else None
+        )
+        order = np.argsort(codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+        for rows in np.split(order, bounds):
+            g = int(codes[rows[0]])
+            plan = plans[g]
+            ordinal = seen[g] + np.arange(len(rows))
+            seen[g] += len(rows)
+            if plan[0] == "all":
+                plan[1].append(_take_rows(table, rows))
+            elif plan[0] == "linspace":
+                hit = rows[np.isin(ordinal, plan[2], assume_unique=True)]
+                if len(hit):
+                    plan[1].append(_take_rows(table, hit))
+            elif plan[0] == "hash":
+                plan[1].push(_take_rows(table, rows), hashes[rows])
+
+    pieces = []
+    for plan in plans:
+        if plan[0] in ("all", "linspace"):
+            pieces.extend(plan[1])
+        elif plan[0] == "hash" and len(plan[1]):
+            pieces.append(plan[1].result())
+    if not pieces:
+        return scan.empty()
+    return pa.concat_tables(pieces)
+
+
+def sample_arrow_stream(  # noqa: PLR0912
+    source: str,
+    *,
+    n: int,
+    strategy: StreamStrategy,
+    id_col: str | None = None,
+    strata_cols: Sequence[str] | None = None,
+    within: WithinGroupStrategy = "hash",
+    allocation: StrataAllocation = "proportional",
+    input_format: InputFormat = "auto",
+    columns: Sequence[str] | None = None,
+    filters: object | None = None,
+    required_cols: Sequence[str] | None = None,
+    batch_size: int = ARROW_BATCH_SIZE,
+    use_threads: bool = True,
+    csv_sep: str = ",",
+    csv_encoding: str | None = None,
+) -> tuple[object, StreamStats]:
+    """
+    Sample `n` rows from CSV/Parquet with bounded memory on Arrow record batches.
+
+    Parameters
+    ----------
+    source : str
+        Local path or filesystem URI of a CSV or Parquet file or directory.
+    n : int
+        Number of rows to sample.
+    strategy : {'hash', 'linspace', 'stratified'}
+        Streaming counterpart of :func:`sample_hash_full`,
+        :func:`sample_linspace` or :func:`sample_stratified`.
+    id_col : str or None, default=None
+        Identifier column (required for 'hash' and ``within='hash'``); rows
+        with a null id are skipped.
+    strata_cols : sequence of str or None, default=None
+        Stratification columns (required for 'stratified').
+    within : {'hash', 'linspace'}, default='hash'
+        Within-stratum selection for 'stratified'.
+    allocation : {'proportional', 'equal'}, default='proportional'
+        Stratum allocation for 'stratified'.
+    input_format : {'auto', 'csv', 'parquet'}, default='auto'
+        Input format selection. If 'auto', inferred from suffix.
+    columns : sequence of str or None, default=None
+        Output columns. Must include `id_col` and `strata_cols` when used.
+    filters : pyarrow.compute.Expression, list of tuple or None, default=None
+        Row predicate pushed down to the reader (replaces the per-chunk pandas
+        query of :func:`sample_hash_csv_stream`).
+    required_cols : sequence of str or None, default=None
+        Columns that must be non-null.
+    batch_size : int, default=131_072
+        Maximum rows per record batch.
+    use_threads : bool, default=True
+        Decode batches on Arrow's thread pool.
+    csv_sep : str, default=','
+        CSV delimiter.
+    csv_encoding : str or None, default=None
+        CSV encoding (UTF-8 if None).
+
+    Returns
+    -------
+    (pyarrow.Table, StreamStats)
+        Sampled rows and statistics of the final scan.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    ValueError
+        If `n` is invalid, the source has too few eligible rows, or the
+        strategy options are incomplete/unsupported.
+    KeyError
+        If required columns are missing.
+
+    See Also
+    --------
+    iter_record_batches, write_dataset
+
+    Notes
+    -----
+    Rows stay in Arrow; only stratum keys are converted to pandas.  Each
+    strategy selects the same rows, in the same order, as its in-memory
+    counterpart on the loaded and filtered data:
+
+    - 'hash' is one pass through a bounded top-N (:class:`_HashTopN`),
+      hashing ids from Arrow buffers with :func:`stable_hash64_array`.
+    - 'linspace' counts eligible rows first (file metadata for unfiltered
+      Parquet), then gathers the evenly spaced positions in a second pass.
+    - 'stratified' counts rows per stratum in a first pass over the strata
+      columns only, allocates with :func:`allocate_strata`, then keeps one
+      bounded top-N or position set per stratum in a second pass.
+      ``within='random'`` has no streaming equivalent and is rejected.
+
+    Memory is bounded by `n` plus the record batches in flight.
+
+    Examples
+    --------
+    >>> # table, stats = sample_arrow_stream("big.parquet", n=10_000,
+    >>> #                                    strategy="hash", id_col="id")
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+
+    needed: list[str] = []
+    if strategy == "hash" or (strategy == "stratified" and within == "hash"):
+        if not id_col:
+            raise ValueError(f"id_col is required for strategy={strategy!r}")
+    if strategy == "stratified":
+        if not strata_cols:
+            raise ValueError("strata_cols is required for strategy='stratified'")
+        if within not in ("hash", "linspace"):
+            raise ValueError(
+                f"within={within!r} is not supported in streaming mode "
+                "(use 'hash' or 'linspace')"
+            )
+        needed.extend(strata_cols)
+    elif strategy not in ("hash", "linspace"):
+        raise ValueError(f"Unknown streaming strategy: {strategy!r}")
+    if id_col:
+        needed.append(id_col)
+
+    if columns is not None:
+        missing = [c for c in needed if c not in set(columns)]
+        if missing:
+            raise KeyError(f"columns is missing required columns: {missing}")
+
+    scan = _ArrowScan(
+        source,
+        input_format=input_format,
+        columns=columns,
+        filters=filters,
+        required_cols=[*(required_cols or []), *([id_col] if id_col else [])],
+        batch_size=batch_size,
+        use_threads=use_threads,
+        csv_sep=csv_sep,
+        csv_encoding=csv_encoding,
+    )
+    missing = [c for c in needed if c not in scan.names]
+    if missing:
+        raise KeyError(f"Missing columns: {missing}")
+
+    if strategy == "hash":
+        top = _HashTopN(n)
+        for table in scan.batches():
+            top.push(table, stable_hash64_array(table.column(id_col)))
+        if len(top) < n:
+            raise ValueError(
+                f"Not enough eligible rows after filters. needed={n}, got={len(top)}"
+            )
+        out = top.result() if n else scan.empty()
+        return out, scan.stats()
+
+    if strategy == "linspace":
+        population = scan.count()
+        pos = _linspace_positions(population=population, n=n)
+        pieces = []
+        offset = 0
+        for table in scan.batches():
+            lo, hi = np.searchsorted(pos, [offset, offset + table.num_rows])
+            if hi > lo:
+                pieces.append(_take_rows(table, pos[lo:hi] - offset))
+            offset += table.num_rows
+        import pyarrow as pa  # noqa: PLC0415
+
+        out = pa.concat_tables(pieces) if pieces else scan.empty()
+        return out, scan.stats()
+
+    if n == 0:
+        return scan.empty(), StreamStats(rows_seen_total=0, rows_seen_eligible=0)
+    out = _stream_select_stratified(
+        scan,
+        n=n,
+        id_col=id_col,
+        strata_cols=list(strata_cols),
+        within=within,
+        allocation=allocation,
+    )
+    return out, scan.stats()
+
+
 # -----------------------------
 # Writing + manifest
 # -----------------------------
-def write_dataset(df: pd.DataFrame, *, output_path: Path, fmt: OutputFormat) -> None:
+def _write_arrow_batches(
+    data: object,
+    *,
+    output_path: Path,
+    fmt: OutputFormat,
+    row_group_size: int | None,
+) -> None:
+    """Write a pyarrow Table/RecordBatch or an iterable of them incrementally."""
+    pa = _import_pyarrow()
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Unsupported format: {fmt}")
+
+    if isinstance(data, pa.Table):
+        schema, batches = data.schema, iter(data.to_batches())
+    elif isinstance(data, pa.RecordBatch):
+        schema, batches = data.schema, iter([data])
+    else:
+        it = iter(data)
+        first = next(it, None)
+        if first is None:
+            raise ValueError("No record batches to write")
+        schema, batches = first.schema, itertools.chain([first], it)
+
+    if fmt == "csv":
+        import pyarrow.csv as pacsv  # noqa: PLC0415
+
+        with pacsv.CSVWriter(output_path, schema) as writer:
+            for batch in batches:
+                writer.write(batch)
+        return
+    import pyarrow.parquet as pq  # noqa: PLC0415
+
+    # Buffer incoming batches so every row group (except the last) has exactly
+    # ``row_group_size`` rows, however the batches were sized upstream.
+    rg = int(row_group_size) if row_group_size else PARQUET_ROW_GROUP_SIZE
+    pending: list[object] = []
+    pending_rows = 0
+    with pq.ParquetWriter(output_path, schema) as writer:
+        for batch in batches:
+            if isinstance(batch, pa.Table):
+                pending.extend(batch.to_batches())
+            else:
+                pending.append(batch)
+            pending_rows += batch.num_rows
+            if pending_rows < rg:
+                continue
+            table = pa.Table.from_batches(pending, schema=schema)
+            full = (pending_rows // rg) * rg
+            writer.write_table(table.slice(0, full), row_group_size=rg)
+            pending = table.slice(full).to_batches()
+            pending_rows -= full
+        if pending_rows:
+            writer.write_table(
+                pa.Table.from_batches(pending, schema=schema), row_group_size=rg
+            )
+
+
+def write_dataset(
+    df: object,
+    *,
+    output_path: Path,
+    fmt: OutputFormat,
+    row_group_size: int | None = None,
+) -> None:
     """
     Write dataframe to disk.
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        Dataframe to write.
+    df : pandas.DataFrame, pyarrow.Table, pyarrow.RecordBatch or iterable
+        Data to write. An iterable of record batches/tables is consumed
+        incrementally and never materialized as a whole.
     output_path : pathlib.Path
         Output file path.
     fmt : {'csv', 'parquet'}
         Output format.
+    row_group_size : int or None, default=None
+        Rows per Parquet row group. For Arrow inputs, batches are regrouped
+        to this size (default 1_048_576); for DataFrames it is passed to
+        ``to_parquet`` if given.
 
     Returns
     -------
@@ -1318,18 +2228,32 @@ def write_dataset(df: pd.DataFrame, *, output_path: Path, fmt: OutputFormat) ->
     Raises
     ------
     ValueError
-        If format is unsupported.
+        If format is unsupported, or an iterable input yields no batches.
 
     See Also
     --------
-    pandas.DataFrame.to_csv, pandas.DataFrame.to_parquet
+    pandas.DataFrame.to_csv, pandas.DataFrame.to_parquet, pyarrow.parquet.ParquetWriter
+
+    Notes
+    -----
+    Arrow inputs are written with Arrow's own CSV/Parquet writers, so CSV
+    quoting follows Arrow (strings are quoted) rather than pandas.
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if not isinstance(df, pd.DataFrame):
+        _write_arrow_batches(
+            df, output_path=output_path, fmt=fmt, row_group_size=row_group_size
+        )
+        return
+
     if fmt == "csv":
         df.to_csv(output_path, index=False)
     elif fmt == "parquet":
-        df.to_parquet(output_path, index=False)
+        if row_group_size is None:
+            df.to_parquet(output_path, index=False)
+        else:
+            df.to_parquet(output_path, index=False, row_group_size=int(row_group_size))
     else:
         raise ValueError(f"Unsupported format: {fmt}")
 
@@ -1608,6 +2532,38 @@ def build_parser() -> argparse.ArgumentParser:
         help="CSV chunksize for --stream-hash-csv.",
     )
 
+    # Arrow engine: record-batch streaming with projection/predicate pushdown
+    p.add_argument(
+        "--engine",
+        choices=["pandas", "arrow"],
+        default="pandas",
+        help="Processing engine; 'arrow' streams record batches with bounded memory.",
+    )
+    p.add_argument(
+        "--filter",
+        dest="filters",
+        action="append",
+        default=None,
+        metavar="EXPR",
+        help=(
+            "Arrow row predicate 'COL OP VALUE' (OP: == != < <= > >=), pushed down "
+            "to the reader; repeatable, combined with AND. VALUE is parsed as JSON "
+            "when possible (quote strings). Requires --engine arrow."
+        ),
+    )
+    p.add_argument(
+        "--batch-size",
+        type=int,
+        default=ARROW_BATCH_SIZE,
+        help="Record-batch size for --engine arrow.",
+    )
+    p.add_argument(
+        "--row-group-size",
+        type=int,
+        default=None,
+        help="Parquet row-group size for written subsets.",
+    )
+
     p.add_argument(
         "--log-level",
         default="INFO",
@@ -1676,6 +2632,33 @@ def _validate_args(args: argparse.Namespace) -> None:  # noqa: PLR0912
                 "--fractions/--percentages are not supported with --stream-hash-csv (use absolute --sizes)"
             )
 
+    # Arrow-engine options; getattr keeps programmatic Namespaces from older
+    # callers valid.
+    engine = getattr(args, "engine", "pandas")
+    filters = getattr(args, "filters", None)
+    if filters and engine != "arrow":
+        raise ValueError("--filter requires --engine arrow (use --query with pandas)")
+
+    if engine == "arrow":
+        if args.stream_hash_csv:
+            raise ValueError("--stream-hash-csv is redundant with --engine arrow")
+        if args.strategy == "random":
+            raise ValueError("--strategy random is not supported with --engine arrow")
+        if args.strategy == "stratified" and args.within == "random":
+            raise ValueError("--within random is not supported with --engine arrow")
+        if args.dedup:
+            raise ValueError("--dedup is not supported with --engine arrow")
+        if args.query is not None:
+            raise ValueError("--query is not supported with --engine arrow (use --filter)")
+        if getattr(args, "batch_size", ARROW_BATCH_SIZE) <= 0:
+            raise ValueError("--batch-size must be positive")
+        for expr in filters or []:
+            _parse_filter(expr)
+
+    row_group_size = getattr(args, "row_group_size", None)
+    if row_group_size is not None and row_group_size <= 0:
+        raise ValueError("--row-group-size must be positive")
+
     if args.sizes:
         sizes = [int(s) for s in args.sizes]
         if any(s < 0 for s in sizes):
@@ -1694,6 +2677,45 @@ def _validate_args(args: argparse.Namespace) -> None:  # noqa: PLR0912
             raise ValueError("--percentages must be in [0, 100]")
 
 
+_FILTER_RE = re.compile(r"^\s*([^\s<>=!]+)\s*(==|!=|<=|>=|<|>)\s*(.*?)\s*$")
+
+
+def _parse_filter(expr: str) -> tuple[str, str, object]:
+    """
+    Parse a CLI ``--filter`` expression into a DNF tuple.
+
+    Parameters
+    ----------
+    expr : str
+        ``'COL OP VALUE'``, e.g. ``'price >= 1000'`` or ``'fuel == "Diesel"'``.
+
+    Returns
+    -------
+    tuple of (str, str, object)
+        ``(column, op, value)``; `value` is JSON-decoded when possible,
+        otherwise kept as the raw string.
+
+    Raises
+    ------
+    ValueError
+        If the expression is malformed.
+
+    Examples
+    --------
+    >>> _parse_filter("price >= 1000")
+    ('price', '>=', 1000)
+    """
+    m = _FILTER_RE.match(expr)
+    if m is None or not m.group(3):
+        raise ValueError(f"Invalid --filter {expr!r}; expected 'COL OP VALUE'")
+    col, op, raw = m.groups()
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        value = raw
+    return col, op, value
+
+
 def _required_columns_for_pipeline(args: argparse.Namespace) -> list[str]:
     """
     Compute columns that must be present for requested operations.
@@ -1722,6 +2744,169 @@ def _required_columns_for_pipeline(args: argparse.Namespace) -> list[str]:
     return sorted(set(required))
 
 
+def _main_arrow(  # noqa: PLR0912
+    args: argparse.Namespace,
+    *,
+    source: str,
+    output_dir: Path,
+    out_fmt: OutputFormat,
+    rounding: RoundingMode,
+    prep_params: dict,
+) -> int:
+    """
+    Run the export with the Arrow streaming engine (``--engine arrow``).
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Validated CLI arguments.
+    source : str
+        Input source.
+    output_dir : pathlib.Path
+        Output directory.
+    out_fmt : {'csv', 'parquet'}
+        Output format.
+    rounding : {'floor', 'round', 'ceil'}
+        Rounding for fractional sizes.
+    prep_params : dict
+        Preparation parameters recorded in manifests.
+
+    Returns
+    -------
+    int
+        Exit code (0 success).
+
+    Notes
+    -----
+    Keep/drop columns become the scan projection; required columns, non-null
+    ids and ``--filter`` predicates become the pushed-down row filter.  Hash
+    subsets are prefixes of one top-N pass; stratified subsets take one
+    streaming sampling run per size.  Profiles cover the written subsets only.
+    """
+    scan_kwargs = {
+        "input_format": str(args.input_format),
+        "filters": [_parse_filter(e) for e in args.filters] if args.filters else None,
+        "required_cols": list(args.required_cols) if args.required_cols else None,
+        "batch_size": int(args.batch_size),
+        "csv_sep": str(args.csv_sep),
+        "csv_encoding": args.csv_encoding,
+    }
+
+    columns = list(args.usecols) if args.usecols else None
+    if args.keep_cols:
+        if columns is not None:
+            missing = [c for c in args.keep_cols if c not in set(columns)]
+            if missing:
+                raise KeyError(f"Missing columns: {missing}")
+        columns = list(args.keep_cols)
+    elif args.drop_cols:
+        if columns is None:
+            dataset, _ = _arrow_dataset(
+                source,
+                input_format=str(args.input_format),
+                csv_sep=str(args.csv_sep),
+                csv_encoding=args.csv_encoding,
+            )
+            columns = list(dataset.schema.names)
+        missing = [c for c in args.drop_cols if c not in set(columns)]
+        if missing:
+            raise KeyError(f"Missing columns: {missing}")
+        columns = [c for c in columns if c not in set(args.drop_cols)]
+
+    id_col = str(args.id_col) if args.id_col else None
+    input_rows: int | None = None
+    if args.fractions or args.percentages:
+        # Same eligibility as sample_arrow_stream: required columns and ids non-null.
+        count_kwargs = dict(scan_kwargs)
+        count_kwargs["required_cols"] = [
+            *(scan_kwargs["required_cols"] or []),
+            *([id_col] if id_col else []),
+        ]
+        input_rows = _ArrowScan(
+            source, columns=columns, use_threads=True, **count_kwargs
+        ).count()
+        sizes_final = resolve_sizes(
+            prepared_rows=input_rows,
+            sizes=args.sizes or None,
+            fractions=args.fractions or None,
+            percentages=args.percentages or None,
+            rounding=rounding,
+        )
+    else:
+        sizes_final = sorted({int(x) for x in args.sizes})
+
+    def _sample(n: int) -> tuple[object, StreamStats]:
+        return sample_arrow_stream(
+            source,
+            n=n,
+            strategy=str(args.strategy),
+            id_col=id_col,
+            strata_cols=list(args.strata_cols) if args.strata_cols else None,
+            within=str(args.within),
+            allocation=str(args.allocation),
+            columns=columns,
+            **scan_kwargs,
+        )
+
+    top = stats = None
+    if args.strategy == "hash" and sizes_final:
+        top, stats = _sample(max(sizes_final))
+
+    for n in sizes_final:
+        spec = ExportSpec(size=int(n), strategy=str(args.strategy))
+        if top is not None:
+            out = top.slice(0, spec.size)
+        else:
+            out, stats = _sample(spec.size)
+
+        stem = f"subset_{spec.strategy}_{spec.size}"
+        out_file = output_dir / f"{stem}.{out_fmt if out_fmt == 'csv' else 'parquet'}"
+        write_dataset(
+            out, output_path=out_file, fmt=out_fmt, row_group_size=args.row_group_size
+        )
+
+        if args.write_profile:
+            prof = profile_dataframe(out.to_pandas(), max_columns=args.profile_max_columns)
+            write_json(prof, output_path=output_dir / f"{stem}.profile.json")
+
+        if args.write_manifest:
+            strategy_params = {
+                "id_col": id_col,
+                "engine": "arrow",
+                "batch_size": int(args.batch_size),
+            }
+            if spec.strategy == "stratified":
+                strategy_params.update(
+                    {
+                        "strata_cols": list(args.strata_cols),
+                        "within": str(args.within),
+                        "allocation": str(args.allocation),
+                    }
+                )
+            rows = {
+                "input_prepared": input_rows,
+                "output": int(out.num_rows),
+                "rows_seen_total": int(stats.rows_seen_total),
+                "rows_seen_eligible": int(stats.rows_seen_eligible),
+            }
+            write_manifest(
+                manifest_path=output_dir / f"{stem}.manifest.json",
+                source=source,
+                input_format=str(args.input_format),
+                output_file=out_file,
+                export_spec=spec,
+                prep_params=prep_params,
+                strategy_params=strategy_params,
+                rows=rows,
+                columns=list(out.column_names),
+            )
+
+        LOGGER.info("Wrote arrow subset rows=%d -> %s", out.num_rows, out_file)
+
+    LOGGER.info("Done (arrow).")
+    return 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:  # noqa: PLR0912
     """
     CLI entrypoint.
@@ -1787,6 +2972,17 @@ def main(argv: Sequence[str] | None = None) -> int:  # noqa: PLR0912
         "drop_cols": list(args.drop_cols) if args.drop_cols else None,
     }
 
+    if getattr(args, "engine", "pandas") == "arrow":
+        prep_params["filters"] = [list(_parse_filter(e)) for e in args.filters or []]
+        return _main_arrow(
+            args,
+            source=source,
+            output_dir=output_dir,
+            out_fmt=out_fmt,
+            rounding=rounding,
+            prep_params=prep_params,
+        )
+
     # ---------------------------
     # Streaming path (CSV + hash)
     # ---------------------------
@@ -1830,7 +3026,12 @@ def main(argv: Sequence[str] | None = None) -> int:  # noqa: PLR0912
             out_file = (
                 output_dir / f"{stem}.{out_fmt if out_fmt == 'csv' else 'parquet'}"
             )
-            write_dataset(out, output_path=out_file, fmt=out_fmt)
+            write_dataset(
+                out,
+                output_path=out_file,
+                fmt=out_fmt,
+                row_group_size=getattr(args, "row_group_size", None),
+            )
 
             if args.write_profile:
                 prof = profile_dataframe(out, max_columns=args.profile_max_columns)
@@ -1945,7 +3146,12 @@ def main(argv: Sequence[str] | None = None) -> int:  # noqa: PLR0912
 
         stem = f"subset_{spec.strategy}_{spec.size}"
         out_file = output_dir / f"{stem}.{out_fmt if out_fmt == 'csv' else 'parquet'}"
-        write_dataset(out, output_path=out_file, fmt=out_fmt)
+        write_dataset(
+            out,
+            output_path=out_file,
+            fmt=out_fmt,
+            row_group_size=getattr(args, "row_group_size", None),
+        )
 
         if args.write_profile:
             prof = profile_dataframe(out, max_columns=args.profile_max_columns)
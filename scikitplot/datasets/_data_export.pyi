@@ -6,8 +6,9 @@
 # from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal, Sequence, TypeAlias
+from typing import Any, Iterable, Iterator, Literal, Sequence, TypeAlias
 
+import numpy as np
 import pandas as pd
 
 SamplingStrategy: TypeAlias = Literal["hash", "random", "stratified"]
@@ -16,8 +17,13 @@ StrataAllocation: TypeAlias = Literal["proportional", "equal"]
 InputFormat: TypeAlias = Literal["auto", "csv", "parquet"]
 OutputFormat: TypeAlias = Literal["csv", "parquet"]
 RoundingMode: TypeAlias = Literal["floor", "round", "ceil"]
+StreamStrategy: TypeAlias = Literal["hash", "linspace", "stratified"]
+
+ARROW_BATCH_SIZE: int
+PARQUET_ROW_GROUP_SIZE: int
 
 def stable_hash64(text: str) -> int: ...
+def stable_hash64_array(values: object) -> np.ndarray: ...
 def resolve_sizes(
     *,
     prepared_rows: int,
@@ -89,12 +95,47 @@ def sample_hash_csv_stream(
     csv_encoding: str | None = ...,
 ) -> tuple[pd.DataFrame, StreamStats]: ...
 
+def iter_record_batches(
+    source: str,
+    *,
+    input_format: InputFormat = ...,
+    columns: Sequence[str] | None = ...,
+    filters: Any | None = ...,
+    required_cols: Sequence[str] | None = ...,
+    batch_size: int = ...,
+    use_threads: bool = ...,
+    csv_sep: str = ...,
+    csv_encoding: str | None = ...,
+) -> Iterator[Any]: ...
+def sample_arrow_stream(
+    source: str,
+    *,
+    n: int,
+    strategy: StreamStrategy,
+    id_col: str | None = ...,
+    strata_cols: Sequence[str] | None = ...,
+    within: WithinGroupStrategy = ...,
+    allocation: StrataAllocation = ...,
+    input_format: InputFormat = ...,
+    columns: Sequence[str] | None = ...,
+    filters: Any | None = ...,
+    required_cols: Sequence[str] | None = ...,
+    batch_size: int = ...,
+    use_threads: bool = ...,
+    csv_sep: str = ...,
+    csv_encoding: str | None = ...,
+) -> tuple[Any, StreamStats]: ...
+
 class ExportSpec:
     size: int
     strategy: SamplingStrategy
 
 def write_dataset(
-    df: pd.DataFrame, *, output_path: Path, fmt: OutputFormat
+    df: pd.DataFrame | Any | Iterable[Any],
+    *,
+    output_path: Path,
+    fmt: OutputFormat,
+    row_group_size: int | None = ...,
 ) -> None: ...
 def write_manifest(
     *,
@@ -10,6 +10,8 @@ Coverage map
 ------------
 _utc_now_iso               format, UTC, monotone            → TestUtcNowIso
 stable_hash64              determinism, range, encoding     → TestStableHash64
+stable_hash64_array        bit-identity, dtypes, shapes     → TestStableHash64Array
+_smallest_hash_positions   stable top-n selection           → TestSmallestHashPositions
 _ensure_cols_exist         present/missing/empty            → TestEnsureColsExist
 _infer_format              csv/parquet/gz/url/error         → TestInferFormat
 _round_nonnegative         floor/ceil/round, negative error → TestRoundNonnegative
@@ -27,7 +29,11 @@ _largest_remainder_alloc   sums-to-n/capacity/errors        → TestLargestRemai
 _equal_allocation          balanced/capacity/sums-to-n      → TestEqualAllocation
 allocate_strata            dispatch/invalid                 → TestAllocateStrata
 sample_stratified          all within/alloc combos          → TestSampleStratified
+_HashTopN                  merge, ties, chunk invariance    → TestHashTopN
 sample_hash_csv_stream     happy/filter/n=0/errors          → TestSampleHashCsvStream
+sample_arrow_stream        parity with in-memory samplers   → TestArrowStream
+write_dataset (Arrow)      row groups/CSV/empty input       → TestWriteDatasetArrow
+_parse_filter              numbers/strings/malformed        → TestParseFilter
 write_dataset              csv/parquet/dirs/invalid fmt     → TestWriteDataset
 write_manifest             JSON/keys/dirs                   → TestWriteManifest
 write_json                 content/unicode/dirs             → TestWriteJson
@@ -37,6 +43,7 @@ build_parser               defaults/required flags          → TestBuildParser
 _validate_args             all strategies/conflicts         → TestValidateArgs
 _required_columns          id/required/strata               → TestRequiredColumnsForPipeline
 main CLI                   hash/random/stratified/stream    → TestMainCli
+main CLI (--engine arrow)  filters/stratified/manifest      → TestMainCliArrow
 """
 
 from __future__ import annotations
@@ -68,17 +75,31 @@ _need_parquet = unittest.skipUnless(
     "pyarrow or fastparquet required for Parquet I/O tests",
 )
 
+try:
+    import pyarrow  # noqa: F401
+    _ARROW_OK = True
+except ImportError:
+    _ARROW_OK = False
+
+_need_arrow = unittest.skipUnless(
+    _ARROW_OK,
+    "pyarrow required for the Arrow streaming engine",
+)
+
 
 from .._data_export import (
     ExportSpec,
     StreamStats,
+    _HashTopN,
     _ensure_cols_exist,
     _equal_allocation,
     _infer_format,
     _largest_remainder_allocation,
     _linspace_positions,
+    _parse_filter,
     _required_columns_for_pipeline,
     _round_nonnegative,
+    _smallest_hash_positions,
     _utc_now_iso,
     _validate_args,
     allocate_strata,
@@ -86,16 +107,19 @@ from .._data_export import (
     build_parser,
     drop_duplicates_by_id,
     enforce_required_columns,
+    iter_record_batches,
     load_dataframe,
     main,
     profile_dataframe,
     resolve_sizes,
+    sample_arrow_stream,
     sample_hash_csv_stream,
     sample_hash_full,
     sample_linspace,
     sample_random,
     sample_stratified,
     stable_hash64,
+    stable_hash64_array,
     write_dataset,
     write_json,
     write_manifest,
@@ -178,6 +202,110 @@ class TestStableHash64(unittest.TestCase):
         self.assertGreaterEqual(h, 0)
 
 
+# ---------------------------------------------------------------------------
+# stable_hash64_array
+# ---------------------------------------------------------------------------
+
+class TestStableHash64Array(unittest.TestCase):
+
+    TEXTS = ["", "abc", "row0001", "café", "日本語", "x" * 300]
+
+    def _expected(self, items):
+        return np.array([stable_hash64(str(v)) for v in items], dtype=np.uint64)
+
+    def test_returns_uint64(self):
+        self.assertEqual(stable_hash64_array(["a"]).dtype, np.uint64)
+
+    def test_bit_identical_for_list_and_object(self):
+        expected = self._expected(self.TEXTS)
+        np.testing.assert_array_equal(stable_hash64_array(self.TEXTS), expected)
+        obj = np.array(self.TEXTS, dtype=object)
+        np.testing.assert_array_equal(stable_hash64_array(obj), expected)
+
+    def test_fixed_width_unicode_and_bytes(self):
+        expected = self._expected(self.TEXTS)
+        np.testing.assert_array_equal(stable_hash64_array(np.array(self.TEXTS)), expected)
+        raw = np.array([t.encode("utf-8") for t in self.TEXTS], dtype="S")
+        np.testing.assert_array_equal(stable_hash64_array(raw), expected)
+
+    def test_bytes_elements_are_utf8_text(self):
+        raw = [t.encode("utf-8") for t in self.TEXTS]
+        expected = self._expected(self.TEXTS)
+        obj = pd.Series(raw, dtype=object)
+        np.testing.assert_array_equal(stable_hash64_array(obj), expected)
+        np.testing.assert_array_equal(
+            stable_hash64_array(obj), obj.astype(str).map(stable_hash64).to_numpy()
+        )
+        self.assertNotEqual(
+            int(stable_hash64_array([b"a"])[0]), stable_hash64(str(b"a"))
+        )
+
+    def test_non_string_elements_are_formatted_with_str(self):
+        s = pd.Series([1, 2.5, None, "a"], dtype=object)
+        np.testing.assert_array_equal(stable_hash64_array(s), self._expected(s))
+
+    def test_pandas_string_dtype(self):
+        s = pd.Series(self.TEXTS, dtype="string")
+        np.testing.assert_array_equal(stable_hash64_array(s), self._expected(self.TEXTS))
+
+    def test_pandas_string_dtype_with_na_raises(self):
+        with self.assertRaises(ValueError):
+            stable_hash64_array(pd.Series(["a", None], dtype="string"))
+
+    def test_preserves_shape_and_empty(self):
+        self.assertEqual(stable_hash64_array(np.array([["a", "b"]] * 3)).shape, (3, 2))
+        self.assertEqual(stable_hash64_array([]).shape, (0,))
+
+    def test_pyarrow_string_and_sliced_chunks(self):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+        expected = self._expected(self.TEXTS)
+        for typ in (pa.string(), pa.large_string(), pa.binary()):
+            with self.subTest(typ=str(typ)):
+                data = self.TEXTS if typ != pa.binary() else [
+                    t.encode("utf-8") for t in self.TEXTS
+                ]
+                arr = pa.array(data, type=typ)
+                np.testing.assert_array_equal(stable_hash64_array(arr), expected)
+                np.testing.assert_array_equal(
+                    stable_hash64_array(arr.slice(2)), expected[2:]
+                )
+        chunked = pa.chunked_array([self.TEXTS[:2], self.TEXTS[2:]])
+        np.testing.assert_array_equal(stable_hash64_array(chunked), expected)
+        s = pd.Series(self.TEXTS, dtype="string[pyarrow]")
+        np.testing.assert_array_equal(stable_hash64_array(s), expected)
+
+    def test_pyarrow_nulls_raise(self):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+        with self.assertRaises(ValueError):
+            stable_hash64_array(pa.array(["a", None]))
+
+
+# ---------------------------------------------------------------------------
+# _smallest_hash_positions
+# ---------------------------------------------------------------------------
+
+class TestSmallestHashPositions(unittest.TestCase):
+
+    def test_matches_stable_argsort(self):
+        rng = np.random.default_rng(0)
+        h = rng.integers(0, 20, size=200).astype(np.uint64)  # many ties
+        for n in (0, 1, 7, 50, 200, 500):
+            with self.subTest(n=n):
+                np.testing.assert_array_equal(
+                    _smallest_hash_positions(h, n), np.argsort(h, kind="stable")[:n]
+                )
+
+    def test_full_uint64_range(self):
+        h = np.array([2**64 - 1, 0, 2**63, 5], dtype=np.uint64)
+        np.testing.assert_array_equal(_smallest_hash_positions(h, 3), [1, 3, 2])
+
+
 # ---------------------------------------------------------------------------
 # _ensure_cols_exist
 # ---------------------------------------------------------------------------
@@ -872,6 +1000,37 @@ class TestSampleStratified(unittest.TestCase):
         self.assertEqual(len(out), 2)
 
 
+# ---------------------------------------------------------------------------
+# _HashTopN
+# ---------------------------------------------------------------------------
+
+class TestHashTopN(unittest.TestCase):
+
+    def test_matches_full_sort_for_any_chunking(self):
+        df = _make_df(97)
+        ref = sample_hash_full(df, n=15, id_col="id")
+        for size in (1, 7, 15, 40, 97):
+            with self.subTest(chunk=size):
+                top = _HashTopN(15)
+                for start in range(0, len(df), size):
+                    chunk = df.iloc[start:start + size]
+                    top.push(chunk, stable_hash64_array(chunk["id"]))
+                pd.testing.assert_frame_equal(top.result(), ref)
+
+    def test_ties_keep_earliest_rows(self):
+        df = pd.DataFrame({"v": range(6)})
+        top = _HashTopN(3)
+        top.push(df.iloc[:3], np.array([5, 1, 5], dtype=np.uint64))
+        top.push(df.iloc[3:], np.array([5, 0, 1], dtype=np.uint64))
+        self.assertEqual(top.result()["v"].tolist(), [4, 1, 5])
+
+    def test_n_zero_and_empty(self):
+        top = _HashTopN(0)
+        top.push(_make_df(3), np.zeros(3, dtype=np.uint64))
+        self.assertEqual(len(top), 0)
+        self.assertTrue(top.result().empty)
+
+
 # ---------------------------------------------------------------------------
 # sample_hash_csv_stream
 # ---------------------------------------------------------------------------
@@ -933,6 +1092,163 @@ class TestSampleHashCsvStream(unittest.TestCase):
         out, _ = sample_hash_csv_stream(self.csv_path, n=10, id_col="id")
         self.assertTrue(set(out["id"]).issubset(set(self.df["id"])))
 
+    def test_matches_in_memory_hash_sample_for_any_chunksize(self):
+        ref = sample_hash_full(pd.read_csv(self.csv_path), n=20, id_col="id")
+        for chunksize in (3, 20, 1000):
+            with self.subTest(chunksize=chunksize):
+                out, _ = sample_hash_csv_stream(
+                    self.csv_path, n=20, id_col="id", chunksize=chunksize
+                )
+                pd.testing.assert_frame_equal(out, ref)
+
+
+# ---------------------------------------------------------------------------
+# sample_arrow_stream / iter_record_batches
+# ---------------------------------------------------------------------------
+
+@_need_arrow
+class TestArrowStream(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        n = 150
+        self.df = pd.DataFrame({
+            "id": [f"r{i:04d}" for i in range(n)],
+            "g": [0 if i % 5 else 1 for i in range(n)],  # uneven strata
+            "x": [float(i) for i in range(n)],
+        })
+        tmp = Path(self.tmpdir.name)
+        self.csv_path = str(tmp / "data.csv")
+        self.pq_path = str(tmp / "data.parquet")
+        _write_csv(self.df, Path(self.csv_path))
+        self.df.to_parquet(self.pq_path, index=False, row_group_size=40)
+        # String strata with empty and "NA" cells (missing for pandas).
+        self.na_csv_path = str(tmp / "data_na.csv")
+        with open(self.na_csv_path, "w", encoding="utf-8") as fh:
+            fh.write("id,s,x\n")
+            for i in range(n):
+                s = "" if i % 7 == 0 else "NA" if i % 11 == 0 else "uv"[i % 3 == 0]
+                fh.write(f"r{i:04d},{s},{float(i)}\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _ids(self, table):
+        return table.column("id").to_pylist()
+
+    def test_iter_record_batches_projection_and_filter(self):
+        for src in (self.csv_path, self.pq_path):
+            with self.subTest(src=src):
+                tables = list(iter_record_batches(
+                    src, columns=["id", "x"], filters=[("x", ">=", 100.0)], batch_size=16,
+                ))
+                self.assertTrue(all(t.column_names == ["id", "x"] for t in tables))
+                self.assertEqual(sum(t.num_rows for t in tables), 50)
+
+    def test_hash_matches_in_memory(self):
+        ref = sample_hash_full(self.df, n=25, id_col="id")["id"].tolist()
+        for src in (self.csv_path, self.pq_path):
+            with self.subTest(src=src):
+                out, stats = sample_arrow_stream(
+                    src, n=25, strategy="hash", id_col="id", batch_size=7
+                )
+                self.assertEqual(self._ids(out), ref)
+                self.assertEqual(stats.rows_seen_eligible, 150)
+
+    def test_linspace_matches_in_memory(self):
+        ref = sample_linspace(self.df, n=17)["id"].tolist()
+        out, _ = sample_arrow_stream(self.pq_path, n=17, strategy="linspace", batch_size=9)
+        self.assertEqual(self._ids(out), ref)
+
+    def test_stratified_matches_in_memory(self):
+        cases = (
+            (self.df, self.csv_path, "g"),
+            # Missing strings form their own stratum, as with dropna=False.
+            (pd.read_csv(self.na_csv_path), self.na_csv_path, "s"),
+        )
+        for df, src, col in cases:
+            for within in ("hash", "linspace"):
+                for allocation in ("proportional", "equal"):
+                    with self.subTest(col=col, within=within, allocation=allocation):
+                        ref = sample_stratified(
+                            df, n=40, id_col="id", strata_cols=[col],
+                            within=within, allocation=allocation, seed=0,
+                        )
+                        out, _ = sample_arrow_stream(
+                            src, n=40, strategy="stratified", id_col="id",
+                            strata_cols=[col], within=within,
+                            allocation=allocation, batch_size=11,
+                        )
+                        self.assertEqual(self._ids(out), ref["id"].tolist())
+
+    def test_filter_stats(self):
+        for src in (self.csv_path, self.pq_path):
+            with self.subTest(src=src):
+                out, stats = sample_arrow_stream(
+                    src, n=5, strategy="hash", id_col="id", filters=[("g", "==", 1)],
+                )
+                self.assertEqual(stats.rows_seen_total, 150)
+                self.assertEqual(stats.rows_seen_eligible, 30)
+                self.assertEqual(set(out.column("g").to_pylist()), {1})
+        n_present = int(pd.read_csv(self.na_csv_path)["s"].notna().sum())
+        out, stats = sample_arrow_stream(
+            self.na_csv_path, n=5, strategy="hash", id_col="id", required_cols=["s"],
+        )
+        self.assertEqual(stats.rows_seen_total, 150)
+        self.assertEqual(stats.rows_seen_eligible, n_present)
+        self.assertNotIn(None, out.column("s").to_pylist())
+
+    def test_n_zero_returns_empty_with_schema(self):
+        out, _ = sample_arrow_stream(self.pq_path, n=0, strategy="hash", id_col="id")
+        self.assertEqual(out.num_rows, 0)
+        self.assertEqual(out.column_names, ["id", "g", "x"])
+
+    def test_not_enough_rows_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            sample_arrow_stream(self.pq_path, n=151, strategy="hash", id_col="id")
+
+    def test_within_random_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            sample_arrow_stream(self.pq_path, n=5, strategy="stratified",
+                                strata_cols=["g"], within="random")
+
+    def test_columns_missing_id_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            sample_arrow_stream(self.pq_path, n=5, strategy="hash", id_col="id",
+                                columns=["x"])
+
+
+@_need_arrow
+class TestWriteDatasetArrow(unittest.TestCase):
+
+    def setUp(self):
+        import pyarrow as pa
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.table = pa.table({"a": list(range(95)), "b": [str(i) for i in range(95)]})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_parquet_row_groups_are_resized(self):
+        import pyarrow.parquet as pq
+        out = Path(self.tmpdir.name) / "out.parquet"
+        write_dataset(iter(self.table.to_batches(max_chunksize=10)),
+                      output_path=out, fmt="parquet", row_group_size=30)
+        meta = pq.ParquetFile(out).metadata
+        sizes = [meta.row_group(i).num_rows for i in range(meta.num_row_groups)]
+        self.assertEqual(sizes, [30, 30, 30, 5])
+        self.assertTrue(pq.read_table(out).equals(self.table))
+
+    def test_csv_from_table(self):
+        out = Path(self.tmpdir.name) / "sub" / "out.csv"
+        write_dataset(self.table, output_path=out, fmt="csv")
+        self.assertEqual(len(pd.read_csv(out)), 95)
+
+    def test_empty_iterable_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            write_dataset(iter([]), output_path=Path(self.tmpdir.name) / "x.parquet",
+                          fmt="parquet")
+
 
 # ---------------------------------------------------------------------------
 # write_dataset
@@ -1231,6 +1547,37 @@ class TestValidateArgs(unittest.TestCase):
         with self.assertRaises(ValueError):
             _validate_args(self._ns(sizes=None, percentages=[150.0]))
 
+    def test_arrow_engine_rejects_random_and_query(self):
+        for kw in ({"strategy": "random"}, {"query": "x > 1"}, {"dedup": True}):
+            with self.subTest(**kw):
+                with self.assertRaises(ValueError):
+                    _validate_args(self._ns(engine="arrow", **kw))
+
+    def test_filter_requires_arrow_engine(self):
+        with self.assertRaises(ValueError):
+            _validate_args(self._ns(filters=["x > 1"]))
+        _validate_args(self._ns(engine="arrow", filters=["x > 1"]))
+
+
+# ---------------------------------------------------------------------------
+# _parse_filter
+# ---------------------------------------------------------------------------
+
+class TestParseFilter(unittest.TestCase):
+
+    def test_number_value(self):
+        self.assertEqual(_parse_filter("price >= 1000"), ("price", ">=", 1000))
+
+    def test_quoted_and_bare_strings(self):
+        self.assertEqual(_parse_filter('fuel == "Diesel"'), ("fuel", "==", "Diesel"))
+        self.assertEqual(_parse_filter("fuel!=Diesel"), ("fuel", "!=", "Diesel"))
+
+    def test_malformed_raises_value_error(self):
+        for expr in ("price", "price >=", ">= 3"):
+            with self.subTest(expr=expr):
+                with self.assertRaises(ValueError):
+                    _parse_filter(expr)
+
 
 # ---------------------------------------------------------------------------
 # _required_columns_for_pipeline
@@ -1351,5 +1698,43 @@ class TestMainCli(unittest.TestCase):
         self.assertEqual(out["id"].nunique(), len(out))
 
 
+@_need_arrow
+class TestMainCliArrow(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        rows = [{"id": f"r{i:04d}", "group": i % 4, "x": float(i)} for i in range(200)]
+        self.df = pd.DataFrame(rows)
+        self.pq_path = str(Path(self.tmpdir.name) / "data.parquet")
+        self.df.to_parquet(self.pq_path, index=False)
+        self.out_dir = Path(self.tmpdir.name) / "out"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _run(self, extra: list) -> int:
+        return main(["--input", self.pq_path, "--output-dir", str(self.out_dir),
+                     "--engine", "arrow", "--batch-size", "32"] + extra)
+
+    def test_hash_with_filter_matches_pandas_engine(self):
+        rc = self._run(["--sizes", "10", "30", "--strategy", "hash", "--id-col", "id",
+                        "--filter", "x >= 20", "--format", "parquet", "--write-manifest"])
+        self.assertEqual(rc, 0)
+        ref = sample_hash_full(self.df[self.df["x"] >= 20], n=30, id_col="id")
+        out = pd.read_parquet(self.out_dir / "subset_hash_30.parquet")
+        self.assertEqual(out["id"].tolist(), ref["id"].tolist())
+        manifest = json.loads((self.out_dir / "subset_hash_10.manifest.json").read_text())
+        self.assertEqual(manifest["rows"]["rows_seen_eligible"], 180)
+
+    def test_stratified_with_percentages_and_drop_cols(self):
+        rc = self._run(["--percentages", "10", "--strategy", "stratified",
+                        "--strata-cols", "group", "--within", "linspace",
+                        "--drop-cols", "x", "--format", "csv"])
+        self.assertEqual(rc, 0)
+        out = pd.read_csv(self.out_dir / "subset_stratified_20.csv")
+        self.assertEqual(len(out), 20)
+        self.assertNotIn("x", out.columns)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
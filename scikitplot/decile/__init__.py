@@ -16,9 +16,12 @@ from . import kds  # noqa: I001
 from . import modelplotpy
 from . import _decile_modelplotpy as _dmpy
 from ._decile_modelplotpy import *  # noqa: F403
+from . import _streaming
+from ._streaming import *  # noqa: F403
 
 __all__ = [
     "kds",
     "modelplotpy",  # legacy ModelPlotPy
 ]
 __all__ += _dmpy.__all__  # New ModelPlotPy
+__all__ += _streaming.__all__  # Out-of-core ntile engine
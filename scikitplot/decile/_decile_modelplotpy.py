@@ -345,6 +345,117 @@ def _assign_descending_ntiles(scores: pd.Series, *, ntiles: int) -> pd.Series:
     return pd.Series(nt.astype(np.int64), index=scores.index, name="ntile")
 
 
+def _ntile_gain_frame(
+    agg: pd.DataFrame,
+    *,
+    ntiles: int,
+    model_label: str,
+    dataset_label: str,
+    target_class: Any,
+) -> pd.DataFrame:
+    """
+    Derive gain/lift/response metrics from per-ntile counts.
+
+    Parameters
+    ----------
+    agg : pandas.DataFrame
+        Per-ntile counts with columns ``tot``, ``pos`` and ``neg``, indexed by
+        ntile. Missing ntiles are filled with zero counts.
+    ntiles : int
+        Number of ntiles.
+    model_label, dataset_label : str
+        Group labels written to the output.
+    target_class : Any
+        Target class written to the output.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per ntile ``0..ntiles`` (ntile 0 is the plotting origin) in the
+        :meth:`ModelPlotPy.aggregate_over_ntiles` schema.
+
+    Raises
+    ------
+    ValueError
+        If the group is empty or has no positive examples.
+
+    Notes
+    -----
+    Shared by :meth:`ModelPlotPy.aggregate_over_ntiles` and the out-of-core
+    engine in :mod:`scikitplot.decile._streaming`, so both produce identical
+    frames from identical counts.
+    """
+    # Ensure a full ntile index for plotting (1..ntiles).
+    agg = agg.reindex(range(1, ntiles + 1), fill_value=0)
+    agg.index.name = "ntile"
+    agg = agg.reset_index()
+
+    # Totals (repeat constants per row; plotting functions rely on these).
+    postot = int(agg["pos"].sum())
+    negtot = int(agg["neg"].sum())
+    tottot = int(agg["tot"].sum())
+    if tottot <= 0:
+        raise ValueError("Empty group encountered during aggregation.")
+    if postot == 0:
+        raise ValueError(
+            f"No positive examples for target_class={target_class} in (model={model_label}, dataset={dataset_label})."
+        )
+
+    agg["pct"] = agg["pos"] / agg["tot"]
+    agg["postot"] = postot
+    agg["negtot"] = negtot
+    agg["tottot"] = tottot
+    agg["pcttot"] = float(agg["pct"].sum())
+
+    agg["cumpos"] = agg["pos"].cumsum()
+    agg["cumneg"] = agg["neg"].cumsum()
+    agg["cumtot"] = agg["tot"].cumsum()
+    agg["cumpct"] = agg["cumpos"] / agg["cumtot"]
+
+    agg["gain"] = agg["pos"] / postot
+    agg["cumgain"] = agg["cumpos"] / postot
+    agg["gain_ref"] = agg["ntile"] / ntiles
+
+    base_rate = postot / tottot
+    agg["pct_ref"] = base_rate
+
+    # Optimal gain curve: saturates at 1 when cumtot >= postot.
+    agg["gain_opt"] = np.minimum(agg["cumtot"] / postot, 1.0)
+
+    agg["lift"] = agg["pct"] / base_rate
+    agg["cumlift"] = agg["cumpct"] / base_rate
+    agg["cumlift_ref"] = 1.0
+
+    # Add metadata columns.
+    agg.insert(0, "target_class", target_class)
+    agg.insert(0, "dataset_label", dataset_label)
+    agg.insert(0, "model_label", model_label)
+
+    # Origin row (ntile=0) for plot continuity.
+    origin = agg.iloc[[0]].copy()
+    origin["ntile"] = 0
+    origin[["tot", "pos", "neg"]] = 0
+    origin[
+        [
+            "pct",
+            "pcttot",
+            "cumpos",
+            "cumneg",
+            "cumtot",
+            "cumpct",
+            "gain",
+            "cumgain",
+            "gain_ref",
+            "gain_opt",
+            "lift",
+            "cumlift",
+        ]
+    ] = 0.0
+    origin["cumlift_ref"] = 1.0
+
+    return pd.concat([origin, agg], axis=0, ignore_index=True)
+
+
 @dataclass(frozen=True)
 class _EvalKey:
     """Internal composite key for model/dataset grouping."""
@@ -782,75 +893,13 @@ class ModelPlotPy:
                         neg=("neg", "sum"),
                     )
 
-                    # Ensure a full ntile index for plotting (1..ntiles).
-                    agg = agg.reindex(range(1, self.ntiles + 1), fill_value=0)
-                    agg.index.name = "ntile"
-                    agg = agg.reset_index()
-
-                    # Totals (repeat constants per row; plotting functions rely on these).
-                    postot = int(agg["pos"].sum())
-                    negtot = int(agg["neg"].sum())
-                    tottot = int(agg["tot"].sum())
-                    if tottot <= 0:
-                        raise ValueError("Empty group encountered during aggregation.")
-                    if postot == 0:
-                        raise ValueError(
-                            f"No positive examples for target_class={cls} in (model={model_label}, dataset={ds_label})."
-                        )
-
-                    agg["pct"] = agg["pos"] / agg["tot"]
-                    agg["postot"] = postot
-                    agg["negtot"] = negtot
-                    agg["tottot"] = tottot
-                    agg["pcttot"] = float(agg["pct"].sum())
-
-                    agg["cumpos"] = agg["pos"].cumsum()
-                    agg["cumneg"] = agg["neg"].cumsum()
-                    agg["cumtot"] = agg["tot"].cumsum()
-                    agg["cumpct"] = agg["cumpos"] / agg["cumtot"]
-
-                    agg["gain"] = agg["pos"] / postot
-                    agg["cumgain"] = agg["cumpos"] / postot
-                    agg["gain_ref"] = agg["ntile"] / self.ntiles
-
-                    base_rate = postot / tottot
-                    agg["pct_ref"] = base_rate
-
-                    # Optimal gain curve: saturates at 1 when cumtot >= postot.
-                    agg["gain_opt"] = np.minimum(agg["cumtot"] / postot, 1.0)
-
-                    agg["lift"] = agg["pct"] / base_rate
-                    agg["cumlift"] = agg["cumpct"] / base_rate
-                    agg["cumlift_ref"] = 1.0
-
-                    # Add metadata columns.
-                    agg.insert(0, "target_class", cls)
-                    agg.insert(0, "dataset_label", ds_label)
-                    agg.insert(0, "model_label", model_label)
-
-                    # Origin row (ntile=0) for plot continuity.
-                    origin = agg.iloc[[0]].copy()
-                    origin["ntile"] = 0
-                    origin[["tot", "pos", "neg"]] = 0
-                    origin[
-                        [
-                            "pct",
-                            "pcttot",
-                            "cumpos",
-                            "cumneg",
-                            "cumtot",
-                            "cumpct",
-                            "gain",
-                            "cumgain",
-                            "gain_ref",
-                            "gain_opt",
-                            "lift",
-                            "cumlift",
-                        ]
-                    ] = 0.0
-                    origin["cumlift_ref"] = 1.0
-
-                    out = pd.concat([origin, agg], axis=0, ignore_index=True)
+                    out = _ntile_gain_frame(
+                        agg,
+                        ntiles=self.ntiles,
+                        model_label=model_label,
+                        dataset_label=ds_label,
+                        target_class=cls,
+                    )
                     rows.append(out)
 
         result = pd.concat(rows, axis=0, ignore_index=True)
@@ -0,0 +1,766 @@
+# scikitplot/decile/_streaming.py
+#
+# flake8: noqa: D213
+# ruff: noqa: PLR2004
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Out-of-core decile / ntile engine for very large score vectors.
+
+:func:`~scikitplot.decile.kds.decile_table` and
+:meth:`~scikitplot.decile.ModelPlotPy.aggregate_over_ntiles` build a full
+:class:`pandas.DataFrame` and sort every score. The functions here compute the
+same tables from chunked input in a bounded number of passes, so peak memory
+is set by ``chunk_size`` rather than by the number of rows:
+
+:func:`decile_table_streaming`
+    The kds decile table (gain, lift, response and KS columns).
+:func:`aggregate_over_ntiles_streaming`
+    One ``(model, dataset, target class)`` group in the
+    :meth:`~scikitplot.decile.ModelPlotPy.aggregate_over_ntiles` schema.
+
+Accepted sources
+----------------
+* ``(y_true, y_score)`` — a pair of array-likes, typically
+  :class:`numpy.memmap`. ``y_score`` may be 2-D (``class_index`` selects the
+  column). Rows are read ``chunk_size`` at a time.
+* :class:`pandas.DataFrame`, :class:`pyarrow.Table` or
+  :class:`pyarrow.RecordBatch` — columns named by ``y_true_col`` /
+  ``y_score_col``.
+* A path to a Parquet file (requires ``pyarrow``), read batch by batch with
+  only the two columns projected.
+* A zero-argument callable returning a fresh iterable of chunks, where each
+  chunk is any of the in-memory forms above (or a ``dict`` of columns). This
+  is how a generator, a ``pyarrow.dataset`` scan or a database cursor is
+  plugged in. Every pass calls the factory again, so one-shot iterators are
+  rejected with a :class:`TypeError`.
+
+Ntile definition
+----------------
+Rows are ranked by score descending with ties broken by row position, and the
+row of rank ``r`` (0-based) out of ``n`` falls in ntile ``r * ntiles // n + 1``
+— the rule used by ``ModelPlotPy``. ``method="exact"`` reproduces it exactly:
+the ntile boundaries are found by a radix selection over order-preserving
+64-bit score keys (16 bits per pass, collecting a boundary's candidates in
+memory as soon as they fit in ``chunk_size``) and then one aggregation pass
+splits tied boundary scores by position. ``method="sketch"`` replaces the
+selection with a fixed-size uniform sample of scores (two passes in total);
+boundaries are then approximate and tied scores never straddle two ntiles.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from ._decile_modelplotpy import _ntile_gain_frame
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable, Iterator
+
+__all__ = [
+    "aggregate_over_ntiles_streaming",
+    "decile_table_streaming",
+]
+
+#: Default rows per chunk (8 MiB of float64 scores).
+_DEFAULT_CHUNK_SIZE = 1 << 20
+
+#: Bits resolved per radix-selection pass (65536-bin histogram).
+_DIGIT_BITS = 16
+_DIGIT_MASK = np.uint64((1 << _DIGIT_BITS) - 1)
+_SIGN_BIT = np.uint64(1 << 63)
+
+##########################################################################
+## Chunked sources
+##########################################################################
+
+
+def _is_arrow_table(obj: Any) -> bool:
+    return hasattr(obj, "to_batches") and hasattr(obj, "schema")
+
+
+def _is_arrow_batch(obj: Any) -> bool:
+    return (
+        hasattr(obj, "schema")
+        and hasattr(obj, "column")
+        and hasattr(obj, "num_rows")
+        and not hasattr(obj, "to_batches")
+    )
+
+
+class _ChunkSource:
+    """
+    Re-iterable stream of ``(y_true, y_score)`` NumPy chunks.
+
+    Parameters
+    ----------
+    source : Any
+        See the module docstring for accepted forms.
+    y_true_col, y_score_col : str
+        Column names used for tabular chunks.
+    class_index : int
+        Column of a 2-D ``y_score`` array.
+    chunk_size : int
+        Maximum rows per yielded chunk.
+
+    Raises
+    ------
+    TypeError
+        If ``source`` is a one-shot iterator or an unsupported object.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        *,
+        y_true_col: str,
+        y_score_col: str,
+        class_index: int,
+        chunk_size: int,
+    ) -> None:
+        if not isinstance(chunk_size, (int, np.integer)) or chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive int, got {chunk_size!r}.")
+        self.y_true_col = y_true_col
+        self.y_score_col = y_score_col
+        self.class_index = class_index
+        self.chunk_size = int(chunk_size)
+
+        if isinstance(source, (str, os.PathLike)):
+            self._factory = self._parquet_factory(os.fspath(source))
+        elif callable(source):
+            self._factory = source
+        elif (
+            (isinstance(source, tuple) and len(source) == 2)
+            or isinstance(source, (pd.DataFrame, dict))
+            or _is_arrow_table(source)
+            or _is_arrow_batch(source)
+        ):
+            self._factory = lambda: (source,)
+        elif hasattr(source, "__iter__") and iter(source) is source:
+            raise TypeError(
+                "A one-shot iterator cannot be read more than once. Pass a "
+                "zero-argument callable that returns a fresh iterator instead, "
+                "e.g. `lambda: pq.ParquetFile(path).iter_batches()`."
+            )
+        else:
+            raise TypeError(
+                "source must be a (y_true, y_score) pair, a DataFrame, an Arrow "
+                "Table/RecordBatch, a Parquet path or a callable returning an "
+                f"iterable of chunks; got {type(source).__name__}."
+            )
+
+    def _parquet_factory(self, path: str) -> Callable[[], Iterable[Any]]:
+        try:
+            import pyarrow.parquet as pq  # noqa: PLC0415
+        except ImportError as exc:
+            raise ImportError(
+                "Reading Parquet input requires 'pyarrow'. "
+                "Install it with: pip install pyarrow"
+            ) from exc
+        columns = [self.y_true_col, self.y_score_col]
+
+        def _factory() -> Iterator[Any]:
+            yield from pq.ParquetFile(path).iter_batches(
+                batch_size=self.chunk_size, columns=columns
+            )
+
+        return _factory
+
+    def _columns(self, chunk: Any) -> tuple[Any, Any]:
+        """Split one chunk into its label and score columns (no copy if possible)."""
+        if isinstance(chunk, tuple) and len(chunk) == 2:
+            return chunk
+        if isinstance(chunk, pd.DataFrame):
+            return (
+                chunk[self.y_true_col].to_numpy(),
+                chunk[self.y_score_col].to_numpy(),
+            )
+        if isinstance(chunk, dict):
+            return chunk[self.y_true_col], chunk[self.y_score_col]
+        if _is_arrow_table(chunk) or _is_arrow_batch(chunk):
+            return (
+                chunk.column(self.y_true_col).to_numpy(),
+                chunk.column(self.y_score_col).to_numpy(),
+            )
+        raise TypeError(f"Unsupported chunk type {type(chunk).__name__}.")
+
+    def __iter__(self) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        step = self.chunk_size
+        for chunk in self._factory():
+            if _is_arrow_table(chunk):
+                # Tables are split on their own batch boundaries first.
+                parts: Iterable[Any] = chunk.to_batches(max_chunksize=step)
+            else:
+                parts = (chunk,)
+            for part in parts:
+                y_true, y_score = self._columns(part)
+                y_true = np.asarray(y_true)
+                y_score = np.asarray(y_score)
+                if y_true.shape[0] != y_score.shape[0]:
+                    raise ValueError(
+                        "y_true and y_score chunks differ in length: "
+                        f"{y_true.shape[0]} != {y_score.shape[0]}."
+                    )
+                # Slicing a memmap only pages in the window being read.
+                for start in range(0, y_true.shape[0], step):
+                    yt = y_true[start : start + step]
+                    ys = y_score[start : start + step]
+                    if ys.ndim == 2:
+                        ys = ys[:, self.class_index]
+                    elif ys.ndim != 1:
+                        raise ValueError(
+                            f"y_score must be 1-D or 2-D, got {ys.ndim} dimensions."
+                        )
+                    yield np.asarray(yt).ravel(), np.asarray(ys, dtype=np.float64)
+
+
+##########################################################################
+## Order-preserving score keys and radix selection
+##########################################################################
+
+
+def _descending_keys(scores: np.ndarray) -> np.ndarray:
+    """
+    Map float64 scores to uint64 keys whose ascending order is score-descending.
+
+    Raises
+    ------
+    ValueError
+        If any score is NaN or infinite.
+    """
+    if not np.isfinite(scores).all():
+        raise ValueError("y_score must contain only finite values.")
+    # ``+ 0.0`` folds -0.0 into 0.0 so equal scores get equal keys.
+    bits = np.ascontiguousarray(scores + 0.0, dtype=np.float64).view(np.uint64)
+    negative = (bits & _SIGN_BIT) != 0
+    ascending = np.where(negative, ~bits, bits | _SIGN_BIT)
+    return ~ascending
+
+
+def _boundary_ranks(n: int, ntiles: int) -> np.ndarray:
+    """First 0-based rank of ntiles ``2..ntiles``: ``ceil(j * n / ntiles)``."""
+    j = np.arange(1, ntiles, dtype=np.int64)
+    return -((-j * n) // ntiles)
+
+
+def _ntile_sizes(n: int, ntiles: int) -> np.ndarray:
+    """Rows per ntile under the rank rule ``r * ntiles // n + 1``."""
+    edges = np.concatenate(([0], _boundary_ranks(n, ntiles), [n]))
+    return np.diff(edges)
+
+
+class _Totals:
+    """First-pass accumulator: row count, positives and validation."""
+
+    def __init__(self, pos_label: Any) -> None:
+        self.pos_label = pos_label
+        self.n = 0
+        self.n_pos = 0
+
+    def positives(self, y_true: np.ndarray) -> np.ndarray:
+        return y_true == self.pos_label
+
+    def update(self, y_true: np.ndarray, keys: np.ndarray) -> None:
+        self.n += keys.shape[0]
+        self.n_pos += int(np.count_nonzero(self.positives(y_true)))
+
+
+def _plan_pass(
+    groups: dict[tuple[int, int], list[int]],
+    population: np.ndarray,
+    budget: int,
+) -> tuple[dict[tuple[int, int], list[np.ndarray]], dict[tuple[int, int], np.ndarray]]:
+    """Split prefix groups into those gathered in memory and those histogrammed."""
+    collect: dict[tuple[int, int], list[np.ndarray]] = {}
+    hists: dict[tuple[int, int], np.ndarray] = {}
+    used = 0
+    for key, members in groups.items():
+        size = int(population[members[0]])
+        if used + size <= budget:
+            collect[key] = []
+            used += size
+        else:
+            hists[key] = np.zeros(1 << _DIGIT_BITS, dtype=np.int64)
+    return collect, hists
+
+
+def _scan_prefixes(
+    source: _ChunkSource,
+    collect: dict[tuple[int, int], list[np.ndarray]],
+    hists: dict[tuple[int, int], np.ndarray],
+) -> None:
+    """Run one pass over ``source`` filling ``collect`` and ``hists`` in place."""
+    for _y_true, scores in source:
+        keys = _descending_keys(scores)
+        for (bits, pre), parts in collect.items():
+            parts.append(keys[(keys >> np.uint64(64 - bits)) == np.uint64(pre)])
+        for bits, pre in hists:
+            sel = keys[(keys >> np.uint64(64 - bits)) == np.uint64(pre)]
+            digits = (sel >> np.uint64(64 - bits - _DIGIT_BITS)) & _DIGIT_MASK
+            hists[(bits, pre)] += np.bincount(
+                digits.astype(np.intp), minlength=1 << _DIGIT_BITS
+            )
+
+
+def _select_exact(
+    source: _ChunkSource, totals: _Totals, ntiles: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the key at each boundary rank by multi-pass radix selection.
+
+    Returns
+    -------
+    keys : numpy.ndarray of uint64, shape (ntiles - 1,)
+        Key of the row at each boundary rank.
+    n_less : numpy.ndarray of int64, shape (ntiles - 1,)
+        Number of rows whose key is strictly smaller than ``keys[j]``.
+
+    Notes
+    -----
+    Each pass handles the unresolved boundaries grouped by their resolved key
+    prefix: a prefix whose population fits in the collection budget is
+    gathered and finished in memory, otherwise its next 16 bits are
+    histogrammed. The first pass also counts rows and positives.
+    """
+    budget = source.chunk_size
+    top = np.zeros(1 << _DIGIT_BITS, dtype=np.int64)
+    shift = np.uint64(64 - _DIGIT_BITS)
+    for y_true, scores in source:
+        keys = _descending_keys(scores)
+        totals.update(y_true, keys)
+        top += np.bincount((keys >> shift).astype(np.intp), minlength=top.size)
+
+    n = totals.n
+    if n < ntiles:
+        raise ValueError(f"ntiles={ntiles} cannot exceed n_samples={n}.")
+    ranks = _boundary_ranks(n, ntiles)
+    n_bound = ranks.shape[0]
+    result = np.zeros(n_bound, dtype=np.uint64)
+    n_less = np.zeros(n_bound, dtype=np.int64)
+
+    # Per unresolved boundary: resolved prefix, its bit width, remaining rank
+    # inside the prefix and the prefix population.
+    prefix = np.zeros(n_bound, dtype=np.uint64)
+    width = np.zeros(n_bound, dtype=np.int64)
+    remaining = ranks.copy()
+    population = np.full(n_bound, n, dtype=np.int64)
+    pending = list(range(n_bound))
+
+    def _descend(j: int, hist: np.ndarray) -> None:
+        cum = np.cumsum(hist)
+        digit = int(np.searchsorted(cum, remaining[j], side="right"))
+        remaining[j] -= cum[digit - 1] if digit else 0
+        population[j] = hist[digit]
+        prefix[j] = (prefix[j] << np.uint64(_DIGIT_BITS)) | np.uint64(digit)
+        width[j] += _DIGIT_BITS
+
+    for j in pending:
+        _descend(j, top)
+
+    while pending:
+        done = [j for j in pending if width[j] == 64]
+        for j in done:
+            result[j] = prefix[j]
+            n_less[j] = ranks[j] - remaining[j]
+        pending = [j for j in pending if width[j] < 64]
+        if not pending:
+            break
+
+        groups: dict[tuple[int, int], list[int]] = {}
+        for j in pending:
+            groups.setdefault((int(width[j]), int(prefix[j])), []).append(j)
+        collect, hists = _plan_pass(groups, population, budget)
+        _scan_prefixes(source, collect, hists)
+
+        for key, parts in collect.items():
+            values = np.sort(np.concatenate(parts))
+            for j in groups[key]:
+                value = values[remaining[j]]
+                result[j] = value
+                n_less[j] = (
+                    ranks[j]
+                    - remaining[j]
+                    + int(np.searchsorted(values, value, side="left"))
+                )
+                width[j] = -1  # resolved
+        for key, hist in hists.items():
+            for j in groups[key]:
+                _descend(j, hist)
+        pending = [j for j in pending if width[j] >= 0]
+
+    return result, n_less
+
+
+def _select_sketch(
+    source: _ChunkSource,
+    totals: _Totals,
+    ntiles: int,
+    sketch_size: int,
+    random_state: Any,
+) -> np.ndarray:
+    """
+    Estimate boundary keys from a uniform sample of ``sketch_size`` keys.
+
+    The sample keeps the keys with the smallest random priorities seen so far
+    (bottom-k sampling), so it is uniform over all rows and costs
+    ``O(sketch_size)`` memory in one pass.
+    """
+    rng = np.random.default_rng(random_state)
+    sample = np.empty(0, dtype=np.uint64)
+    priority = np.empty(0, dtype=np.float64)
+    for y_true, scores in source:
+        keys = _descending_keys(scores)
+        totals.update(y_true, keys)
+        sample = np.concatenate((sample, keys))
+        priority = np.concatenate((priority, rng.random(keys.shape[0])))
+        if sample.shape[0] > sketch_size:
+            keep = np.argpartition(priority, sketch_size - 1)[:sketch_size]
+            sample, priority = sample[keep], priority[keep]
+
+    n = totals.n
+    if n < ntiles:
+        raise ValueError(f"ntiles={ntiles} cannot exceed n_samples={n}.")
+    sample.sort()
+    m = sample.shape[0]
+    at = (_boundary_ranks(n, ntiles) * m) // n
+    return sample[np.minimum(at, m - 1)]
+
+
+##########################################################################
+## Engine
+##########################################################################
+
+
+def _ntile_statistics(
+    source: _ChunkSource,
+    *,
+    ntiles: int,
+    pos_label: Any,
+    method: str,
+    sketch_size: int,
+    random_state: Any,
+) -> tuple[pd.DataFrame, int, int]:
+    """
+    Per-ntile row counts and score statistics.
+
+    Returns
+    -------
+    stats : pandas.DataFrame
+        Indexed by ntile ``1..ntiles`` with columns ``tot``, ``pos``, ``neg``,
+        ``score_min``, ``score_max`` and ``score_sum``.
+    n : int
+        Total rows.
+    n_pos : int
+        Total positives.
+    """
+    if not isinstance(ntiles, (int, np.integer)) or ntiles < 2:
+        raise ValueError("ntiles must be an int >= 2.")
+    if method not in ("exact", "sketch"):
+        raise ValueError(f"method must be 'exact' or 'sketch', got {method!r}.")
+    if method == "sketch" and (
+        not isinstance(sketch_size, (int, np.integer)) or sketch_size < ntiles
+    ):
+        raise ValueError(f"sketch_size must be an int >= ntiles, got {sketch_size!r}.")
+
+    totals = _Totals(pos_label)
+    if method == "exact":
+        bounds, n_less = _select_exact(source, totals, ntiles)
+    else:
+        bounds = _select_sketch(source, totals, ntiles, sketch_size, random_state)
+        n_less = None
+    n = totals.n
+
+    # Boundary keys are non-decreasing; a tie group at a boundary is split by
+    # row position (exact only), everything else is a binary search.
+    tie_keys = np.unique(bounds) if n_less is not None else np.empty(0, np.uint64)
+    tie_base = {}
+    if n_less is not None:
+        for key, less in zip(bounds.tolist(), n_less.tolist()):
+            tie_base[key] = less
+    tie_seen = dict.fromkeys(tie_base, 0)
+
+    size = ntiles + 1
+    tot = np.zeros(size, dtype=np.int64)
+    pos = np.zeros(size, dtype=np.int64)
+    score_sum = np.zeros(size, dtype=np.float64)
+    score_min = np.full(size, np.inf)
+    score_max = np.full(size, -np.inf)
+
+    for y_true, scores in source:
+        keys = _descending_keys(scores)
+        nt = np.searchsorted(bounds, keys, side="right") + 1
+        if tie_keys.size:
+            for key in tie_keys[np.isin(tie_keys, keys)].tolist():
+                idx = np.flatnonzero(keys == np.uint64(key))
+                rank = tie_base[key] + tie_seen[key] + np.arange(idx.shape[0])
+                nt[idx] = rank * ntiles // n + 1
+                tie_seen[key] += idx.shape[0]
+        is_pos = totals.positives(y_true).astype(np.float64)
+        tot += np.bincount(nt, minlength=size)
+        pos += np.bincount(nt, weights=is_pos, minlength=size).astype(np.int64)
+        score_sum += np.bincount(nt, weights=scores, minlength=size)
+        np.minimum.at(score_min, nt, scores)
+        np.maximum.at(score_max, nt, scores)
+
+    empty = tot == 0
+    score_min[empty] = np.nan
+    score_max[empty] = np.nan
+    stats = pd.DataFrame(
+        {
+            "tot": tot,
+            "pos": pos,
+            "neg": tot - pos,
+            "score_min": score_min,
+            "score_max": score_max,
+            "score_sum": score_sum,
+        }
+    ).iloc[1:]
+    stats.index.name = "ntile"
+    return stats, n, totals.n_pos
+
+
+##########################################################################
+## Public API
+##########################################################################
+
+
+def decile_table_streaming(
+    source: Any,
+    *,
+    y_true_col: str = "y_true",
+    y_score_col: str = "y_score",
+    class_index: int = 1,
+    pos_label: Any = 1,
+    change_deciles: int = 10,
+    digits: int = 6,
+    method: str = "exact",
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    sketch_size: int = 1 << 16,
+    random_state: Any = None,
+) -> pd.DataFrame:
+    """
+    Generate the kds Decile Table from chunked input with bounded memory.
+
+    Out-of-core counterpart of :func:`scikitplot.decile.kds.decile_table`:
+    same columns, computed without materialising or sorting the scores.
+
+    .. versionadded:: 0.5
+
+    Parameters
+    ----------
+    source : Any
+        ``(y_true, y_score)`` arrays or memmaps, a DataFrame, an Arrow
+        Table/RecordBatch, a Parquet path, or a callable returning an iterable
+        of chunks. See :mod:`scikitplot.decile._streaming`.
+    y_true_col, y_score_col : str, default='y_true', 'y_score'
+        Column names for tabular sources.
+    class_index : int, default=1
+        Column of a 2-D ``y_score`` array.
+    pos_label : Any, default=1
+        Label counted as a responder.
+    change_deciles : int, default=10
+        Number of partitions.
+    digits : int, default=6
+        Decimal precision of the rounded columns.
+    method : {'exact', 'sketch'}, default='exact'
+        ``'exact'`` reproduces the in-memory ntiles (a few selection passes
+        plus one aggregation pass); ``'sketch'`` uses approximate boundaries
+        from a uniform sample (two passes).
+    chunk_size : int, default=1048576
+        Rows per chunk; bounds peak memory.
+    sketch_size : int, default=65536
+        Sample size for ``method='sketch'``.
+    random_state : int, numpy.random.Generator or None, default=None
+        Seed for the ``'sketch'`` sample.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The decile table with the columns of
+        :func:`~scikitplot.decile.kds.decile_table`.
+
+    Raises
+    ------
+    ValueError
+        If scores are not finite or there are fewer rows than deciles.
+    TypeError
+        If ``source`` is a one-shot iterator or unsupported.
+
+    See Also
+    --------
+    scikitplot.decile.kds.decile_table
+        In-memory decile table.
+    aggregate_over_ntiles_streaming
+        Out-of-core ``ModelPlotPy`` aggregation.
+
+    Notes
+    -----
+    Ties are broken by row position (the in-memory table's sort is not
+    stable, so tied scores may land in different deciles there).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scikitplot.decile import decile_table_streaming
+    >>> rng = np.random.default_rng(0)
+    >>> y_score = rng.random(10_000)
+    >>> y_true = (rng.random(10_000) < y_score).astype(int)
+    >>> dt = decile_table_streaming((y_true, y_score), chunk_size=1_000)
+    >>> dt["cnt_cust"].tolist()[:3]
+    [1000.0, 1000.0, 1000.0]
+    """
+    chunks = _ChunkSource(
+        source,
+        y_true_col=y_true_col,
+        y_score_col=y_score_col,
+        class_index=class_index,
+        chunk_size=chunk_size,
+    )
+    stats, n, n_pos = _ntile_statistics(
+        chunks,
+        ntiles=change_deciles,
+        pos_label=pos_label,
+        method=method,
+        sketch_size=sketch_size,
+        random_state=random_state,
+    )
+    k = change_deciles
+    tot = stats["tot"].to_numpy(dtype=float)
+
+    dt = pd.DataFrame({"decile": np.arange(1, k + 1, dtype=np.int64)})
+    dt["prob_min"] = stats["score_min"].to_numpy().round(digits)
+    dt["prob_max"] = stats["score_max"].to_numpy().round(digits)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dt["prob_avg"] = (stats["score_sum"].to_numpy() / tot).round(digits)
+    dt["cnt_cust"] = tot
+    dt["cnt_resp"] = stats["pos"].to_numpy(dtype=float)
+    dt["cnt_non_resp"] = stats["neg"].to_numpy(dtype=float)
+    dt["cnt_resp_rndm"] = n_pos / k
+    # Best possible ranking: all responders first, ntiles of ideal size.
+    sizes = _ntile_sizes(n, k)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    dt["cnt_resp_wiz"] = np.clip(n_pos - starts, 0, sizes).astype(np.int64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dt["resp_rate"] = (dt["cnt_resp"] * 100 / dt["cnt_cust"]).round(digits)
+        dt["cum_cust"] = np.cumsum(dt["cnt_cust"])
+        dt["cum_resp"] = np.cumsum(dt["cnt_resp"])
+        dt["cum_resp_wiz"] = np.cumsum(dt["cnt_resp_wiz"])
+        dt["cum_non_resp"] = np.cumsum(dt["cnt_non_resp"])
+        dt["cum_cust_pct"] = (dt["cum_cust"] * 100 / n).round(digits)
+        dt["cum_resp_pct"] = (dt["cum_resp"] * 100 / n_pos).round(digits)
+        dt["cum_resp_pct_wiz"] = (dt["cum_resp_wiz"] * 100 / n_pos).round(digits)
+        dt["cum_non_resp_pct"] = (dt["cum_non_resp"] * 100 / (n - n_pos)).round(
+            digits
+        )
+        dt["KS"] = (dt["cum_resp_pct"] - dt["cum_non_resp_pct"]).round(digits)
+        dt["lift"] = (dt["cum_resp_pct"] / dt["cum_cust_pct"]).round(digits)
+    return dt
+
+
+def aggregate_over_ntiles_streaming(
+    source: Any,
+    *,
+    target_class: Any = 1,
+    model_label: str = "model",
+    dataset_label: str = "dataset",
+    ntiles: int = 10,
+    y_true_col: str = "y_true",
+    y_score_col: str = "y_score",
+    class_index: int = 1,
+    method: str = "exact",
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    sketch_size: int = 1 << 16,
+    random_state: Any = None,
+) -> pd.DataFrame:
+    """
+    Aggregate gain/lift/response metrics per ntile from chunked input.
+
+    Out-of-core counterpart of
+    :meth:`~scikitplot.decile.ModelPlotPy.aggregate_over_ntiles` for one
+    ``(model, dataset, target class)`` group. With ``method='exact'`` the
+    result equals the in-memory aggregation of the same scores.
+
+    .. versionadded:: 0.5
+
+    Parameters
+    ----------
+    source : Any
+        ``(y_true, y_score)`` arrays or memmaps, a DataFrame, an Arrow
+        Table/RecordBatch, a Parquet path, or a callable returning an iterable
+        of chunks. ``y_score`` holds the probability of ``target_class``.
+    target_class : Any, default=1
+        Class whose rows count as positives.
+    model_label, dataset_label : str, default='model', 'dataset'
+        Labels written to the output.
+    ntiles : int, default=10
+        Number of ntiles (``>= 2``).
+    y_true_col, y_score_col : str, default='y_true', 'y_score'
+        Column names for tabular sources.
+    class_index : int, default=1
+        Column of a 2-D ``y_score`` array.
+    method : {'exact', 'sketch'}, default='exact'
+        See :func:`decile_table_streaming`.
+    chunk_size : int, default=1048576
+        Rows per chunk; bounds peak memory.
+    sketch_size : int, default=65536
+        Sample size for ``method='sketch'``.
+    random_state : int, numpy.random.Generator or None, default=None
+        Seed for the ``'sketch'`` sample.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Rows for ntiles ``0..ntiles`` in the ``aggregate_over_ntiles`` schema.
+        Concatenate several groups and add a ``scope`` column to feed the
+        ``plot_*`` functions.
+
+    Raises
+    ------
+    ValueError
+        If scores are not finite, there are fewer rows than ntiles, or there
+        are no positives.
+
+    See Also
+    --------
+    ModelPlotPy.aggregate_over_ntiles
+        In-memory aggregation over fitted models.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scikitplot.decile import aggregate_over_ntiles_streaming
+    >>> rng = np.random.default_rng(0)
+    >>> y_score = rng.random(10_000)
+    >>> y_true = (rng.random(10_000) < y_score).astype(int)
+    >>> agg = aggregate_over_ntiles_streaming((y_true, y_score), chunk_size=1_000)
+    >>> plot_input = agg.assign(scope="no_comparison")
+    """
+    chunks = _ChunkSource(
+        source,
+        y_true_col=y_true_col,
+        y_score_col=y_score_col,
+        class_index=class_index,
+        chunk_size=chunk_size,
+    )
+    stats, _, _ = _ntile_statistics(
+        chunks,
+        ntiles=ntiles,
+        pos_label=target_class,
+        method=method,
+        sketch_size=sketch_size,
+        random_state=random_state,
+    )
+    return _ntile_gain_frame(
+        stats[["tot", "pos", "neg"]],
+        ntiles=ntiles,
+        model_label=model_label,
+        dataset_label=dataset_label,
+        target_class=target_class,
+    )
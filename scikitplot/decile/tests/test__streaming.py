@@ -0,0 +1,190 @@
+# scikitplot/decile/tests/test__streaming.py
+#
+# flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Tests for :mod:`~scikitplot.decile._streaming`.
+
+- exact engine reproduces ``kds.decile_table`` and
+  ``ModelPlotPy.aggregate_over_ntiles`` for any chunk size
+- ties at ntile boundaries are split by row position
+- memmap, DataFrame, Arrow, Parquet and callable sources
+- ``method='sketch'`` yields near-equal ntiles
+- input validation (one-shot iterators, non-finite scores, too few rows)
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+from .._decile_modelplotpy import ModelPlotPy, _assign_descending_ntiles
+from .._streaming import (
+    _descending_keys,
+    aggregate_over_ntiles_streaming,
+    decile_table_streaming,
+)
+from ..kds import decile_table
+
+
+def _scores(n: int = 5003, seed: int = 7):
+    rng = np.random.default_rng(seed)
+    y_score = rng.random(n)
+    y_true = (rng.random(n) < y_score).astype(int)
+    return y_true, y_score
+
+
+class TestDescendingKeys(unittest.TestCase):
+    def test_key_order_is_score_descending(self):
+        scores = np.array([3.5, -0.0, 0.0, -2.0, 1e-300, -1e-300, 7.0])
+        keys = _descending_keys(scores)
+        order = np.argsort(keys, kind="stable")
+        self.assertEqual(scores[order].tolist(), sorted(scores, reverse=True))
+        self.assertEqual(keys[1], keys[2])  # -0.0 == 0.0
+
+    def test_rejects_non_finite(self):
+        with self.assertRaises(ValueError):
+            _descending_keys(np.array([0.1, np.nan]))
+
+
+class TestDecileTableStreaming(unittest.TestCase):
+    def test_matches_in_memory_decile_table(self):
+        y_true, y_score = _scores()
+        expected = decile_table(y_true, y_score)
+        for chunk_size in (97, 1000, 1 << 20):
+            got = decile_table_streaming((y_true, y_score), chunk_size=chunk_size)
+            pd.testing.assert_frame_equal(got, expected)
+
+    def test_two_dimensional_scores_use_class_index(self):
+        y_true, y_score = _scores()
+        proba = np.c_[1 - y_score, y_score]
+        pd.testing.assert_frame_equal(
+            decile_table_streaming((y_true, proba), class_index=1),
+            decile_table_streaming((y_true, y_score)),
+        )
+
+    def test_sketch_gives_near_equal_deciles(self):
+        y_true, y_score = _scores(n=40_000)
+        dt = decile_table_streaming(
+            (y_true, y_score), method="sketch", sketch_size=16384,
+            random_state=123, chunk_size=3000,
+        )
+        self.assertEqual(dt["cnt_cust"].sum(), 40_000)
+        np.testing.assert_allclose(dt["cnt_cust"], 4000, rtol=0.1)
+
+
+class TestAggregateOverNtilesStreaming(unittest.TestCase):
+    def test_matches_model_plot_py(self):
+        rng = np.random.default_rng(0)
+        X = pd.DataFrame(rng.normal(size=(600, 3)))
+        y = pd.Series((X[0] + rng.normal(size=600) > 0).astype(int))
+        model = LogisticRegression().fit(X, y)
+        mp = ModelPlotPy(
+            feature_data=[X], label_data=[y], dataset_labels=["test"],
+            models=[model], model_labels=["lr"], ntiles=10,
+        )
+        expected = mp.aggregate_over_ntiles()
+        expected = expected[expected["target_class"] == 1].reset_index(drop=True)
+        proba = model.predict_proba(X)
+        got = aggregate_over_ntiles_streaming(
+            (y.to_numpy(), proba), target_class=1, model_label="lr",
+            dataset_label="test", chunk_size=64,
+        )
+        pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+    def test_boundary_ties_split_by_position(self):
+        rng = np.random.default_rng(1)
+        y_score = np.round(rng.random(3001), 1)
+        y_score[:700] = 0.5
+        y_true = rng.integers(0, 2, size=3001)
+        ntile = _assign_descending_ntiles(pd.Series(y_score), ntiles=7).to_numpy()
+        got = aggregate_over_ntiles_streaming(
+            (y_true, y_score), ntiles=7, chunk_size=250
+        ).iloc[1:]
+        self.assertEqual(got["tot"].tolist(), np.bincount(ntile)[1:].tolist())
+        self.assertEqual(
+            got["pos"].tolist(),
+            np.bincount(ntile, weights=y_true)[1:].astype(int).tolist(),
+        )
+
+    def test_constant_scores(self):
+        y_true, _ = _scores(n=1000)
+        got = aggregate_over_ntiles_streaming(
+            (y_true, np.full(1000, 0.25)), ntiles=4, chunk_size=33
+        )
+        self.assertEqual(got["tot"].tolist(), [0, 250, 250, 250, 250])
+
+
+class TestSources(unittest.TestCase):
+    def setUp(self):
+        self.y_true, self.y_score = _scores(n=2500)
+        self.expected = decile_table_streaming((self.y_true, self.y_score))
+        self.tmp = tempfile.mkdtemp()
+
+    def test_memmap(self):
+        path = os.path.join(self.tmp, "scores.dat")
+        mm = np.memmap(path, dtype=np.float64, mode="w+", shape=self.y_score.shape)
+        mm[:] = self.y_score
+        mm.flush()
+        ro = np.memmap(path, dtype=np.float64, mode="r", shape=self.y_score.shape)
+        got = decile_table_streaming((self.y_true, ro), chunk_size=300)
+        pd.testing.assert_frame_equal(got, self.expected)
+        del mm, ro
+
+    def test_dataframe_and_callable(self):
+        df = pd.DataFrame({"label": self.y_true, "p": self.y_score})
+        kw = {"y_true_col": "label", "y_score_col": "p", "chunk_size": 400}
+        pd.testing.assert_frame_equal(decile_table_streaming(df, **kw), self.expected)
+
+        def _batches():
+            for start in range(0, len(df), 700):
+                yield df.iloc[start : start + 700]
+
+        pd.testing.assert_frame_equal(
+            decile_table_streaming(_batches, **kw), self.expected
+        )
+
+    def test_arrow_and_parquet(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            self.skipTest("pyarrow is not installed")
+        table = pa.table({"y_true": self.y_true, "y_score": self.y_score})
+        pd.testing.assert_frame_equal(
+            decile_table_streaming(table, chunk_size=512), self.expected
+        )
+        path = os.path.join(self.tmp, "scores.parquet")
+        pq.write_table(table, path, row_group_size=600)
+        pd.testing.assert_frame_equal(
+            decile_table_streaming(path, chunk_size=256), self.expected
+        )
+
+    def test_one_shot_iterator_rejected(self):
+        chunks = iter([(self.y_true, self.y_score)])
+        with self.assertRaises(TypeError):
+            decile_table_streaming(chunks)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            decile_table_streaming((self.y_true[:5], self.y_score[:5]))
+        with self.assertRaises(ValueError):
+            decile_table_streaming((self.y_true, self.y_score), method="bogus")
+        with self.assertRaises(ValueError):
+            decile_table_streaming((self.y_true, self.y_score), chunk_size=0)
+        bad = self.y_score.copy()
+        bad[3] = np.inf
+        with self.assertRaises(ValueError):
+            decile_table_streaming((self.y_true, bad))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -38,13 +38,6 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
-# cpu_count()            # tells you how many CPUs are available
-# Parallel(n_jobs=-1)    # uses cpu_count() workers (all CPUs)
-# Parallel(n_jobs=None)  # usually = 1 worker (sequential)
-# with parallel_config(n_jobs=-1):
-#     Parallel(n_jobs=None)  # now inherits -1 => all CPUs
-from joblib import Parallel, cpu_count, delayed, parallel_config
-
 # sklearn
 from sklearn.base import BaseEstimator, TransformerMixin, _fit_context
 from sklearn.impute._base import _BaseImputer
@@ -316,22 +309,28 @@ class ANNImputer(OutsourcedIndexMixin, _BaseImputer):
         The imputed value is always `0`.
 
     n_jobs : int or None, default=None
-        Parallelism level used in two places:
+        Parallelism level used in three places:
 
         - during Annoy index construction, passed to
           :meth:`AnnoyIndex.build`,
-        - during Voyager query construction, passed to
-          :meth:`Voyager.query`,
-        - during imputation, used as the number of worker threads in a
-          :class:`joblib.Parallel` loop.
+        - during Annoy batch queries, passed to
+          :meth:`AnnoyIndex.get_nns_by_vectors` (native threads, GIL released),
+        - during Voyager batch queries, passed to
+          :meth:`voyager.Index.query` as ``num_threads``.
 
-        If None usually = 1 worker (sequential).
+        If None, the backend default is used (``-1``: all available cores).
 
-        A value of ``-1`` uses all available CPU cores. Using threads
-        for the imputation step avoids spawning new Python processes and
-        keeps this estimator compatible with editable installs and other
+        Queries are fanned out by the backend itself, so no Python worker
+        threads or processes are spawned during :meth:`transform`. This keeps
+        the estimator compatible with editable installs and other
         environments where the package cannot be safely re-imported in
-        child processes. So like uses ``import joblib; joblib.cpu_count()``
+        child processes.
+
+    batch_size : int, default=1024
+        Number of rows with at least one missing value sent to the ANN index
+        in one batched neighbour query during :meth:`transform`. Rows without
+        missing values are never queried. Peak transform memory grows with
+        ``batch_size * n_neighbors * n_features``.
 
     random_state : int or None, default=None
         Seed for the backend index construction (e.g. Annoy hyperplanes,
@@ -517,6 +516,7 @@ class ANNImputer(OutsourcedIndexMixin, _BaseImputer):
         "fill_value": "no_validation",  # any object is valid
         "copy": ["boolean"],
         "n_jobs": [None, Integral],
+        "batch_size": [Interval(Integral, 1, None, closed="left")],
         "random_state": ["random_state"],
         # "verbose": ["verbose"],
         # "include_distances": "no_validation",  # any object is valid
@@ -544,6 +544,7 @@ class ANNImputer(OutsourcedIndexMixin, _BaseImputer):
         add_indicator=False,
         keep_empty_features=False,
         n_jobs=None,  # annoy default
+        batch_size=1024,  # rows per batched neighbour query in transform
         random_state=None,
     ):
         # Base imputer handles missing_values / indicators
@@ -568,6 +569,7 @@ class ANNImputer(OutsourcedIndexMixin, _BaseImputer):
         self.fill_value = fill_value
         self.copy = copy
         self.n_jobs = n_jobs
+        self.batch_size = batch_size
         self.random_state = random_state
 
     # ------------------------------------------------------------------ #
@@ -1317,190 +1319,263 @@ class ANNImputer(OutsourcedIndexMixin, _BaseImputer):
         return new_row
 
     # ------------------------------------------------------------------ #
-    # Per-row backends (Annoy / Voyager)
+    # Batched transform engine (shared by Annoy + Voyager)
     # ------------------------------------------------------------------ #
-    def _process_single_row_annoy(  # noqa: PLR0912, PLR0913  # ruff: ignore[too-many-positional-arguments]
+    def _compute_neighbor_weights_batch(
         self,
-        i: int,
-        row: np.ndarray,
-        row_missing_mask: np.ndarray,
-        train_index,
-        fill_vec: np.ndarray,
-        n_neighbors: int,
-        search_k: int,
+        dists: np.ndarray,
+        neighbor_valid: np.ndarray,
         weights_method,
+    ) -> np.ndarray:
+        """
+        Row-wise counterpart of :meth:`_compute_neighbor_weights`.
+
+        Parameters
+        ----------
+        dists : ndarray of shape (n_rows, n_neighbors)
+            Distances to neighbor points.
+        neighbor_valid : ndarray of shape (n_rows, n_neighbors)
+            Boolean mask of returned neighbours; padded slots get zero weight.
+        weights_method : {'uniform', 'distance'} or callable or None
+            Weighting strategy as accepted by :func:`_get_weights`.
+
+        Returns
+        -------
+        weights : ndarray of shape (n_rows, n_neighbors)
+            Per-row normalized weights with the same zero-distance handling as
+            :meth:`_compute_neighbor_weights`.
+        """
+        if weights_method is None or weights_method == "uniform":
+            return neighbor_valid.astype(float)
+
+        # Padded slots are pushed to +inf so 'distance' maps them to 0.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = _get_weights(
+                np.where(neighbor_valid, np.asarray(dists, dtype=float), np.inf),
+                weights_method,
+            )
+        if weights is None:
+            return neighbor_valid.astype(float)
+        weights = np.where(neighbor_valid, np.asarray(weights, dtype=float), 0.0)
+
+        # Rows with infinite weights (zero distances): share weight equally
+        # among the infinite entries and zero out the others.
+        inf_mask = np.isinf(weights)
+        inf_rows = inf_mask.any(axis=1)
+        if inf_rows.any():
+            n_inf = inf_mask[inf_rows].sum(axis=1, keepdims=True)
+            weights[inf_rows] = np.where(inf_mask[inf_rows], 1.0 / n_inf, 0.0)
+
+        row_sums = weights.sum(axis=1, keepdims=True)
+        np.divide(weights, row_sums, out=weights, where=row_sums > 0)
+        return weights
+
+    def _impute_from_neighbors_batch(  # ruff: ignore[too-many-positional-arguments]
+        self,
+        rows: np.ndarray,
+        rows_missing_mask: np.ndarray,
+        neighbors: np.ndarray,
+        neighbor_valid: np.ndarray,
+        weights: np.ndarray,
+        fill_vec: np.ndarray,
         is_empty_feature: np.ndarray,
-    ) -> tuple[int, np.ndarray]:
+    ) -> np.ndarray:
         """
-        Impute missing values for a single row using an Annoy-based index.
+        Vectorized counterpart of :meth:`_impute_from_neighbors`.
 
         Parameters
         ----------
-        i : int
-            Row index in ``X``.
-        row : ndarray of shape (n_features,)
-            The input row (possibly containing NaNs).
-        row_missing_mask : ndarray of shape (n_features,)
-            Boolean mask for missing values in this row.
-        train_index : AnnoyIndex
-            Fitted Annoy index built on (temporarily) complete vectors.
+        rows : ndarray of shape (n_rows, n_features)
+            Original rows (with NaNs for missing values).
+        rows_missing_mask : ndarray of shape (n_rows, n_features)
+            Boolean mask for missing values.
+        neighbors : ndarray of shape (n_rows, n_neighbors, n_features)
+            Neighbor feature values (padded slots may hold anything).
+        neighbor_valid : ndarray of shape (n_rows, n_neighbors)
+            Boolean mask of returned neighbours.
+        weights : ndarray of shape (n_rows, n_neighbors)
+            Neighbor weights from :meth:`_compute_neighbor_weights_batch`.
         fill_vec : ndarray of shape (n_features,)
-            Global per-feature fill statistics used as a fallback.
-        n_neighbors : int
-            Number of neighbors to retrieve from the Annoy index.
-        search_k : int
-            Annoy search parameter controlling the accuracy/speed trade-off.
-        weights_method : {'uniform', 'distance'} or callable
-            Weighting strategy passed to :func:`sklearn.neighbors._base._get_weights`.
+            Global per-feature statistics used as fallback.
         is_empty_feature : ndarray of shape (n_features,)
             Boolean mask marking features that were entirely missing at fit time.
 
         Returns
         -------
-        idx : int
-            The original row index ``i``.
-        new_row : ndarray of shape (n_features,)
-            The imputed row.
+        new_rows : ndarray of shape (n_rows, n_features)
+            The imputed rows. Rows without any returned neighbour are left
+            unchanged.
         """
-        # skip complete rows has no missing values
-        if not np.any(row_missing_mask):
-            return i, row  # nothing to impute
-
-        # 1. Prepare query vector
-        vec = self._prepare_query_vector(row, fill_vec)
-
-        # 2. Query neighbors (backend may be our wrapper or raw spotify Annoy)
-        query_kwargs = {
-            "n": n_neighbors,
-            "search_k": search_k,  # If -1, defaults to approximately n_trees * n
-            "include_distances": True,  # (weights == "distance")
-        }
-        # raw spotify/annoy API
-        neighbor_ids, dists = train_index.get_nns_by_vector(
-            vec,  # row, X[i]
-            **query_kwargs,
-        )
-        # Annoy returns the query point itself as the first element
-        # Remove self-neighbors (distance == 0)
-        if not list(neighbor_ids):  # python list or not neighbor_ids
-            return i, row  # nothing to impute
-
-        # Convert to 2D so _get_weights expects shape (n_queries, n_neighbors)
-        # np.asarray(dists, dtype=float).reshape(1, -1)
-        # dists_2d = np.atleast_2d(np.asarray(dists, dtype=float))
-        # weights_2d = _get_weights(dists_2d, self.weights)
-
-        # Ensure dists is always 1D (even when a scalar sneaks in)
-        neighbor_ids = np.asarray(neighbor_ids, dtype=int).ravel()
-        dists = np.asarray(dists, dtype=float).reshape(-1)
-
-        if neighbor_ids.size == 0:
-            return i, row
-        if dists.size != len(neighbor_ids):
-            raise ValueError(
-                f"Annoy returned mismatched ids/distances lengths: "
-                f"{len(neighbor_ids)} vs {dists.size}"
-            )
-
-        # 4. Retrieve neighbor rows
-        neighbors = np.asarray(
-            [train_index.get_item(int(idx)) for idx in neighbor_ids],
-            dtype=float,
+        observed = neighbor_valid[:, :, np.newaxis] & ~np.isnan(neighbors)
+        vals = np.where(observed, neighbors, 0.0)
+        w = np.where(observed, weights[:, :, np.newaxis], 0.0)
+
+        n_observed = observed.sum(axis=1)
+        w_sum = w.sum(axis=1)
+        weighted = np.einsum("rkf,rkf->rf", w, vals) / np.where(w_sum > 0, w_sum, 1.0)
+        unweighted = vals.sum(axis=1) / np.maximum(n_observed, 1)
+        fills = np.where(
+            n_observed == 0,
+            fill_vec[np.newaxis, :],
+            np.where(w_sum > 0, weighted, unweighted),
         )
-        if dists.size != neighbors.shape[0]:
-            raise ValueError(
-                f"Annoy returned mismatched ids/distances lengths: "
-                f"{neighbors.shape[0]} vs {dists.size}"
-            )
 
-        # 4. Compute weights (strict shape safe), If no distances, fallback to uniform
-        weights = self._compute_neighbor_weights(dists, weights_method)
-
-        # 5. Impute row
-        new_row = self._impute_from_neighbors(
-            row=row,
-            row_idx=i,
-            row_missing_mask=row_missing_mask,
-            neighbors=neighbors,
-            weights=weights,
-            fill_vec=fill_vec,
-            is_empty_feature=is_empty_feature,
+        target = (
+            rows_missing_mask
+            & ~is_empty_feature[np.newaxis, :]
+            & neighbor_valid.any(axis=1)[:, np.newaxis]
         )
-        return i, new_row
+        new_rows = rows.copy()
+        new_rows[target] = fills[target]
+        return new_rows
 
-    def _process_single_row_voyager(  # noqa: PLR0912  # ruff: ignore[too-many-positional-arguments]
+    def _query_annoy_batch(
         self,
-        i: int,
-        row: np.ndarray,
-        row_missing_mask: np.ndarray,
         train_index,
-        fill_vec: np.ndarray,
-        n_neighbors: int,
-        search_k: int,
-        weights_method,
-        is_empty_feature: np.ndarray,
-    ) -> tuple[int, np.ndarray]:
+        queries: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Impute missing values for a single row using a voyager.Index.
-        """
-        if not np.any(row_missing_mask):
-            return i, row  # nothing to impute
+        Query an Annoy index for a block of rows.
 
-        self._ensure_voyager_available()
+        Uses the batched, GIL-free :meth:`AnnoyIndex.get_nns_by_vectors` when
+        the backend provides it and falls back to one native call per row for
+        the raw spotify/annoy API.
+
+        Returns
+        -------
+        neighbors : ndarray of shape (n_rows, n_neighbors, n_features)
+            Neighbor vectors (NaN in padded slots).
+        dists : ndarray of shape (n_rows, n_neighbors)
+            Neighbor distances.
+        neighbor_valid : ndarray of shape (n_rows, n_neighbors)
+            Mask of returned neighbours (Annoy may return fewer than ``k``).
+        """
+        n_rows, n_features = queries.shape
+        n_neighbors = self.n_neighbors
+
+        get_nns_by_vectors = getattr(train_index, "get_nns_by_vectors", None)
+        if callable(get_nns_by_vectors):
+            neighbor_ids, dists = get_nns_by_vectors(
+                queries,
+                n_neighbors,
+                search_k=self.search_k,
+                include_distances=True,
+                n_jobs=self.n_jobs or -1,
+            )
+            neighbor_ids = np.asarray(neighbor_ids, dtype=np.int64)
+            dists = np.asarray(dists, dtype=float)
+        else:
+            # raw spotify/annoy API
+            neighbor_ids = np.full((n_rows, n_neighbors), -1, dtype=np.int64)
+            dists = np.full((n_rows, n_neighbors), np.inf, dtype=float)
+            for r, vec in enumerate(queries):
+                ids_r, dists_r = train_index.get_nns_by_vector(
+                    vec,
+                    n_neighbors,
+                    search_k=self.search_k,
+                    include_distances=True,
+                )
+                m = min(len(ids_r), n_neighbors)
+                neighbor_ids[r, :m] = np.asarray(ids_r, dtype=np.int64)[:m]
+                dists[r, :m] = np.asarray(dists_r, dtype=float)[:m]
+
+        neighbor_valid = neighbor_ids >= 0
+        # Fetch each distinct donor vector once per block
+        # (raw spotify/annoy names the accessor ``get_item_vector``).
+        get_item = getattr(train_index, "get_item", None)
+        if get_item is None:
+            get_item = train_index.get_item_vector
+        unique_ids, inverse = np.unique(neighbor_ids[neighbor_valid], return_inverse=True)
+        donors = np.asarray(
+            [get_item(int(idx)) for idx in unique_ids],
+            dtype=float,
+        ).reshape(unique_ids.size, n_features)
+        neighbors = np.full((n_rows, n_neighbors, n_features), np.nan, dtype=float)
+        neighbors[neighbor_valid] = donors[inverse.reshape(-1)]
+        return neighbors, dists, neighbor_valid
 
-        # 1. Prepare query vector
-        vec = self._prepare_query_vector(row, fill_vec).astype(np.float32, copy=False)
+    def _query_voyager_batch(
+        self,
+        train_index,
+        queries: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Query a voyager.Index for a block of rows with one native batch call.
 
-        # 2. Query neighbors
-        query_kwargs = {
-            "k": n_neighbors,
-            "num_threads": self.n_jobs or -1,  # n_jobs controls outer-level parallelism
-            "query_ef": search_k,  # try to find up the k nearest neighbors per query.
-        }
-        # query(vectors: ndarray[Any, dtype[float32]], k: int = 1, num_threads: int = -1,
-        # query_ef: int = -1)
+        Returns the same ``(neighbors, dists, neighbor_valid)`` triple as
+        :meth:`_query_annoy_batch`.
+        """
+        n_rows, n_features = queries.shape
         neighbor_ids, dists = train_index.query(
-            vec,  # row, X[i],
-            **query_kwargs,
+            np.ascontiguousarray(queries, dtype=np.float32),
+            k=self.n_neighbors,
+            num_threads=self.n_jobs or -1,
+            query_ef=self.search_k,
         )
+        neighbor_ids = np.asarray(neighbor_ids, dtype=np.int64).reshape(n_rows, -1)
+        dists = np.asarray(dists, dtype=float).reshape(n_rows, -1)
+
+        unique_ids, inverse = np.unique(neighbor_ids, return_inverse=True)
+        donors = np.asarray(
+            train_index.get_vectors(unique_ids.tolist()), dtype=float
+        ).reshape(unique_ids.size, n_features)
+        neighbors = donors[inverse.reshape(neighbor_ids.shape)]
+        neighbor_valid = np.ones(neighbor_ids.shape, dtype=bool)
+        return neighbors, dists, neighbor_valid
+
+    def _transform_batched(
+        self,
+        X: np.ndarray,
+        missing_mask: np.ndarray,
+        query_batch: typing.Callable[
+            [np.ndarray], tuple[np.ndarray, np.ndarray, np.ndarray]
+        ],
+    ) -> np.ndarray:
+        """
+        Impute ``X`` in-place, one batched neighbour query per row block.
 
-        # ensure 1D
-        neighbor_ids = np.asarray(neighbor_ids, dtype=int).reshape(-1)
-        dists = np.asarray(dists, dtype=float).reshape(-1)
-
-        if neighbor_ids.size == 0:
-            return i, row
-        # if dists.size != len(neighbor_ids):
-        #     raise ValueError(
-        #         f"voyager returned mismatched ids/distances lengths: "
-        #         f"{len(neighbor_ids)} vs {dists.size}"
-        #     )
+        Only rows with at least one missing cell are queried. They are grouped
+        into blocks of :attr:`batch_size` rows; each block is answered by a
+        single ``query_batch`` call and filled with vectorized NumPy gathers.
 
-        # 3. Retrieve neighbor vectors
-        neighbors = train_index.get_vectors(neighbor_ids.tolist()).astype(float)
-        if neighbors.ndim == 1:
-            neighbors = neighbors.reshape(1, -1)
+        Parameters
+        ----------
+        X : ndarray of shape (n_samples, n_features)
+            Data to impute (modified in-place).
+        missing_mask : ndarray of shape (n_samples, n_features)
+            Boolean mask for missing values in ``X``.
+        query_batch : callable
+            Maps a ``(n_rows, n_features)`` query block to
+            ``(neighbors, dists, neighbor_valid)``.
 
-        if dists.size != neighbors.shape[0]:
-            raise ValueError(
-                f"voyager returned mismatched ids/distances lengths: "
-                f"{neighbors.shape[0]} vs {dists.size}"
+        Returns
+        -------
+        X : ndarray of shape (n_samples, n_features)
+            The imputed data (same object as the input).
+        """
+        fill_vec = np.asarray(self.temp_fill_vector_, dtype=float)
+        rows_to_impute = np.flatnonzero(missing_mask.any(axis=1))
+        batch_size = int(self.batch_size)
+
+        for start in range(0, rows_to_impute.size, batch_size):
+            block = rows_to_impute[start : start + batch_size]
+            rows = X[block]
+            queries = self._prepare_query_vector(rows, fill_vec)
+
+            neighbors, dists, neighbor_valid = query_batch(queries)
+            weights = self._compute_neighbor_weights_batch(
+                dists, neighbor_valid, self.weights
             )
-
-        # 4. Compute weights
-        weights = self._compute_neighbor_weights(dists, weights_method)
-
-        # 5. Impute row
-        new_row = self._impute_from_neighbors(
-            row=row,
-            row_idx=i,
-            row_missing_mask=row_missing_mask,
-            neighbors=neighbors,
-            weights=weights,
-            fill_vec=fill_vec,
-            is_empty_feature=is_empty_feature,
-        )
-        return i, new_row
+            X[block] = self._impute_from_neighbors_batch(
+                rows=rows,
+                rows_missing_mask=missing_mask[block],
+                neighbors=neighbors,
+                neighbor_valid=neighbor_valid,
+                weights=weights,
+                fill_vec=fill_vec,
+                is_empty_feature=self._is_empty_feature,
+            )
+        return X
 
     # ------------------------------------------------------------------ #
     # Transform backends (Annoy / Voyager)
@@ -1513,7 +1588,8 @@ class ANNImputer(OutsourcedIndexMixin, _BaseImputer):
 
         - obtains an index for runtime use via :meth:`_get_index_for_runtime`
           (in-memory or external depending on :attr:`index_access`),
-        - parallelises neighbour lookups over rows using :mod:`joblib`,
+        - queries only rows with missing values, in blocks of
+          :attr:`batch_size` rows (see :meth:`_transform_batched`),
         - writes the imputed rows back into ``X`` in-place.
         """
         with Timer("Transforming with Annoy..."):
@@ -1531,26 +1607,11 @@ class ANNImputer(OutsourcedIndexMixin, _BaseImputer):
                 loader=_loader,
             )
 
-            # Iterate over rows with missing values
-            # for i, row in enumerate(X):
-            results = Parallel(n_jobs=self.n_jobs)(
-                delayed(self._process_single_row_annoy)(
-                    i,
-                    X[i],
-                    missing_mask[i],
-                    train_index,
-                    self.temp_fill_vector_,
-                    self.n_neighbors,
-                    self.search_k,
-                    self.weights,
-                    self._is_empty_feature,
-                )
-                for i in range(X.shape[0])
+            return self._transform_batched(
+                X,
+                missing_mask,
+                lambda queries: self._query_annoy_batch(train_index, queries),
             )
-            # Write updated rows back
-            for i, new_row in results:
-                X[i] = new_row
-            return X
 
     def _transform_voyager_index(self, X, missing_mask):
         """Impute missing values in ``X`` using a fitted voyager.Index."""
@@ -1567,35 +1628,11 @@ class ANNImputer(OutsourcedIndexMixin, _BaseImputer):
                 loader=_loader,
             )
 
-            # results = Parallel(n_jobs=self.n_jobs)(
-            #     delayed(self._process_single_row_voyager)(
-            #         i,
-            #         X[i],
-            #         missing_mask[i],
-            #         train_index,
-            #         self.temp_fill_vector_,
-            #         self.n_neighbors,
-            #         self.search_k,
-            #         self.weights,
-            #         self._is_empty_feature,
-            #     )
-            #     for i in range(X.shape[0])
-            # )
-            # for i, new_row in results:
-            #     X[i] = new_row
-            for i in range(X.shape[0]):
-                X[i] = self._process_single_row_voyager(
-                    i,
-                    X[i],
-                    missing_mask[i],
-                    train_index,
-                    self.temp_fill_vector_,
-                    self.n_neighbors,
-                    self.search_k,
-                    self.weights,
-                    self._is_empty_feature,
-                )[1]
-            return X
+            return self._transform_batched(
+                X,
+                missing_mask,
+                lambda queries: self._query_voyager_batch(train_index, queries),
+            )
 
     # ------------------------------------------------------------------ #
     # Transform: approximate KNN imputation
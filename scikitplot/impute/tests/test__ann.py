@@ -74,9 +74,10 @@ ANNImputer._impute_from_neighbors
   * empty feature skipped
   * zero-weight-sum falls back to mean
 
-ANNImputer._process_single_row_annoy
-  * complete row returned unchanged
-  * missing row imputed, returns correct index
+ANNImputer._transform_batched (row-batched transform engine)
+  * matches a per-row reference for uniform, distance and callable weights
+  * result independent of batch_size; only missing rows queried
+  * batched weights match single-row weights; invalid batch_size rejected
 
 ANNImputer.get_feature_names_out
   * length matches n_features_in_, custom names, empty col excluded,
@@ -726,42 +727,89 @@ class TestImputeFromNeighbors(unittest.TestCase):
 
 
 # ===========================================================================
-# _process_single_row_annoy
+# Batched transform engine
 # ===========================================================================
 
-class TestProcessSingleRowAnnoy(unittest.TestCase):
+class TestTransformBatched(unittest.TestCase):
+    """The row-batched engine must match a per-row reference."""
 
-    def setUp(self):
-        self.imp = _make_imp(index_access="public")
-        self.imp.fit(_X4)
-        self.train_index = self.imp.train_index_
-        self.fill_vec    = self.imp.temp_fill_vector_
-        self.is_empty    = self.imp._is_empty_feature
-
-    def _call(self, i, row, mask):
-        return self.imp._process_single_row_annoy(
-            i, row, mask, self.train_index, self.fill_vec,
-            self.imp.n_neighbors, self.imp.search_k,
-            self.imp.weights, self.is_empty,
-        )
+    def _data(self):
+        rng = np.random.RandomState(0)
+        X = rng.randn(120, 4)
+        X[rng.rand(120, 4) < 0.15] = np.nan
+        X[:5] = rng.randn(5, 4)  # guarantee complete rows
+        return X
+
+    def _reference(self, imp, X):
+        # One Annoy query per row, weighted and imputed with the single-row
+        # helpers.
+        ref = X.copy()
+        mask = np.isnan(ref)
+        index, fill = imp.train_index_, imp.temp_fill_vector_
+        get_item = getattr(index, "get_item", None) or index.get_item_vector
+        for i in np.flatnonzero(mask.any(axis=1)):
+            ids, dists = index.get_nns_by_vector(
+                imp._prepare_query_vector(ref[i], fill),
+                imp.n_neighbors,
+                search_k=imp.search_k,
+                include_distances=True,
+            )
+            neighbors = np.asarray([get_item(j) for j in ids], dtype=float)
+            ref[i] = imp._impute_from_neighbors(
+                row=ref[i],
+                row_idx=i,
+                row_missing_mask=mask[i],
+                neighbors=neighbors,
+                weights=imp._compute_neighbor_weights(
+                    np.asarray(dists, dtype=float), imp.weights
+                ),
+                fill_vec=fill,
+                is_empty_feature=imp._is_empty_feature,
+            )
+        return ref
+
+    def test_default_batch_size(self):
+        self.assertEqual(ANNImputer().batch_size, 1024)
+
+    def test_matches_per_row_path(self):
+        X = self._data()
+        for weights in ("uniform", "distance", lambda d: 1.0 / (1.0 + d)):
+            imp = _make_imp(n_neighbors=4, weights=weights, batch_size=17)
+            imp.fit(X)
+            assert_allclose(imp.transform(X), self._reference(imp, X))
+
+    def test_batch_size_does_not_change_result(self):
+        X = self._data()
+        out_small = _make_imp(batch_size=1).fit_transform(X)
+        out_large = _make_imp(batch_size=10_000).fit_transform(X)
+        assert_allclose(out_small, out_large)
+
+    def test_only_missing_rows_are_queried(self):
+        X = self._data()
+        imp = _make_imp().fit(X)
+        seen = []
+        original = imp._query_annoy_batch
 
-    def test_complete_row_returned_unchanged(self):
-        row  = np.array([3.0, 4.0, 3.0])
-        mask = np.array([False, False, False])
-        _, new_row = self._call(0, row, mask)
-        assert_allclose(new_row, row)
-
-    def test_missing_row_imputed(self):
-        row  = _X4[0].copy()
-        mask = np.array([False, False, True])
-        _, new_row = self._call(0, row, mask)
-        self.assertFalse(np.isnan(new_row[2]))
-
-    def test_returns_original_row_index(self):
-        row  = np.array([3.0, 4.0, 3.0])
-        mask = np.array([False, False, False])
-        idx, _ = self._call(7, row, mask)
-        self.assertEqual(idx, 7)
+        def _spy(train_index, queries):
+            seen.append(queries.shape[0])
+            return original(train_index, queries)
+
+        imp._query_annoy_batch = _spy
+        imp.transform(X)
+        self.assertEqual(sum(seen), int(np.isnan(X).any(axis=1).sum()))
+
+    def test_weights_batch_matches_single_row(self):
+        imp = _make_imp()
+        dists = np.array([[0.0, 1.0, 2.0], [1.0, 3.0, np.inf]])
+        valid = np.array([[True, True, True], [True, True, False]])
+        got = imp._compute_neighbor_weights_batch(dists, valid, "distance")
+        assert_allclose(got[0], imp._compute_neighbor_weights(dists[0], "distance"))
+        assert_allclose(got[1, :2], imp._compute_neighbor_weights(dists[1, :2], "distance"))
+        self.assertEqual(got[1, 2], 0.0)
+
+    def test_invalid_batch_size_rejected(self):
+        with self.assertRaises(ValueError):
+            _make_imp(batch_size=0).fit(_X4)
 
 
 # ===========================================================================
@@ -34,6 +34,9 @@ from __future__ import annotations
 
 import math
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from itertools import islice
 from typing import Any, Iterable, Protocol, runtime_checkable
@@ -224,6 +227,54 @@ def _coerce_finite_score(value: Any, default: float = 0.0) -> float:
     return score if math.isfinite(score) else default
 
 
+class _LruCache:
+    """Thread-safe LRU mapping with an optional per-entry time-to-live.
+
+    Shared by the service result cache and the query-embedding cache. A
+    ``maxsize`` of ``0`` disables caching (every lookup misses, nothing is
+    stored); ``ttl`` of ``None`` keeps entries until they are evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self._maxsize = int(maxsize)
+        self._ttl = None if ttl is None else float(ttl)
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] >= now:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Any, value: Any) -> None:
+        if self._maxsize <= 0:
+            return
+        expires = math.inf if self._ttl is None else time.monotonic() + self._ttl
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
 def build_search_docs_result(
     query: str,
     chunks: Iterable[RetrievedChunk],
@@ -42,12 +42,13 @@ from __future__ import annotations
 import logging
 from typing import Any, Callable, Protocol
 
-from ._core import DocsRetriever, RetrievedChunk, _coerce_finite_score
+from ._core import DocsRetriever, RetrievedChunk, _coerce_finite_score, _LruCache
 
 __all__ = ["CorpusAnnoyRetriever", "Embedder", "VectorIndex"]
 
 _LOG = logging.getLogger(__name__)
 _MAX_RETRIEVAL_K = 50
+_DEFAULT_EMBEDDING_CACHE_SIZE = 256
 
 
 class Embedder(Protocol):
@@ -76,16 +77,28 @@ class _CorpusEmbedder:
     (The previous implementation called a non-existent ``encode`` method and
     then passed a bare ``str`` to ``embed`` — both incorrect against the corpus
     ``EmbeddingEngine`` contract.)
+
+    Agents tend to repeat queries, and encoding is the dominant per-query cost,
+    so the last ``cache_size`` query vectors are kept in an LRU keyed on the
+    exact query text (``0`` disables the cache).
     """
 
-    def __init__(self, engine: Any) -> None:
+    def __init__(
+        self, engine: Any, *, cache_size: int = _DEFAULT_EMBEDDING_CACHE_SIZE
+    ) -> None:
         self._engine = engine
+        self._cache = _LruCache(cache_size)
 
     def embed(self, text: str) -> Any:
+        vector = self._cache.get(text)
+        if vector is not None:
+            return vector
         vectors = self._engine.embed([text])
         if vectors is None or len(vectors) != 1:
             raise ValueError("EmbeddingEngine.embed must return one vector")
-        return vectors[0]
+        vector = vectors[0]
+        self._cache.put(text, vector)
+        return vector
 
 
 class _SimilarityVectorIndex:
@@ -232,6 +245,7 @@ class CorpusAnnoyRetriever(DocsRetriever):
         embedding_model: str = "all-MiniLM-L6-v2",
         backend: str = "annoy",
         strict: bool = False,
+        embedding_cache_size: int = _DEFAULT_EMBEDDING_CACHE_SIZE,
     ) -> CorpusAnnoyRetriever:
         """
         Build the real retriever from a docs directory (import-guarded).
@@ -260,6 +274,9 @@ class CorpusAnnoyRetriever(DocsRetriever):
             ``'auto'`` (Annoy first, then FAISS / Voyager / brute-force).
         strict : bool, optional
             False.
+        embedding_cache_size : int, optional
+            Number of query vectors kept in the query-embedding LRU cache, so
+            a repeated query skips the embedding model. ``0`` disables it.
 
         Returns
         -------
@@ -338,7 +355,7 @@ class CorpusAnnoyRetriever(DocsRetriever):
             raise RuntimeError("corpus build produced no retrievable documents")
 
         return cls(
-            _CorpusEmbedder(engine),
+            _CorpusEmbedder(engine, cache_size=embedding_cache_size),
             _SimilarityVectorIndex(index),
             lambda doc_id: table.get(str(doc_id), {}),
             strict=strict,
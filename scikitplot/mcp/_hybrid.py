@@ -28,13 +28,29 @@ normalisation is brittle. RRF ignores raw scores and fuses by *rank*:
 ``score(d) = Σ_legs weight_leg / (rrf_k + rank_leg(d))``. It is parameter-light
 (``rrf_k≈60``), robust to one leg being miscalibrated, and a documented standard
 for hybrid search. A document found by several legs is naturally boosted.
+
+Concurrent legs
+---------------
+By default legs run one after another, so end-to-end latency is the *sum* of
+the leg latencies. With ``concurrent=True`` every leg is submitted to a small
+thread pool owned by the retriever and latency becomes that of the slowest
+leg. The pool has one worker per leg for each of ``max_concurrent_queries``
+simultaneous searches, so concurrent queries do not queue behind each other's
+legs. ``leg_timeout`` additionally bounds it: a leg that has not returned by its
+deadline is dropped from fusion (and counted), and whatever did return is fused
+as usual. Per-leg call, failure, timeout and latency counters are available
+from :meth:`HybridRetriever.leg_stats`.
 """
 
 from __future__ import annotations
 
 import logging
 import math
+import threading
+import time
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as _FutureTimeout
 from dataclasses import replace
 from typing import Any, Callable, Sequence
 
@@ -128,6 +144,38 @@ def _metadata_richness(chunk: RetrievedChunk) -> tuple[int, int, int, int]:
     )
 
 
+class _LegCounters:
+    """Mutable per-leg counters; guarded by the owning retriever's lock."""
+
+    __slots__ = ("calls", "failures", "last_latency", "timeouts", "total_latency")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.last_latency = 0.0
+        self.total_latency = 0.0
+
+
+def _run_leg(
+    index: int,
+    retriever: DocsRetriever,
+    query: str,
+    per_leg: int,
+) -> tuple[list[RetrievedChunk], float]:
+    """Run one leg; return its deduplicated hits and wall time in seconds."""
+    started = time.perf_counter()
+    raw_hits = retriever.search(query, per_leg) or []
+    if not isinstance(raw_hits, list):
+        raw_hits = list(raw_hits)
+    invalid = [hit for hit in raw_hits if not isinstance(hit, RetrievedChunk)]
+    if invalid:
+        raise TypeError(
+            f"retriever leg {index} returned {len(invalid)} non-RetrievedChunk item(s)"
+        )
+    return _deduplicate(raw_hits), time.perf_counter() - started
+
+
 class HybridRetriever(DocsRetriever):
     """
     Fuse several retrievers into one via Reciprocal Rank Fusion.
@@ -145,12 +193,35 @@ class HybridRetriever(DocsRetriever):
         fusion has depth to work with (default ``4``).
     strict : bool, optional
         False.
+    concurrent : bool, optional
+        Run the legs in parallel on a private thread pool instead of one after
+        another (default ``False``).
+    leg_timeout : float or sequence of float, optional
+        Deadline in seconds, measured from the start of the query, after which
+        a leg's result is no longer waited for; one value for all legs or one
+        per leg. Requires ``concurrent=True``. ``None`` waits for every leg.
+
+        .. versionadded:: 0.5
+    max_concurrent_queries : int, optional
+        Number of searches expected to run at the same time (default ``4``,
+        the default ``max_concurrency`` of
+        :class:`~scikitplot.mcp._server.SearchService`). The leg pool holds
+        ``len(retrievers) * max_concurrent_queries`` threads; more
+        simultaneous searches than this queue for workers, and the queue
+        wait counts against ``leg_timeout``.
+
+        .. versionadded:: 0.5
 
     Notes
     -----
     Resilient: a leg that raises is skipped, not fatal — one broken backend must
     not take down retrieval. Read-only; results are sanitised downstream by
     :func:`~scikitplot.mcp._core.build_search_docs_result`.
+
+    A timed-out leg cannot be interrupted; it finishes in the background and
+    its result is discarded. Its worker stays busy until then, so a
+    persistently hung backend should be fixed or removed rather than left to
+    time out on every query. Call :meth:`close` to release the pool.
     """
 
     def __init__(
@@ -161,6 +232,9 @@ class HybridRetriever(DocsRetriever):
         rrf_k: int = DEFAULT_RRF_K,
         fanout: int = 4,
         strict: bool = False,
+        concurrent: bool = False,
+        leg_timeout: float | Sequence[float] | None = None,
+        max_concurrent_queries: int = 4,
     ) -> None:
         self._retrievers = list(retrievers)
         if not self._retrievers:
@@ -185,6 +259,145 @@ class HybridRetriever(DocsRetriever):
         self._fanout = max(1, min(int(fanout), 20))
         self._strict = bool(strict)
 
+        self._concurrent = bool(concurrent)
+        self._leg_timeouts = self._resolve_timeouts(leg_timeout)
+        if not self._concurrent and any(t is not None for t in self._leg_timeouts):
+            raise ValueError("leg_timeout requires concurrent=True")
+        if isinstance(max_concurrent_queries, bool) or not isinstance(
+            max_concurrent_queries, int
+        ):
+            raise TypeError("max_concurrent_queries must be an integer")
+        if not 1 <= max_concurrent_queries <= 128:  # ruff: ignore[magic-value-comparison]
+            raise ValueError("max_concurrent_queries must be between 1 and 128")
+        self._max_concurrent_queries = max_concurrent_queries
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._counters = [_LegCounters() for _ in self._retrievers]
+
+    def _resolve_timeouts(
+        self, leg_timeout: float | Sequence[float] | None
+    ) -> list[float | None]:
+        n_legs = len(self._retrievers)
+        if leg_timeout is None:
+            return [None] * n_legs
+        if isinstance(leg_timeout, (int, float)) and not isinstance(leg_timeout, bool):
+            values = [float(leg_timeout)] * n_legs
+        else:
+            values = [float(value) for value in leg_timeout]
+            if len(values) != n_legs:
+                raise ValueError("leg_timeout length must match retrievers length")
+        if any(not math.isfinite(value) or value <= 0 for value in values):
+            raise ValueError("leg_timeout must be finite and positive")
+        return list(values)
+
+    # ------------------------------------------------------------------
+    # Leg execution
+    # ------------------------------------------------------------------
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self._retrievers)
+                    * self._max_concurrent_queries,
+                    thread_name_prefix="skplt-hybrid-leg",
+                )
+            return self._executor
+
+    def _record(
+        self,
+        index: int,
+        *,
+        latency: float | None = None,
+        failed: bool = False,
+        timed_out: bool = False,
+    ) -> None:
+        with self._lock:
+            counters = self._counters[index]
+            counters.calls += 1
+            counters.failures += int(failed)
+            counters.timeouts += int(timed_out)
+            if latency is not None:
+                counters.last_latency = latency
+                counters.total_latency += latency
+
+    def _log_failed_leg(self, index: int, exc: BaseException) -> None:
+        """Log a failed leg (with traceback in strict mode)."""
+        _LOG.warning(
+            "MCP retrieval leg %s (%s) failed and was skipped: %s",
+            index,
+            type(self._retrievers[index]).__name__,
+            exc,
+            exc_info=self._strict,
+        )
+
+    def _gather_sequential(
+        self, legs: list[int], query: str, per_leg: int
+    ) -> dict[int, list[RetrievedChunk]]:
+        results: dict[int, list[RetrievedChunk]] = {}
+        for index in legs:
+            try:
+                hits, latency = _run_leg(
+                    index, self._retrievers[index], query, per_leg
+                )
+            except Exception as exc:  # resilience boundary
+                self._record(index, failed=True)
+                self._log_failed_leg(index, exc)
+                if self._strict:
+                    raise
+                continue
+            self._record(index, latency=latency)
+            results[index] = hits
+        return results
+
+    def _gather_concurrent(
+        self, legs: list[int], query: str, per_leg: int
+    ) -> dict[int, list[RetrievedChunk]]:
+        pool = self._pool()
+        started = time.monotonic()
+        futures: dict[int, Future] = {
+            index: pool.submit(_run_leg, index, self._retrievers[index], query, per_leg)
+            for index in legs
+        }
+        results: dict[int, list[RetrievedChunk]] = {}
+        # Collected in leg order so fusion tie-breaking matches sequential mode;
+        # the legs themselves are already running in parallel.
+        for index, future in futures.items():
+            budget = self._leg_timeouts[index]
+            remaining = None
+            if budget is not None:
+                remaining = max(0.0, started + budget - time.monotonic())
+            try:
+                hits, latency = future.result(timeout=remaining)
+            except _FutureTimeout:
+                future.cancel()
+                self._record(index, timed_out=True)
+                _LOG.warning(
+                    "MCP retrieval leg %s (%s) exceeded its %.3fs deadline and "
+                    "was skipped",
+                    index,
+                    type(self._retrievers[index]).__name__,
+                    budget,
+                )
+                if self._strict:
+                    raise TimeoutError(
+                        f"retriever leg {index} exceeded its {budget}s deadline"
+                    ) from None
+                continue
+            except Exception as exc:  # resilience boundary
+                self._record(index, failed=True)
+                self._log_failed_leg(index, exc)
+                if self._strict:
+                    raise
+                continue
+            self._record(index, latency=latency)
+            results[index] = hits
+        return results
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
     def search(self, query: str, k: int = 5) -> list[RetrievedChunk]:
         """Query every leg, fuse by RRF, and return the top-``k`` fused chunks."""
         if not isinstance(query, str) or not query.strip():
@@ -193,41 +406,22 @@ class HybridRetriever(DocsRetriever):
         k = max(1, min(int(k), _MAX_RETRIEVAL_K))
         per_leg = min(_MAX_RETRIEVAL_K, max(k, self._fanout * k))
 
+        legs = [index for index, weight in enumerate(self._weights) if weight != 0]
+        if self._concurrent and len(legs) > 1:
+            leg_hits = self._gather_concurrent(legs, query, per_leg)
+        else:
+            leg_hits = self._gather_sequential(legs, query, per_leg)
+
         ranked_lists: list[tuple[float, list[RetrievedChunk]]] = []
         best_chunk: dict[str, RetrievedChunk] = {}
         first_seen: dict[str, int] = {}
         sequence = 0
 
-        for index, (retriever, weight) in enumerate(
-            zip(self._retrievers, self._weights)
-        ):
-            if weight == 0:
+        for index in legs:
+            hits = leg_hits.get(index)
+            if hits is None:
                 continue
-            try:
-                raw_hits = retriever.search(query, per_leg) or []
-                if not isinstance(raw_hits, list):
-                    raw_hits = list(raw_hits)
-                invalid = [
-                    hit for hit in raw_hits if not isinstance(hit, RetrievedChunk)
-                ]
-                if invalid:
-                    raise TypeError(
-                        f"retriever leg {index} returned {len(invalid)} non-RetrievedChunk item(s)"
-                    )
-                hits = _deduplicate(raw_hits)
-            except Exception as exc:  # resilience boundary
-                _LOG.warning(
-                    "MCP retrieval leg %s (%s) failed and was skipped: %s",
-                    index,
-                    type(retriever).__name__,
-                    exc,
-                    exc_info=self._strict,
-                )
-                if self._strict:
-                    raise
-                continue
-
-            ranked_lists.append((weight, hits))
+            ranked_lists.append((self._weights[index], hits))
             for hit in hits:
                 identity = _chunk_key(hit)
                 if identity not in first_seen:
@@ -250,6 +444,45 @@ class HybridRetriever(DocsRetriever):
             if identity in best_chunk
         ]
 
+    def leg_stats(self) -> list[dict[str, Any]]:
+        """
+        Per-leg execution counters since construction.
+
+        Returns
+        -------
+        list of dict
+            One entry per leg, in construction order, with ``leg`` (index),
+            ``retriever`` (class name), ``calls``, ``failures``, ``timeouts``,
+            ``last_latency_s`` and ``mean_latency_s`` (over completed calls).
+        """
+        with self._lock:
+            stats = []
+            for index, (retriever, counters) in enumerate(
+                zip(self._retrievers, self._counters)
+            ):
+                completed = counters.calls - counters.failures - counters.timeouts
+                stats.append(
+                    {
+                        "leg": index,
+                        "retriever": type(retriever).__name__,
+                        "calls": counters.calls,
+                        "failures": counters.failures,
+                        "timeouts": counters.timeouts,
+                        "last_latency_s": counters.last_latency,
+                        "mean_latency_s": (
+                            counters.total_latency / completed if completed else 0.0
+                        ),
+                    }
+                )
+            return stats
+
+    def close(self) -> None:
+        """Shut down the leg thread pool (a later search starts a new one)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
 
 class Bm25Retriever(DocsRetriever):
     """
@@ -11,7 +11,8 @@ from __future__ import annotations
 import logging
 import re
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Hashable
 from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr, model_validator
@@ -21,6 +22,8 @@ from ._core import (
     MAX_RESULTS,
     DocsRetriever,
     RetrievedChunk,
+    _clean_text,
+    _LruCache,
     build_search_docs_result,
 )
 from ._version import __version__
@@ -35,6 +38,8 @@ __all__ = [
 _LOG = logging.getLogger(__name__)
 _DOC_ID_RE = re.compile(r"\A[A-Za-z0-9._:-]{1,200}\Z")
 _MAX_RESOURCE_CHARS = 20_000
+_MAX_CACHE_SIZE = 65_536
+_MAX_QUEUE = 4_096
 
 
 class _ClosedModel(BaseModel):
@@ -94,8 +99,72 @@ class SearchDocsOutput(_ClosedModel):
         return self
 
 
+class _Flight:
+    """One in-flight retrieval that identical concurrent queries wait on."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: SearchDocsOutput | None = None
+        self.error: BaseException | None = None
+
+
+def _check_number(name: str, value: Any, *, allow_none: bool = False) -> None:
+    if value is None and allow_none:
+        return
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"{name} must be a number")
+    if value < 0:
+        raise ValueError(f"{name} must be non-negative")
+
+
+def _check_count(name: str, value: Any, upper: int) -> None:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"{name} must be an integer")
+    if not 0 <= value <= upper:
+        raise ValueError(f"{name} must be between 0 and {upper}")
+
+
 class SearchService:
-    """Validated, bounded orchestration independent from the MCP SDK itself."""
+    """Validated, bounded orchestration independent from the MCP SDK itself.
+
+    Parameters
+    ----------
+    retriever : DocsRetriever
+        Backend queried on a cache miss.
+    max_concurrency : int, optional
+        Retrievals allowed to run at once.
+    acquire_timeout_seconds : float, optional
+        Fail-fast grace period for a free slot when ``max_queue`` is ``0``.
+    cache_size : int, optional
+        Entries in the TTL+LRU result cache keyed on the whitespace-normalised
+        query and ``k``. ``0`` (default) disables result caching.
+    cache_ttl_seconds : float or None, optional
+        Lifetime of a cached result; ``None`` keeps it until evicted.
+    generation : callable or None, optional
+        Zero-argument callable returning a hashable index generation. When
+        the returned value changes the result cache is dropped. Defaults to
+        the retriever's ``generation`` attribute (called if callable), when
+        it has one; otherwise the cache is only invalidated by TTL, eviction
+        or :meth:`invalidate`.
+    max_queue : int, optional
+        Requests allowed to wait for a slot once all slots are busy. ``0``
+        (default) keeps fail-fast admission; a positive value turns bursts
+        into a bounded wait queue and only rejects when the queue is full.
+    queue_timeout_seconds : float, optional
+        Longest a queued request waits for a slot, and a coalesced request
+        for the in-flight retrieval it shares, before being rejected.
+
+    Notes
+    -----
+    Identical queries that arrive while the same retrieval is in flight are
+    coalesced (single-flight): they wait for the first one and share its
+    result, or its error, without taking a slot. That wait is bounded by
+    ``queue_timeout_seconds``; on expiry the request fails with the same
+    "busy" error as a rejected one. Counters are available from
+    :meth:`stats`.
+    """
 
     def __init__(
         self,
@@ -103,6 +172,11 @@ class SearchService:
         *,
         max_concurrency: int = 4,
         acquire_timeout_seconds: float = 0.05,
+        cache_size: int = 0,
+        cache_ttl_seconds: float | None = 300.0,
+        generation: Callable[[], Hashable] | None = None,
+        max_queue: int = 0,
+        queue_timeout_seconds: float = 5.0,
     ) -> None:
         if not isinstance(retriever, DocsRetriever):
             raise TypeError("retriever must implement DocsRetriever.search(query, k)")
@@ -110,15 +184,32 @@ class SearchService:
             raise TypeError("max_concurrency must be an integer")
         if not 1 <= max_concurrency <= 128:  # ruff: ignore[magic-value-comparison]
             raise ValueError("max_concurrency must be between 1 and 128")
-        if isinstance(acquire_timeout_seconds, bool) or not isinstance(
-            acquire_timeout_seconds, (int, float)
-        ):
-            raise TypeError("acquire_timeout_seconds must be a number")
-        if acquire_timeout_seconds < 0:
-            raise ValueError("acquire_timeout_seconds must be non-negative")
+        _check_number("acquire_timeout_seconds", acquire_timeout_seconds)
+        _check_count("cache_size", cache_size, _MAX_CACHE_SIZE)
+        _check_number("cache_ttl_seconds", cache_ttl_seconds, allow_none=True)
+        _check_count("max_queue", max_queue, _MAX_QUEUE)
+        _check_number("queue_timeout_seconds", queue_timeout_seconds)
+        if generation is None:
+            generation = getattr(retriever, "generation", None)
+        if generation is not None and not callable(generation):
+            # A plain attribute is re-read on every call so updates are seen.
+            generation = lambda: getattr(retriever, "generation", None)  # noqa: E731
         self._retriever = retriever
         self._slots = threading.BoundedSemaphore(max_concurrency)
         self._acquire_timeout = float(acquire_timeout_seconds)
+        self._cache = _LruCache(cache_size, cache_ttl_seconds)
+        self._generation = generation
+        self._cached_generation: Hashable = None
+        self._max_queue = max_queue
+        self._queue_timeout = float(queue_timeout_seconds)
+        self._lock = threading.Lock()
+        self._flights: dict[tuple[Hashable, str, int], _Flight] = {}
+        self._waiting = 0
+        self._coalesced = 0
+        self._queued = 0
+        self._rejected = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
 
     def search(self, query: str, k: int = 5) -> SearchDocsOutput:
         if not isinstance(query, str):
@@ -138,8 +229,126 @@ class SearchService:
         if not 1 <= limit <= MAX_RESULTS:
             raise ValueError(f"k must be between 1 and {MAX_RESULTS}")
 
-        if not self._slots.acquire(timeout=self._acquire_timeout):
+        key = (self._current_generation(), " ".join(clean_query.split()), limit)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._for_query(cached, clean_query)
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._coalesced += 1
+        if not leader:
+            return self._follow(flight, clean_query)
+
+        try:
+            output = self._retrieve(clean_query, limit)
+            self._cache.put(key, output)
+            flight.result = output
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return self._for_query(output, clean_query)
+
+    def _follow(self, flight: _Flight, clean_query: str) -> SearchDocsOutput:
+        """Share the result (or error) of an identical in-flight retrieval."""
+        # Bounded like a queued request: a hung retrieval must not pin an
+        # unlimited number of identical callers forever.
+        if not flight.done.wait(self._queue_timeout):
+            with self._lock:
+                self._rejected += 1
+            raise RuntimeError("search service is busy; retry shortly")
+        if flight.error is not None:
+            raise flight.error
+        return self._for_query(flight.result, clean_query)
+
+    def invalidate(self) -> None:
+        """Drop every cached result (e.g. after rebuilding the index in place)."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Cache, coalescing and admission counters since construction.
+
+        Returns
+        -------
+        dict
+            ``cache_hits``, ``cache_misses``, ``cache_entries``,
+            ``coalesced`` (requests served by another in-flight retrieval),
+            ``queued`` (requests that had to wait for a slot), ``rejected``
+            (busy errors), ``queue_depth`` (currently waiting),
+            ``queue_wait_total_s``, ``queue_wait_max_s`` and
+            ``queue_wait_mean_s``.
+        """
+        with self._lock:
+            return {
+                "cache_hits": self._cache.hits,
+                "cache_misses": self._cache.misses,
+                "cache_entries": len(self._cache),
+                "coalesced": self._coalesced,
+                "queued": self._queued,
+                "rejected": self._rejected,
+                "queue_depth": self._waiting,
+                "queue_wait_total_s": self._queue_wait_total,
+                "queue_wait_max_s": self._queue_wait_max,
+                "queue_wait_mean_s": (
+                    self._queue_wait_total / self._queued if self._queued else 0.0
+                ),
+            }
+
+    def _current_generation(self) -> Hashable:
+        if self._generation is None:
+            return None
+        try:
+            current = self._generation()
+            hash(current)
+        except Exception:  # resilience boundary  # ruff: ignore[blind-except]
+            _LOG.exception("index generation lookup failed; bypassing result cache")
+            self._cache.clear()
+            return object()
+        with self._lock:
+            if current != self._cached_generation:
+                self._cache.clear()
+                self._cached_generation = current
+        return current
+
+    def _acquire_slot(self) -> None:
+        if self._slots.acquire(blocking=False):
+            return
+        if self._max_queue == 0:
+            if self._slots.acquire(timeout=self._acquire_timeout):
+                return
+            with self._lock:
+                self._rejected += 1
             raise RuntimeError("search service is busy; retry shortly")
+
+        with self._lock:
+            if self._waiting >= self._max_queue:
+                self._rejected += 1
+                raise RuntimeError("search service is busy; retry shortly")
+            self._waiting += 1
+        started = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self._queue_timeout)
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._waiting -= 1
+            self._queued += 1
+            self._queue_wait_total += waited
+            self._queue_wait_max = max(self._queue_wait_max, waited)
+            if not acquired:
+                self._rejected += 1
+        if not acquired:
+            raise RuntimeError("search service is busy; retry shortly")
+
+    def _retrieve(self, clean_query: str, limit: int) -> SearchDocsOutput:
+        self._acquire_slot()
         try:
             try:
                 chunks = self._retriever.search(clean_query, limit)
@@ -165,6 +374,13 @@ class SearchService:
             security=SecurityOutput.model_validate(structured["security"]),
         )
 
+    @staticmethod
+    def _for_query(output: SearchDocsOutput, clean_query: str) -> SearchDocsOutput:
+        # Callers get their own copy, echoing their own spelling of the query
+        # sanitised exactly as build_search_docs_result does.
+        echo = _clean_text(clean_query, MAX_QUERY_CHARS).strip()
+        return output.model_copy(update={"query": echo}, deep=True)
+
 
 def _forbid_unknown_tool_arguments(server: Any, tool_name: str) -> None:
     """Close one MCP SDK-generated tool argument model.
@@ -227,6 +443,10 @@ def create_server(
     *,
     document_reader: Callable[[str], RetrievedChunk | None] | None = None,
     max_concurrency: int = 4,
+    cache_size: int = 0,
+    cache_ttl_seconds: float | None = 300.0,
+    max_queue: int = 0,
+    queue_timeout_seconds: float = 5.0,
     version: str = __version__,
     log_level: str = "INFO",
     health_path: str | None = "/healthz",
@@ -234,7 +454,8 @@ def create_server(
     """Create an official MCP Python SDK v2 ``MCPServer`` instance.
 
     Importing :mod:`scikitplot.mcp` remains SDK-independent; the optional MCP
-    dependency is imported only when this factory is called.
+    dependency is imported only when this factory is called. The cache and
+    queue options are forwarded to :class:`SearchService`.
     """
     try:
         from mcp.server import (  # ruff: ignore[import-outside-top-level] # type: ignore[]
@@ -246,7 +467,14 @@ def create_server(
             'MCP SDK v2 is required for the server layer; install with "pip install mcp>=2,<3".'
         ) from exc
 
-    service = SearchService(retriever, max_concurrency=max_concurrency)
+    service = SearchService(
+        retriever,
+        max_concurrency=max_concurrency,
+        cache_size=cache_size,
+        cache_ttl_seconds=cache_ttl_seconds,
+        max_queue=max_queue,
+        queue_timeout_seconds=queue_timeout_seconds,
+    )
     mcp = MCPServer(
         "scikitplot-docs",
         title="scikit-plots documentation retrieval",
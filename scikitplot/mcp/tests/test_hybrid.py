@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import builtins
 import sys
+import threading
+import time
 import types
 from pathlib import Path
 
@@ -240,3 +242,130 @@ def test_bm25_strict_mode_reraises_backend_failure():
     retriever = Bm25Retriever(fail, lambda _doc_id: {}, strict=True)
     with pytest.raises(OSError, match="database unavailable"):
         retriever.search("q", k=1)
+
+
+# ── Concurrent legs, deadlines and stats ─────────────────────────────────────
+class _Slow:
+    def __init__(self, chunks, delay, gate=None):
+        self._c = chunks
+        self._delay = delay
+        self._gate = gate
+
+    def search(self, query, k=5):
+        if self._gate is not None:
+            self._gate.wait(self._delay)
+        else:
+            time.sleep(self._delay)
+        return self._c[:k]
+
+
+def test_hybrid_concurrent_matches_sequential():
+    legs = [
+        _Fixed([_chunk("A"), _chunk("B"), _chunk("C")]),
+        _Fixed([_chunk("C"), _chunk("A"), _chunk("D")]),
+        _Boom(),
+    ]
+    sequential = HybridRetriever(legs, weights=[1.0, 2.0, 1.0])
+    parallel = HybridRetriever(legs, weights=[1.0, 2.0, 1.0], concurrent=True)
+    try:
+        assert parallel.search("q", k=4) == sequential.search("q", k=4)
+    finally:
+        parallel.close()
+
+
+def test_hybrid_concurrent_latency_bounded_by_slowest_leg():
+    legs = [_Slow([_chunk(f"L{i}")], 0.2) for i in range(3)]
+    retriever = HybridRetriever(legs, concurrent=True)
+    try:
+        started = time.perf_counter()
+        out = retriever.search("q", k=3)
+        elapsed = time.perf_counter() - started
+    finally:
+        retriever.close()
+    assert {c.doc_id for c in out} == {"L0", "L1", "L2"}
+    assert elapsed < 0.5
+
+
+def test_hybrid_leg_timeout_fuses_what_returned():
+    gate = threading.Event()
+    slow = _Slow([_chunk("SLOW")], 5.0, gate=gate)
+    fast = _Fixed([_chunk("A"), _chunk("B")])
+    retriever = HybridRetriever([slow, fast], concurrent=True, leg_timeout=0.1)
+    try:
+        started = time.perf_counter()
+        out = retriever.search("q", k=3)
+        assert time.perf_counter() - started < 1.0
+    finally:
+        gate.set()
+        retriever.close()
+    assert [c.doc_id for c in out] == ["A", "B"]
+    stats = retriever.leg_stats()
+    assert stats[0]["timeouts"] == 1 and stats[0]["calls"] == 1
+    assert stats[1]["timeouts"] == 0 and stats[1]["last_latency_s"] >= 0.0
+
+
+def test_hybrid_leg_timeout_strict_raises():
+    gate = threading.Event()
+    retriever = HybridRetriever(
+        [_Slow([_chunk("S")], 5.0, gate=gate), _Fixed([_chunk("A")])],
+        concurrent=True,
+        leg_timeout=[0.05, 5.0],
+        strict=True,
+    )
+    try:
+        with pytest.raises(TimeoutError, match="leg 0"):
+            retriever.search("q", k=1)
+    finally:
+        gate.set()
+        retriever.close()
+
+
+def test_hybrid_concurrent_searches_do_not_queue_behind_each_other():
+    legs = [_Slow([_chunk(f"L{i}")], 0.2) for i in range(2)]
+    retriever = HybridRetriever(legs, concurrent=True, leg_timeout=0.3)
+    outputs = [None] * 4
+
+    def _search(slot):
+        outputs[slot] = retriever.search("q", k=2)
+
+    threads = [threading.Thread(target=_search, args=(i,)) for i in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        retriever.close()
+    assert all({c.doc_id for c in out} == {"L0", "L1"} for out in outputs)
+    assert all(leg["timeouts"] == 0 for leg in retriever.leg_stats())
+
+
+def test_hybrid_rejects_invalid_max_concurrent_queries():
+    with pytest.raises(ValueError, match="max_concurrent_queries"):
+        HybridRetriever([_Fixed([])], max_concurrent_queries=0)
+    with pytest.raises(TypeError, match="max_concurrent_queries"):
+        HybridRetriever([_Fixed([])], max_concurrent_queries=2.0)
+
+
+def test_hybrid_leg_stats_count_failures():
+    retriever = HybridRetriever([_Boom(), _Fixed([_chunk("A")])])
+    retriever.search("q", k=1)
+    retriever.search("q", k=1)
+    boom, good = retriever.leg_stats()
+    assert (boom["calls"], boom["failures"]) == (2, 2)
+    assert (good["calls"], good["failures"], good["timeouts"]) == (2, 0, 0)
+    assert good["retriever"] == "_Fixed"
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"leg_timeout": 1.0},
+        {"concurrent": True, "leg_timeout": 0.0},
+        {"concurrent": True, "leg_timeout": [1.0]},
+        {"concurrent": True, "leg_timeout": float("inf")},
+    ],
+)
+def test_hybrid_rejects_invalid_leg_timeout(kwargs):
+    with pytest.raises(ValueError, match="leg_timeout"):
+        HybridRetriever([_Fixed([]), _Fixed([])], **kwargs)
@@ -265,6 +265,29 @@ def test_from_corpus_annoy_uses_current_corpus_api(monkeypatch, tmp_path):
     assert hits[0].anchor == "section-1"
 
 
+def test_corpus_embedder_caches_repeated_queries():
+    from scikitplot.mcp._corpus_annoy import _CorpusEmbedder
+
+    class CountingEngine:
+        calls = 0
+
+        def embed(self, texts):
+            CountingEngine.calls += 1
+            return [[float(len(texts[0])), 1.0]]
+
+    embedder = _CorpusEmbedder(CountingEngine(), cache_size=1)
+    assert embedder.embed("roc") == embedder.embed("roc") == [3.0, 1.0]
+    assert CountingEngine.calls == 1
+    embedder.embed("lift")
+    embedder.embed("roc")  # evicted by "lift"
+    assert CountingEngine.calls == 3
+
+    uncached = _CorpusEmbedder(CountingEngine(), cache_size=0)
+    uncached.embed("roc")
+    uncached.embed("roc")
+    assert CountingEngine.calls == 5
+
+
 def test_from_corpus_annoy_raises_when_build_has_no_index(monkeypatch, tmp_path):
     """A successful corpus import without a dense index remains actionable."""
 
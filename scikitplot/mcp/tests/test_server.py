@@ -7,6 +7,8 @@ import asyncio
 import inspect
 import json
 import sys
+import threading
+import time
 import types
 from pathlib import Path
 from typing import get_type_hints
@@ -269,3 +271,144 @@ def test_output_models_reject_unknown_fields():
     payload["unexpected"] = "value"
     with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
         SearchDocsOutput.model_validate(payload)
+
+
+class _CountingRetriever:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+        self.generation = 0
+        self._lock = threading.Lock()
+
+    def search(self, query, k=5):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return builtin_demo_retriever().search(query, k)
+
+
+def test_search_service_result_cache_normalises_query():
+    retriever = _CountingRetriever()
+    service = SearchService(retriever, cache_size=8)
+    first = service.search("transport", 2)
+    second = service.search("  transport ", 2)
+    assert retriever.calls == 1
+    assert second.model_dump() == first.model_dump()
+    assert second is not first
+
+    service.search("transport", 3)
+    assert retriever.calls == 2
+    assert service.stats()["cache_hits"] == 1
+
+
+def test_search_service_cache_invalidated_by_generation_and_ttl():
+    retriever = _CountingRetriever()
+    service = SearchService(retriever, cache_size=8)
+    service.search("transport", 2)
+    retriever.generation = 1
+    service.search("transport", 2)
+    assert retriever.calls == 2
+    service.invalidate()
+    service.search("transport", 2)
+    assert retriever.calls == 3
+
+    expiring = SearchService(retriever, cache_size=8, cache_ttl_seconds=0)
+    expiring.search("transport", 2)
+    time.sleep(0.01)
+    expiring.search("transport", 2)
+    assert retriever.calls == 5
+
+
+def test_search_service_coalesces_identical_in_flight_queries():
+    retriever = _CountingRetriever(delay=0.2)
+    service = SearchService(retriever, max_concurrency=1)
+    results = []
+
+    def worker():
+        results.append(service.search("transport", 2).model_dump())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert retriever.calls == 1
+    assert len(results) == 4 and all(item == results[0] for item in results)
+    assert service.stats()["coalesced"] == 3
+
+
+def test_search_service_coalesced_wait_is_bounded():
+    retriever = _CountingRetriever(delay=0.5)
+    service = SearchService(retriever, max_concurrency=2, queue_timeout_seconds=0.05)
+    errors = []
+
+    def follower():
+        try:
+            service.search("transport", 2)
+        except RuntimeError as exc:
+            errors.append(str(exc))
+
+    leader = threading.Thread(target=service.search, args=("transport", 2))
+    leader.start()
+    while not service._flights:
+        time.sleep(0.005)
+    followers = [threading.Thread(target=follower) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    for thread in followers:
+        thread.join(timeout=2)
+    leader.join()
+
+    assert not any(thread.is_alive() for thread in followers)
+    assert errors == ["search service is busy; retry shortly"] * 3
+    assert retriever.calls == 1
+    assert service.stats()["rejected"] == 3
+
+
+def test_search_service_bounded_queue_waits_then_rejects():
+    retriever = _CountingRetriever(delay=0.2)
+    fail_fast = SearchService(retriever, max_concurrency=1)
+    queued = SearchService(retriever, max_concurrency=1, max_queue=1)
+    errors = []
+
+    def worker(service, query):
+        try:
+            service.search(query, 1)
+        except RuntimeError as exc:
+            errors.append((service, str(exc)))
+
+    for service in (fail_fast, queued):
+        threads = [
+            threading.Thread(target=worker, args=(service, query))
+            for query in ("transport", "stdio", "http")
+        ]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.02)
+        for thread in threads:
+            thread.join()
+
+    assert [msg for owner, msg in errors if owner is fail_fast] == [
+        "search service is busy; retry shortly"
+    ] * 2
+    assert len([owner for owner, _ in errors if owner is queued]) == 1
+    stats = queued.stats()
+    assert stats["queued"] == 1 and stats["rejected"] == 1
+    assert stats["queue_wait_max_s"] > 0.0
+    assert stats["queue_depth"] == 0
+
+
+@pytest.mark.parametrize(
+    ("name", "bad", "error"),
+    [
+        ("cache_size", -1, ValueError),
+        ("cache_size", 1.0, TypeError),
+        ("max_queue", True, TypeError),
+        ("cache_ttl_seconds", -1.0, ValueError),
+        ("queue_timeout_seconds", "1", TypeError),
+    ],
+)
+def test_search_service_rejects_bad_cache_and_queue_options(name, bad, error):
+    with pytest.raises(error, match=name):
+        SearchService(builtin_demo_retriever(), **{name: bad})
@@ -29,12 +29,18 @@ This module is not a file I/O or parsing interface and does not eagerly copy
 file contents into memory. It is intended for efficient random access to large,
 stable binary data stored on disk with explicit and deterministic lifetime
 management.
+
+:class:`SharedArray` and :class:`SharedArrayManager` build on the same
+mappings to share large NumPy arrays between worker processes without
+serialisation copies: pickling a handle transfers only the segment name.
 """
 
 from __future__ import annotations
 
-from . import _memmap
+from . import _memmap, _shared
 from ._memmap import *  # noqa: F403
+from ._shared import *  # noqa: F403
 
 __all__ = []
 __all__ += _memmap.__all__
+__all__ += _shared.__all__
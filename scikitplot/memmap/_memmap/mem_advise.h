@@ -0,0 +1,168 @@
+// scikitplot/memmap/_memmap/mem_advise.h
+//
+// Authors: The scikit-plots developers
+// SPDX-License-Identifier: BSD-3-Clause
+
+/*
+ * Portable access-pattern hints for mem_map.pyx.
+ *
+ * Exposes a small C API on top of madvise()/mincore() with *portable*
+ * advice codes (the Linux numeric values, which are what mem_map.pyx
+ * publishes as PY_MADV_*).  Each platform translates them to its native
+ * constant; hints with no native equivalent fail with errno = ENOSYS so the
+ * caller can decide whether to ignore them.
+ *
+ *   skplt_madvise(addr, len, advice)   -> 0 / -1 + errno
+ *   skplt_mincore(addr, len, vec)      -> 0 / -1 + errno (1 byte per page,
+ *                                         bit 0 set when resident)
+ *   SKPLT_NATIVE_MAP_POPULATE          -> native MAP_POPULATE or 0
+ *   SKPLT_NATIVE_MAP_HUGETLB           -> native MAP_HUGETLB or 0
+ *
+ * Windows: WILLNEED uses PrefetchVirtualMemory (Windows 8+, resolved at run
+ * time so older systems still load the module); DONTNEED trims the range
+ * from the working set; NORMAL/RANDOM/SEQUENTIAL are accepted as no-ops
+ * (hints are advisory); huge pages and mincore are unsupported.
+ */
+
+#ifndef SKPLT_MEM_ADVISE_H
+#define SKPLT_MEM_ADVISE_H
+
+#include <stddef.h>
+#include <errno.h>
+
+#ifndef ENOSYS
+#define ENOSYS 38
+#endif
+
+/* Portable advice codes (== Linux values). */
+#define SKPLT_ADV_NORMAL      0
+#define SKPLT_ADV_RANDOM      1
+#define SKPLT_ADV_SEQUENTIAL  2
+#define SKPLT_ADV_WILLNEED    3
+#define SKPLT_ADV_DONTNEED    4
+#define SKPLT_ADV_HUGEPAGE    14
+#define SKPLT_ADV_NOHUGEPAGE  15
+
+#if defined(_WIN32) || defined(_WIN64)
+
+/* ============================== Windows ============================== */
+
+#include <windows.h>
+
+#define SKPLT_NATIVE_MAP_POPULATE 0
+#define SKPLT_NATIVE_MAP_HUGETLB  0
+
+typedef struct {
+    PVOID  VirtualAddress;
+    SIZE_T NumberOfBytes;
+} skplt_range_entry;
+
+typedef BOOL (WINAPI *skplt_prefetch_fn)(HANDLE, ULONG_PTR, skplt_range_entry*, ULONG);
+
+static inline skplt_prefetch_fn skplt_resolve_prefetch(void) {
+    static skplt_prefetch_fn fn = NULL;
+    static int resolved = 0;
+    if (!resolved) {
+        HMODULE kernel = GetModuleHandleA("kernel32.dll");
+        fn = kernel ? (skplt_prefetch_fn)GetProcAddress(kernel, "PrefetchVirtualMemory") : NULL;
+        resolved = 1;
+    }
+    return fn;
+}
+
+static inline int skplt_madvise(void *addr, size_t len, int advice) {
+    switch (advice) {
+    case SKPLT_ADV_NORMAL:
+    case SKPLT_ADV_RANDOM:
+    case SKPLT_ADV_SEQUENTIAL:
+        return 0;
+    case SKPLT_ADV_WILLNEED: {
+        skplt_prefetch_fn fn = skplt_resolve_prefetch();
+        skplt_range_entry range;
+        if (fn == NULL) {
+            errno = ENOSYS;
+            return -1;
+        }
+        range.VirtualAddress = addr;
+        range.NumberOfBytes = len;
+        if (!fn(GetCurrentProcess(), 1, &range, 0)) {
+            errno = EINVAL;
+            return -1;
+        }
+        return 0;
+    }
+    case SKPLT_ADV_DONTNEED:
+        /* VirtualUnlock on unlocked pages removes them from the working set. */
+        if (VirtualUnlock(addr, len) || GetLastError() == ERROR_NOT_LOCKED)
+            return 0;
+        errno = EINVAL;
+        return -1;
+    default:
+        errno = ENOSYS;
+        return -1;
+    }
+}
+
+static inline int skplt_mincore(void *addr, size_t len, unsigned char *vec) {
+    (void)addr;
+    (void)len;
+    (void)vec;
+    errno = ENOSYS;
+    return -1;
+}
+
+#else
+
+/* ======================= POSIX (Linux/macOS/BSD) ====================== */
+
+#include <sys/mman.h>
+
+#ifdef MAP_POPULATE
+#define SKPLT_NATIVE_MAP_POPULATE MAP_POPULATE
+#else
+#define SKPLT_NATIVE_MAP_POPULATE 0
+#endif
+
+#ifdef MAP_HUGETLB
+#define SKPLT_NATIVE_MAP_HUGETLB MAP_HUGETLB
+#else
+#define SKPLT_NATIVE_MAP_HUGETLB 0
+#endif
+
+static inline int skplt_native_advice(int advice) {
+    switch (advice) {
+    case SKPLT_ADV_NORMAL:     return MADV_NORMAL;
+    case SKPLT_ADV_RANDOM:     return MADV_RANDOM;
+    case SKPLT_ADV_SEQUENTIAL: return MADV_SEQUENTIAL;
+    case SKPLT_ADV_WILLNEED:   return MADV_WILLNEED;
+    case SKPLT_ADV_DONTNEED:   return MADV_DONTNEED;
+#ifdef MADV_HUGEPAGE
+    case SKPLT_ADV_HUGEPAGE:   return MADV_HUGEPAGE;
+#endif
+#ifdef MADV_NOHUGEPAGE
+    case SKPLT_ADV_NOHUGEPAGE: return MADV_NOHUGEPAGE;
+#endif
+    default:                   return -1;
+    }
+}
+
+static inline int skplt_madvise(void *addr, size_t len, int advice) {
+    int native = skplt_native_advice(advice);
+    if (native < 0) {
+        errno = ENOSYS;
+        return -1;
+    }
+    return madvise(addr, len, native);
+}
+
+static inline int skplt_mincore(void *addr, size_t len, unsigned char *vec) {
+#if defined(__APPLE__) || defined(__FreeBSD__) || defined(__NetBSD__) || defined(__OpenBSD__)
+    return mincore(addr, len, (char *)vec);
+#else
+    return mincore(addr, len, vec);
+#endif
+}
+
+#endif  /* platform */
+
+#endif  /* SKPLT_MEM_ADVISE_H */
@@ -106,6 +106,14 @@ cdef extern from "../../cexternals/_annoy/src/mman.h" nogil:
     int mlock(void* addr, size_t length) nogil
     int munlock(void* addr, size_t length) nogil
 
+# Access-pattern hints (portable advice codes, see mem_advise.h)
+cdef extern from "mem_advise.h" nogil:
+    int SKPLT_NATIVE_MAP_POPULATE
+    int SKPLT_NATIVE_MAP_HUGETLB
+
+    int skplt_madvise(void* addr, size_t length, int advice) nogil
+    int skplt_mincore(void* addr, size_t length, unsigned char* vec) nogil
+
 # ===========================================================================
 # Version information
 # ===========================================================================
@@ -29,7 +29,8 @@ Notes for Maintainers
   against your consumer code before shipping.
 """
 
-from typing import Final, Optional
+from concurrent.futures import Future
+from typing import Final, NamedTuple, Optional, Union
 from types import TracebackType
 
 import numpy as np
@@ -75,6 +76,21 @@ MS_INVALIDATE: Final[int]
 
 FILE_MAP_EXECUTE: Final[int]
 
+# ===========================================================================
+# Population / Huge-Page Flags and Advice Values
+# ===========================================================================
+
+PY_MAP_POPULATE: Final[int]
+PY_MAP_HUGETLB: Final[int]
+
+PY_MADV_NORMAL: Final[int]
+PY_MADV_RANDOM: Final[int]
+PY_MADV_SEQUENTIAL: Final[int]
+PY_MADV_WILLNEED: Final[int]
+PY_MADV_DONTNEED: Final[int]
+PY_MADV_HUGEPAGE: Final[int]
+PY_MADV_NOHUGEPAGE: Final[int]
+
 # ===========================================================================
 # Exception Classes
 # ===========================================================================
@@ -91,6 +107,23 @@ class MMapInvalidParameterError(MMapError):
     """Raised when caller supplies an invalid parameter."""
     ...
 
+# ===========================================================================
+# Residency Report
+# ===========================================================================
+
+class ResidencyReport(NamedTuple):
+    """Page residency of a byte range (see :py:meth:`MemoryMap.residency`)."""
+
+    offset: int
+    length: int
+    page_size: int
+    pages: int
+    resident_pages: int
+    mask: bytes
+
+    @property
+    def fraction(self) -> float: ...
+
 # ===========================================================================
 # MemoryMap Class
 # ===========================================================================
@@ -136,6 +169,9 @@ class MemoryMap:
         size: int,
         prot: int = ...,
         flags: int = ...,
+        *,
+        populate: bool = ...,
+        huge_pages: Union[bool, str, None] = ...,
     ) -> MemoryMap:
         """
         Create an anonymous (RAM-only) mapping.
@@ -148,6 +184,11 @@ class MemoryMap:
             Protection flags.  Default ``PROT_READ | PROT_WRITE``.
         flags : int, optional
             Mapping flags.  Default ``MAP_PRIVATE``.
+        populate : bool, optional
+            Pre-fault all pages (``MAP_POPULATE``).
+        huge_pages : bool or {"transparent", "explicit"}, optional
+            Transparent (``MADV_HUGEPAGE``) or reserved (``MAP_HUGETLB``)
+            huge pages.
 
         Returns
         -------
@@ -169,6 +210,8 @@ class MemoryMap:
         size: int,
         prot: int = ...,
         flags: int = ...,
+        *,
+        populate: bool = ...,
     ) -> MemoryMap:
         """
         Create a file-backed mapping.
@@ -244,6 +287,35 @@ class MemoryMap:
         """Release page-lock set by :py:meth:`mlock`."""
         ...
 
+    # ----- access-pattern hints -----
+
+    def madvise(
+        self,
+        advice: Union[int, str],
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> None:
+        """Apply a ``PY_MADV_*`` hint (or its name) to a byte range."""
+        ...
+
+    def prefetch(
+        self,
+        offset: int = 0,
+        length: Optional[int] = None,
+        *,
+        touch: bool = False,
+    ) -> "Future[int]":
+        """Start background read-ahead of a byte range."""
+        ...
+
+    def residency(
+        self,
+        offset: int = 0,
+        length: Optional[int] = None,
+    ) -> ResidencyReport:
+        """``mincore``-based page residency of a byte range."""
+        ...
+
     # ----- NumPy integration -----
 
     def as_numpy_array(self, dtype: "Optional[np.dtype]" = None) -> "np.ndarray":
@@ -65,6 +65,17 @@ MS_SYNC : int
 MS_INVALIDATE : int
     Invalidate cached pages
 
+Advice Flags
+------------
+MADV_NORMAL, MADV_RANDOM, MADV_SEQUENTIAL : int
+    Expected access pattern (controls kernel readahead)
+MADV_WILLNEED, MADV_DONTNEED : int
+    Start read-ahead / drop pages from the resident set
+MADV_HUGEPAGE, MADV_NOHUGEPAGE : int
+    Opt a range in or out of transparent huge pages (Linux)
+MAP_POPULATE, MAP_HUGETLB : int
+    Pre-fault the mapping / back it with explicit huge pages (Linux)
+
 Design Principles
 -----------------
 - Thin Cython wrapper around C implementation in mman.h
@@ -171,9 +182,12 @@ from cpython.bytes cimport PyBytes_AsStringAndSize
 # from libc.stdint cimport int64_t
 from libc.stdint cimport uintptr_t
 from libc.stddef cimport size_t
-from libc.errno cimport errno
+from libc.errno cimport errno, ENOSYS
 from libc.string cimport memcpy  # , memset
 
+import threading
+from collections import namedtuple
+
 # Python-level imports
 # import os
 # from sys import platform
@@ -191,6 +205,8 @@ from scikitplot.memmap._memmap.mem_map cimport (
     mmap, munmap, mprotect, msync, mlock, munlock,
     off_t, is_map_failed, validate_prot_flags, validate_map_flags,
     get_page_size,
+    skplt_madvise, skplt_mincore,
+    SKPLT_NATIVE_MAP_POPULATE, SKPLT_NATIVE_MAP_HUGETLB,
 )
 
 # ============================================================================
@@ -252,6 +268,17 @@ __all__ = [
 
     "PY_FILE_MAP_EXECUTE",
 
+    "PY_MAP_POPULATE",
+    "PY_MAP_HUGETLB",
+
+    "PY_MADV_NORMAL",
+    "PY_MADV_RANDOM",
+    "PY_MADV_SEQUENTIAL",
+    "PY_MADV_WILLNEED",
+    "PY_MADV_DONTNEED",
+    "PY_MADV_HUGEPAGE",
+    "PY_MADV_NOHUGEPAGE",
+
     # Exceptions
     "MMapError",
     "MMapAllocationError",
@@ -259,6 +286,7 @@ __all__ = [
 
     # memmap
     "MemoryMap",
+    "ResidencyReport",
     "mmap_region",
     "py_validate_prot_flags",  # no-cython-lint
     "py_validate_map_flags",  # no-cython-lint
@@ -295,6 +323,21 @@ DEF MAP_TYPE = 0xf
 DEF MAP_FIXED = 0x10
 DEF MAP_ANONYMOUS = 0x20
 DEF MAP_ANON = 0x20  # Alias for MAP_ANONYMOUS
+# Linux values; translated to the native flag (or emulated) per platform
+DEF MAP_POPULATE = 0x8000
+DEF MAP_HUGETLB = 0x40000
+
+# ===========================================================================
+# Advice values (Linux values; mem_advise.h translates per platform)
+# ===========================================================================
+
+DEF MADV_NORMAL = 0
+DEF MADV_RANDOM = 1
+DEF MADV_SEQUENTIAL = 2
+DEF MADV_WILLNEED = 3
+DEF MADV_DONTNEED = 4
+DEF MADV_HUGEPAGE = 14
+DEF MADV_NOHUGEPAGE = 15
 
 # ===========================================================================
 # Sync flags (POSIX-compatible)
@@ -328,6 +371,27 @@ PY_MS_INVALIDATE = 4
 # Windows native
 PY_FILE_MAP_EXECUTE = 0x0020
 
+PY_MAP_POPULATE = 0x8000
+PY_MAP_HUGETLB = 0x40000
+
+PY_MADV_NORMAL = 0
+PY_MADV_RANDOM = 1
+PY_MADV_SEQUENTIAL = 2
+PY_MADV_WILLNEED = 3
+PY_MADV_DONTNEED = 4
+PY_MADV_HUGEPAGE = 14
+PY_MADV_NOHUGEPAGE = 15
+
+_ADVICE_NAMES = {
+    "normal": MADV_NORMAL,
+    "random": MADV_RANDOM,
+    "sequential": MADV_SEQUENTIAL,
+    "willneed": MADV_WILLNEED,
+    "dontneed": MADV_DONTNEED,
+    "hugepage": MADV_HUGEPAGE,
+    "nohugepage": MADV_NOHUGEPAGE,
+}
+
 # ===========================================================================
 # Utility Functions Implementation (Thread-Safe, No Global State)
 # ===========================================================================
@@ -603,7 +667,8 @@ cdef int validate_map_flags(int flags) except -1:  # no-cython-lint
 
     Notes
     -----
-    Valid flags are: MAP_SHARED, MAP_PRIVATE, MAP_ANONYMOUS, MAP_FIXED.
+    Valid flags are: MAP_SHARED, MAP_PRIVATE, MAP_ANONYMOUS, MAP_FIXED,
+    MAP_POPULATE and MAP_HUGETLB.
 
     The validation enforces:
     1. No unknown flag bits are present (checked first for fail-fast)
@@ -630,7 +695,8 @@ cdef int validate_map_flags(int flags) except -1:  # no-cython-lint
     >>> validate_map_flags(0x1000)  # Raises ValueError (unknown bit)
     """
     cdef int allowed = (MAP_SHARED | MAP_PRIVATE |
-                        MAP_ANONYMOUS | MAP_FIXED)
+                        MAP_ANONYMOUS | MAP_FIXED |
+                        MAP_POPULATE | MAP_HUGETLB)
 
     cdef bint has_shared = (flags & MAP_SHARED) != 0
     cdef bint has_private = (flags & MAP_PRIVATE) != 0
@@ -643,7 +709,9 @@ cdef int validate_map_flags(int flags) except -1:  # no-cython-lint
             f"Allowed flags: MAP_SHARED ({MAP_SHARED}), "
             f"MAP_PRIVATE ({MAP_PRIVATE}), "
             f"MAP_ANONYMOUS ({MAP_ANONYMOUS}), "
-            f"MAP_FIXED ({MAP_FIXED})"
+            f"MAP_FIXED ({MAP_FIXED}), "
+            f"MAP_POPULATE ({MAP_POPULATE:#x}), "
+            f"MAP_HUGETLB ({MAP_HUGETLB:#x})"
         )
 
     # Enforce exactly one of MAP_SHARED or MAP_PRIVATE
@@ -733,6 +801,106 @@ class MMapInvalidParameterError(MMapError):
     pass
 
 
+# ===========================================================================
+# Access-pattern helpers (advice names, residency report, prefetch pool)
+# ===========================================================================
+
+class ResidencyReport(
+    namedtuple(
+        "ResidencyReport",
+        ["offset", "length", "page_size", "pages", "resident_pages", "mask"],
+    )
+):
+    """
+    Page residency of a byte range, as reported by ``mincore``.
+
+    Attributes
+    ----------
+    offset : int
+        Page-aligned start of the inspected range.
+    length : int
+        Number of bytes inspected (from *offset*).
+    page_size : int
+        OS page size in bytes.
+    pages : int
+        Number of pages in the range.
+    resident_pages : int
+        Pages currently in physical memory.
+    mask : bytes
+        One byte per page, ``1`` when resident.  Use
+        ``numpy.frombuffer(mask, numpy.uint8)`` for a vector view.
+    """
+
+    __slots__ = ()
+
+    @property
+    def fraction(self) -> float:
+        """Share of resident pages (``1.0`` for an empty range)."""
+        return self.resident_pages / self.pages if self.pages else 1.0
+
+
+def _advice_code(advice):
+    """Map an advice name or ``PY_MADV_*`` value to its portable code."""
+    if isinstance(advice, str):
+        try:
+            return _ADVICE_NAMES[advice.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Unknown advice {advice!r}; expected one of "
+                f"{sorted(_ADVICE_NAMES)} or a PY_MADV_* constant"
+            ) from None
+    if advice not in _ADVICE_NAMES.values():
+        raise ValueError(
+            f"Unknown advice {advice!r}; expected one of "
+            f"{sorted(_ADVICE_NAMES)} or a PY_MADV_* constant"
+        )
+    return int(advice)
+
+
+def _huge_page_size():
+    """Default huge page size in bytes (``Hugepagesize`` on Linux, else 2 MiB)."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("Hugepagesize:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 2 * 1024 * 1024
+
+
+_PREFETCH_POOL = None
+_PREFETCH_POOL_LOCK = threading.Lock()
+
+
+def _prefetch_executor():
+    """Shared background pool used by :py:meth:`MemoryMap.prefetch`."""
+    global _PREFETCH_POOL
+    with _PREFETCH_POOL_LOCK:
+        if _PREFETCH_POOL is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _PREFETCH_POOL = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="memmap-prefetch"
+            )
+        return _PREFETCH_POOL
+
+
+def _reset_prefetch_pool():
+    # Worker threads do not survive fork(); let the child build its own pool.
+    global _PREFETCH_POOL, _PREFETCH_POOL_LOCK
+    _PREFETCH_POOL = None
+    _PREFETCH_POOL_LOCK = threading.Lock()
+
+
+try:
+    import os as _os
+
+    _os.register_at_fork(after_in_child=_reset_prefetch_pool)
+except AttributeError:  # Windows has no fork
+    pass
+
+
 # ===========================================================================
 # MemoryMap - Python wrapper for memory-mapped regions
 # ===========================================================================
@@ -779,6 +947,8 @@ cdef class MemoryMap:
     cdef bint _is_valid
     cdef int _prot
     cdef int _flags
+    cdef object _io_lock   # serialises close() with background prefetch
+    cdef unsigned long _touch_sink
 
     def __cinit__(self):
         """
@@ -796,6 +966,8 @@ cdef class MemoryMap:
         self._is_valid = False
         self._prot = 0
         self._flags = 0
+        self._io_lock = threading.Lock()
+        self._touch_sink = 0
 
     def __dealloc__(self):
         """
@@ -829,7 +1001,10 @@ cdef class MemoryMap:
     def create_anonymous(
         size: int,
         prot: int = PROT_READ | PROT_WRITE,
-        flags: int = MAP_PRIVATE
+        flags: int = MAP_PRIVATE,
+        *,
+        populate: bool = False,
+        huge_pages=False,
     ) -> MemoryMap:
         """
         Create anonymous memory mapping (not backed by file).
@@ -844,6 +1019,16 @@ cdef class MemoryMap:
         flags : int, optional
             Mapping flags (should include MAP_PRIVATE or MAP_SHARED).
             Default: MAP_PRIVATE
+        populate : bool, optional
+            Pre-fault all pages at creation (``MAP_POPULATE``) so the first
+            access does not page-fault.  Default: False
+        huge_pages : bool or {"transparent", "explicit"}, optional
+            ``True`` / ``"transparent"`` marks the region ``MADV_HUGEPAGE``
+            (best effort; ignored where transparent huge pages are
+            unavailable).  ``"explicit"`` maps from the reserved huge-page
+            pool (``MAP_HUGETLB``) and rounds *size* up to the huge page
+            size; it fails with :py:class:`MMapAllocationError` when no
+            huge pages are reserved.  Default: False
 
         Returns
         -------
@@ -853,7 +1038,9 @@ cdef class MemoryMap:
         Raises
         ------
         ValueError
-            If size <= 0 or invalid flags
+            If size <= 0, invalid flags or invalid *huge_pages*
+        MMapInvalidParameterError
+            If ``huge_pages="explicit"`` is not supported on this platform
         MMapAllocationError
             If mapping allocation fails
 
@@ -862,6 +1049,7 @@ cdef class MemoryMap:
         - Memory is initially zero-filled
         - Anonymous mappings are not backed by any file
         - Useful for inter-process communication with MAP_SHARED
+        - Huge pages cut TLB misses for large, randomly accessed buffers
 
         Examples
         --------
@@ -876,6 +1064,18 @@ cdef class MemoryMap:
         """
         if size <= 0:
             raise ValueError(f"Size must be positive, got {size}")
+        if huge_pages not in (False, None, True, "transparent", "explicit"):
+            raise ValueError(
+                "huge_pages must be False, True, 'transparent' or 'explicit', "
+                f"got {huge_pages!r}"
+            )
+
+        if populate:
+            flags |= MAP_POPULATE
+        if huge_pages == "explicit":
+            flags |= MAP_HUGETLB
+            hp = _huge_page_size()
+            size = -(-size // hp) * hp
 
         cdef MemoryMap instance = MemoryMap()
         instance._create_mapping(
@@ -886,6 +1086,9 @@ cdef class MemoryMap:
             -1,  # No file descriptor for anonymous mapping
             0    # No offset
         )
+        if huge_pages is True or huge_pages == "transparent":
+            # Advisory: THP may be disabled system-wide, which is fine.
+            instance._advise_quiet(0, instance._size, MADV_HUGEPAGE)
         return instance
 
     @staticmethod
@@ -894,7 +1097,9 @@ cdef class MemoryMap:
         offset: int,
         size: int,
         prot: int = PROT_READ,
-        flags: int = MAP_PRIVATE
+        flags: int = MAP_PRIVATE,
+        *,
+        populate: bool = False,
     ) -> MemoryMap:
         """
         Create file-backed memory mapping.
@@ -913,6 +1118,11 @@ cdef class MemoryMap:
         flags : int, optional
             Mapping flags.
             Default: MAP_PRIVATE
+        populate : bool, optional
+            Read the whole range into the page cache and pre-fault it at
+            creation (``MAP_POPULATE``; a ``MADV_WILLNEED`` hint where the
+            flag does not exist).  Useful to warm read-only indexes
+            up front.  Default: False
 
         Returns
         -------
@@ -946,6 +1156,8 @@ cdef class MemoryMap:
             raise ValueError(f"Size must be positive, got {size}")
         if offset < 0:
             raise ValueError(f"Offset must be non-negative, got {offset}")
+        if populate:
+            flags |= MAP_POPULATE
 
         cdef MemoryMap instance = MemoryMap()
         instance._create_mapping(
@@ -1000,11 +1212,24 @@ cdef class MemoryMap:
         validate_prot_flags(prot)
         validate_map_flags(flags)
 
+        # MAP_POPULATE / MAP_HUGETLB use Linux values; swap in the native
+        # bits (0 where the platform has no equivalent).
+        cdef int native_flags = flags & ~(MAP_POPULATE | MAP_HUGETLB)
+        if flags & MAP_HUGETLB:
+            if SKPLT_NATIVE_MAP_HUGETLB == 0:
+                raise MMapInvalidParameterError(
+                    "MAP_HUGETLB (explicit huge pages) is not supported "
+                    "on this platform"
+                )
+            native_flags |= SKPLT_NATIVE_MAP_HUGETLB
+        if flags & MAP_POPULATE:
+            native_flags |= SKPLT_NATIVE_MAP_POPULATE
+
         # Explicit C-level copies
         cdef void* c_addr = addr
         cdef size_t c_size = size
         cdef int c_prot = prot
-        cdef int c_flags = flags
+        cdef int c_flags = native_flags
         cdef int c_fd = fd
         cdef off_t c_offset = offset
 
@@ -1028,6 +1253,10 @@ cdef class MemoryMap:
         self._flags = flags
         self._is_valid = True
 
+        if (flags & MAP_POPULATE) and SKPLT_NATIVE_MAP_POPULATE == 0:
+            # No MAP_POPULATE here: fall back to an asynchronous read-ahead.
+            self._advise_quiet(0, size, MADV_WILLNEED)
+
     @property
     def addr(self) -> int:
         """
@@ -1105,19 +1334,21 @@ cdef class MemoryMap:
         >>> m.is_valid
         False
         """
-        if not self._is_valid:
-            return  # Already closed, idempotent
-
         cdef int result
-        with nogil:
-            result = munmap(self._addr, self._size)
+        # Wait for an in-flight prefetch chunk (see prefetch()).
+        with self._io_lock:
+            if not self._is_valid:
+                return  # Already closed, idempotent
 
-        if result != 0:
-            err = errno
-            raise MMapError(f"Failed to unmap memory: errno={err}")
+            with nogil:
+                result = munmap(self._addr, self._size)
 
-        self._addr = NULL
-        self._is_valid = False
+            if result != 0:
+                err = errno
+                raise MMapError(f"Failed to unmap memory: errno={err}")
+
+            self._addr = NULL
+            self._is_valid = False
 
     def read(self, size: int, offset: int = 0) -> bytes:
         """
@@ -1436,6 +1667,243 @@ cdef class MemoryMap:
             err = errno
             raise MMapError(f"munlock failed: errno={err}")
 
+    # ---------------------------------------------------------------
+    # Access-pattern hints (madvise / prefetch / mincore)
+    # ---------------------------------------------------------------
+
+    def _page_range(self, offset, length):
+        """Validate ``[offset, offset + length)``; return page-aligned ``(start, nbytes)``."""
+        if not self._is_valid:
+            raise ValueError("Mapping is closed")
+        if offset < 0:
+            raise ValueError(f"Offset must be non-negative, got {offset}")
+        if length is None:
+            length = self._size - offset
+        if length < 0:
+            raise ValueError(f"Length must be non-negative, got {length}")
+        if offset + length > self._size:
+            raise ValueError(
+                f"Range beyond mapping bounds: "
+                f"offset={offset}, length={length}, mapping_size={self._size}"
+            )
+        page = <size_t>get_page_size()
+        start = (offset // page) * page
+        return start, offset + length - start
+
+    cdef bint _advise_quiet(self, size_t start, size_t nbytes, int advice) noexcept:
+        """Apply *advice* to a validated range; ``False`` instead of raising."""
+        if not self._is_valid or nbytes == 0:
+            return False
+        cdef void* c_addr = <void*>(<uintptr_t>self._addr + <uintptr_t>start)
+        cdef int result
+        with nogil:
+            result = skplt_madvise(c_addr, nbytes, advice)
+        return result == 0
+
+    def madvise(self, advice, offset: int = 0, length=None) -> None:
+        """
+        Tell the kernel how a byte range will be accessed.
+
+        Parameters
+        ----------
+        advice : int or str
+            A ``PY_MADV_*`` constant or its name: ``"normal"``,
+            ``"random"``, ``"sequential"``, ``"willneed"``, ``"dontneed"``,
+            ``"hugepage"`` or ``"nohugepage"``.
+        offset : int, optional
+            Start of the range in bytes; rounded down to a page boundary.
+            Default: 0
+        length : int or None, optional
+            Range length in bytes.  Default: to the end of the mapping.
+
+        Raises
+        ------
+        ValueError
+            If the mapping is closed, the advice is unknown, or the range
+            is out of bounds.
+        MMapError
+            If the kernel rejects the advice, or the advice has no
+            equivalent on this platform.
+
+        Notes
+        -----
+        - ``"random"`` disables read-ahead: point lookups in large index
+          files (e.g. Annoy trees) stop pulling in pages they never use.
+        - ``"sequential"`` enlarges read-ahead for linear scans.
+        - ``"dontneed"`` drops the pages from the resident set; on a
+          private anonymous mapping their contents are lost (re-read as
+          zeros), on file mappings they are re-read from the file.
+        - ``"hugepage"`` opts the range into transparent huge pages
+          (Linux only).
+        - On Windows ``"willneed"`` uses ``PrefetchVirtualMemory`` and the
+          access-pattern hints are accepted as no-ops.
+
+        Examples
+        --------
+        >>> with open("index.ann", "rb") as f:
+        ...     m = MemoryMap.create_file_mapping(f.fileno(), 0, size)
+        ...     m.madvise("random")
+        """
+        code = _advice_code(advice)
+        start, nbytes = self._page_range(offset, length)
+        if nbytes == 0:
+            return
+
+        cdef void* c_addr = <void*>(<uintptr_t>self._addr + <uintptr_t>start)
+        cdef size_t c_len = nbytes
+        cdef int c_advice = code
+        cdef int result
+        with nogil:
+            result = skplt_madvise(c_addr, c_len, c_advice)
+
+        if result != 0:
+            err = errno
+            if err == ENOSYS:
+                raise MMapError(
+                    f"madvise advice {advice!r} is not supported on this platform"
+                )
+            raise MMapError(f"madvise failed: errno={err}, advice={advice!r}")
+
+    def prefetch(self, offset: int = 0, length=None, *, touch: bool = False):
+        """
+        Start warming a byte range in the background.
+
+        Issues ``MADV_WILLNEED`` (asynchronous kernel read-ahead) and
+        returns immediately.  With ``touch=True`` -- or where the hint is
+        unavailable -- a background thread additionally reads one byte per
+        page so every page is resident when the returned future completes.
+
+        Parameters
+        ----------
+        offset : int, optional
+            Start of the range in bytes; rounded down to a page boundary.
+            Default: 0
+        length : int or None, optional
+            Range length in bytes.  Default: to the end of the mapping.
+        touch : bool, optional
+            Fault the pages in from a background thread.  Default: False
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the number of bytes covered.  Already done when
+            only the kernel hint was needed.
+
+        Raises
+        ------
+        ValueError
+            If the mapping is closed, the range is out of bounds, or
+            pages must be touched on a mapping without ``PROT_READ``.
+
+        Notes
+        -----
+        Intended for file-backed mappings.  Closing the mapping while a
+        touch is running is safe: :py:meth:`close` waits for the current
+        chunk and the remaining pages are skipped.
+
+        Examples
+        --------
+        >>> fut = m.prefetch(0, 64 * 1024 * 1024)     # first 64 MiB
+        >>> ...                                        # overlap other work
+        >>> fut.result()
+        """
+        start, nbytes = self._page_range(offset, length)
+        hinted = self._advise_quiet(start, nbytes, MADV_WILLNEED)
+        if nbytes == 0 or (hinted and not touch):
+            from concurrent.futures import Future
+
+            done = Future()
+            done.set_result(nbytes)
+            return done
+        if not (self._prot & PROT_READ):
+            raise ValueError("Cannot touch pages of a mapping without PROT_READ")
+        return _prefetch_executor().submit(self._touch_pages, start, nbytes)
+
+    def _touch_pages(self, size_t start, size_t nbytes):
+        """Read one byte per page of a validated range, 1 MiB-ish at a time."""
+        cdef size_t page = get_page_size()
+        cdef size_t chunk = page * 256
+        cdef size_t end = start + nbytes
+        cdef size_t pos = start
+        cdef size_t stop, i
+        cdef unsigned long acc = 0
+        cdef const unsigned char* base
+
+        while pos < end:
+            stop = pos + chunk if end - pos > chunk else end
+            with self._io_lock:
+                if not self._is_valid:
+                    break  # closed underneath us; nothing left to warm
+                base = <const unsigned char*>self._addr
+                with nogil:
+                    i = pos
+                    while i < stop:
+                        acc += base[i]
+                        i += page
+            pos = stop
+
+        # Keep the loads observable so the compiler cannot drop them.
+        self._touch_sink = acc
+        return pos - start
+
+    def residency(self, offset: int = 0, length=None) -> ResidencyReport:
+        """
+        Report which pages of a byte range are in physical memory.
+
+        Parameters
+        ----------
+        offset : int, optional
+            Start of the range in bytes; rounded down to a page boundary.
+            Default: 0
+        length : int or None, optional
+            Range length in bytes.  Default: to the end of the mapping.
+
+        Returns
+        -------
+        ResidencyReport
+            Page counts, resident fraction and a per-page mask.
+
+        Raises
+        ------
+        ValueError
+            If the mapping is closed or the range is out of bounds.
+        MMapError
+            If ``mincore`` fails or is unavailable (Windows).
+
+        Examples
+        --------
+        >>> m.prefetch(touch=True).result()
+        >>> m.residency().fraction
+        1.0
+        """
+        start, nbytes = self._page_range(offset, length)
+        cdef size_t page = get_page_size()
+        cdef size_t npages = (<size_t>nbytes + page - 1) // page
+        if npages == 0:
+            return ResidencyReport(start, 0, page, 0, 0, b"")
+
+        vec = bytearray(npages)
+        cdef unsigned char* c_vec = <unsigned char*>PyByteArray_AS_STRING(vec)
+        cdef void* c_addr = <void*>(<uintptr_t>self._addr + <uintptr_t>start)
+        cdef size_t c_len = nbytes
+        cdef size_t i
+        cdef size_t resident = 0
+        cdef int result
+        with nogil:
+            result = skplt_mincore(c_addr, c_len, c_vec)
+            if result == 0:
+                for i in range(npages):
+                    c_vec[i] &= 1
+                    resident += c_vec[i]
+
+        if result != 0:
+            err = errno
+            if err == ENOSYS:
+                raise MMapError("mincore is not supported on this platform")
+            raise MMapError(f"mincore failed: errno={err}")
+
+        return ResidencyReport(start, nbytes, page, npages, resident, bytes(vec))
+
     # ---------------------------------------------------------------
     # Zero-copy NumPy view
     # ---------------------------------------------------------------
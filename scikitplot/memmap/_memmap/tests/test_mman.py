@@ -705,6 +705,111 @@ class TestThreadSafety:
         assert true_count == expected
 
 
+
+# ===========================================================================
+# Access-Pattern Hints (madvise / prefetch / mincore)
+# ===========================================================================
+
+posix_only = pytest.mark.skipif(
+    sys.platform == "win32", reason="madvise/mincore are POSIX-only"
+)
+
+
+class TestAccessHints:
+    """Test madvise, prefetch, residency and population flags."""
+
+    @posix_only
+    @pytest.mark.parametrize(
+        "advice", ["normal", "random", "sequential", "willneed"]
+    )
+    def test_madvise_names(self, advice):
+        with MemoryMap.create_anonymous(4 * 4096) as m:
+            m.madvise(advice)
+            m.madvise(advice, offset=100, length=5000)
+
+    @posix_only
+    def test_madvise_constant(self, temp_file):
+        fd, _ = temp_file
+        with MemoryMap.create_file_mapping(fd, 0, 4096) as m:
+            m.madvise(memmap.PY_MADV_RANDOM)
+
+    def test_madvise_unknown_advice(self, small_mapping):
+        with pytest.raises(ValueError, match="Unknown advice"):
+            small_mapping.madvise("sometimes")
+        with pytest.raises(ValueError, match="Unknown advice"):
+            small_mapping.madvise(99)
+
+    def test_madvise_out_of_bounds(self, small_mapping):
+        with pytest.raises(ValueError, match="beyond mapping bounds"):
+            small_mapping.madvise("normal", offset=0, length=small_mapping.size + 1)
+
+    def test_madvise_closed_fails(self):
+        m = MemoryMap.create_anonymous(4096)
+        m.close()
+        with pytest.raises(ValueError, match="closed"):
+            m.madvise("normal")
+
+    @posix_only
+    def test_residency_after_touch(self, temp_file):
+        fd, _ = temp_file
+        with MemoryMap.create_file_mapping(fd, 0, 4096) as m:
+            assert m.prefetch(touch=True).result(timeout=10) == 4096
+            report = m.residency()
+            assert report.pages == 1
+            assert report.resident_pages == 1
+            assert report.fraction == 1.0
+            assert report.mask == b"\x01"
+
+    @posix_only
+    def test_residency_of_untouched_anonymous_pages(self):
+        with MemoryMap.create_anonymous(16 * 4096) as m:
+            m.write(b"x", 0)
+            report = m.residency()
+            assert report.pages == m.size // m.page_size
+            assert report.mask[0] == 1
+            assert 1 <= report.resident_pages <= report.pages
+
+    def test_prefetch_returns_future(self, small_mapping):
+        fut = small_mapping.prefetch(0, 10)
+        assert fut.result(timeout=10) >= 10
+
+    def test_prefetch_requires_readable_mapping_to_touch(self):
+        with MemoryMap.create_anonymous(4096, PY_PROT_NONE) as m:
+            with pytest.raises(ValueError, match="PROT_READ"):
+                m.prefetch(touch=True)
+
+    def test_close_during_prefetch_is_safe(self):
+        m = MemoryMap.create_anonymous(64 * 1024 * 1024)
+        fut = m.prefetch(touch=True)
+        m.close()
+        assert 0 <= fut.result(timeout=30) <= 64 * 1024 * 1024
+
+    @posix_only
+    def test_populate_flag(self):
+        with MemoryMap.create_anonymous(8 * 4096, populate=True) as m:
+            m.write(b"ok")
+            assert m.read(2) == b"ok"
+
+    def test_populate_flag_is_valid(self):
+        memmap.py_validate_map_flags(memmap.PY_MAP_PRIVATE | memmap.PY_MAP_POPULATE)
+
+    def test_transparent_huge_pages_best_effort(self):
+        with MemoryMap.create_anonymous(4 * 1024 * 1024, huge_pages=True) as m:
+            m.write(b"hp")
+            assert m.read(2) == b"hp"
+
+    def test_invalid_huge_pages_value(self):
+        with pytest.raises(ValueError, match="huge_pages"):
+            MemoryMap.create_anonymous(4096, huge_pages="always")
+
+    def test_explicit_huge_pages_rounds_size(self):
+        try:
+            m = MemoryMap.create_anonymous(4096, huge_pages="explicit")
+        except MMapError:
+            pytest.skip("no reserved huge pages")
+        with m:
+            assert m.size > 4096
+
 if __name__ == "__main__":
     # Run tests if executed directly
     pytest.main([__file__, "-v"])
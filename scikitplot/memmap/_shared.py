@@ -0,0 +1,642 @@
+# scikitplot/memmap/_shared.py
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Zero-copy NumPy arrays shared between processes.
+
+Built on :class:`~scikitplot.memmap.MemoryMap` and
+:func:`~scikitplot.memmap.mmap_region`.  A *segment* is a named file in a
+RAM-backed directory (``/dev/shm`` where available, the temporary directory
+otherwise) mapped with ``MAP_SHARED``.  Its first page(s) hold a small
+header describing the array (dtype and shape, ``.npy``-style descr); the data
+starts on the next page boundary so every attached view is page-aligned.
+
+Pickling a :class:`SharedArray` transfers only the segment *name*; the
+receiving process re-maps the same physical pages.  This works with
+:mod:`concurrent.futures`, :mod:`multiprocessing` and joblib/loky without
+copying multi-GB matrices through pipes.
+
+Lifetime
+--------
+* Each process keeps one mapping per segment and a reference count of the
+  :class:`SharedArray` handles using it.  When the count drops to zero the
+  registry forgets the mapping; the pages are unmapped once the last NumPy
+  view of them is garbage collected (views keep their mapping alive, see
+  :meth:`MemoryMap.as_numpy_array`).
+* The *owner* (the process that created the segment) removes the backing
+  file with :meth:`SharedArray.unlink`, on context-manager exit, when a
+  :class:`SharedArrayManager` exits, or at interpreter shutdown.  Existing
+  mappings stay valid after unlinking on POSIX; new attaches fail.
+
+Examples
+--------
+>>> import numpy as np
+>>> from concurrent.futures import ProcessPoolExecutor
+>>> from scikitplot.memmap import SharedArrayManager
+>>> def column_means(shared):
+...     return shared.array.mean(axis=0)
+>>> with SharedArrayManager() as mgr:  # doctest: +SKIP
+...     X = mgr.share(np.random.rand(1_000_000, 64))
+...     with ProcessPoolExecutor() as pool:
+...         means = pool.submit(column_means, X).result()
+"""
+
+from __future__ import annotations
+
+import ast
+import atexit
+import logging
+import os
+import re
+import secrets
+import struct
+import tempfile
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ._memmap import (
+    PY_MAP_SHARED,
+    PY_PROT_READ,
+    PY_PROT_WRITE,
+    MemoryMap,
+    mmap_region,
+    py_get_page_size,
+)
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "SharedArray",
+    "SharedArrayManager",
+    "attach_shared_array",
+    "share_array",
+]
+
+# ---------------------------------------------------------------------------
+# Segment layout
+# ---------------------------------------------------------------------------
+
+#: File signature; the trailing byte is the layout version.
+_MAGIC = b"SKPLTSA\x01"
+#: ``magic, data_offset, header_len`` followed by the header literal.
+_PREFIX = struct.Struct("<8sQQ")
+_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$")
+
+
+def _default_directory() -> str:
+    """RAM-backed directory for segments (``/dev/shm`` when usable)."""
+    shm = "/dev/shm"  # noqa: S108
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return tempfile.gettempdir()
+
+
+def _check_name(name: str) -> str:
+    if not isinstance(name, str) or not _NAME_RE.match(name):
+        raise ValueError(
+            "Segment name must be 1-128 characters of [A-Za-z0-9_.-] and "
+            f"start with a letter or digit, got {name!r}"
+        )
+    return name
+
+
+def _encode_header(dtype: np.dtype, shape: tuple[int, ...]) -> tuple[bytes, int]:
+    """Return ``(prefix + header bytes, data_offset)`` for a new segment."""
+    header = repr(
+        {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "shape": tuple(shape),
+        }
+    ).encode("utf-8")
+    page = py_get_page_size()
+    used = _PREFIX.size + len(header)
+    data_offset = -(-used // page) * page
+    return _PREFIX.pack(_MAGIC, data_offset, len(header)) + header, data_offset
+
+
+def _decode_header(mm: MemoryMap, path: str) -> tuple[np.dtype, tuple[int, ...], int]:
+    if mm.size < _PREFIX.size:
+        raise ValueError(f"{path!r} is not a shared-array segment (too small)")
+    magic, data_offset, header_len = _PREFIX.unpack(mm.read(_PREFIX.size))
+    if magic != _MAGIC:
+        raise ValueError(f"{path!r} is not a shared-array segment (bad magic)")
+    if _PREFIX.size + header_len > data_offset or data_offset > mm.size:
+        raise ValueError(f"{path!r} has a corrupt shared-array header")
+    # literal_eval only accepts Python literals, as in the .npy format.
+    meta = ast.literal_eval(mm.read(header_len, _PREFIX.size).decode("utf-8"))
+    dtype = np.lib.format.descr_to_dtype(meta["descr"])
+    shape = tuple(int(n) for n in meta["shape"])
+    return dtype, shape, data_offset
+
+
+# ---------------------------------------------------------------------------
+# Per-process segment registry
+# ---------------------------------------------------------------------------
+
+
+class _Segment:
+    """One mapped segment and the number of live handles in this process."""
+
+    __slots__ = (
+        "data_offset",
+        "dtype",
+        "mm",
+        "name",
+        "owner_pid",
+        "path",
+        "readonly",
+        "refs",
+        "shape",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        mm: MemoryMap,
+        *,
+        dtype: np.dtype,
+        shape: tuple[int, ...],
+        data_offset: int,
+        readonly: bool,
+        owner_pid: int | None,
+    ) -> None:
+        self.name = name
+        self.path = path
+        self.mm = mm
+        self.dtype = dtype
+        self.shape = shape
+        self.data_offset = data_offset
+        self.readonly = readonly
+        self.owner_pid = owner_pid
+        self.refs = 0
+
+    def view(self) -> np.ndarray:
+        raw = self.mm.as_numpy_array()
+        nbytes = self.dtype.itemsize * int(np.prod(self.shape, dtype=np.int64))
+        data = raw[self.data_offset : self.data_offset + nbytes]
+        return data.view(self.dtype).reshape(self.shape)
+
+
+_REGISTRY: dict[tuple[str, str, bool], _Segment] = {}
+_OWNED_PATHS: dict[str, int] = {}  # path -> creating pid, for atexit cleanup
+_LOCK = threading.Lock()
+
+
+def _release(key: tuple[str, str, bool]) -> None:
+    """Drop one handle reference; forget the mapping at zero."""
+    with _LOCK:
+        seg = _REGISTRY.get(key)
+        if seg is None:
+            return
+        seg.refs -= 1
+        if seg.refs <= 0:
+            # Do not close() here: NumPy views handed out earlier keep the
+            # MemoryMap alive and it unmaps itself once they are collected.
+            del _REGISTRY[key]
+
+
+def _unlink_path(path: str) -> bool:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        # Windows refuses to delete a file that is still mapped.
+        logger.warning("Could not remove shared-array segment %r: %s", path, exc)
+        return False
+    with _LOCK:
+        _OWNED_PATHS.pop(path, None)
+    return True
+
+
+@atexit.register
+def _cleanup_owned_segments() -> None:
+    pid = os.getpid()
+    for path, owner in list(_OWNED_PATHS.items()):
+        if owner == pid:
+            _unlink_path(path)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+class SharedArray:
+    """
+    Handle to a NumPy array stored in a named shared-memory segment.
+
+    Do not instantiate directly; use :meth:`create`, :meth:`from_array` or
+    :meth:`attach` (or :func:`share_array` / :func:`attach_shared_array`).
+
+    Attributes
+    ----------
+    name : str
+        Segment name; all that crosses a process boundary when pickled.
+    directory : str
+        Directory holding the backing file.
+    readonly : bool
+        Whether this handle maps the segment read-only.
+
+    Notes
+    -----
+    Handles are cheap: all handles for the same segment in one process share
+    a single mapping.  :meth:`close` releases this handle only; arrays
+    obtained from :attr:`array` remain valid until they are collected.
+    """
+
+    def __init__(self, segment: _Segment, key: tuple[str, str, bool]) -> None:
+        self._segment = segment
+        self._key = key
+        self._array: np.ndarray | None = None
+        self._finalizer = weakref.finalize(self, _release, key)
+
+    # ------------------------------------------------------------------
+    # Constructors
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def create(
+        cls,
+        shape: int | tuple[int, ...],
+        dtype: Any = np.float64,
+        *,
+        name: str | None = None,
+        directory: str | None = None,
+    ) -> SharedArray:
+        """
+        Allocate a new zero-filled shared array.
+
+        Parameters
+        ----------
+        shape : int or tuple of int
+            Array shape.
+        dtype : data-type, optional
+            Element type.  Object dtypes are rejected.
+        name : str or None, optional
+            Segment name.  Defaults to a random ``skplt-<pid>-<hex>`` name.
+        directory : str or None, optional
+            Where to create the backing file.  Defaults to ``/dev/shm``
+            when available, else the system temporary directory.
+
+        Returns
+        -------
+        SharedArray
+            Writable handle owned by the calling process.
+
+        Raises
+        ------
+        ValueError
+            Invalid *name*, negative dimensions, or an object dtype.
+        FileExistsError
+            A segment called *name* already exists.
+        """
+        dtype = np.dtype(dtype)
+        if dtype.hasobject:
+            raise ValueError(f"Object dtypes cannot be shared, got {dtype}")
+        shape = (shape,) if isinstance(shape, (int, np.integer)) else tuple(shape)
+        shape = tuple(int(n) for n in shape)
+        if any(n < 0 for n in shape):
+            raise ValueError(f"shape must be non-negative, got {shape}")
+
+        if name is None:
+            name = f"skplt-{os.getpid()}-{secrets.token_hex(8)}"
+        name = _check_name(name)
+        directory = os.fspath(directory or _default_directory())
+        path = os.path.join(directory, name)
+
+        header, data_offset = _encode_header(dtype, shape)
+        nbytes = dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            os.ftruncate(fd, data_offset + nbytes)
+            mm = mmap_region(
+                data_offset + nbytes,
+                PY_PROT_READ | PY_PROT_WRITE,
+                PY_MAP_SHARED,
+                fd,
+                0,
+            )
+        except BaseException:
+            os.close(fd)
+            os.unlink(path)
+            raise
+        # The mapping holds its own reference to the file.
+        os.close(fd)
+        mm.write(header, 0)
+
+        seg = _Segment(
+            name,
+            path,
+            mm,
+            dtype=dtype,
+            shape=shape,
+            data_offset=data_offset,
+            readonly=False,
+            owner_pid=os.getpid(),
+        )
+        key = (directory, name, False)
+        with _LOCK:
+            seg.refs = 1
+            _REGISTRY[key] = seg
+            _OWNED_PATHS[path] = seg.owner_pid
+        return cls(seg, key)
+
+    @classmethod
+    def from_array(
+        cls,
+        array: Any,
+        *,
+        name: str | None = None,
+        directory: str | None = None,
+    ) -> SharedArray:
+        """
+        Copy *array* into a new shared segment (the only copy made).
+
+        Parameters
+        ----------
+        array : array-like
+            Source data.  Non-contiguous and Fortran-ordered inputs are
+            stored C-contiguous.
+        name, directory : optional
+            As for :meth:`create`.
+
+        Returns
+        -------
+        SharedArray
+        """
+        src = np.asarray(array)
+        shared = cls.create(src.shape, src.dtype, name=name, directory=directory)
+        np.copyto(shared.array, src, casting="no")
+        return shared
+
+    @classmethod
+    def attach(
+        cls,
+        name: str,
+        *,
+        directory: str | None = None,
+        readonly: bool = False,
+    ) -> SharedArray:
+        """
+        Map an existing segment by name.
+
+        Parameters
+        ----------
+        name : str
+            Segment name (:attr:`name` of the creating handle).
+        directory : str or None, optional
+            Directory of the backing file; must match the creator's.
+        readonly : bool, optional
+            Map with ``PROT_READ`` only; the arrays are not writeable.
+
+        Returns
+        -------
+        SharedArray
+
+        Raises
+        ------
+        FileNotFoundError
+            The segment does not exist (never created, or unlinked).
+        ValueError
+            The file is not a shared-array segment.
+        """
+        name = _check_name(name)
+        directory = os.fspath(directory or _default_directory())
+        key = (directory, name, bool(readonly))
+        with _LOCK:
+            seg = _REGISTRY.get(key)
+            if seg is not None:
+                seg.refs += 1
+                return cls(seg, key)
+
+        path = os.path.join(directory, name)
+        prot = PY_PROT_READ if readonly else PY_PROT_READ | PY_PROT_WRITE
+        fd = os.open(path, os.O_RDONLY if readonly else os.O_RDWR)
+        try:
+            size = os.fstat(fd).st_size
+            if size <= 0:
+                raise ValueError(f"{path!r} is not a shared-array segment (empty)")
+            mm = mmap_region(size, prot, PY_MAP_SHARED, fd, 0)
+        finally:
+            os.close(fd)
+        dtype, shape, data_offset = _decode_header(mm, path)
+
+        with _LOCK:
+            seg = _REGISTRY.get(key)
+            if seg is None:
+                seg = _Segment(
+                    name,
+                    path,
+                    mm,
+                    dtype=dtype,
+                    shape=shape,
+                    data_offset=data_offset,
+                    readonly=bool(readonly),
+                    owner_pid=None,
+                )
+                _REGISTRY[key] = seg
+            seg.refs += 1
+        return cls(seg, key)
+
+    # ------------------------------------------------------------------
+    # Accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def name(self) -> str:
+        return self._segment.name
+
+    @property
+    def directory(self) -> str:
+        return self._key[0]
+
+    @property
+    def readonly(self) -> bool:
+        return self._segment.readonly
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._segment.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._segment.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self.dtype.itemsize * int(np.prod(self.shape, dtype=np.int64))
+
+    @property
+    def is_owner(self) -> bool:
+        """``True`` in the process that created the segment."""
+        return self._segment.owner_pid == os.getpid()
+
+    @property
+    def array(self) -> np.ndarray:
+        """Zero-copy view of the shared data."""
+        if not self._finalizer.alive:
+            raise ValueError(f"SharedArray {self.name!r} is closed")
+        if self._array is None:
+            self._array = self._segment.view()
+        return self._array
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        arr = self.array
+        if dtype is not None and np.dtype(dtype) != arr.dtype:
+            return arr.astype(dtype)
+        return arr.copy() if copy else arr
+
+    def __len__(self) -> int:
+        if not self.shape:
+            raise TypeError("len() of unsized SharedArray")
+        return self.shape[0]
+
+    # ------------------------------------------------------------------
+    # Lifetime
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Release this handle (idempotent).  Existing views stay valid."""
+        self._array = None
+        self._finalizer()
+
+    def unlink(self) -> None:
+        """
+        Remove the backing file so the name can no longer be attached.
+
+        Processes that already mapped the segment keep their data.  Call
+        once, normally from the owner after all workers have attached or
+        finished.
+        """
+        _unlink_path(self._segment.path)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        owner = self.is_owner
+        self.close()
+        if owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        # Only the name travels; the receiver maps the same pages.
+        return (_rebuild, (self.name, self.directory, self.readonly))
+
+    def __repr__(self) -> str:
+        state = "" if self._finalizer.alive else ", closed"
+        return (
+            f"SharedArray(name={self.name!r}, shape={self.shape}, "
+            f"dtype={self.dtype}{state})"
+        )
+
+
+def _rebuild(name: str, directory: str, readonly: bool) -> SharedArray:
+    return SharedArray.attach(name, directory=directory, readonly=readonly)
+
+
+def share_array(
+    array: Any,
+    *,
+    name: str | None = None,
+    directory: str | None = None,
+) -> SharedArray:
+    """
+    Copy *array* into shared memory and return its handle.
+
+    Shorthand for :meth:`SharedArray.from_array`.
+    """
+    return SharedArray.from_array(array, name=name, directory=directory)
+
+
+def attach_shared_array(
+    name: str,
+    *,
+    directory: str | None = None,
+    readonly: bool = False,
+) -> SharedArray:
+    """
+    Attach to the segment *name* created by another process.
+
+    Shorthand for :meth:`SharedArray.attach`; usable as a worker
+    initializer when only the name is known.
+    """
+    return SharedArray.attach(name, directory=directory, readonly=readonly)
+
+
+class SharedArrayManager:
+    """
+    Create shared arrays and remove them all on exit.
+
+    Parameters
+    ----------
+    directory : str or None, optional
+        Directory for the backing files (see :meth:`SharedArray.create`).
+
+    Examples
+    --------
+    >>> with SharedArrayManager() as mgr:  # doctest: +SKIP
+    ...     X = mgr.share(features)           # one copy into shared memory
+    ...     out = mgr.create((len(features),), "float32")
+    ...     joblib.Parallel(n_jobs=4)(
+    ...         joblib.delayed(score_rows)(X, out, rows) for rows in chunks
+    ...     )
+    ...     result = out.array.copy()
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = directory
+        self._arrays: list[SharedArray] = []
+        self._lock = threading.Lock()
+
+    def create(self, shape: int | tuple[int, ...], dtype: Any = np.float64) -> SharedArray:
+        """Allocate a zero-filled shared array tracked by this manager."""
+        return self._track(SharedArray.create(shape, dtype, directory=self.directory))
+
+    def share(self, array: Any) -> SharedArray:
+        """Copy *array* into shared memory, tracked by this manager."""
+        return self._track(SharedArray.from_array(array, directory=self.directory))
+
+    def _track(self, shared: SharedArray) -> SharedArray:
+        with self._lock:
+            self._arrays.append(shared)
+        return shared
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    def shutdown(self) -> None:
+        """Close and unlink every array created by this manager."""
+        with self._lock:
+            arrays, self._arrays = self._arrays, []
+        for shared in arrays:
+            shared.close()
+            shared.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
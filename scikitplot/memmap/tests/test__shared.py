@@ -0,0 +1,117 @@
+"""Tests for scikitplot.memmap._shared (zero-copy shared arrays)."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+try:
+    from scikitplot.memmap import (
+        SharedArray,
+        SharedArrayManager,
+        attach_shared_array,
+        share_array,
+    )
+except ImportError as e:
+    pytest.skip(f"memmap module not built: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def shm_dir(tmp_path):
+    return str(tmp_path)
+
+
+def _double_in_place(shared):
+    shared.array[:] *= 2
+    return shared.array.sum()
+
+
+class TestSharedArray:
+    def test_create_is_zero_filled(self, shm_dir) -> None:
+        with SharedArray.create((3, 4), "int32", directory=shm_dir) as sa:
+            assert sa.shape == (3, 4)
+            assert sa.dtype == np.int32
+            assert sa.is_owner
+            np.testing.assert_array_equal(sa.array, np.zeros((3, 4), np.int32))
+
+    def test_from_array_round_trip(self, shm_dir) -> None:
+        src = np.asfortranarray(np.arange(12.0).reshape(3, 4))
+        with share_array(src, directory=shm_dir) as sa:
+            np.testing.assert_array_equal(np.asarray(sa), src)
+            assert sa.array.flags.c_contiguous
+
+    def test_structured_dtype(self, shm_dir) -> None:
+        dt = np.dtype([("id", "<i8"), ("score", "<f4")])
+        src = np.array([(1, 0.5), (2, 1.5)], dtype=dt)
+        with share_array(src, directory=shm_dir) as sa:
+            other = attach_shared_array(sa.name, directory=shm_dir, readonly=True)
+            assert other.dtype == dt
+            np.testing.assert_array_equal(other.array, src)
+            other.close()
+
+    def test_attach_sees_writes(self, shm_dir) -> None:
+        with SharedArray.create(4, directory=shm_dir) as sa:
+            ro = SharedArray.attach(sa.name, directory=shm_dir, readonly=True)
+            sa.array[2] = 7.0
+            assert ro.array[2] == 7.0
+            assert not ro.array.flags.writeable
+            assert not ro.is_owner
+            ro.close()
+
+    def test_pickle_carries_only_the_name(self, shm_dir) -> None:
+        with share_array(np.ones(100_000), directory=shm_dir) as sa:
+            payload = pickle.dumps(sa)
+            assert len(payload) < 1_000
+            clone = pickle.loads(payload)
+            assert clone.name == sa.name
+            np.testing.assert_array_equal(clone.array, sa.array)
+            clone.close()
+
+    def test_worker_process_writes_are_visible(self, shm_dir) -> None:
+        with share_array(np.arange(10.0), directory=shm_dir) as sa:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                total = pool.submit(_double_in_place, sa).result()
+            assert total == pytest.approx(90.0)
+            np.testing.assert_array_equal(sa.array, np.arange(10.0) * 2)
+
+    def test_views_survive_close_and_unlink(self, shm_dir) -> None:
+        sa = share_array(np.arange(5), directory=shm_dir)
+        view = sa.array
+        sa.close()
+        sa.unlink()
+        np.testing.assert_array_equal(view, np.arange(5))
+        with pytest.raises(ValueError, match="closed"):
+            sa.array
+        with pytest.raises(FileNotFoundError):
+            attach_shared_array(sa.name, directory=shm_dir)
+
+    def test_duplicate_name_rejected(self, shm_dir) -> None:
+        with SharedArray.create(1, name="dup", directory=shm_dir):
+            with pytest.raises(FileExistsError):
+                SharedArray.create(1, name="dup", directory=shm_dir)
+
+    @pytest.mark.parametrize("name", ["../escape", "", "a/b", ".hidden"])
+    def test_invalid_name_rejected(self, name, shm_dir) -> None:
+        with pytest.raises(ValueError, match="Segment name"):
+            SharedArray.create(1, name=name, directory=shm_dir)
+
+    def test_object_dtype_rejected(self, shm_dir) -> None:
+        with pytest.raises(ValueError, match="Object dtypes"):
+            SharedArray.create(2, object, directory=shm_dir)
+
+    def test_foreign_file_rejected(self, tmp_path) -> None:
+        (tmp_path / "junk").write_bytes(b"x" * 64)
+        with pytest.raises(ValueError, match="not a shared-array segment"):
+            attach_shared_array("junk", directory=str(tmp_path))
+
+
+class TestSharedArrayManager:
+    def test_shutdown_unlinks_everything(self, shm_dir) -> None:
+        with SharedArrayManager(directory=shm_dir) as mgr:
+            a = mgr.share(np.arange(3))
+            b = mgr.create((2, 2), "float32")
+            assert len(mgr) == 2
+        for sa in (a, b):
+            with pytest.raises(FileNotFoundError):
+                attach_shared_array(sa.name, directory=shm_dir)
@@ -23,10 +23,13 @@ Compilers:
 
 # nc/
 # ├── __init__.py              ← public API: get_include(), author metadata
-# ├── _wrappers.py             ← pure Python: _promote_to_supported_dtype, _binary_arraylike
+# ├── _wrappers.py             ← pure Python: dtype helpers, _binary_arraylike, _unary_arraylike
 # ├── _linalg/
-# │   ├── __init__.py          ← pure Python wrapper exposing dot
+# │   ├── __init__.py          ← wrappers: dot, row_norms, pairwise_distances, decompositions
 # │   └── tests/test__linalg.py ← tests (Layer 1 + Layer 2 mixed)
+# ├── _stats/
+# │   ├── __init__.py          ← wrappers: cumsum, histogram, argsort, argpartition
+# │   └── tests/test__stats.py  ← tests (Layer 1 + Layer 2 mixed)
 # ├── _version/
 # │   ├── __init__.py          ← imports Cython + pybind11 version modules
 # │   └── tests/
@@ -38,6 +41,7 @@ Compilers:
 
 # PUBLIC, user-facing API: Python wrapper that accepts array_like (lists, tuples, ndarrays)
 from ._linalg import *  # noqa: F403
+from ._stats import *  # noqa: F403
 from ._version import *  # noqa: F403
 
 __author__ = "David Pilger"
@@ -10,16 +10,56 @@ numpy.linalg
 
 from __future__ import annotations
 
-from .._wrappers import _binary_arraylike
+import numpy as np
+import numpy.typing as npt
+
+from .._wrappers import _as_supported_array, _binary_arraylike, _unary_arraylike
 from . import _linalg
 
-__all__ = ["dot"]
+__all__ = [
+    "cholesky",
+    "det",
+    "dot",
+    "eigh",
+    "lu",
+    "pairwise_distances",
+    "row_norms",
+    "svd",
+]
 
 # High-level, NumPy-style dot:
 # - accepts array_like (lists, tuples, ndarrays)
 # - reuses C++ docstring from _linalg.dot
 dot = _binary_arraylike(_linalg.dot, name="dot")
 
+# Single-array kernels: dtype-preserving for float64/float32/int64 inputs,
+# zero-copy for C-contiguous arrays; decompositions compute in floating point.
+row_norms = _unary_arraylike(_linalg.row_norms, name="row_norms")
+svd = _unary_arraylike(_linalg.svd, name="svd", floating=True)
+cholesky = _unary_arraylike(_linalg.cholesky, name="cholesky", floating=True)
+lu = _unary_arraylike(_linalg.lu, name="lu", floating=True)
+eigh = _unary_arraylike(_linalg.eigh, name="eigh", floating=True)
+det = _unary_arraylike(_linalg.det, name="det", floating=True)
+
+
+def pairwise_distances(
+    X: npt.ArrayLike,
+    Y: npt.ArrayLike | None = None,  # noqa: N803
+    metric: str = "euclidean",
+) -> np.ndarray:  # noqa: D103 - docstring comes from the C++ binding
+    X_arr = _as_supported_array(X, func_name="pairwise_distances")
+    if Y is None:
+        return _linalg.pairwise_distances(X_arr, None, metric)
+    Y_arr = _as_supported_array(Y, func_name="pairwise_distances")  # noqa: N806
+    if X_arr.dtype != Y_arr.dtype:
+        # Mixed inputs are measured in float64 (float32 only if both are).
+        X_arr = X_arr.astype(np.float64, copy=False)
+        Y_arr = Y_arr.astype(np.float64, copy=False)  # noqa: N806
+    return _linalg.pairwise_distances(X_arr, Y_arr, metric)
+
+
+pairwise_distances.__doc__ = _linalg.pairwise_distances.__doc__
+
 
 # """
 # Functions present in numpy.linalg are listed below.
@@ -14,6 +14,7 @@ using nc::pybindInterface::pbArray;
 // scikitplot_nc header
 using scikitplot_nc::linalg::dot;
 using scikitplot_nc::linalg::dot_doc;
+namespace linalg = scikitplot_nc::linalg;
 
 // -----------------------------------------------------
 // PYBIND11_MODULE(<module_name>, <variable>)
@@ -57,7 +58,27 @@ PYBIND11_MODULE(
         py::arg("b")   // Argument 2 name
     );
 
-    // later:
-    // m.def("norm", [](pbArray<double> a) { ... });
-    // m.def("det",  [](pbArray<double> a) { ... });
+    // -------- Norms and distances (GIL released, zero-copy inputs) --------
+    m.def(
+        "row_norms",
+        &linalg::row_norms,
+        linalg::row_norms_doc,
+        py::arg("X"),
+        py::arg("squared") = false
+    );
+    m.def(
+        "pairwise_distances",
+        &linalg::pairwise_distances,
+        linalg::pairwise_distances_doc,
+        py::arg("X"),
+        py::arg("Y") = py::none(),
+        py::arg("metric") = "euclidean"
+    );
+
+    // -------- Decompositions --------
+    m.def("svd", &linalg::svd, linalg::svd_doc, py::arg("a"));
+    m.def("cholesky", &linalg::cholesky, linalg::cholesky_doc, py::arg("a"));
+    m.def("lu", &linalg::lu, linalg::lu_doc, py::arg("a"));
+    m.def("eigh", &linalg::eigh, linalg::eigh_doc, py::arg("a"));
+    m.def("det", &linalg::det, linalg::det_doc, py::arg("a"));
 }
@@ -254,3 +254,171 @@ class TestLinalgeExtDot:
         """1-D dot product result is a finite number (not NaN or inf)."""
         result = nc.dot([1.0, 2.0], [3.0, 4.0])
         assert np.isfinite(result.flat[0])
+
+
+# ===========================================================================
+# Layer 1: wrappers for the norm, distance and decomposition kernels
+# ===========================================================================
+
+_NEW_KERNELS = (
+    "row_norms",
+    "pairwise_distances",
+    "svd",
+    "cholesky",
+    "lu",
+    "eigh",
+    "det",
+)
+
+
+class TestLinalgKernelWrappers:
+    """The new kernels are exported, named and documented like dot."""
+
+    @pytest.mark.parametrize("name", _NEW_KERNELS)
+    def test_exported_and_named(self, name):
+        assert name in _linalg_pkg.__all__
+        func = getattr(_linalg_pkg, name)
+        assert callable(func)
+        assert func.__name__ == name
+
+    @pytest.mark.skipif(not _EXT_AVAILABLE, reason=_EXT_REASON)
+    @pytest.mark.parametrize("name", _NEW_KERNELS)
+    def test_docstring_reused_from_binding(self, name):
+        ext_doc = getattr(_linalg_ext, name).__doc__
+        assert getattr(_linalg_pkg, name).__doc__ == ext_doc
+
+
+# ===========================================================================
+# Layer 2: norms and distances
+# ===========================================================================
+
+@pytest.mark.skipif(not _EXT_AVAILABLE, reason=_EXT_REASON)
+class TestLinalgExtNormsDistances:
+    """row_norms / pairwise_distances against NumPy references."""
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(37, 5))
+    Y = rng.normal(size=(70, 5))  # more rows than one cache block
+
+    @pytest.mark.parametrize("squared", [False, True])
+    def test_row_norms_matches_numpy(self, squared):
+        expected = np.linalg.norm(self.X, axis=1)
+        np.testing.assert_allclose(
+            nc.row_norms(self.X, squared=squared), expected**2 if squared else expected
+        )
+
+    def test_row_norms_dtypes(self):
+        assert nc.row_norms(self.X.astype(np.float32)).dtype == np.float32
+        out = nc.row_norms(np.array([[3, 4], [0, 0]], dtype=np.int64))
+        assert out.dtype == np.float64
+        np.testing.assert_array_equal(out, [5.0, 0.0])
+
+    def test_row_norms_rejects_1d(self):
+        with pytest.raises(ValueError):
+            nc.row_norms([1.0, 2.0])
+
+    def test_euclidean_matches_numpy(self):
+        expected = np.sqrt(((self.X[:, None, :] - self.Y[None, :, :]) ** 2).sum(-1))
+        np.testing.assert_allclose(nc.pairwise_distances(self.X, self.Y), expected)
+
+    def test_manhattan_matches_numpy(self):
+        expected = np.abs(self.X[:, None, :] - self.Y[None, :, :]).sum(-1)
+        np.testing.assert_allclose(
+            nc.pairwise_distances(self.X, self.Y, metric="manhattan"), expected
+        )
+
+    def test_cosine_matches_numpy_and_handles_zero_rows(self):
+        X = np.vstack([self.X, np.zeros(5)])
+        Xn = X / np.maximum(np.linalg.norm(X, axis=1, keepdims=True), 1e-300)
+        Yn = self.Y / np.linalg.norm(self.Y, axis=1, keepdims=True)
+        expected = np.clip(1.0 - Xn @ Yn.T, 0.0, 2.0)
+        D = nc.pairwise_distances(X, self.Y, metric="cosine")
+        np.testing.assert_allclose(D, expected, atol=1e-12)
+        np.testing.assert_allclose(D[-1], 1.0)  # zero vector: similarity 0
+
+    @pytest.mark.parametrize("metric", ["euclidean", "cosine", "manhattan"])
+    def test_symmetric_when_y_is_none(self, metric):
+        D = nc.pairwise_distances(self.Y, metric=metric)
+        full = nc.pairwise_distances(self.Y, self.Y.copy(), metric=metric)
+        np.testing.assert_allclose(D, full, atol=1e-12)
+        np.testing.assert_array_equal(np.diag(D), 0.0)
+        np.testing.assert_array_equal(D, D.T)
+
+    def test_dtype_handling(self):
+        X32 = self.X.astype(np.float32)
+        assert nc.pairwise_distances(X32).dtype == np.float32
+        assert nc.pairwise_distances(X32, self.Y).dtype == np.float64
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="Incompatible dimension"):
+            nc.pairwise_distances(self.X, self.Y[:, :3])
+        with pytest.raises(ValueError, match="Unknown metric"):
+            nc.pairwise_distances(self.X, metric="chebyshev")
+
+    def test_float64_input_is_not_copied(self):
+        """C-contiguous float64 input reaches the kernel as the same buffer."""
+        X = np.ascontiguousarray(self.X)
+        from scikitplot.nc._wrappers import _as_supported_array  # noqa: PLC0415
+
+        assert np.shares_memory(_as_supported_array(X, func_name="row_norms"), X)
+
+
+# ===========================================================================
+# Layer 2: decompositions
+# ===========================================================================
+
+@pytest.mark.skipif(not _EXT_AVAILABLE, reason=_EXT_REASON)
+class TestLinalgExtDecompositions:
+    """svd / cholesky / lu / eigh / det against NumPy references."""
+
+    rng = np.random.default_rng(1)
+    A = rng.normal(size=(6, 6))
+    SPD = A @ A.T + 6 * np.eye(6)
+
+    @pytest.mark.parametrize("shape", [(6, 6), (7, 4), (4, 7)])
+    def test_svd_reconstructs(self, shape):
+        a = self.rng.normal(size=shape)
+        u, s, vt = nc.svd(a)
+        m, n = shape
+        assert u.shape == (m, m) and vt.shape == (n, n) and s.shape == (min(m, n),)
+        np.testing.assert_allclose(s, np.linalg.svd(a, compute_uv=False), rtol=1e-8)
+        k = min(m, n)
+        np.testing.assert_allclose(u[:, :k] * s @ vt[:k], a, atol=1e-10)
+
+    def test_cholesky(self):
+        L = nc.cholesky(self.SPD)
+        np.testing.assert_allclose(L, np.linalg.cholesky(self.SPD), atol=1e-12)
+        assert nc.cholesky(self.SPD.astype(np.float32)).dtype == np.float32
+
+    def test_cholesky_not_positive_definite(self):
+        with pytest.raises(np.linalg.LinAlgError, match="positive definite"):
+            nc.cholesky([[1.0, 2.0], [2.0, 1.0]])
+
+    def test_lu_scipy_convention(self):
+        p, l, u = nc.lu(self.A)
+        np.testing.assert_allclose(p @ l @ u, self.A, atol=1e-12)
+        np.testing.assert_array_equal(np.triu(l, 1), 0.0)
+        np.testing.assert_array_equal(np.diag(l), 1.0)
+        np.testing.assert_array_equal(np.tril(u, -1), 0.0)
+        assert (np.abs(l) <= 1.0 + 1e-12).all()  # partial pivoting
+
+    def test_lu_singular_matrix(self):
+        a = np.array([[1.0, 2.0], [2.0, 4.0]])
+        p, l, u = nc.lu(a)
+        np.testing.assert_allclose(p @ l @ u, a)
+
+    def test_eigh(self):
+        w, v = nc.eigh(self.SPD)
+        np.testing.assert_allclose(w, np.linalg.eigvalsh(self.SPD), rtol=1e-10)
+        assert np.all(np.diff(w) >= 0)
+        np.testing.assert_allclose(self.SPD @ v, v * w, atol=1e-9)
+
+    def test_det(self):
+        np.testing.assert_allclose(nc.det(self.A), np.linalg.det(self.A), rtol=1e-10)
+        assert nc.det([[1, 2], [2, 4]]) == 0.0
+        assert nc.det(np.empty((0, 0))) == 1.0
+
+    @pytest.mark.parametrize("func", ["cholesky", "lu", "eigh", "det"])
+    def test_non_square_raises_linalg_error(self, func):
+        with pytest.raises(np.linalg.LinAlgError):
+            getattr(nc, func)(np.ones((2, 3)))
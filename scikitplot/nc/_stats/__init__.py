@@ -0,0 +1,68 @@
+# scikitplot/nc/_stats/__init__.py
+
+"""
+The scikitplot.nc._stats statistics and ordering functions.
+
+See Also
+--------
+numpy.cumsum
+numpy.histogram
+numpy.argsort
+numpy.argpartition
+"""
+
+from __future__ import annotations
+
+import operator
+
+import numpy as np
+import numpy.typing as npt
+
+from .._wrappers import _as_supported_array, _unary_arraylike
+from . import _stats
+
+__all__ = [
+    "argpartition",
+    "argsort",
+    "cumsum",
+    "histogram",
+]
+
+# High-level, NumPy-style kernels:
+# - accept array_like (buffer-protocol objects, lists, tuples, ndarrays)
+# - keep float64/float32/int64 inputs as they are (zero-copy when C-ordered)
+# - reuse the C++ docstrings from _stats
+cumsum = _unary_arraylike(_stats.cumsum, name="cumsum")
+argsort = _unary_arraylike(_stats.argsort, name="argsort")
+
+
+def histogram(
+    a: npt.ArrayLike,
+    bins: int = 10,
+    range: tuple[float, float] | None = None,  # noqa: A002 - NumPy's name
+) -> tuple[np.ndarray, np.ndarray]:  # noqa: D103 - docstring comes from the C++ binding
+    try:
+        n_bins = operator.index(bins)
+    except TypeError:
+        raise TypeError(
+            "scikitplot.nc.histogram only supports an integer number of "
+            "equal-width bins; use numpy.histogram for explicit bin edges."
+        ) from None
+    arr = _as_supported_array(a, func_name="histogram")
+    return _stats.histogram(arr, n_bins, range)
+
+
+def argpartition(
+    a: npt.ArrayLike,
+    kth: int | npt.ArrayLike,
+    axis: int | None = -1,
+) -> np.ndarray:  # noqa: D103 - docstring comes from the C++ binding
+    arr = _as_supported_array(a, func_name="argpartition")
+    positions = np.asarray(kth)
+    if not np.issubdtype(positions.dtype, np.integer):
+        raise TypeError("Partition index must be integer")
+    return _stats.argpartition(arr, positions.ravel().tolist(), axis)
+
+
+histogram.__doc__ = _stats.histogram.__doc__
+argpartition.__doc__ = _stats.argpartition.__doc__
@@ -0,0 +1,68 @@
+// scikitplot/nc/_stats/src/module_stats.cpp
+#include <pybind11/pybind11.h>     // Main pybind11 header
+#include <pybind11/numpy.h>        // For Pybind11 NumPy support
+#include "NumCpp.hpp"              // NumCpp library header (header-only)
+
+#include "nc.hpp"                  // Include header with template
+
+// Creates a namespace alias 'py' for the pybind11 library.
+namespace py = pybind11;
+
+// scikitplot_nc header
+namespace stats = scikitplot_nc::stats;
+
+// -----------------------------------------------------
+// PYBIND11_MODULE(<module_name>, <variable>)
+// -----------------------------------------------------
+PYBIND11_MODULE(
+    _stats,  // <module_name>, so Python sees scikitplot.nc._stats._stats
+    m,
+    py::mod_gil_not_used(),
+    py::multiple_interpreters::per_interpreter_gil()
+){
+    // -------- Module Docstring --------
+    m.doc() = R"pbdoc(
+        :py:mod:`~scikitplot.nc._stats._stats` - low-level statistics and
+        ordering kernels (cumulative sums, histograms, argsort/argpartition).
+
+        Kernels take float64, float32 and int64 NumPy arrays without copying
+        and release the GIL while they run. End users are expected to use
+        :mod:`~scikitplot.nc._stats` and :mod:`~scikitplot.nc`, which wrap
+        these kernels with NumPy-style array_like handling.
+
+        .. seealso::
+            * https://github.com/dpilger26/NumCpp
+    )pbdoc";
+
+    // -------- Bind the Functions --------
+    m.def(
+        "cumsum",
+        &stats::cumsum,
+        stats::cumsum_doc,
+        py::arg("a"),
+        py::arg("axis") = py::none()
+    );
+    m.def(
+        "histogram",
+        &stats::histogram,
+        stats::histogram_doc,
+        py::arg("a"),
+        py::arg("bins") = 10,
+        py::arg("range") = py::none()
+    );
+    m.def(
+        "argsort",
+        &stats::argsort,
+        stats::argsort_doc,
+        py::arg("a"),
+        py::arg("axis") = -1
+    );
+    m.def(
+        "argpartition",
+        &stats::argpartition,
+        stats::argpartition_doc,
+        py::arg("a"),
+        py::arg("kth"),
+        py::arg("axis") = -1
+    );
+}
@@ -0,0 +1,164 @@
+# scikitplot/nc/_stats/tests/test__stats.py
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Tests for :mod:`scikitplot.nc._stats`.
+
+Structure
+---------
+Layer 1 — pure-Python wrapper (always runnable, no compiled extension needed):
+    ``__all__``, names and argument validation done before the kernel call.
+
+Layer 2 — C++ extension (skipped when extension is not compiled):
+    ``cumsum``, ``histogram``, ``argsort`` and ``argpartition`` compared with
+    their NumPy counterparts through the public ``nc`` API.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+# ---------------------------------------------------------------------------
+# Layer 1 imports (pure Python — always importable)
+# ---------------------------------------------------------------------------
+import scikitplot.nc._stats as _stats_pkg  # noqa: PLC0415
+
+# ---------------------------------------------------------------------------
+# Layer 2 sentinel (see test__linalg.py for why this is not importorskip)
+# ---------------------------------------------------------------------------
+try:
+    from scikitplot.nc._stats import _stats as _stats_ext  # C++ module
+    _EXT_AVAILABLE = True
+except ImportError:
+    _stats_ext = None  # type: ignore[assignment]
+    _EXT_AVAILABLE = False
+
+_EXT_REASON = "C++ extension _stats._stats not compiled"
+
+try:
+    import scikitplot.nc as nc  # noqa: PLC0415
+except ImportError:
+    nc = None  # type: ignore[assignment]
+
+_KERNELS = ("cumsum", "histogram", "argsort", "argpartition")
+
+
+# ===========================================================================
+# Layer 1: Pure-Python wrapper layer (_stats package __init__)
+# ===========================================================================
+
+class TestStatsPackageInit:
+    """Tests for nc._stats.__init__ that require NO compiled extension."""
+
+    @pytest.mark.parametrize("name", _KERNELS)
+    def test_exported_and_named(self, name):
+        assert name in _stats_pkg.__all__
+        assert getattr(_stats_pkg, name).__name__ == name
+
+    def test_histogram_rejects_explicit_edges(self):
+        with pytest.raises(TypeError, match="integer number"):
+            _stats_pkg.histogram([1.0, 2.0], bins=[0.0, 1.0, 2.0])
+
+    def test_argpartition_rejects_float_kth(self):
+        with pytest.raises(TypeError, match="integer"):
+            _stats_pkg.argpartition([1.0, 2.0], 0.5)
+
+
+# ===========================================================================
+# Layer 2: C++ extension
+# ===========================================================================
+
+@pytest.mark.skipif(not _EXT_AVAILABLE, reason=_EXT_REASON)
+class TestStatsExtCumsum:
+    """cumsum is bit-identical to numpy.cumsum."""
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+    @pytest.mark.parametrize("axis", [None, 0, 1, 2, -1])
+    def test_matches_numpy(self, dtype, axis):
+        a = np.random.default_rng(0).normal(scale=100, size=(3, 4, 5)).astype(dtype)
+        out = nc.cumsum(a, axis=axis)
+        expected = np.cumsum(a, axis=axis)
+        assert out.dtype == expected.dtype
+        np.testing.assert_array_equal(out, expected)
+
+    def test_promotes_small_ints_and_lists(self):
+        out = nc.cumsum(np.array([1, 2, 3], dtype=np.int8))
+        assert out.dtype == np.int64
+        np.testing.assert_array_equal(nc.cumsum([[1, 2], [3, 4]]), [1, 3, 6, 10])
+
+    def test_bad_axis(self):
+        with pytest.raises(ValueError, match="out of bounds"):
+            nc.cumsum(np.ones((2, 2)), axis=2)
+
+
+@pytest.mark.skipif(not _EXT_AVAILABLE, reason=_EXT_REASON)
+class TestStatsExtHistogram:
+    """histogram counts and edges agree with numpy.histogram."""
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+    @pytest.mark.parametrize("bins", [1, 7, 64])
+    def test_matches_numpy(self, dtype, bins):
+        a = (np.random.default_rng(1).normal(size=5000) * 50).astype(dtype)
+        hist, edges = nc.histogram(a, bins=bins)
+        ref_hist, ref_edges = np.histogram(a, bins=bins)
+        np.testing.assert_array_equal(hist, ref_hist)
+        np.testing.assert_allclose(edges, ref_edges, rtol=1e-6)
+        assert hist.dtype == np.int64 and hist.sum() == a.size
+
+    def test_range_excludes_outside_values_and_nan(self):
+        a = np.array([-1.0, 0.0, 0.5, 1.0, 2.0, np.nan])
+        hist, _ = nc.histogram(a, bins=2, range=(0.0, 1.0))
+        expected, _ = np.histogram(a, bins=2, range=(0.0, 1.0))
+        np.testing.assert_array_equal(hist, expected)
+
+    def test_constant_and_empty_input(self):
+        _, edges = nc.histogram([3.0, 3.0])
+        np.testing.assert_allclose(edges, np.histogram([3.0, 3.0])[1])
+        hist, edges = nc.histogram(np.array([]), bins=4)
+        np.testing.assert_array_equal(hist, 0)
+        np.testing.assert_allclose(edges, np.linspace(0, 1, 5))
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="positive"):
+            nc.histogram([1.0], bins=0)
+        with pytest.raises(ValueError, match="larger than min"):
+            nc.histogram([1.0], range=(2.0, 1.0))
+        with pytest.raises(ValueError, match="not finite"):
+            nc.histogram([1.0, np.nan])
+
+
+@pytest.mark.skipif(not _EXT_AVAILABLE, reason=_EXT_REASON)
+class TestStatsExtOrdering:
+    """argsort / argpartition against numpy."""
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+    @pytest.mark.parametrize("axis", [None, 0, -1])
+    def test_argsort_matches_stable_numpy(self, dtype, axis):
+        a = np.random.default_rng(2).integers(0, 10, size=(6, 40)).astype(dtype)
+        out = nc.argsort(a, axis=axis)
+        assert out.dtype == np.int64
+        np.testing.assert_array_equal(out, np.argsort(a, axis=axis, kind="stable"))
+
+    def test_argsort_nan_last(self):
+        a = np.array([np.nan, 2.0, np.nan, 1.0])
+        np.testing.assert_array_equal(nc.argsort(a), np.argsort(a, kind="stable"))
+
+    @pytest.mark.parametrize("kth", [0, 17, -1, [3, 30, 10]])
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_argpartition_property(self, kth, axis):
+        a = np.random.default_rng(3).normal(size=(40, 40))
+        idx = nc.argpartition(a, kth, axis=axis)
+        part = np.take_along_axis(a, idx, axis=axis)
+        ref = np.sort(a, axis=axis)
+        for k in np.atleast_1d(kth) % 40:
+            kth_vals = np.take(part, [k], axis=axis)
+            np.testing.assert_array_equal(kth_vals, np.take(ref, [k], axis=axis))
+            assert (np.take(part, range(k), axis=axis) <= kth_vals).all()
+            assert (np.take(part, range(k + 1, 40), axis=axis) >= kth_vals).all()
+
+    def test_argpartition_kth_out_of_bounds(self):
+        with pytest.raises(ValueError, match="out of bounds"):
+            nc.argpartition([1.0, 2.0], 2)
@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Any, Callable
 
 import numpy as np
 import numpy.typing as npt
@@ -210,3 +210,108 @@ def _binary_arraylike(
     # Reuse the docstring from the low-level C++ binding to avoid duplication
     wrapped.__doc__ = core.__doc__
     return wrapped
+
+
+#: dtypes the C++ kernels are instantiated for.
+_BACKEND_DTYPES = (np.dtype(np.float64), np.dtype(np.float32), np.dtype(np.int64))
+
+
+def _as_supported_array(
+    a: npt.ArrayLike,
+    *,
+    func_name: str,
+    floating: bool = False,
+) -> np.ndarray:
+    """
+    Convert one array-like input to a backend dtype, zero-copy when possible.
+
+    Unlike :func:`_promote_to_supported_dtype`, the dtype of a single input
+    is preserved whenever the kernels implement it, so ``float32`` data stays
+    ``float32``.
+
+    Parameters
+    ----------
+    a : array_like
+        Input data (buffer-protocol objects, lists, tuples, ndarrays).
+    func_name : str
+        Name of the calling function, used in error messages.
+    floating : bool, default=False
+        Map integer and boolean inputs to ``float64`` instead of ``int64``
+        (for kernels, such as decompositions, that only have float variants).
+
+    Returns
+    -------
+    numpy.ndarray
+        C-contiguous ``float64``, ``float32`` or ``int64`` array. An input
+        that already has one of these dtypes and C layout is returned as a
+        view of the same memory.
+
+    Raises
+    ------
+    TypeError
+        If the dtype is not integer, boolean, floating, or object data that
+        can be converted to ``float64``.
+    """
+    arr = np.asarray(a)
+    dtype = arr.dtype
+    if dtype in _BACKEND_DTYPES:
+        target = dtype
+    elif np.issubdtype(dtype, np.floating):
+        target = np.dtype(np.float64)
+    elif np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.bool_):
+        target = np.dtype(np.int64)
+    elif dtype == np.dtype("O"):
+        try:
+            arr = arr.astype(np.float64)
+        except (TypeError, ValueError) as exc:
+            raise TypeError(
+                f"scikitplot.nc.{func_name} received object-dtype input that "
+                "could not be converted to numeric values."
+            ) from exc
+        target = arr.dtype
+    else:
+        raise TypeError(
+            f"scikitplot.nc.{func_name} does not yet support dtype {dtype!r}; "
+            "supported inputs are integer, boolean, or floating types."
+        )
+    if floating and target == np.int64:
+        target = np.dtype(np.float64)
+    return np.ascontiguousarray(arr, dtype=target)
+
+
+def _unary_arraylike(
+    core: Callable[..., Any],
+    *,
+    name: str | None = None,
+    floating: bool = False,
+) -> Callable[..., Any]:
+    """
+    Wrap a single-array C++ kernel so it accepts any array_like input.
+
+    The first argument is passed through :func:`_as_supported_array`; all
+    other positional and keyword arguments are forwarded unchanged.
+
+    Parameters
+    ----------
+    core : callable
+        Low-level kernel taking a ``numpy.ndarray`` as first argument.
+    name : str, optional
+        Name assigned to the wrapper and used in error messages. Defaults
+        to ``core.__name__``.
+    floating : bool, default=False
+        Forwarded to :func:`_as_supported_array`.
+
+    Returns
+    -------
+    wrapped : callable
+        Wrapper that inherits the docstring of ``core``.
+    """
+    func_name = name or core.__name__
+
+    def wrapped(a: npt.ArrayLike, *args: Any, **kwargs: Any) -> Any:
+        arr = _as_supported_array(a, func_name=func_name, floating=floating)
+        return core(arr, *args, **kwargs)
+
+    wrapped.__name__ = func_name
+    wrapped.__doc__ = core.__doc__
+    return wrapped
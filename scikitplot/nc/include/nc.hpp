@@ -9,4 +9,5 @@
 /// the ::nc namespace from the upstream NumCpp library.
 
 #include "nc/linalg.hpp"
-// later: #include "nc/random.hpp", "nc/stats.hpp", ...
+#include "nc/stats.hpp"
+// later: #include "nc/random.hpp", ...
@@ -0,0 +1,215 @@
+// include/nc/detail/decompositions.hpp
+#pragma once
+
+/// @file decompositions.hpp
+/// @brief Python-free matrix decompositions behind scikitplot.nc._linalg.
+///
+/// SVD and the symmetric eigensolver delegate to ``nc::linalg`` on a
+/// zero-copy ``nc::NdArray`` shell over the caller's buffer. LU, Cholesky and
+/// the determinant are factorized here instead: NumCpp's
+/// ``pivotLU_decomposition`` throws on singular input, ``nc::det`` is a
+/// cofactor expansion, and every NumCpp error is echoed to stderr, none of
+/// which suits a general-purpose kernel. Failures are reported through
+/// return values, so callers can run these functions with the GIL released.
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <exception>
+#include <numeric>
+#include <vector>
+
+#include "NumCpp.hpp"
+
+#include "nc/detail/kernels.hpp"
+
+namespace scikitplot_nc::detail
+{
+
+/// Read-only NumCpp view over a C-contiguous (rows, cols) buffer.
+template <typename T>
+inline nc::NdArray<T> shell_view(const T* data, index_t rows, index_t cols)
+{
+    return nc::NdArray<T>(
+        const_cast<T*>(data),
+        static_cast<nc::uint32>(rows),
+        static_cast<nc::uint32>(cols),
+        nc::PointerPolicy::SHELL);
+}
+
+/// Copy a NumCpp result into a caller-owned buffer, casting to R.
+template <typename R>
+inline void copy_out(const nc::NdArray<double>& src, R* dst)
+{
+    std::transform(src.begin(), src.end(), dst,
+        [](double v) { return static_cast<R>(v); });
+}
+
+// ---------------------------------------------------------------------------
+// LU and Cholesky
+// ---------------------------------------------------------------------------
+
+/**
+ * In-place Doolittle LU of the n x n matrix ``a`` with row pivoting.
+ *
+ * On return ``lu`` holds L (unit diagonal, strictly below) and U (on and
+ * above the diagonal), and row ``k`` of ``P A`` is row ``perm[k]`` of ``a``.
+ * A zero pivot column is skipped instead of aborting, so singular matrices
+ * factor too (with a zero on the diagonal of U).
+ *
+ * @return +1 or -1, the sign of the row permutation.
+ */
+template <typename T>
+int lu_factor(const T* a, index_t n, std::vector<double>& lu, std::vector<index_t>& perm)
+{
+    lu.assign(a, a + n * n);
+    perm.resize(static_cast<std::size_t>(n));
+    std::iota(perm.begin(), perm.end(), index_t{0});
+    int sign = 1;
+    for (index_t k = 0; k < n; ++k) {
+        index_t p = k;
+        double best = std::fabs(lu[k * n + k]);
+        for (index_t i = k + 1; i < n; ++i) {
+            const double v = std::fabs(lu[i * n + k]);
+            if (v > best) {
+                best = v;
+                p = i;
+            }
+        }
+        if (p != k) {
+            std::swap_ranges(lu.begin() + k * n, lu.begin() + (k + 1) * n, lu.begin() + p * n);
+            std::swap(perm[k], perm[p]);
+            sign = -sign;
+        }
+        const double pivot = lu[k * n + k];
+        if (pivot == 0.0) {
+            continue;
+        }
+        for (index_t i = k + 1; i < n; ++i) {
+            double* row = lu.data() + i * n;
+            const double f = row[k] / pivot;
+            row[k] = f;
+            if (f == 0.0) {
+                continue;
+            }
+            const double* prow = lu.data() + k * n;
+            for (index_t j = k + 1; j < n; ++j) {
+                row[j] -= f * prow[j];
+            }
+        }
+    }
+    return sign;
+}
+
+/// SciPy-style ``A = P @ L @ U`` for a square matrix, written to p/l/u.
+template <typename T, typename R>
+void lu(const T* a, index_t n, R* p, R* l, R* u)
+{
+    std::vector<double> f;
+    std::vector<index_t> perm;
+    lu_factor(a, n, f, perm);
+    std::fill(p, p + n * n, R(0));
+    for (index_t k = 0; k < n; ++k) {
+        p[perm[k] * n + k] = R(1);
+        for (index_t j = 0; j < n; ++j) {
+            const double v = f[k * n + j];
+            l[k * n + j] = j < k ? static_cast<R>(v) : R(j == k ? 1 : 0);
+            u[k * n + j] = j >= k ? static_cast<R>(v) : R(0);
+        }
+    }
+}
+
+/// Determinant as the signed product of the LU pivots, O(n^3).
+template <typename T>
+double det(const T* a, index_t n)
+{
+    std::vector<double> f;
+    std::vector<index_t> perm;
+    double out = lu_factor(a, n, f, perm);
+    for (index_t k = 0; k < n; ++k) {
+        out *= f[k * n + k];
+    }
+    return out + 0.0;  // no negative zero for singular input
+}
+
+/**
+ * Lower Cholesky factor ``A = L @ L.T`` (Cholesky-Banachiewicz, row by row).
+ * Only the lower triangle of ``a`` is read.
+ *
+ * @return false if a pivot is not strictly positive (or is NaN).
+ */
+template <typename T, typename R>
+bool cholesky(const T* a, index_t n, R* out)
+{
+    std::vector<double> l(static_cast<std::size_t>(n * n), 0.0);
+    for (index_t i = 0; i < n; ++i) {
+        double* li = l.data() + i * n;
+        for (index_t j = 0; j <= i; ++j) {
+            const double* lj = l.data() + j * n;
+            double acc = static_cast<double>(a[i * n + j]);
+            for (index_t k = 0; k < j; ++k) {
+                acc -= li[k] * lj[k];
+            }
+            if (i == j) {
+                if (!(acc > 0.0)) {
+                    return false;
+                }
+                li[i] = std::sqrt(acc);
+            } else {
+                li[j] = acc / lj[j];
+            }
+        }
+    }
+    std::transform(l.begin(), l.end(), out, [](double v) { return static_cast<R>(v); });
+    return true;
+}
+
+// ---------------------------------------------------------------------------
+// NumCpp-backed decompositions
+// ---------------------------------------------------------------------------
+
+/**
+ * Full SVD ``A = U @ diag(S) @ VT`` of an (m, n) matrix via
+ * ``nc::linalg::svd``: u is (m, m), s has min(m, n) values in descending
+ * order and vt is (n, n).
+ */
+template <typename T, typename R>
+bool svd(const T* a, index_t m, index_t n, R* u, R* s, R* vt)
+{
+    try {
+        nc::NdArray<double> U, S, VT;
+        nc::linalg::svd(shell_view(a, m, n), U, S, VT);
+        copy_out(U, u);
+        copy_out(S, s);
+        copy_out(VT, vt);
+    } catch (const std::exception&) {
+        return false;
+    }
+    return true;
+}
+
+/**
+ * Eigenpairs of a real symmetric matrix via NumCpp's Jacobi solver,
+ * re-ordered to ascending eigenvalues like ``numpy.linalg.eigh``.
+ * ``vectors`` holds the eigenvectors as columns.
+ */
+template <typename T, typename R>
+bool eigh(const T* a, index_t n, R* values, R* vectors)
+{
+    try {
+        const auto [vals, vecs] = nc::linalg::eig(shell_view(a, n, n));
+        // NumCpp sorts descending; reverse the order of pairs.
+        for (index_t k = 0; k < n; ++k) {
+            const auto src = static_cast<nc::uint32>(n - 1 - k);
+            values[k] = static_cast<R>(vals[src]);
+            for (index_t i = 0; i < n; ++i) {
+                vectors[i * n + k] = static_cast<R>(vecs(static_cast<nc::uint32>(i), src));
+            }
+        }
+    } catch (const std::exception&) {
+        return false;
+    }
+    return true;
+}
+
+} // namespace scikitplot_nc::detail
@@ -0,0 +1,364 @@
+// include/nc/detail/kernels.hpp
+#pragma once
+
+/// @file kernels.hpp
+/// @brief Python-free compute kernels behind the scikitplot.nc bindings.
+///
+/// Every function here works on raw C-contiguous buffers owned by the caller
+/// and never touches a Python object, so the pybind11 layer can run it with
+/// the GIL released. Reductions accumulate in double precision; element-wise
+/// scans (cumsum) stay in the input dtype, exactly like NumPy.
+
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <numeric>
+#include <type_traits>
+#include <vector>
+
+namespace scikitplot_nc::detail
+{
+
+using index_t = std::ptrdiff_t;
+
+/// Floating dtype of norm/distance results: float32 stays float32, float64
+/// and integer inputs produce float64 (the NumPy / scikit-learn convention).
+template <typename T>
+using float_result_t = std::conditional_t<std::is_same_v<T, float>, float, double>;
+
+/// Rows of ``y`` kept hot in cache while a block of distances is computed.
+inline constexpr index_t kDistanceBlock = 64;
+
+// ---------------------------------------------------------------------------
+// Row norms
+// ---------------------------------------------------------------------------
+
+template <typename T, typename R>
+void row_norms(const T* x, index_t n, index_t d, bool squared, R* out)
+{
+    for (index_t i = 0; i < n; ++i) {
+        const T* row = x + i * d;
+        double acc = 0.0;
+        for (index_t k = 0; k < d; ++k) {
+            const double v = static_cast<double>(row[k]);
+            acc += v * v;
+        }
+        out[i] = static_cast<R>(squared ? acc : std::sqrt(acc));
+    }
+}
+
+// ---------------------------------------------------------------------------
+// Pairwise distances
+// ---------------------------------------------------------------------------
+
+enum class Metric { euclidean, cosine, manhattan };
+
+template <typename T>
+inline double squared_euclidean(const T* a, const T* b, index_t d)
+{
+    double acc = 0.0;
+    for (index_t k = 0; k < d; ++k) {
+        const double diff = static_cast<double>(a[k]) - static_cast<double>(b[k]);
+        acc += diff * diff;
+    }
+    return acc;
+}
+
+template <typename T>
+inline double cityblock(const T* a, const T* b, index_t d)
+{
+    double acc = 0.0;
+    for (index_t k = 0; k < d; ++k) {
+        acc += std::fabs(static_cast<double>(a[k]) - static_cast<double>(b[k]));
+    }
+    return acc;
+}
+
+template <typename T>
+inline double inner(const T* a, const T* b, index_t d)
+{
+    double acc = 0.0;
+    for (index_t k = 0; k < d; ++k) {
+        acc += static_cast<double>(a[k]) * static_cast<double>(b[k]);
+    }
+    return acc;
+}
+
+/// Euclidean norms with zero norms replaced by one, so a zero vector has
+/// cosine similarity 0 with everything (scikit-learn's ``normalize`` rule).
+template <typename T>
+std::vector<double> safe_norms(const T* x, index_t n, index_t d)
+{
+    std::vector<double> norms(static_cast<std::size_t>(n));
+    row_norms(x, n, d, false, norms.data());
+    for (auto& v : norms) {
+        if (v == 0.0) {
+            v = 1.0;
+        }
+    }
+    return norms;
+}
+
+/**
+ * Distance matrix ``out[i, j] = metric(x[i], y[j])`` of shape (n, m).
+ *
+ * With ``symmetric`` (``y`` is ``x``) only the upper triangle is computed,
+ * mirrored, and the diagonal is set to exactly zero. ``y`` is walked in
+ * blocks of kDistanceBlock rows so each block is reused from cache across
+ * all rows of ``x``.
+ */
+template <typename T, typename R>
+void pairwise_distances(
+    const T* x, index_t n, const T* y, index_t m, index_t d,
+    Metric metric, bool symmetric, R* out)
+{
+    std::vector<double> x_norms, y_norms;
+    if (metric == Metric::cosine) {
+        x_norms = safe_norms(x, n, d);
+        y_norms = symmetric ? x_norms : safe_norms(y, m, d);
+    }
+
+    for (index_t jb = 0; jb < m; jb += kDistanceBlock) {
+        const index_t je = std::min(m, jb + kDistanceBlock);
+        for (index_t i = 0; i < n; ++i) {
+            const T* xi = x + i * d;
+            const index_t j0 = symmetric ? std::max(jb, i + 1) : jb;
+            for (index_t j = j0; j < je; ++j) {
+                const T* yj = y + j * d;
+                double dist = 0.0;
+                switch (metric) {
+                    case Metric::euclidean:
+                        dist = std::sqrt(squared_euclidean(xi, yj, d));
+                        break;
+                    case Metric::manhattan:
+                        dist = cityblock(xi, yj, d);
+                        break;
+                    case Metric::cosine:
+                        dist = 1.0 - inner(xi, yj, d) / (x_norms[i] * y_norms[j]);
+                        dist = std::clamp(dist, 0.0, 2.0);
+                        break;
+                }
+                out[i * m + j] = static_cast<R>(dist);
+                if (symmetric) {
+                    out[j * m + i] = static_cast<R>(dist);
+                }
+            }
+        }
+    }
+    if (symmetric) {
+        for (index_t i = 0; i < n; ++i) {
+            out[i * m + i] = R(0);
+        }
+    }
+}
+
+// ---------------------------------------------------------------------------
+// Cumulative sum
+// ---------------------------------------------------------------------------
+
+/// Two's-complement wrapping add for integers (NumPy semantics, no UB).
+template <typename T>
+inline T wrapping_add(T a, T b)
+{
+    if constexpr (std::is_integral_v<T>) {
+        using U = std::make_unsigned_t<T>;
+        return static_cast<T>(static_cast<U>(a) + static_cast<U>(b));
+    } else {
+        return a + b;
+    }
+}
+
+/**
+ * Cumulative sum along the middle axis of an array viewed as
+ * (outer, len, inner). The innermost loop runs over ``inner`` contiguous
+ * elements, so scans along a leading axis vectorize.
+ */
+template <typename T>
+void cumsum(const T* a, index_t outer, index_t len, index_t inner, T* out)
+{
+    if (len == 0) {
+        return;
+    }
+    const index_t slab = len * inner;
+    for (index_t o = 0; o < outer; ++o) {
+        const T* src = a + o * slab;
+        T* dst = out + o * slab;
+        std::copy(src, src + inner, dst);
+        for (index_t k = 1; k < len; ++k) {
+            const T* s = src + k * inner;
+            const T* prev = dst + (k - 1) * inner;
+            T* cur = dst + k * inner;
+            for (index_t j = 0; j < inner; ++j) {
+                cur[j] = wrapping_add(prev[j], s[j]);
+            }
+        }
+    }
+}
+
+// ---------------------------------------------------------------------------
+// Histogram
+// ---------------------------------------------------------------------------
+
+/// Minimum and maximum of ``a``; false if either is NaN or infinite.
+template <typename T>
+bool finite_min_max(const T* a, index_t n, double& lo, double& hi)
+{
+    if (n == 0) {
+        lo = 0.0;
+        hi = 1.0;
+        return true;
+    }
+    lo = hi = static_cast<double>(a[0]);
+    for (index_t i = 0; i < n; ++i) {
+        const double v = static_cast<double>(a[i]);
+        if (!std::isfinite(v)) {
+            lo = hi = v;
+            return false;
+        }
+        lo = std::min(lo, v);
+        hi = std::max(hi, v);
+    }
+    return true;
+}
+
+/// ``bins + 1`` evenly spaced edges, computed like ``numpy.linspace`` with
+/// arithmetic in ``C`` (``float`` reproduces NumPy 2 edges for float32 data).
+template <typename C, typename E>
+void linspace_edges(double first, double last, index_t bins, E* edges)
+{
+    const C start = static_cast<C>(first);
+    const C stop = static_cast<C>(last);
+    const C delta = stop - start;
+    const C step = delta / static_cast<C>(bins);
+    for (index_t i = 0; i < bins; ++i) {
+        C y = static_cast<C>(i);
+        if (step == C{0}) {
+            // Denormal step, as numpy.linspace: divide first, then scale.
+            y = y / static_cast<C>(bins) * delta;
+        } else {
+            y = y * step;
+        }
+        edges[i] = static_cast<E>(y + start);
+    }
+    edges[bins] = static_cast<E>(stop);
+}
+
+/**
+ * Counts over ``bins`` equal-width bins spanning [first, last].
+ *
+ * Mirrors numpy.histogram's fast path: the bin index is computed
+ * arithmetically, then corrected against the (rounded) edges so every value
+ * lands in the bin whose half-open interval contains it; the last bin is
+ * closed. Values outside the range and NaNs are ignored.
+ */
+template <typename T, typename E>
+void histogram_uniform(
+    const T* a, index_t n, index_t bins, double first, double last,
+    const E* edges, std::int64_t* counts)
+{
+    std::fill(counts, counts + bins, std::int64_t{0});
+    const E lo = static_cast<E>(first);
+    const E hi = static_cast<E>(last);
+    const double scale = static_cast<double>(bins) / (last - first);
+    for (index_t i = 0; i < n; ++i) {
+        const E x = static_cast<E>(a[i]);
+        if (!(x >= lo && x <= hi)) {
+            continue;
+        }
+        index_t idx = static_cast<index_t>((static_cast<double>(x) - first) * scale);
+        idx = std::clamp<index_t>(idx, 0, bins - 1);
+        if (x < edges[idx]) {
+            --idx;
+        } else if (idx != bins - 1 && x >= edges[idx + 1]) {
+            ++idx;
+        }
+        ++counts[idx];
+    }
+}
+
+// ---------------------------------------------------------------------------
+// Sorting
+// ---------------------------------------------------------------------------
+
+/// Strict weak ordering that sorts NaN after every number (NumPy order).
+template <typename T>
+struct NanLastLess
+{
+    bool operator()(T a, T b) const
+    {
+        if constexpr (std::is_floating_point_v<T>) {
+            return a < b || (std::isnan(b) && !std::isnan(a));
+        } else {
+            return a < b;
+        }
+    }
+};
+
+/**
+ * Apply ``order(values, idx)`` to every 1-D lane of an array viewed as
+ * (outer, len, inner) and scatter the permuted indices into ``out``.
+ * Strided lanes are gathered into a scratch buffer first.
+ */
+template <typename T, typename Order>
+void for_each_lane(
+    const T* a, index_t outer, index_t len, index_t inner,
+    std::int64_t* out, Order order)
+{
+    std::vector<T> scratch(inner == 1 ? 0 : static_cast<std::size_t>(len));
+    std::vector<std::int64_t> idx(static_cast<std::size_t>(len));
+    for (index_t o = 0; o < outer; ++o) {
+        for (index_t j = 0; j < inner; ++j) {
+            const T* base = a + o * len * inner + j;
+            const T* values = base;
+            if (inner != 1) {
+                for (index_t k = 0; k < len; ++k) {
+                    scratch[k] = base[k * inner];
+                }
+                values = scratch.data();
+            }
+            std::iota(idx.begin(), idx.end(), std::int64_t{0});
+            order(values, idx);
+            std::int64_t* dst = out + o * len * inner + j;
+            for (index_t k = 0; k < len; ++k) {
+                dst[k * inner] = idx[k];
+            }
+        }
+    }
+}
+
+/// Stable argsort of every lane; NaNs last.
+template <typename T>
+void argsort(const T* a, index_t outer, index_t len, index_t inner, std::int64_t* out)
+{
+    const NanLastLess<T> less;
+    for_each_lane(a, outer, len, inner, out,
+        [&](const T* values, std::vector<std::int64_t>& idx) {
+            std::stable_sort(idx.begin(), idx.end(),
+                [&](std::int64_t p, std::int64_t q) { return less(values[p], values[q]); });
+        });
+}
+
+/**
+ * Argpartition of every lane around the sorted, de-duplicated,
+ * non-negative positions ``kth``. Each selection only searches the part of
+ * the lane to the right of the previous one (introselect via nth_element).
+ */
+template <typename T>
+void argpartition(
+    const T* a, index_t outer, index_t len, index_t inner,
+    const std::vector<index_t>& kth, std::int64_t* out)
+{
+    const NanLastLess<T> less;
+    for_each_lane(a, outer, len, inner, out,
+        [&](const T* values, std::vector<std::int64_t>& idx) {
+            auto first = idx.begin();
+            for (const index_t k : kth) {
+                std::nth_element(first, idx.begin() + k, idx.end(),
+                    [&](std::int64_t p, std::int64_t q) { return less(values[p], values[q]); });
+                first = idx.begin() + k + 1;
+            }
+        });
+}
+
+} // namespace scikitplot_nc::detail
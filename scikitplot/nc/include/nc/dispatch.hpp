@@ -0,0 +1,105 @@
+// include/nc/dispatch.hpp
+#pragma once
+
+/// @file dispatch.hpp
+/// @brief Shared dtype dispatch and axis helpers for scikitplot.nc bindings.
+///
+/// Kernels are instantiated for float64, float32 and int64. Arrays are taken
+/// as C-contiguous ``py::array_t`` views, which pybind11 builds without a
+/// copy whenever the input already has that dtype and layout (the Python
+/// wrappers make sure it does).
+
+#include <string>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+namespace py = pybind11;
+
+namespace scikitplot_nc
+{
+
+/// C-contiguous NumPy array of T (zero-copy for matching inputs).
+template <typename T>
+using CArray = py::array_t<T, py::array::c_style>;
+
+/// Call ``f(T{})`` with T matching the dtype of ``a`` or raise TypeError.
+template <typename F>
+auto dispatch_dtype(const py::array& a, const char* func, F&& f) -> decltype(f(double{}))
+{
+    const auto dtype = a.dtype();
+    if (dtype.is(py::dtype::of<double>())) {
+        return f(double{});
+    }
+    if (dtype.is(py::dtype::of<float>())) {
+        return f(float{});
+    }
+    if (dtype.is(py::dtype::of<long long>())) {
+        return f(static_cast<long long>(0));
+    }
+    throw py::type_error(
+        std::string("Unsupported dtype for scikitplot.nc.") + func +
+        ". Supported dtypes are float64, float32 and int64."
+    );
+}
+
+/// Like dispatch_dtype, restricted to float64 and float32.
+template <typename F>
+auto dispatch_float(const py::array& a, const char* func, F&& f) -> decltype(f(double{}))
+{
+    const auto dtype = a.dtype();
+    if (dtype.is(py::dtype::of<double>())) {
+        return f(double{});
+    }
+    if (dtype.is(py::dtype::of<float>())) {
+        return f(float{});
+    }
+    throw py::type_error(
+        std::string("Unsupported dtype for scikitplot.nc.") + func +
+        ". Supported dtypes are float64 and float32."
+    );
+}
+
+/// An array viewed as (outer, len, inner) around one axis.
+struct AxisSplit
+{
+    py::ssize_t outer = 1;
+    py::ssize_t len = 1;
+    py::ssize_t inner = 1;
+};
+
+/**
+ * Split the shape of ``a`` around ``axis``; ``None`` means the flattened
+ * array. Negative axes count from the end, as in NumPy.
+ */
+inline AxisSplit split_axis(const py::array& a, const py::object& axis, const char* func)
+{
+    AxisSplit s;
+    if (axis.is_none()) {
+        s.len = a.size();
+        return s;
+    }
+    const auto ndim = static_cast<py::ssize_t>(a.ndim());
+    auto ax = axis.cast<py::ssize_t>();
+    if (ax < -ndim || ax >= ndim) {
+        throw py::value_error(
+            std::string("scikitplot.nc.") + func + ": axis " + std::to_string(ax) +
+            " is out of bounds for array of dimension " + std::to_string(ndim)
+        );
+    }
+    if (ax < 0) {
+        ax += ndim;
+    }
+    for (py::ssize_t i = 0; i < ndim; ++i) {
+        if (i < ax) {
+            s.outer *= a.shape(i);
+        } else if (i == ax) {
+            s.len = a.shape(i);
+        } else {
+            s.inner *= a.shape(i);
+        }
+    }
+    return s;
+}
+
+} // namespace scikitplot_nc
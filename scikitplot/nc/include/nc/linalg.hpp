@@ -7,4 +7,6 @@
 /// Aggregates individual linear algebra bindings such as dot, norm, det, etc.
 
 #include "nc/linalg/dot.hpp"
-// later: #include "nc/linalg/norm.hpp", ...
+#include "nc/linalg/norms.hpp"
+#include "nc/linalg/distances.hpp"
+#include "nc/linalg/decompositions.hpp"
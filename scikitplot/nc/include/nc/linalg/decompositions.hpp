@@ -0,0 +1,308 @@
+// include/nc/linalg/decompositions.hpp
+#pragma once
+
+#include <algorithm>
+#include <string>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include "nc/detail/decompositions.hpp"
+#include "nc/dispatch.hpp"
+
+namespace py = pybind11;
+
+namespace scikitplot_nc::linalg
+{
+
+inline constexpr const char* svd_doc = R"pbdoc(
+svd(a)
+
+Singular value decomposition ``a = u @ diag(s) @ vt``.
+
+Parameters
+----------
+a : array_like of shape (M, N)
+    Real matrix. float32 is kept; other dtypes are computed in float64.
+
+Returns
+-------
+u : numpy.ndarray of shape (M, M)
+s : numpy.ndarray of shape (min(M, N),)
+    Singular values in descending order.
+vt : numpy.ndarray of shape (N, N)
+
+Raises
+------
+numpy.linalg.LinAlgError
+    If ``a`` is not 2-D.
+
+Notes
+-----
+Backed by NumCpp's ``nc::linalg::svd``, which diagonalizes ``a.T @ a``
+and ``a @ a.T`` with the Jacobi method. This squares the condition number,
+so singular values far below ``sqrt(eps) * s[0]`` lose relative accuracy;
+prefer :func:`numpy.linalg.svd` for ill-conditioned problems. Intended for
+small and medium matrices.
+
+See Also
+--------
+numpy.linalg.svd
+)pbdoc";
+
+inline constexpr const char* cholesky_doc = R"pbdoc(
+cholesky(a)
+
+Lower Cholesky factor ``L`` with ``a = L @ L.T``.
+
+Parameters
+----------
+a : array_like of shape (M, M)
+    Symmetric positive-definite matrix; only the lower triangle is read.
+
+Returns
+-------
+L : numpy.ndarray of shape (M, M)
+    Lower-triangular factor, float32 for float32 input, float64 otherwise.
+
+Raises
+------
+numpy.linalg.LinAlgError
+    If ``a`` is not square or not positive definite.
+
+See Also
+--------
+numpy.linalg.cholesky
+)pbdoc";
+
+inline constexpr const char* lu_doc = R"pbdoc(
+lu(a)
+
+LU decomposition with partial pivoting, ``a = p @ l @ u``.
+
+Parameters
+----------
+a : array_like of shape (M, M)
+    Square matrix. Singular matrices are factorized too.
+
+Returns
+-------
+p : numpy.ndarray of shape (M, M)
+    Permutation matrix.
+l : numpy.ndarray of shape (M, M)
+    Unit lower-triangular factor.
+u : numpy.ndarray of shape (M, M)
+    Upper-triangular factor.
+
+Raises
+------
+numpy.linalg.LinAlgError
+    If ``a`` is not square.
+
+Notes
+-----
+Same convention as :func:`scipy.linalg.lu` (``permute_l=False``) for square
+input.
+
+See Also
+--------
+scipy.linalg.lu
+)pbdoc";
+
+inline constexpr const char* eigh_doc = R"pbdoc(
+eigh(a)
+
+Eigenvalues and eigenvectors of a real symmetric matrix.
+
+Parameters
+----------
+a : array_like of shape (M, M)
+    Symmetric matrix.
+
+Returns
+-------
+w : numpy.ndarray of shape (M,)
+    Eigenvalues in ascending order.
+v : numpy.ndarray of shape (M, M)
+    Normalized eigenvectors; column ``v[:, i]`` belongs to ``w[i]``.
+
+Raises
+------
+numpy.linalg.LinAlgError
+    If ``a`` is not square.
+
+Notes
+-----
+Backed by NumCpp's Jacobi eigensolver (``nc::linalg::eig``), which is
+accurate for symmetric input but scales worse than LAPACK; it is meant for
+small and medium matrices.
+
+See Also
+--------
+numpy.linalg.eigh
+)pbdoc";
+
+inline constexpr const char* det_doc = R"pbdoc(
+det(a)
+
+Determinant of a square matrix.
+
+Parameters
+----------
+a : array_like of shape (M, M)
+    Square matrix.
+
+Returns
+-------
+det : float
+    Determinant; exactly ``0.0`` when elimination finds a zero pivot.
+
+Raises
+------
+numpy.linalg.LinAlgError
+    If ``a`` is not square.
+
+Notes
+-----
+Computed as the signed product of the pivots of a partial-pivoting LU
+factorization in O(M^3), instead of NumCpp's cofactor expansion.
+
+See Also
+--------
+numpy.linalg.det
+)pbdoc";
+
+[[noreturn]] inline void throw_linalg_error(const std::string& msg)
+{
+    const py::object exc = py::module_::import("numpy.linalg").attr("LinAlgError");
+    PyErr_SetString(exc.ptr(), msg.c_str());
+    throw py::error_already_set();
+}
+
+inline void require_matrix(const py::array& a, bool square, const char* func)
+{
+    if (a.ndim() != 2) {
+        throw_linalg_error(
+            std::to_string(a.ndim()) + "-dimensional array given. "
+            "scikitplot.nc." + func + " expects a 2-D array."
+        );
+    }
+    if (square && a.shape(0) != a.shape(1)) {
+        throw_linalg_error("Last 2 dimensions of the array must be square");
+    }
+}
+
+inline py::tuple svd(const py::array& A)
+{
+    require_matrix(A, false, "svd");
+    return dispatch_float(A, "svd", [&](auto tag) -> py::tuple {
+        using T = decltype(tag);
+        CArray<T> a(A);
+        const auto m = a.shape(0);
+        const auto n = a.shape(1);
+        py::array_t<T> u({m, m});
+        py::array_t<T> s(std::min(m, n));
+        py::array_t<T> vt({n, n});
+        const T* src = a.data();
+        T* pu = u.mutable_data();
+        T* ps = s.mutable_data();
+        T* pvt = vt.mutable_data();
+        bool ok = true;
+        if (m == 0 || n == 0) {
+            std::fill(pu, pu + m * m, T(0));
+            std::fill(pvt, pvt + n * n, T(0));
+            for (py::ssize_t i = 0; i < m; ++i) pu[i * m + i] = T(1);
+            for (py::ssize_t i = 0; i < n; ++i) pvt[i * n + i] = T(1);
+        } else {
+            py::gil_scoped_release release;
+            ok = detail::svd(src, m, n, pu, ps, pvt);
+        }
+        if (!ok) {
+            throw_linalg_error("SVD did not converge");
+        }
+        return py::make_tuple(u, s, vt);
+    });
+}
+
+inline py::array cholesky(const py::array& A)
+{
+    require_matrix(A, true, "cholesky");
+    return dispatch_float(A, "cholesky", [&](auto tag) -> py::array {
+        using T = decltype(tag);
+        CArray<T> a(A);
+        const auto n = a.shape(0);
+        py::array_t<T> out({n, n});
+        const T* src = a.data();
+        T* dst = out.mutable_data();
+        bool ok;
+        {
+            py::gil_scoped_release release;
+            ok = detail::cholesky(src, n, dst);
+        }
+        if (!ok) {
+            throw_linalg_error("Matrix is not positive definite");
+        }
+        return out;
+    });
+}
+
+inline py::tuple lu(const py::array& A)
+{
+    require_matrix(A, true, "lu");
+    return dispatch_float(A, "lu", [&](auto tag) -> py::tuple {
+        using T = decltype(tag);
+        CArray<T> a(A);
+        const auto n = a.shape(0);
+        py::array_t<T> p({n, n});
+        py::array_t<T> l({n, n});
+        py::array_t<T> u({n, n});
+        const T* src = a.data();
+        T* pp = p.mutable_data();
+        T* pl = l.mutable_data();
+        T* pu = u.mutable_data();
+        {
+            py::gil_scoped_release release;
+            detail::lu(src, n, pp, pl, pu);
+        }
+        return py::make_tuple(p, l, u);
+    });
+}
+
+inline py::tuple eigh(const py::array& A)
+{
+    require_matrix(A, true, "eigh");
+    return dispatch_float(A, "eigh", [&](auto tag) -> py::tuple {
+        using T = decltype(tag);
+        CArray<T> a(A);
+        const auto n = a.shape(0);
+        py::array_t<T> w(n);
+        py::array_t<T> v({n, n});
+        const T* src = a.data();
+        T* pw = w.mutable_data();
+        T* pv = v.mutable_data();
+        bool ok = true;
+        if (n > 0) {
+            py::gil_scoped_release release;
+            ok = detail::eigh(src, n, pw, pv);
+        }
+        if (!ok) {
+            throw_linalg_error("Eigenvalues did not converge");
+        }
+        return py::make_tuple(w, v);
+    });
+}
+
+inline double det(const py::array& A)
+{
+    require_matrix(A, true, "det");
+    return dispatch_float(A, "det", [&](auto tag) -> double {
+        using T = decltype(tag);
+        CArray<T> a(A);
+        const auto n = a.shape(0);
+        const T* src = a.data();
+        py::gil_scoped_release release;
+        return detail::det(src, n);
+    });
+}
+
+} // namespace scikitplot_nc::linalg
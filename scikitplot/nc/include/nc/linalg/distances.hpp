@@ -0,0 +1,124 @@
+// include/nc/linalg/distances.hpp
+#pragma once
+
+#include <string>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include "nc/detail/kernels.hpp"
+#include "nc/dispatch.hpp"
+
+namespace py = pybind11;
+
+namespace scikitplot_nc::linalg
+{
+
+inline constexpr const char* pairwise_distances_doc = R"pbdoc(
+pairwise_distances(X, Y=None, metric="euclidean")
+
+Distance matrix between the rows of ``X`` and the rows of ``Y``.
+
+Parameters
+----------
+X : array_like of shape (n_samples_X, n_features)
+    First set of row vectors.
+Y : array_like of shape (n_samples_Y, n_features), optional
+    Second set of row vectors. If None, distances between the rows of
+    ``X`` are computed; only one triangle is evaluated and the diagonal is
+    exactly zero.
+metric : {"euclidean", "cosine", "manhattan"}, default="euclidean"
+    ``"l2"`` and ``"l1"``/``"cityblock"`` are accepted as aliases.
+
+Returns
+-------
+D : numpy.ndarray of shape (n_samples_X, n_samples_Y)
+    float32 when both inputs are float32, float64 otherwise.
+
+Raises
+------
+ValueError
+    If an input is not 2-D, the feature counts differ, or ``metric`` is
+    unknown.
+
+Notes
+-----
+Euclidean distances are summed from the coordinate differences rather
+than expanded as ``|x|^2 - 2 x.y + |y|^2``, so they carry no cancellation
+error for close points. Cosine distances follow scikit-learn: a zero
+vector has similarity 0 with every vector, and results are clipped to
+``[0, 2]``. Rows of ``Y`` are processed in cache-sized blocks and the GIL
+is released while the kernel runs.
+
+See Also
+--------
+scipy.spatial.distance.cdist
+sklearn.metrics.pairwise_distances
+
+Examples
+--------
+>>> import scikitplot.nc as nc
+>>> nc.pairwise_distances([[0.0, 0.0], [3.0, 4.0]])
+array([[0., 5.],
+       [5., 0.]])
+)pbdoc";
+
+inline detail::Metric parse_metric(const std::string& metric)
+{
+    if (metric == "euclidean" || metric == "l2") {
+        return detail::Metric::euclidean;
+    }
+    if (metric == "cosine") {
+        return detail::Metric::cosine;
+    }
+    if (metric == "manhattan" || metric == "cityblock" || metric == "l1") {
+        return detail::Metric::manhattan;
+    }
+    throw py::value_error(
+        "Unknown metric '" + metric + "' for scikitplot.nc.pairwise_distances. "
+        "Supported metrics are 'euclidean', 'cosine' and 'manhattan'."
+    );
+}
+
+inline py::array pairwise_distances(
+    const py::array& X, const py::object& Y, const std::string& metric)
+{
+    const auto kind = parse_metric(metric);
+    const py::array Yarr = Y.is_none() ? X : Y.cast<py::array>();
+    if (X.ndim() != 2 || Yarr.ndim() != 2) {
+        throw py::value_error("scikitplot.nc.pairwise_distances expects 2-D arrays.");
+    }
+    if (!X.dtype().is(Yarr.dtype())) {
+        throw py::type_error(
+            "`X` and `Y` must have the same dtype for scikitplot.nc.pairwise_distances."
+        );
+    }
+    if (X.shape(1) != Yarr.shape(1)) {
+        throw py::value_error(
+            "Incompatible dimension for X and Y matrices: X.shape[1] == " +
+            std::to_string(X.shape(1)) + " while Y.shape[1] == " +
+            std::to_string(Yarr.shape(1))
+        );
+    }
+    return dispatch_dtype(X, "pairwise_distances", [&](auto tag) -> py::array {
+        using T = decltype(tag);
+        using R = detail::float_result_t<T>;
+        CArray<T> x(X);
+        CArray<T> y(Yarr);
+        const auto n = x.shape(0);
+        const auto m = y.shape(0);
+        const auto d = x.shape(1);
+        const bool symmetric = x.data() == y.data() && n == m;
+        py::array_t<R> out({n, m});
+        const T* xs = x.data();
+        const T* ys = y.data();
+        R* dst = out.mutable_data();
+        {
+            py::gil_scoped_release release;
+            detail::pairwise_distances(xs, n, ys, m, d, kind, symmetric, dst);
+        }
+        return out;
+    });
+}
+
+} // namespace scikitplot_nc::linalg
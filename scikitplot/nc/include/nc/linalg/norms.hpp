@@ -0,0 +1,81 @@
+// include/nc/linalg/norms.hpp
+#pragma once
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include "nc/detail/kernels.hpp"
+#include "nc/dispatch.hpp"
+
+namespace py = pybind11;
+
+namespace scikitplot_nc::linalg
+{
+
+inline constexpr const char* row_norms_doc = R"pbdoc(
+row_norms(X, squared=False)
+
+Euclidean norm of every row of a 2-D array.
+
+Equivalent to ``numpy.linalg.norm(X, axis=1)`` (or
+:func:`sklearn.utils.extmath.row_norms`) computed in one pass over the
+data, without the ``X * X`` temporary.
+
+Parameters
+----------
+X : array_like of shape (n_samples, n_features)
+    Input matrix. float64, float32 and int64 arrays in C order are used
+    in place; other inputs are converted once.
+squared : bool, default=False
+    Return squared norms.
+
+Returns
+-------
+norms : numpy.ndarray of shape (n_samples,)
+    float32 for float32 input, float64 otherwise.
+
+Raises
+------
+ValueError
+    If ``X`` is not 2-D.
+
+Notes
+-----
+Sums are accumulated in double precision for every input dtype. The GIL
+is released while the kernel runs.
+
+See Also
+--------
+numpy.linalg.norm
+scikitplot.nc.pairwise_distances
+
+Examples
+--------
+>>> import scikitplot.nc as nc
+>>> nc.row_norms([[3.0, 4.0], [1.0, 0.0]])
+array([5., 1.])
+)pbdoc";
+
+inline py::array row_norms(const py::array& X, bool squared)
+{
+    if (X.ndim() != 2) {
+        throw py::value_error("scikitplot.nc.row_norms expects a 2-D array.");
+    }
+    return dispatch_dtype(X, "row_norms", [&](auto tag) -> py::array {
+        using T = decltype(tag);
+        using R = detail::float_result_t<T>;
+        CArray<T> x(X);
+        const auto n = x.shape(0);
+        const auto d = x.shape(1);
+        py::array_t<R> out(n);
+        const T* src = x.data();
+        R* dst = out.mutable_data();
+        {
+            py::gil_scoped_release release;
+            detail::row_norms(src, n, d, squared, dst);
+        }
+        return out;
+    });
+}
+
+} // namespace scikitplot_nc::linalg
@@ -0,0 +1,11 @@
+// include/nc/stats.hpp
+#pragma once
+
+/// @file stats.hpp
+/// @brief Statistics and ordering bindings for scikitplot.nc.
+///
+/// Aggregates cumulative sums, histograms and (arg)sorting kernels.
+
+#include "nc/stats/cumsum.hpp"
+#include "nc/stats/histogram.hpp"
+#include "nc/stats/sorting.hpp"
@@ -0,0 +1,81 @@
+// include/nc/stats/cumsum.hpp
+#pragma once
+
+#include <vector>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include "nc/detail/kernels.hpp"
+#include "nc/dispatch.hpp"
+
+namespace py = pybind11;
+
+namespace scikitplot_nc::stats
+{
+
+inline constexpr const char* cumsum_doc = R"pbdoc(
+cumsum(a, axis=None)
+
+Cumulative sum of the elements along a given axis.
+
+Parameters
+----------
+a : array_like
+    Input array.
+axis : int, optional
+    Axis along which the sum is computed. The default (None) sums over the
+    flattened array.
+
+Returns
+-------
+out : numpy.ndarray
+    Same dtype as the (float64, float32 or int64) input; same shape, or
+    1-D when ``axis`` is None.
+
+Raises
+------
+ValueError
+    If ``axis`` is out of bounds.
+
+Notes
+-----
+Sums run sequentially in the input dtype, so results match
+:func:`numpy.cumsum` bit for bit; int64 overflow wraps around as in NumPy.
+Scans along a leading axis process whole rows at a time. The GIL is
+released while the kernel runs.
+
+See Also
+--------
+numpy.cumsum
+
+Examples
+--------
+>>> import scikitplot.nc as nc
+>>> nc.cumsum([[1, 2, 3], [4, 5, 6]], axis=0)
+array([[1, 2, 3],
+       [5, 7, 9]])
+)pbdoc";
+
+inline py::array cumsum(const py::array& A, const py::object& axis)
+{
+    const auto split = split_axis(A, axis, "cumsum");
+    return dispatch_dtype(A, "cumsum", [&](auto tag) -> py::array {
+        using T = decltype(tag);
+        CArray<T> a(A);
+        std::vector<py::ssize_t> shape(a.shape(), a.shape() + a.ndim());
+        if (axis.is_none()) {
+            shape.assign(1, a.size());
+        }
+        py::array_t<T> out(shape);
+        const T* src = a.data();
+        T* dst = out.mutable_data();
+        {
+            py::gil_scoped_release release;
+            detail::cumsum(src, split.outer, split.len, split.inner, dst);
+        }
+        return out;
+    });
+}
+
+} // namespace scikitplot_nc::stats
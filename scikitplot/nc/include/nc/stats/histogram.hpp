@@ -0,0 +1,139 @@
+// include/nc/stats/histogram.hpp
+#pragma once
+
+#include <cmath>
+#include <cstdint>
+#include <sstream>
+#include <string>
+#include <type_traits>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include "nc/detail/kernels.hpp"
+#include "nc/dispatch.hpp"
+
+namespace py = pybind11;
+
+namespace scikitplot_nc::stats
+{
+
+inline constexpr const char* histogram_doc = R"pbdoc(
+histogram(a, bins=10, range=None)
+
+Histogram of a dataset over equal-width bins.
+
+Parameters
+----------
+a : array_like
+    Input data, flattened.
+bins : int, default=10
+    Number of equal-width bins.
+range : (float, float), optional
+    Lower and upper range of the bins. Defaults to ``(a.min(), a.max())``;
+    values outside the range (and NaNs) are ignored.
+
+Returns
+-------
+hist : numpy.ndarray of int64, shape (bins,)
+    Number of samples in each bin.
+bin_edges : numpy.ndarray of shape (bins + 1,)
+    float32 for float32 input, float64 otherwise. As in NumPy 2, edges of
+    float32 input with an autodetected range are computed in single
+    precision.
+
+Raises
+------
+ValueError
+    If ``bins`` is not positive, ``range`` is inverted or not finite, or
+    the range is autodetected from data containing NaN or inf.
+
+Notes
+-----
+Uses NumPy's rule for equal-width bins: every bin is half-open except
+the last, which includes its right edge, and each value is placed by
+comparing it with the returned edges, so counts agree with
+:func:`numpy.histogram` exactly. The range and the counts are computed in
+single passes with the GIL released, without sorting or temporaries.
+
+See Also
+--------
+numpy.histogram
+
+Examples
+--------
+>>> import scikitplot.nc as nc
+>>> hist, edges = nc.histogram([0, 1, 1, 2, 3, 3, 3], bins=3)
+>>> hist
+array([1, 2, 4])
+)pbdoc";
+
+inline std::string format_range(const char* kind, double lo, double hi)
+{
+    std::ostringstream msg;
+    msg << kind << " range of [" << lo << ", " << hi << "] is not finite";
+    return msg.str();
+}
+
+inline py::tuple histogram(const py::array& A, py::ssize_t bins, const py::object& range)
+{
+    if (bins < 1) {
+        throw py::value_error("`bins` must be positive, when an integer");
+    }
+    double first = 0.0;
+    double last = 0.0;
+    const bool has_range = !range.is_none();
+    if (has_range) {
+        const auto bounds = range.cast<py::sequence>();
+        if (bounds.size() != 2) {
+            throw py::value_error("`range` must be a pair (min, max).");
+        }
+        first = bounds[0].cast<double>();
+        last = bounds[1].cast<double>();
+        if (first > last) {
+            throw py::value_error("max must be larger than min in range parameter.");
+        }
+        if (!std::isfinite(first) || !std::isfinite(last)) {
+            throw py::value_error(format_range("supplied", first, last));
+        }
+    }
+    return dispatch_dtype(A, "histogram", [&](auto tag) -> py::tuple {
+        using T = decltype(tag);
+        using E = detail::float_result_t<T>;
+        CArray<T> a(A);
+        const T* src = a.data();
+        const auto n = a.size();
+        if (!has_range) {
+            bool finite;
+            {
+                py::gil_scoped_release release;
+                finite = detail::finite_min_max(src, n, first, last);
+            }
+            if (!finite) {
+                throw py::value_error(format_range("autodetected", first, last));
+            }
+        }
+        if (first == last) {
+            first -= 0.5;
+            last += 0.5;
+        }
+        py::array_t<std::int64_t> hist(bins);
+        py::array_t<E> edges(bins + 1);
+        std::int64_t* counts = hist.mutable_data();
+        E* pe = edges.mutable_data();
+        {
+            py::gil_scoped_release release;
+            // NumPy 2 (NEP 50) keeps autodetected float32 bounds in float32,
+            // so those edges are computed in single precision.
+            if (std::is_same_v<T, float> && !has_range) {
+                detail::linspace_edges<float>(first, last, bins, pe);
+            } else {
+                detail::linspace_edges<double>(first, last, bins, pe);
+            }
+            detail::histogram_uniform(src, n, bins, first, last, pe, counts);
+        }
+        return py::make_tuple(hist, edges);
+    });
+}
+
+} // namespace scikitplot_nc::stats
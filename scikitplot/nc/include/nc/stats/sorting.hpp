@@ -0,0 +1,178 @@
+// include/nc/stats/sorting.hpp
+#pragma once
+
+#include <algorithm>
+#include <cstdint>
+#include <string>
+#include <vector>
+
+#include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
+
+#include "nc/detail/kernels.hpp"
+#include "nc/dispatch.hpp"
+
+namespace py = pybind11;
+
+namespace scikitplot_nc::stats
+{
+
+inline constexpr const char* argsort_doc = R"pbdoc(
+argsort(a, axis=-1)
+
+Indices that would sort an array along an axis.
+
+Parameters
+----------
+a : array_like
+    Array to sort.
+axis : int or None, default=-1
+    Axis to sort along. None sorts the flattened array.
+
+Returns
+-------
+index_array : numpy.ndarray of int64
+    Same shape as ``a`` (1-D when ``axis`` is None).
+
+Raises
+------
+ValueError
+    If ``axis`` is out of bounds.
+
+Notes
+-----
+The sort is stable, like ``numpy.argsort(a, kind="stable")``, and NaNs
+sort to the end. Lanes along a non-last axis are gathered into a scratch
+buffer first. The GIL is released while the kernel runs.
+
+See Also
+--------
+numpy.argsort
+scikitplot.nc.argpartition
+
+Examples
+--------
+>>> import scikitplot.nc as nc
+>>> nc.argsort([3.0, 1.0, 2.0])
+array([1, 2, 0])
+)pbdoc";
+
+inline constexpr const char* argpartition_doc = R"pbdoc(
+argpartition(a, kth, axis=-1)
+
+Indices that would partition an array around the ``kth`` element(s).
+
+Parameters
+----------
+a : array_like
+    Array to partition.
+kth : int or sequence of ints
+    Position(s) that end up holding the value a full sort would put
+    there; smaller values come before, larger after. Negative positions
+    count from the end.
+axis : int or None, default=-1
+    Axis to partition along. None partitions the flattened array.
+
+Returns
+-------
+index_array : numpy.ndarray of int64
+    Same shape as ``a`` (1-D when ``axis`` is None).
+
+Raises
+------
+ValueError
+    If ``axis`` or a ``kth`` position is out of bounds.
+
+Notes
+-----
+Uses introselect (``std::nth_element``), O(n) on average per position;
+with several positions each selection only searches the part of the lane
+right of the previous one. NaNs compare greater than every number. The
+order within each partition is unspecified.
+
+See Also
+--------
+numpy.argpartition
+scikitplot.nc.argsort
+
+Examples
+--------
+>>> import scikitplot.nc as nc
+>>> idx = nc.argpartition([5.0, 1.0, 4.0, 2.0, 3.0], 1)
+>>> sorted(idx[:2].tolist())
+[1, 3]
+)pbdoc";
+
+/// Normalize, bounds-check, sort and de-duplicate kth positions.
+inline std::vector<detail::index_t> normalize_kth(const py::object& kth, py::ssize_t len)
+{
+    std::vector<detail::index_t> out;
+    const auto push = [&](py::ssize_t k) {
+        const auto orig = k;
+        if (k < 0) {
+            k += len;
+        }
+        if (k < 0 || k >= len) {
+            throw py::value_error(
+                "kth(=" + std::to_string(orig) + ") out of bounds (" + std::to_string(len) + ")"
+            );
+        }
+        out.push_back(k);
+    };
+    if (py::isinstance<py::sequence>(kth) || py::isinstance<py::array>(kth)) {
+        for (const auto item : kth) {
+            push(item.cast<py::ssize_t>());
+        }
+    } else {
+        push(kth.cast<py::ssize_t>());
+    }
+    std::sort(out.begin(), out.end());
+    out.erase(std::unique(out.begin(), out.end()), out.end());
+    return out;
+}
+
+/// Shape of an index result: ``a.shape``, or ``(a.size,)`` for axis=None.
+inline std::vector<py::ssize_t> index_shape(const py::array& a, const py::object& axis)
+{
+    if (axis.is_none()) {
+        return {a.size()};
+    }
+    return std::vector<py::ssize_t>(a.shape(), a.shape() + a.ndim());
+}
+
+inline py::array argsort(const py::array& A, const py::object& axis)
+{
+    const auto split = split_axis(A, axis, "argsort");
+    return dispatch_dtype(A, "argsort", [&](auto tag) -> py::array {
+        using T = decltype(tag);
+        CArray<T> a(A);
+        py::array_t<std::int64_t> out(index_shape(a, axis));
+        const T* src = a.data();
+        std::int64_t* dst = out.mutable_data();
+        {
+            py::gil_scoped_release release;
+            detail::argsort(src, split.outer, split.len, split.inner, dst);
+        }
+        return out;
+    });
+}
+
+inline py::array argpartition(const py::array& A, const py::object& kth, const py::object& axis)
+{
+    const auto split = split_axis(A, axis, "argpartition");
+    const auto positions = normalize_kth(kth, split.len);
+    return dispatch_dtype(A, "argpartition", [&](auto tag) -> py::array {
+        using T = decltype(tag);
+        CArray<T> a(A);
+        py::array_t<std::int64_t> out(index_shape(a, axis));
+        const T* src = a.data();
+        std::int64_t* dst = out.mutable_data();
+        {
+            py::gil_scoped_release release;
+            detail::argpartition(src, split.outer, split.len, split.inner, positions, dst);
+        }
+        return out;
+    });
+}
+
+} // namespace scikitplot_nc::stats
@@ -19,6 +19,13 @@ Coverage targets
   - Value preservation after dtype cast.
   - ``func_name`` propagation into error messages.
 
+* :func:`~scikitplot.nc._wrappers._as_supported_array` and
+  :func:`~scikitplot.nc._wrappers._unary_arraylike`
+
+  - Backend dtypes are preserved and C-contiguous inputs are not copied.
+  - Other dtypes map to float64/int64; ``floating=True`` maps ints to float64.
+  - Extra arguments are forwarded to the core unchanged.
+
 * :func:`~scikitplot.nc._wrappers._binary_arraylike`
 
   - Callable creation and ``__name__`` / ``__doc__`` assignment.
@@ -54,8 +61,10 @@ import pytest
 # Portable import — works both inside the full scikitplot tree and standalone.
 # ---------------------------------------------------------------------------
 from scikitplot.nc._wrappers import (
+    _as_supported_array,
     _binary_arraylike,
     _promote_to_supported_dtype,
+    _unary_arraylike,
 )
 
 
@@ -813,3 +822,74 @@ class TestBinaryArraylike:
         core.__doc__ = ""
         wrapped = _binary_arraylike(core)
         assert wrapped([1.0], [2.0]) is sentinel
+
+
+# ===========================================================================
+# _as_supported_array / _unary_arraylike — single-input kernels
+# ===========================================================================
+
+class TestAsSupportedArray:
+    """Tests for :func:`_as_supported_array`."""
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+    def test_backend_dtype_is_zero_copy(self, dtype):
+        a = np.arange(6, dtype=dtype).reshape(2, 3)
+        out = _as_supported_array(a, func_name="f")
+        assert out.dtype == dtype
+        assert np.shares_memory(out, a)
+
+    def test_f_order_becomes_c_contiguous(self):
+        a = np.asfortranarray(np.ones((3, 4)))
+        out = _as_supported_array(a, func_name="f")
+        assert out.flags.c_contiguous
+        np.testing.assert_array_equal(out, a)
+
+    @pytest.mark.parametrize(
+        ("dtype", "expected"),
+        [
+            (np.float16, np.float64),
+            (np.int8, np.int64),
+            (np.uint32, np.int64),
+            (np.bool_, np.int64),
+        ],
+    )
+    def test_other_dtypes_are_mapped(self, dtype, expected):
+        out = _as_supported_array(np.ones(3, dtype=dtype), func_name="f")
+        assert out.dtype == expected
+
+    def test_floating_maps_integers_to_float64(self):
+        out = _as_supported_array([1, 2], func_name="f", floating=True)
+        assert out.dtype == np.float64
+        a32 = np.ones(2, np.float32)
+        out32 = _as_supported_array(a32, func_name="f", floating=True)
+        assert out32.dtype == np.float32
+
+    def test_object_dtype(self):
+        out = _as_supported_array(np.array([1, None], dtype=object), func_name="f")
+        assert out.dtype == np.float64 and np.isnan(out[1])
+        with pytest.raises(TypeError, match="scikitplot.nc.f"):
+            _as_supported_array(np.array(["a"], dtype=object), func_name="f")
+
+    def test_unsupported_dtype(self):
+        with pytest.raises(TypeError, match="does not yet support"):
+            _as_supported_array(np.array([1j]), func_name="f")
+
+
+class TestUnaryArraylike:
+    """Tests for :func:`_unary_arraylike`."""
+
+    def test_converts_first_argument_and_forwards_the_rest(self):
+        calls = []
+
+        def core(a, *args, **kwargs):
+            calls.append((a, args, kwargs))
+            return "ok"
+
+        core.__doc__ = "Core doc."
+        wrapped = _unary_arraylike(core, name="kernel")
+        assert wrapped([1, 2], 3, axis=0) == "ok"
+        a, args, kwargs = calls[0]
+        assert isinstance(a, np.ndarray) and a.dtype == np.int64
+        assert args == (3,) and kwargs == {"axis": 0}
+        assert wrapped.__name__ == "kernel"
+        assert wrapped.__doc__ == "Core doc."
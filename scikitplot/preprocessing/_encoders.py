@@ -25,6 +25,8 @@ import itertools
 import numbers
 import re
 import warnings
+from collections import Counter
+from functools import partial
 from numbers import Integral
 from typing import TYPE_CHECKING
 
@@ -52,6 +54,7 @@ from sklearn.utils._encode import _check_unknown, _encode, _get_counts, _unique
 from sklearn.utils._missing import is_scalar_nan
 from sklearn.utils._param_validation import Interval, RealNotInt, StrOptions
 from sklearn.utils._set_output import _get_output_config
+from sklearn.utils.parallel import Parallel, delayed
 from sklearn.utils.validation import (
     _check_feature_names_in,
     check_is_fitted,
@@ -74,6 +77,258 @@ __all__ = [
     "GetDummies",
 ]
 
+# ---------------------------------------------------------------------------
+# Multi-label vocabulary engine
+# ---------------------------------------------------------------------------
+# Both encoders below tokenise every cell exactly once, look tokens up in a
+# fitted ``token -> column id`` dict and write CSR ``indptr``/``indices``
+# straight from the ids.  No dense (n_samples, n_categories) frame or array is
+# ever materialised, which is what makes high-cardinality tag columns
+# (tens of thousands of labels, millions of rows) fit in memory.
+
+_DEFAULT_CHUNK_SIZE = 65_536
+
+
+def _is_missing(value) -> bool:
+    """Return True for None, NaN and the pandas NA / NaT scalars."""
+    return (
+        value is None
+        or is_scalar_nan(value)
+        or type(value).__name__ in ("NAType", "NaTType")
+    )
+
+
+def _normalized_tokens(value, sep):
+    """
+    Tokens of one :class:`GetDummies` cell.
+
+    The cell is split on the literal ``sep``; tokens are stripped, lowercased
+    and deduplicated, and empty tokens are discarded.  Missing cells yield no
+    tokens, so they always encode as an all-zero row.
+    """
+    if not isinstance(value, str):
+        if _is_missing(value):
+            return ()
+        value = str(value)
+    return {tok for tok in (part.strip().lower() for part in value.split(sep)) if tok}
+
+
+def _expanded_tokens(value, sep, regex):
+    """
+    Tokens of one :class:`DummyCodeEncoder` cell.
+
+    Mirrors :meth:`DummyCodeEncoder._expand_by_separators` for a single cell:
+    strings are split by ``sep`` (callable, regex or literal) and stripped,
+    other values are used as-is.  Every missing value maps to the single key
+    ``None``.
+    """
+    if not isinstance(value, str):
+        return (None,) if _is_missing(value) else (value,)
+    if callable(sep):
+        parts = sep(value)
+    elif regex:
+        parts = re.split(sep, value)
+    else:
+        parts = value.split(sep)
+    return [part.strip() for part in parts if part.strip()]
+
+
+class _MultiLabelVocabulary:
+    """
+    Fitted ``token -> column id`` map for one multi-label column.
+
+    Parameters
+    ----------
+    tokens : iterable
+        Tokens in output column order.
+    ignored : iterable, default=()
+        Tokens that were seen during fit but have no output column (e.g. the
+        category removed by ``drop``).  They are skipped silently instead of
+        being reported as unknown.
+    """
+
+    __slots__ = ("ignored", "index")
+
+    def __init__(self, tokens, ignored=()):
+        self.index = {tok: j for j, tok in enumerate(tokens)}
+        self.ignored = frozenset(ignored)
+
+    def __len__(self):
+        return len(self.index)
+
+
+def _chunk_bounds(n_samples, chunk_size):
+    """Return ``(start, stop)`` row ranges covering ``n_samples`` rows."""
+    if chunk_size is None:
+        chunk_size = _DEFAULT_CHUNK_SIZE
+    if not isinstance(chunk_size, numbers.Integral) or chunk_size < 1:
+        raise ValueError(
+            f"chunk_size must be a positive integer or None, got {chunk_size!r}."
+        )
+    if n_samples == 0:
+        return [(0, 0)]
+    return [
+        (start, min(start + chunk_size, n_samples))
+        for start in range(0, n_samples, chunk_size)
+    ]
+
+
+def _chunk_values(column, start, stop):
+    """Slice rows ``[start, stop)`` of a column as a list of Python scalars."""
+    values = column[start:stop]
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
+
+
+def _count_tokens(values, tokenize):
+    """Count the tokens of one chunk of cells."""
+    counts = Counter()
+    for value in values:
+        counts.update(tokenize(value))
+    return counts
+
+
+def _encode_rows(values, vocabulary, tokenize):
+    """
+    Encode one chunk of one column into CSR row arrays.
+
+    Returns
+    -------
+    indptr, indices : array.array
+        Per-row column ids (sorted, deduplicated) local to ``vocabulary``.
+    unknown : set
+        Tokens absent from ``vocabulary``.
+    unknown_rows : array.array
+        Chunk-local indices of the rows that contained an unknown token.
+    """
+    lookup = vocabulary.index.get
+    ignored = vocabulary.ignored
+    indptr = array.array("q", [0])
+    indices = array.array("q")
+    unknown = set()
+    unknown_rows = array.array("q")
+    for row, value in enumerate(values):
+        ids = set()
+        seen_unknown = False
+        for token in tokenize(value):
+            j = lookup(token)
+            if j is not None:
+                ids.add(j)
+            elif token not in ignored:
+                unknown.add(token)
+                seen_unknown = True
+        if seen_unknown:
+            unknown_rows.append(row)
+        indices.extend(sorted(ids))
+        indptr.append(len(indices))
+    return indptr, indices, unknown, unknown_rows
+
+
+def _fit_token_counts(columns, tokenize, *, chunk_size=None, n_jobs=None):
+    """
+    Count the tokens of every column in a single tokenisation pass.
+
+    Each ``(column, row chunk)`` pair is one task; tasks run on a thread pool
+    of ``n_jobs`` workers.
+
+    Returns
+    -------
+    list of collections.Counter
+        One ``token -> occurrences`` counter per column.
+    """
+    bounds = _chunk_bounds(len(columns[0]) if columns else 0, chunk_size)
+    parts = iter(
+        Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_count_tokens)(_chunk_values(column, start, stop), tokenize)
+            for column in columns
+            for start, stop in bounds
+        )
+    )
+    counts = []
+    for _ in columns:
+        total = Counter()
+        for _ in bounds:
+            total.update(next(parts))
+        counts.append(total)
+    return counts
+
+
+def _encode_multilabel_csr(
+    columns,
+    vocabularies,
+    tokenize,
+    *,
+    n_samples,
+    dtype=np.float64,
+    chunk_size=None,
+    n_jobs=None,
+):
+    """
+    Encode multi-label columns straight into one CSR matrix.
+
+    Column ``k`` occupies output columns ``[offset_k, offset_k + len(vocab_k))``.
+    Each ``(column, row chunk)`` pair is encoded by its own task on a thread
+    pool of ``n_jobs`` workers; the per-column blocks are then interleaved row
+    by row with vectorised index arithmetic, so no intermediate sparse or
+    dense matrix is built.
+
+    Returns
+    -------
+    X_out : scipy.sparse.csr_matrix of shape (n_samples, sum(len(vocab)))
+        Encoded matrix with sorted indices.
+    unknown : list of set
+        Unknown tokens per column.
+    unknown_rows : list of ndarray
+        Row indices with at least one unknown token, per column.
+    """
+    bounds = _chunk_bounds(n_samples, chunk_size)
+    parts = iter(
+        Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(_encode_rows)(
+                _chunk_values(column, start, stop), vocabulary, tokenize
+            )
+            for column, vocabulary in zip(columns, vocabularies)
+            for start, stop in bounds
+        )
+    )
+
+    blocks, unknown, unknown_rows = [], [], []
+    offset = 0
+    for vocabulary in vocabularies:
+        lengths, indices, tokens, rows = [], [], set(), []
+        for start, _stop in bounds:
+            c_indptr, c_indices, c_unknown, c_rows = next(parts)
+            lengths.append(np.diff(np.array(c_indptr, dtype=np.int64)))
+            indices.append(np.array(c_indices, dtype=np.int64))
+            tokens |= c_unknown
+            rows.append(np.array(c_rows, dtype=np.int64) + start)
+        blocks.append((np.concatenate(lengths), np.concatenate(indices) + offset))
+        unknown.append(tokens)
+        unknown_rows.append(np.concatenate(rows))
+        offset += len(vocabulary)
+
+    indptr = np.zeros(n_samples + 1, dtype=np.int64)
+    row_nnz = np.zeros(n_samples, dtype=np.int64)
+    for lengths, _ in blocks:
+        row_nnz += lengths
+    np.cumsum(row_nnz, out=indptr[1:])
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    cursor = indptr[:-1].copy()  # next free slot of every output row
+    for lengths, block_indices in blocks:
+        block_starts = np.cumsum(lengths) - lengths
+        indices[
+            np.repeat(cursor - block_starts, lengths) + np.arange(block_indices.size)
+        ] = block_indices
+        cursor += lengths
+
+    X_out = sp.csr_matrix(
+        (np.ones(indices.size, dtype=dtype), indices, indptr),
+        shape=(n_samples, offset),
+    )
+    X_out.has_sorted_indices = True
+    return X_out, unknown, unknown_rows
+
 
 # order matters in Python's Method Resolution Order (MRO) then the first one in the list takes precedence.
 # print(GetDummies.mro()): [GetDummies, TransformerMixin, BaseEstimator, object]
@@ -82,7 +337,13 @@ class GetDummies(TransformerMixin, BaseEstimator):
     Multi-column multi-label string column one-hot encoder [1]_.
 
     Custom transformer to expand string columns that contain multiple labels
-    separated by `sep` into one-hot encoded columns by :func:`pandas.get_dummies`.
+    separated by `sep` into one-hot encoded columns, like
+    :meth:`pandas.Series.str.get_dummies`.
+
+    Every cell is tokenised once into a vocabulary learned during :meth:`fit`
+    and the indicator columns are written straight into a CSR matrix, so no
+    dense intermediate is built; only ``sparse_output=False`` densifies the
+    final result.
 
     Compatible with sklearn pipelines, `set_output` API, and supports both
     dense and sparse output.
@@ -105,6 +366,11 @@ class GetDummies(TransformerMixin, BaseEstimator):
         Drop the first dummy in each feature (sorted order) to avoid collinearity.
     dtype : number type, default=np.float64
         Data type for the output values. (sklearn default is float)
+    n_jobs : int, default=None
+        Number of threads tokenising ``(column, row chunk)`` tasks.
+        ``None`` means 1 and ``-1`` uses all processors.
+    chunk_size : int, default=None
+        Number of rows tokenised per task. ``None`` uses 65536 rows.
 
     See Also
     --------
@@ -166,6 +432,8 @@ class GetDummies(TransformerMixin, BaseEstimator):
         sparse_output=False,
         dtype=np.float64,
         handle_unknown="error",
+        n_jobs=None,
+        chunk_size=None,
     ):
         # NOTE: sklearn contract — __init__ must store ALL params exactly as received.
         # get_params() / clone() / set_params() rely on __init__ param names matching
@@ -184,6 +452,9 @@ class GetDummies(TransformerMixin, BaseEstimator):
         self.handle_unknown = handle_unknown
         # Drop first dummy column to avoid multicollinearity
         self.drop = drop
+        # Tokenisation threads and rows per task
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
 
     # -----------------------
     # Helpers
@@ -211,148 +482,9 @@ class GetDummies(TransformerMixin, BaseEstimator):
             "Input must be a pandas DataFrame, NumPy array, or SciPy sparse matrix"
         )
 
-    def _split_and_clean(self, series: pandas.Series) -> pandas.Series:
-        """
-        Split strings by separator and normalize, preserving NaN positions.
-
-        Each non-NaN entry is lowercased, whitespace-stripped, deduplicated,
-        sorted, and rejoined by ``self.sep`` so that ``str.get_dummies`` can
-        parse it in a deterministic, order-independent way.
-
-        NaN values are kept as NaN throughout — never coerced to empty string.
-        The downstream invariant (NaN row → all-zero dummy row) is enforced
-        explicitly in :meth:`_make_dummies`, not here.
-
-        Parameters
-        ----------
-        series : pd.Series
-            Raw string series from a DataFrame column; may contain ``NaN`` /
-            ``None`` values.
-
-        Returns
-        -------
-        pd.Series
-            Normalised, separator-rejoined strings for valid entries.
-            NaN entries remain NaN, preserving the original index and length.
-
-        Notes
-        -----
-        Developer note
-            **Do NOT replace** ``fillna("")`` here.  In pandas ≥ 3 the empty
-            string ``""`` is a valid, non-null value.  ``str.get_dummies``
-            treats it as a real token and produces a spurious ``""`` dummy
-            column, giving the NaN row a ``1`` instead of all zeros.
-
-            The NaN → zero-row contract is owned entirely by ``_make_dummies``,
-            which captures the NaN mask before calling this method and zeroes
-            those rows explicitly after dummification.
-        """
-        nan_mask = series.isna()
-        result = series.copy()
-
-        valid = ~nan_mask
-        if valid.any():
-            result[valid] = (
-                series[valid]
-                .str.split(self.sep)
-                .apply(
-                    lambda lst: self.sep.join(
-                        sorted({s.strip().lower() for s in lst if s.strip()})
-                    )
-                )
-            )
-        # NaN rows remain NaN — _make_dummies enforces the zero-row invariant.
-        return result
-
-    def _make_dummies(self, series: pandas.Series, colname: str) -> pandas.DataFrame:
-        """
-        Convert a raw string column into prefixed one-hot dummy variables.
-
-        Enforces the invariant: a row whose input value was NaN produces a
-        row of all zeros in the output, deterministically across all pandas
-        versions.
-
-        Parameters
-        ----------
-        series : pd.Series
-            Raw string column from the input DataFrame; may contain NaN.
-        colname : str
-            Name of the source column, used to look up the abbreviation
-            prefix stored in ``self.dummy_prefix_`` and to build output
-            column names (e.g. ``"tags"`` → prefix ``"ta"`` → ``"ta_a"``).
-
-        Returns
-        -------
-        dummies : pd.DataFrame
-            One-hot encoded DataFrame.  Column names are prefixed with
-            ``<abbrev><col_name_sep><token>`` (e.g. ``"ta_a"``).
-            Shape: ``(len(series), n_unique_tokens)``.  Rows where the
-            original value was NaN are guaranteed to be all-zero.
-
-        Notes
-        -----
-        Developer note
-            This method is the **invariant owner** for NaN handling.  The
-            two-step design is intentional:
-
-            1. ``_split_and_clean`` is a pure normaliser — it preserves NaN
-               as NaN and never decides what missing means semantically.
-
-            2. This method captures ``nan_mask`` *before* normalisation,
-               calls ``str.get_dummies`` on the cleaned series, then
-               unconditionally zeros the NaN rows.  That explicit zero-out
-               is the load-bearing line: it makes the contract hold
-               regardless of how any pandas version internally handles NaN
-               or empty strings in ``str.get_dummies``.
-
-            A defensive ``drop(columns=[""])`` follows dummification.  In
-            some pandas builds a non-NaN row that normalises to ``""`` (e.g.
-            input was ``","`` — only separator, no tokens) can produce a
-            spurious ``""`` column.  Dropping it keeps the column set clean.
-
-        Raises
-        ------
-        KeyError
-            If ``colname`` is not present in ``self.dummy_prefix_``.  This
-            indicates ``fit`` was not called before ``transform``.
-        """
-        # ── Step 1: capture NaN positions before any mutation ────────────
-        # This is the authoritative source of truth for missing rows.
-        nan_mask = series.isna()
-
-        # ── Step 2: normalise tokens; NaN rows remain NaN (no fillna) ────
-        series = self._split_and_clean(series)
-
-        # ── Step 3: expand into one-hot dummy columns ─────────────────────
-        # str.get_dummies(NaN) → all-zeros in pandas 2.x; behaviour is
-        # version-sensitive in pandas 3.x.  We enforce the invariant below
-        # so behaviour is deterministic across all supported versions.
-        dummies = series.str.get_dummies(sep=self.sep)
-
-        # ── Step 4: drop spurious empty-token column ──────────────────────
-        # Appears in certain pandas builds when a valid (non-NaN) row
-        # normalises to "" (e.g. input "," → all tokens stripped → "").
-        # Dropping it prevents an unwanted column from polluting the schema.
-        if "" in dummies.columns:
-            dummies = dummies.drop(columns=[""])
-
-        # ── Step 5: enforce NaN-row → zero-row invariant ─────────────────
-        # Unconditional: does not depend on any pandas NA behaviour.
-        if nan_mask.any():
-            dummies.loc[nan_mask] = 0
-
-        # ── Step 6: prefix column names to avoid cross-column collisions ──
-        dummies = dummies.add_prefix(self.dummy_prefix_[colname] + self.col_name_sep)
-
-        # ── Step 7: optionally drop first dummy (collinearity reduction) ──
-        if self.drop in ["first", True] and len(dummies.columns) > 1:
-            dummies = dummies.iloc[:, 1:]
-
-        # ── Step 8: cast to requested output dtype ────────────────────────
-        if self.dtype is not None:
-            dummies = dummies.astype(self.dtype)
-
-        return dummies
+    def _dummy_columns(self, X) -> list:
+        """Return the dummy columns of ``X`` as object arrays, in fit order."""
+        return [X[col].to_numpy(dtype=object) for col in self.dummy_cols_]
 
     # -----------------------
     # Core API
@@ -415,11 +547,26 @@ class GetDummies(TransformerMixin, BaseEstimator):
             # Collision detected — use full column names as prefixes for safety
             self.dummy_prefix_ = {col: col for col in self.dummy_cols_}
 
-        # Learn/Store categories seen during fit for each dummy column
+        # Learn/Store categories seen during fit for each dummy column.
+        # Each cell is tokenised once; a NaN cell contributes no tokens, so it
+        # always encodes as an all-zero row.
+        token_counts = _fit_token_counts(
+            self._dummy_columns(X),
+            partial(_normalized_tokens, sep=self.sep),
+            chunk_size=self.chunk_size,
+            n_jobs=self.n_jobs,
+        )
         self.categories_ = {}
-        for col in self.dummy_cols_:
-            dummies = self._make_dummies(X[col], col)
-            self.categories_[col] = sorted(dummies.columns.tolist())
+        self._vocabularies = {}
+        for col, counts in zip(self.dummy_cols_, token_counts):
+            tokens = sorted(counts)
+            dropped = []
+            # Drop first dummy (collinearity reduction) unless it is the only one
+            if self.drop in ["first", True] and len(tokens) > 1:
+                dropped, tokens = tokens[:1], tokens[1:]
+            prefix = self.dummy_prefix_[col] + self.col_name_sep
+            self.categories_[col] = [prefix + tok for tok in tokens]
+            self._vocabularies[col] = _MultiLabelVocabulary(tokens, ignored=dropped)
 
         # Final build global column order: (non-dummy + all dummy) columns
         self.columns_ = X.drop(columns=self.dummy_cols_).columns.tolist() + [
@@ -432,51 +579,54 @@ class GetDummies(TransformerMixin, BaseEstimator):
         Transform new data into dummy-expanded format.
 
         Steps:
-        - Align columns with fit.
+        - Tokenise the dummy columns against the fitted vocabularies.
         - Drop unknown categories or raise error.
         - Return dense/pandas or sparse output.
         """
         import pandas as pd  # noqa: PLC0415
-        import scipy.sparse as sp  # SciPy sparse CSR/CSC matrices  # noqa: PLC0415
 
         # Ensure fit has been called
         check_is_fitted(self, "columns_")
         # Convert to DataFrame if needed
         X = self._to_dataframe(X)
 
-        dummies_list = []
-        for col in self.dummy_cols_:
-            # Create dummy columns for this feature
-            dummies = self._make_dummies(X[col], col)
+        dtype = self.dtype if self.dtype is not None else np.int64
+        X_dummies, unknown, _ = _encode_multilabel_csr(
+            self._dummy_columns(X),
+            [self._vocabularies[col] for col in self.dummy_cols_],
+            partial(_normalized_tokens, sep=self.sep),
+            n_samples=X.shape[0],
+            dtype=dtype,
+            chunk_size=self.chunk_size,
+            n_jobs=self.n_jobs,
+        )
 
-            # Detect/Handle unseen categories
-            unseen = set(dummies.columns) - set(self.categories_[col])
-            if unseen:
-                if self.handle_unknown == "error":
+        # Detect/Handle unseen categories; with "ignore" they are already dropped
+        if self.handle_unknown == "error":
+            for col, unseen in zip(self.dummy_cols_, unknown):
+                if unseen:
+                    prefix = self.dummy_prefix_[col] + self.col_name_sep
+                    unseen = {prefix + tok for tok in unseen}
                     raise ValueError(
                         f"Found unknown categories {unseen} in column '{col}' not seen during fit."
                     )
-                # Drop unseen if ignoring
-                dummies = dummies.drop(columns=list(unseen), errors="ignore")
 
-            # Align with fitted columns: ensure same order and missing columns filled with 0
-            dummies = dummies.reindex(columns=self.categories_[col], fill_value=0)
-            dummies_list.append(dummies)
+        # Return SciPy sparse CSR matrix if requested.
+        # Only dummy columns are numeric; non-dummy passthrough columns may contain
+        # strings or objects, so the sparse output holds the dummy block only.
+        if self.sparse_output:
+            return X_dummies
 
+        dummies = pd.DataFrame(
+            X_dummies.toarray(),
+            index=X.index,
+            columns=[c for cats in self.categories_.values() for c in cats],
+        )
         # Combine non-dummy + all dummy columns
-        X_out = pd.concat([X.drop(columns=self.dummy_cols_), *dummies_list], axis=1)
+        X_out = pd.concat([X.drop(columns=self.dummy_cols_), dummies], axis=1)
         # Reindex to preserve global column order
         X_out = X_out.reindex(columns=self.columns_, fill_value=0)
 
-        # Return SciPy sparse CSR matrix if requested.
-        # Only dummy columns are numeric; non-dummy passthrough columns may contain
-        # strings or objects.  Cast only the dummy sub-block so we never attempt
-        # float-casting string columns (which raises ValueError on mixed DataFrames).
-        if self.sparse_output:
-            dummy_cols = [c for cats in self.categories_.values() for c in cats]
-            numeric_block = X_out[dummy_cols].to_numpy(dtype=self.dtype)
-            return sp.csr_matrix(numeric_block)
-
         # Default: return pandas DataFrame.
         # NOTE: The `set_output` API (pandas / numpy wrapping) is handled automatically
         # by TransformerMixin's decorated `transform` wrapper — no manual dispatch needed
@@ -952,6 +1102,11 @@ class DummyCodeEncoder(_BaseEncoder):
     into one-hot encoded columns by :func:`pandas.get_dummies`.
     Alternatively, you can also specify the `categories` manually.
 
+    Every cell is tokenised once against a per-feature ``token -> column``
+    vocabulary and the output is written straight into a CSR matrix, so
+    high-cardinality multi-label columns never go through a dense
+    intermediate.
+
     This encoding is needed for feeding categorical data to many scikit-learn
     estimators, notably linear models and SVMs with the standard kernels.
 
@@ -1089,6 +1244,12 @@ class DummyCodeEncoder(_BaseEncoder):
         `"concat"` concatenates encoded feature name and category with
         `feature + "_" + str(category)`.E.g. feature X with values 1, 6, 7 create
         feature names `X_1, X_6, X_7`.
+    n_jobs : int, default=None
+        Number of threads tokenising ``(feature, row chunk)`` tasks during
+        :meth:`fit` and :meth:`transform`. ``None`` means 1 and ``-1`` uses all
+        processors.
+    chunk_size : int, default=None
+        Number of rows tokenised per task. ``None`` uses 65536 rows.
 
     Attributes
     ----------
@@ -1254,6 +1415,8 @@ class DummyCodeEncoder(_BaseEncoder):
         ],
         "sparse_output": ["boolean"],
         "feature_name_combiner": [StrOptions({"concat"}), callable],
+        "n_jobs": [Integral, None],
+        "chunk_size": [Interval(Integral, 1, None, closed="left"), None],
     }
 
     def __init__(
@@ -1275,6 +1438,8 @@ class DummyCodeEncoder(_BaseEncoder):
         min_frequency=None,
         max_categories=None,
         feature_name_combiner="concat",
+        n_jobs=None,
+        chunk_size=None,
     ):
         self.columns = columns
         self.sep = sep
@@ -1290,6 +1455,8 @@ class DummyCodeEncoder(_BaseEncoder):
         self.min_frequency = min_frequency
         self.max_categories = max_categories
         self.feature_name_combiner = feature_name_combiner
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
 
     def _map_drop_idx_to_infrequent(self, feature_idx, drop_idx):
         """Convert `drop_idx` into the index for infrequent categories.
@@ -1597,23 +1764,38 @@ class DummyCodeEncoder(_BaseEncoder):
         )
         self.n_features_in_ = n_features
 
-        self._cached_dict = None
+        self._vocabularies = None
         # input_features = _check_feature_names_in(self)
         input_features = range(n_features)
         self.categories_ = dict.fromkeys(input_features)
 
+        # One tokenisation pass over every feature; the counts give both the
+        # "auto" categories and the frequencies for infrequent grouping.
+        token_counts = _fit_token_counts(
+            X_list,
+            self._tokenizer(),
+            chunk_size=self.chunk_size,
+            n_jobs=self.n_jobs,
+        )
+
         for i in range(n_features):
             Xi = X_list[i]
-            Xi = self._expand_by_separators(Xi)
 
             if self.categories == "auto":
                 # Sort: normal values first, None/NaN at the end
-                cats = self._sort_with_none_nan_last(Xi)
+                cats = self._sort_with_none_nan_last(token_counts[i])
+                cats_dtype = Xi.dtype
+                try:
+                    np.array(cats, dtype=cats_dtype)
+                except (TypeError, ValueError):
+                    cats_dtype = object
             elif not isinstance(self.categories, list):
                 raise ValueError(
                     "categories must be 'auto' or a list of per-feature arrays."
                 )
             else:
+                Xi = self._expand_by_separators(Xi)
+                cats_dtype = Xi.dtype
                 if np.issubdtype(Xi.dtype, np.str_):
                     # Always convert string categories to objects to avoid
                     # unexpected string truncation for longer category labels
@@ -1670,7 +1852,7 @@ class DummyCodeEncoder(_BaseEncoder):
                         )
                         raise ValueError(msg)
 
-            categories = np.empty(len(cats), dtype=Xi.dtype)
+            categories = np.empty(len(cats), dtype=cats_dtype)
             categories[:] = cats
             self.categories_[input_features[i]] = categories
 
@@ -1685,14 +1867,16 @@ class DummyCodeEncoder(_BaseEncoder):
         # _default_to_infrequent_mappings are always defined before fit()
         # calls _set_drop_idx() and _compute_n_features_outs().
         if self._infrequent_enabled:
-            category_counts = []
-            for i in range(n_features):
-                Xi = X_list[i]
-                Xi_expanded = self._expand_by_separators(Xi)
-                counts = []
-                for cat in self.categories_[i]:
-                    counts.append(np.sum(Xi_expanded == cat))
-                category_counts.append(np.array(counts, dtype=np.int64))
+            category_counts = [
+                np.array(
+                    [
+                        token_counts[i].get(None if _is_missing(cat) else cat, 0)
+                        for cat in self.categories_[i]
+                    ],
+                    dtype=np.int64,
+                )
+                for i in range(n_features)
+            ]
             self._fit_infrequent_category_mapping(
                 n_samples, category_counts, missing_indices={}
             )
@@ -1731,15 +1915,32 @@ class DummyCodeEncoder(_BaseEncoder):
         self._n_features_outs = self._compute_n_features_outs()
         return self
 
-    def _build_cache(self):
-        if self._cached_dict is None:
-            categories_flat_ = [
-                item for arr in self.categories_.values() for item in arr
-            ]
-            self._cached_dict = dict(
-                zip(categories_flat_, range(len(categories_flat_)))
-            )
-        return self._cached_dict
+    def _tokenizer(self):
+        """Return the per-cell tokenizer configured by ``sep`` and ``regex``."""
+        return partial(_expanded_tokens, sep=self.sep or "|", regex=self.regex)
+
+    def _build_vocabularies(self):
+        """
+        Build (once) the per-feature ``token -> column`` vocabularies.
+
+        The category removed by ``drop`` is kept as an ignored token, so the
+        encoded block already excludes it and it is not reported as unknown.
+        """
+        if self._vocabularies is None:
+            vocabularies = []
+            for i, cats in self.categories_.items():
+                keys = [None if _is_missing(cat) else cat for cat in cats]
+                drop_idx = (
+                    None
+                    if self._drop_idx_after_grouping is None
+                    else self._drop_idx_after_grouping[i]
+                )
+                ignored = ()
+                if drop_idx is not None:
+                    ignored = (keys.pop(int(drop_idx)),)
+                vocabularies.append(_MultiLabelVocabulary(keys, ignored=ignored))
+            self._vocabularies = vocabularies
+        return self._vocabularies
 
     def _transform(
         self,
@@ -1748,73 +1949,29 @@ class DummyCodeEncoder(_BaseEncoder):
         ensure_all_finite=True,
         warn_on_unknown=False,
         ignore_category_indices=None,
-        class_to_index=None,
     ):
         X_list, n_samples, n_features = self._check_X(
             X, ensure_all_finite=ensure_all_finite
         )
         validate_data(self, X=X, reset=False, skip_check_array=True)
 
-        class_mapping = (
-            class_to_index if class_to_index is not None else self._build_cache()
+        # Tokenise each (feature, row chunk) once and write the CSR arrays
+        # directly; feature blocks are laid side by side in fit order.
+        X_out, unknown, unknown_rows = _encode_multilabel_csr(
+            X_list,
+            self._build_vocabularies(),
+            self._tokenizer(),
+            n_samples=n_samples,
+            dtype=self.dtype,
+            chunk_size=self.chunk_size,
+            n_jobs=self.n_jobs,
         )
-        X_int = np.zeros((n_samples, len(class_mapping)), dtype=int)
-        X_mask = np.ones((n_samples, len(class_mapping)), dtype=bool)
-
-        # FIX: convert col-based X_list (list-cols) to row-based (list-rows)
-        # X_list = list(zip(*X_list))   # row-major view like X_list.T
-        # Instead of building each row via zip(*X_list),
-        # process column-by-column and push values into row sets.
-        per_row_buckets = [set() for _ in range(n_samples)]
-
-        # Build CSR matrix
-        indices = array.array("i")
-        indptr = array.array("i", [0])
-        columns_with_unknown = set()
-        for i in range(n_features):
-            # index = set()
-            X_col = X_list[i]  # length = n_samples
-            # vals = self._expand_by_separators([X_col])
-            # diff, valid_mask = _check_unknown(vals, self.categories_[i], return_mask=True)
-            # if not np.all(valid_mask):
-            #     if handle_unknown == "error":
-            #         msg = (
-            #             "Found unknown categories {0} in column {1}"
-            #             " during transform".format(diff, i)
-            #         )
-            #         raise ValueError(msg)
-            #     else:
-            #         if warn_on_unknown:
-            #             columns_with_unknown.add(i)
-            #         # Set the problematic rows to an acceptable value and
-            #         # continue `The rows are marked `X_mask` and will be
-            #         # removed later.
-            #         X_mask[:, i] = valid_mask
-            #         # cast X_col into the largest string type necessary
-            #         # to handle different lengths of numpy strings
-            #         if (
-            #             self.categories_[i].dtype.kind in ("U", "S")
-            #             and self.categories_[i].itemsize > X_col.itemsize
-            #         ):
-            #             X_col = X_col.astype(self.categories_[i].dtype)
-            #         elif self.categories_[i].dtype.kind == "O" and X_col.dtype.kind == "U":
-            #             # categories are objects and X_col are numpy strings.
-            #             # Cast X_col to an object dtype to prevent truncation
-            #             # when setting invalid values.
-            #             X_col = X_col.astype("O")
-            #         else:
-            #             X_col = X_col.copy()
-            #         X_col[~valid_mask] = self.categories_[i][0]
-            # X_int[:, i] = _encode(X_col, uniques=self.categories_[i], check_unknown=False)
-            for j in range(n_samples):
-                vals = self._expand_by_separators([X_col[j]])
-                for d in vals:
-                    try:
-                        # index.add(class_mapping[d])
-                        per_row_buckets[j].add(class_mapping[d])
-                    except KeyError:
-                        columns_with_unknown.add(d)
+        # X_mask[j, i] is False when row j of feature i held an unknown token.
+        X_mask = np.ones((n_samples, n_features), dtype=bool)
+        for i, rows in enumerate(unknown_rows):
+            X_mask[rows, i] = False
 
+        columns_with_unknown = set().union(*unknown)
         if columns_with_unknown:
             sorted_unknown = sorted(columns_with_unknown, key=str)
             if handle_unknown == "error":
@@ -1839,21 +1996,8 @@ class DummyCodeEncoder(_BaseEncoder):
                     UserWarning,
                 )
 
-        # Convert row buckets → CSR lists
-        for index in per_row_buckets:
-            indices.extend(index)
-            indptr.append(len(indices))
-        data = np.ones(len(indices), dtype=int)
-
         # self._map_infrequent_categories(X_int, X_mask, ignore_category_indices)
-        return (
-            sp.csr_matrix(
-                (data, indices, indptr),
-                shape=(len(indptr) - 1, len(class_mapping)),
-                dtype=self.dtype,
-            ),
-            X_mask,
-        )
+        return X_out, X_mask
 
     def transform(self, X):
         """
@@ -1899,11 +2043,11 @@ class DummyCodeEncoder(_BaseEncoder):
             }
             handle_unknown = self.handle_unknown
 
-        # NOTE: _transform() returns (csr_matrix, X_mask).  X_mask is a boolean
-        # array marking valid (known) entries; it is produced by the parent-class
-        # _transform() but DummyCodeEncoder overrides _transform() with its own CSR
-        # builder that already encodes unknowns as all-zeros.  The mask is therefore
-        # not needed here and is intentionally discarded (_mask_unused).
+        # NOTE: _transform() returns (csr_matrix, X_mask).  X_mask marks, per
+        # input feature, the rows that held no unknown token (sklearn's
+        # _transform contract).  The CSR already encodes unknowns as all-zeros
+        # and already excludes the `drop` categories (they are ignored tokens of
+        # the fitted vocabularies), so the mask is not needed here.
         X_int, _mask_unused = self._transform(
             X,
             handle_unknown=handle_unknown,
@@ -1911,23 +2055,6 @@ class DummyCodeEncoder(_BaseEncoder):
             warn_on_unknown=warn_on_unknown,
         )
 
-        # Apply drop filtering: remove globally-indexed columns that correspond to
-        # the `drop` parameter (e.g. drop='first' removes index 0 within each feature).
-        # The CSR was built from all categories; the drop bookkeeping (_set_drop_idx)
-        # computed which local-within-feature indices to remove — translate those to
-        # global column indices and slice them out now.
-        if self._drop_idx_after_grouping is not None:
-            # Compute per-feature start offsets in the flat column space
-            offsets = np.cumsum([0] + [len(v) for v in self.categories_.values()])
-            cols_to_drop = []
-            for feat_i, drop_idx in enumerate(self._drop_idx_after_grouping):
-                if drop_idx is not None:
-                    cols_to_drop.append(int(offsets[feat_i]) + int(drop_idx))
-            if cols_to_drop:
-                all_cols = list(range(X_int.shape[1]))
-                keep_cols = [c for c in all_cols if c not in cols_to_drop]
-                X_int = X_int[:, keep_cols]
-
         if not self.sparse_output:
             return X_int.toarray()
         return X_int
@@ -21,6 +21,7 @@ Coverage map
 - sklearn Pipeline and clone compatibility                             → TestSklearnCompat
 - ``_expand_by_separators`` unit test                                  → TestExpandBySeparators
 - ``_sort_with_none_nan_last`` unit test                               → TestSortHelper
+- vocabulary engine: chunked / threaded encoding, per-feature ids     → TestVocabularyEngine
 
 Notes
 -----
@@ -731,6 +732,61 @@ class TestSortHelper(unittest.TestCase):
         self.assertEqual(len(result), 4)
 
 
+# ===========================================================================
+# TestVocabularyEngine — chunked / threaded CSR encoding
+# ===========================================================================
+
+class TestVocabularyEngine(unittest.TestCase):
+    """Tokens are looked up in per-feature vocabularies and written as CSR."""
+
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "tags": ["a,b", "b,c", "a", "c,a,b", "b"] * 4,
+                "other": ["a", "x,a", "y", "x", "y,a"] * 4,
+            }
+        )
+
+    def test_chunked_threaded_matches_default(self):
+        """chunk_size / n_jobs must not change the encoded values."""
+        expected = DummyCodeEncoder(sep=",").fit_transform(self.df)
+        result = DummyCodeEncoder(sep=",", chunk_size=3, n_jobs=2).fit_transform(
+            self.df
+        )
+        self.assertTrue(result.has_sorted_indices)
+        np.testing.assert_array_equal(result.toarray(), expected.toarray())
+
+    def test_shared_token_encoded_per_feature(self):
+        """A token present in two features must light up each feature's column."""
+        enc = DummyCodeEncoder(sep=",", sparse_output=False).fit(self.df)
+        names = list(enc.get_feature_names_out())
+        result = enc.transform(pd.DataFrame({"tags": ["a"], "other": ["y"]}))
+        self.assertEqual(result[0, names.index("tags_a")], 1)
+        self.assertEqual(result[0, names.index("other_a")], 0)
+        self.assertEqual(result[0, names.index("other_y")], 1)
+
+    def test_min_frequency_counts_tokens(self):
+        enc = DummyCodeEncoder(sep=",", min_frequency=6).fit(self.df)
+        # other: a=12, x=8, y=8 — tags: a=12, b=16, c=8; nothing below 6
+        self.assertIsNone(enc.infrequent_categories_[0])
+        enc = DummyCodeEncoder(sep=",", min_frequency=9).fit(self.df)
+        self.assertEqual(list(enc.infrequent_categories_[0]), ["c"])
+
+    def test_unknown_rows_marked_in_mask(self):
+        enc = DummyCodeEncoder(sep=",", handle_unknown="ignore").fit(self.df)
+        X_out, X_mask = enc._transform(
+            pd.DataFrame({"tags": ["a,zz", "b"], "other": ["x", "qq"]}),
+            handle_unknown="ignore",
+        )
+        np.testing.assert_array_equal(X_mask, [[False, True], [True, False]])
+        self.assertEqual(X_out.shape, (2, 6))
+
+    def test_drop_first_columns_removed(self):
+        enc = DummyCodeEncoder(sep=",", drop="first", sparse_output=False)
+        result = enc.fit_transform(self.df)
+        self.assertEqual(result.shape[1], len(enc.get_feature_names_out()))
+
+
 if __name__ == "__main__":
     # install_scikitplot_stub()
     unittest.main(verbosity=2)
@@ -22,6 +22,7 @@ Coverage map
 - sklearn pipeline and clone round-trip                        → TestSklearnCompat
 - numpy array and sparse matrix input                          → TestInputFormats
 - ``fit_transform`` consistency                                 → TestFitTransform
+- vocabulary engine: chunked / threaded encoding, drop at fit   → TestVocabularyEngine
 
 Notes
 -----
@@ -464,7 +465,7 @@ class TestDrop(unittest.TestCase):
     def test_drop_single_category_feature_preserved(self):
         """A feature with only 1 category must be KEPT even with drop='first'.
 
-        The guard ``len(dummies.columns) > 1`` in ``_make_dummies`` intentionally
+        The guard ``len(tokens) > 1`` in ``GetDummies.fit`` intentionally
         preserves single-category features: dropping the sole category would
         produce a fully-zero column with no information and silently destroy the
         feature, which is misleading.  This matches scikit-learn's ``OneHotEncoder``
@@ -647,6 +648,61 @@ class TestFitTransform(unittest.TestCase):
         self.assertGreater(len(col_cols), 0)
 
 
+# ===========================================================================
+# TestVocabularyEngine — chunked / threaded CSR encoding
+# ===========================================================================
+
+class TestVocabularyEngine(unittest.TestCase):
+    """Tokens are looked up in the fitted vocabulary and written as CSR."""
+
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "tags": ["a,b", "B, c", None, "c", ",", "a,A,b"] * 5,
+                "labels": ["x", "y,z", "x,z", None, "y", "z"] * 5,
+                "val": range(30),
+            }
+        )
+
+    def test_chunked_threaded_matches_default(self):
+        """chunk_size / n_jobs must not change the encoded values."""
+        ref = GetDummies(columns=["tags", "labels"], sep=",", sparse_output=True)
+        enc = GetDummies(
+            columns=["tags", "labels"], sep=",", sparse_output=True,
+            chunk_size=4, n_jobs=2,
+        )
+        expected = ref.fit_transform(self.df)
+        result = enc.fit_transform(self.df)
+        self.assertEqual(enc.categories_, ref.categories_)
+        np.testing.assert_array_equal(result.toarray(), expected.toarray())
+
+    def test_sparse_matches_dense(self):
+        """The CSR block must equal the dummy block of the DataFrame output."""
+        dense = GetDummies(columns=["tags", "labels"], sep=",").fit_transform(self.df)
+        enc = GetDummies(columns=["tags", "labels"], sep=",", sparse_output=True)
+        result = enc.fit_transform(self.df)
+        self.assertTrue(result.has_sorted_indices)
+        dummy_cols = [c for cats in enc.categories_.values() for c in cats]
+        np.testing.assert_array_equal(result.toarray(), dense[dummy_cols].to_numpy())
+
+    def test_empty_cell_and_nan_rows_are_zero(self):
+        enc = GetDummies(columns="tags", sep=",", sparse_output=True)
+        result = enc.fit_transform(self.df).toarray()
+        np.testing.assert_array_equal(result[[2, 4]], 0)
+
+    def test_drop_first_is_decided_at_fit(self):
+        """A transform batch without the first token must keep its columns."""
+        enc = GetDummies(columns="tags", sep=",", drop="first").fit(self.df)
+        result = enc.transform(pd.DataFrame({"tags": ["b", "a,c"], "val": [0, 1]}))
+        np.testing.assert_array_equal(result["ta_b"].to_numpy(), [1.0, 0.0])
+        np.testing.assert_array_equal(result["ta_c"].to_numpy(), [0.0, 1.0])
+
+    def test_invalid_chunk_size_raises(self):
+        enc = GetDummies(columns="tags", sep=",", chunk_size=0)
+        with self.assertRaises(ValueError):
+            enc.fit(self.df)
+
+
 if __name__ == "__main__":
     # install_scikitplot_stub()
     unittest.main(verbosity=2)
@@ -293,6 +293,8 @@ class KissBitGenerator:
     ) -> None: ...
 
     def spawn(self, n_children: int) -> list[KissBitGenerator]: ...
+    def advance(self, delta: int) -> KissBitGenerator: ...
+    def jumped(self, jumps: int = 1) -> KissBitGenerator: ...
 
     @property
     def capsule(self) -> Any: ...
@@ -366,15 +368,19 @@ class KissGenerator:
         self,
         size: None = None,
         dtype: DTypeLike = np.float64,
-        out: None = None
+        out: None = None,
+        *,
+        workers: int | None = None,
     ) -> float: ...
 
     @overload
     def random(
         self,
-        size: int | tuple[int, ...],
+        size: int | tuple[int, ...] | None = None,
         dtype: DTypeLike = np.float64,
-        out: NDArray[np.floating[Any]] | None = None
+        out: NDArray[np.floating[Any]] | None = None,
+        *,
+        workers: int | None = None,
     ) -> NDArray[np.floating[Any]]: ...
 
     # Random integers
@@ -385,7 +391,10 @@ class KissGenerator:
         high: int | None = None,
         size: None = None,
         dtype: DTypeLike = np.int64,
-        endpoint: bool = False
+        endpoint: bool = False,
+        *,
+        out: None = None,
+        workers: int | None = None,
     ) -> int: ...
 
     @overload
@@ -393,10 +402,13 @@ class KissGenerator:
         self,
         low: int,
         high: int | None = None,
-        size: int | tuple[int, ...] = ...,
+        size: int | tuple[int, ...] | None = ...,
         dtype: DTypeLike = np.int64,
-        endpoint: bool = False
-    ) -> NDArray[np.signedinteger[Any]]: ...
+        endpoint: bool = False,
+        *,
+        out: NDArray[np.integer[Any]] | None = None,
+        workers: int | None = None,
+    ) -> NDArray[np.integer[Any]]: ...
 
     # Normal distribution
     @overload
@@ -409,8 +421,31 @@ class KissGenerator:
         self,
         loc: ArrayLike = 0.0,
         scale: ArrayLike = 1.0,
-        size: int | tuple[int, ...] | None = ...
-    ) -> NDArray[np.float64]: ...
+        size: int | tuple[int, ...] | None = ...,
+        *,
+        out: NDArray[np.floating[Any]] | None = None,
+        workers: int | None = None,
+    ) -> NDArray[np.floating[Any]]: ...
+
+    @overload
+    def standard_normal(
+        self,
+        size: None = None,
+        dtype: DTypeLike = np.float64,
+        out: None = None,
+        *,
+        workers: int | None = None,
+    ) -> float: ...
+
+    @overload
+    def standard_normal(
+        self,
+        size: int | tuple[int, ...] | None = None,
+        dtype: DTypeLike = np.float64,
+        out: NDArray[np.floating[Any]] | None = None,
+        *,
+        workers: int | None = None,
+    ) -> NDArray[np.floating[Any]]: ...
 
     # Uniform distribution
     @overload
@@ -455,7 +490,8 @@ class KissGenerator:
     ) -> NDArray[Any]: ...
 
     # Array operations
-    def shuffle(self, x: NDArray[Any]) -> None: ...
+    def shuffle(self, x: NDArray[Any] | list[Any], axis: int = 0) -> None: ...
+    def permutation(self, x: int | ArrayLike, axis: int = 0) -> NDArray[Any]: ...
 
     # Spawning
     def spawn(self, n_children: int) -> list[KissGenerator]: ...
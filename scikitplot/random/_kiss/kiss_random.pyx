@@ -98,10 +98,12 @@ import sys
 import time
 import platform
 # import struct
+import operator
 import threading
 import secrets
 import warnings
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Any, Optional, Union  # Mapping  # no-cython-lint
 
@@ -126,6 +128,7 @@ from numpy._typing import (
 cnp.import_array()
 
 # Cython-level imports
+from libc.math cimport log, sqrt
 from libc.stdint cimport uint32_t, uint64_t
 from libc.stddef cimport size_t
 
@@ -2052,6 +2055,194 @@ cdef uint64_t kiss32_next_raw(void *st) noexcept nogil:
     """C callback for next_raw from 32-bit RNG."""
     return kiss32_next_uint64(st)
 
+# ===========================================================================
+# Jump-ahead for Kiss64Random
+# ===========================================================================
+#
+# KISS64 is the sum of three independent recurrences, each of which can be
+# advanced by ``k`` steps in O(log k):
+#
+# - MWC (x, c): multiply-with-carry with a = 2**58 + 1, b = 2**64.  With
+#   t_n = a * x_{n-1} + c_{n-1} and p = a * b - 1 we have t_{n+1} = a * t_n
+#   (mod p), x_n = t_n mod b and c_n = t_n // b, so k steps are one modular
+#   power.  The C step drops a carry when c >= 2**58 (never reached from a
+#   seeded state in practice); such states are stepped explicitly first.
+# - LCG (z): affine map composed by repeated squaring modulo 2**64.
+# - Xorshift (y): linear over GF(2); T**(2**e) is precomputed as 64x64 bit
+#   matrices (column images) and applied by binary exponentiation.
+#
+# ``KissBitGenerator.jumped`` advances by 2**128 draws, so ~2**122 disjoint
+# streams of 2**128 values each fit in the KISS64 period.
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_KISS64_MWC_A = 0x0400000000000001  # 2**58 + 1
+_KISS64_MWC_CARRY_LIMIT = 0x0400000000000000  # 2**58
+_KISS64_MWC_P = (_KISS64_MWC_A << 64) - 1
+_KISS64_LCG_MULT = 6906969069
+_KISS64_LCG_INC = 1234567
+_KISS64_JUMP = 1 << 128
+
+# _XS_POW[e][i] = image of bit i under the xorshift map applied 2**e times.
+cdef uint64_t _XS_POW[64][64]
+
+
+cdef inline uint64_t _xorshift64_step(uint64_t y) noexcept nogil:
+    y ^= y << 13
+    y ^= y >> 17
+    y ^= y << 43
+    return y
+
+
+cdef inline uint64_t _gf2_matvec(const uint64_t* cols, uint64_t v) noexcept nogil:
+    cdef uint64_t r = 0
+    cdef int i = 0
+    while v:
+        if v & 1:
+            r ^= cols[i]
+        v >>= 1
+        i += 1
+    return r
+
+
+cdef void _init_xorshift_powers() noexcept nogil:
+    cdef int e, i
+    for i in range(64):
+        _XS_POW[0][i] = _xorshift64_step((<uint64_t>1) << i)
+    for e in range(1, 64):
+        for i in range(64):
+            _XS_POW[e][i] = _gf2_matvec(_XS_POW[e - 1], _XS_POW[e - 1][i])
+
+
+cdef uint64_t _xorshift64_advance(uint64_t y, uint64_t k) noexcept nogil:
+    """Apply the xorshift map ``k`` times (``k`` already reduced mod 2**64 - 1)."""
+    cdef int e = 0
+    while k:
+        if k & 1:
+            y = _gf2_matvec(_XS_POW[e], y)
+        k >>= 1
+        e += 1
+    return y
+
+
+_init_xorshift_powers()
+
+
+def _kiss64_mwc_advance(x, c, k):
+    """Advance the (x, c) multiply-with-carry pair by ``k`` steps."""
+    while k and c >= _KISS64_MWC_CARRY_LIMIT:
+        # Mirror the C step exactly for carries outside the canonical range.
+        t = (((x << 58) & _MASK64) + c) & _MASK64
+        c = x >> 6
+        x = (x + t) & _MASK64
+        c += x < t
+        k -= 1
+    if not k:
+        return x, c
+    t = _KISS64_MWC_A * x + c
+    if t == _KISS64_MWC_P:
+        # (2**64 - 1, 2**58) is the MWC fixed point.
+        return x, c
+    t = pow(_KISS64_MWC_A, k - 1, _KISS64_MWC_P) * t % _KISS64_MWC_P
+    return t & _MASK64, t >> 64
+
+
+def _kiss64_lcg_advance(z, k):
+    """Advance the LCG word ``z`` by ``k`` steps (Brown, 1994)."""
+    acc_mult, acc_inc = 1, 0
+    cur_mult, cur_inc = _KISS64_LCG_MULT, _KISS64_LCG_INC
+    while k:
+        if k & 1:
+            acc_mult = (acc_mult * cur_mult) & _MASK64
+            acc_inc = (acc_inc * cur_mult + cur_inc) & _MASK64
+        cur_inc = ((cur_mult + 1) * cur_inc) & _MASK64
+        cur_mult = (cur_mult * cur_mult) & _MASK64
+        k >>= 1
+    return (acc_mult * z + acc_inc) & _MASK64
+
+# ===========================================================================
+# Native sampling kernels (nogil, fill caller-provided buffers)
+# ===========================================================================
+#
+# Every kernel draws straight from ``CKiss64Random.kiss()`` into a typed
+# memoryview, so no intermediate uint64 array or NumPy post-processing is
+# involved.  Callers hold ``KissBitGenerator.lock`` around each kernel.
+
+DEF KISS_F32_SHIFT = 40              # 64 - 24
+DEF KISS_F32_SCALE = 5.9604644775390625e-08   # 2**-24 (exact)
+
+# Elements per independent block in ``workers=`` mode.  Fixed (not derived
+# from the worker count) so that parallel output depends only on the seed.
+DEF KISS_PARALLEL_BLOCK = 65536
+
+ctypedef fused _kiss_float_t:
+    float
+    double
+
+ctypedef fused _kiss_int_t:
+    cnp.int8_t
+    cnp.int16_t
+    cnp.int32_t
+    cnp.int64_t
+    cnp.uint8_t
+    cnp.uint16_t
+    cnp.uint32_t
+    cnp.uint64_t
+
+
+cdef inline double _kiss64_double(CKiss64Random* rng) noexcept nogil:
+    return <double>(rng.kiss() >> KISS_F64_SHIFT) * KISS_F64_SCALE
+
+
+cdef inline uint64_t _mulhilo64(uint64_t a, uint64_t b, uint64_t* lo) noexcept nogil:
+    """Full 64x64 -> 128-bit product; portable (no ``__int128`` on MSVC)."""
+    cdef uint64_t a_lo = a & 0xFFFFFFFFULL
+    cdef uint64_t a_hi = a >> 32
+    cdef uint64_t b_lo = b & 0xFFFFFFFFULL
+    cdef uint64_t b_hi = b >> 32
+    cdef uint64_t p0 = a_lo * b_lo
+    cdef uint64_t p1 = a_lo * b_hi
+    cdef uint64_t p2 = a_hi * b_lo
+    cdef uint64_t p3 = a_hi * b_hi
+    cdef uint64_t mid = (p0 >> 32) + (p1 & 0xFFFFFFFFULL) + (p2 & 0xFFFFFFFFULL)
+    lo[0] = (mid << 32) | (p0 & 0xFFFFFFFFULL)
+    return p3 + (p1 >> 32) + (p2 >> 32) + (mid >> 32)
+
+
+cdef inline uint64_t _kiss64_bounded(CKiss64Random* rng, uint64_t n) noexcept nogil:
+    """
+    Unbiased integer in ``[0, n)`` (Lemire's nearly divisionless method).
+
+    ``n == 0`` stands for the full 2**64 range.  The modulo that computes the
+    rejection threshold only runs when the low product word falls below
+    ``n``, i.e. with probability ``n / 2**64``.
+    """
+    cdef uint64_t lo, hi, threshold
+    if n == 0:
+        return rng.kiss()
+    hi = _mulhilo64(rng.kiss(), n, &lo)
+    if lo < n:
+        threshold = (<uint64_t>0 - n) % n
+        while lo < threshold:
+            hi = _mulhilo64(rng.kiss(), n, &lo)
+    return hi
+
+
+cdef inline void _kiss64_polar_pair(
+    CKiss64Random* rng, double* z0, double* z1
+) noexcept nogil:
+    """Two independent standard normals (Marsaglia polar method)."""
+    cdef double u, v, s, f
+    while True:
+        u = 2.0 * _kiss64_double(rng) - 1.0
+        v = 2.0 * _kiss64_double(rng) - 1.0
+        s = u * u + v * v
+        if 0.0 < s < 1.0:
+            break
+    f = sqrt(-2.0 * log(s) / s)
+    z0[0] = u * f
+    z1[0] = v * f
+
+
 # ===========================================================================
 # KissBitGenerator - NumPy-compatible BitGenerator Protocol
 # ===========================================================================
@@ -2342,6 +2533,94 @@ cdef class KissBitGenerator:
             for child_seq in child_seed_seqs
         ]
 
+    def advance(self, delta):
+        """
+        Advance the state as if ``delta`` raw values had been drawn.
+
+        Parameters
+        ----------
+        delta : int
+            Number of draws to skip.  Must be >= 0; may exceed 2**64.
+
+        Returns
+        -------
+        self : KissBitGenerator
+            This bit generator, advanced in place.
+
+        Raises
+        ------
+        ValueError
+            If delta < 0
+
+        Notes
+        -----
+        Runs in O(log delta): each of the three KISS64 component
+        recurrences (multiply-with-carry, LCG, xorshift) is advanced in
+        closed form rather than stepped.
+
+        See Also
+        --------
+        jumped : Copy advanced by a multiple of 2**128 draws
+
+        Examples
+        --------
+        >>> a, b = KissBitGenerator(42), KissBitGenerator(42)
+        >>> _ = a.random_raw(1000)
+        >>> b.advance(1000).random_raw() == a.random_raw()
+        True
+        """
+        delta = operator.index(delta)
+        if delta < 0:
+            raise ValueError(f"delta must be >= 0, got {delta}")
+        with self.lock:
+            x, c = _kiss64_mwc_advance(int(self._rng.x), int(self._rng.c), delta)
+            z = _kiss64_lcg_advance(int(self._rng.z), delta)
+            self._rng.y = _xorshift64_advance(
+                self._rng.y, <uint64_t>(delta % _MASK64)
+            )
+            self._rng.x = <uint64_t>x
+            self._rng.c = <uint64_t>c
+            self._rng.z = <uint64_t>z
+        return self
+
+    def jumped(self, jumps=1):
+        """
+        Return a copy whose state is advanced by ``jumps * 2**128`` draws.
+
+        Parameters
+        ----------
+        jumps : int, default=1
+            Number of 2**128-draw jumps.  Must be >= 0.
+
+        Returns
+        -------
+        KissBitGenerator
+            New bit generator; this one is left unchanged.
+
+        Notes
+        -----
+        Unlike :meth:`spawn`, which reseeds, ``jumped(1)``, ``jumped(2)``, ...
+        are non-overlapping windows of *this* stream, so work split across
+        threads stays reproducible from a single seed.
+
+        See Also
+        --------
+        advance : Advance in place by an arbitrary number of draws
+        spawn : Independent children from the seed sequence
+
+        Examples
+        --------
+        >>> bg = KissBitGenerator(42)
+        >>> streams = [bg.jumped(i + 1) for i in range(4)]
+        """
+        jumps = operator.index(jumps)
+        if jumps < 0:
+            raise ValueError(f"jumps must be >= 0, got {jumps}")
+        child = KissBitGenerator(int(self._seed))
+        with self.lock:
+            child.set_state(self.get_state())
+        return child.advance(jumps * _KISS64_JUMP)
+
     @property
     def capsule(self):
         """
@@ -2718,6 +2997,149 @@ cdef class KissBitGenerator:
         print(f"Generated {cnt:,} {method} values in {elapsed:.4f}s")
         print(f"Rate: {cnt / elapsed:,.0f} values/sec")
 
+# ===========================================================================
+# Buffer-filling entry points (called with the bit generator's lock held)
+# ===========================================================================
+
+def _fill_random(KissBitGenerator bit_generator, _kiss_float_t[::1] out):
+    """Fill ``out`` with uniforms in [0, 1) (top mantissa bits, exact scale)."""
+    cdef CKiss64Random* rng = bit_generator._rng
+    cdef Py_ssize_t i, n = out.shape[0]
+    with nogil:
+        if _kiss_float_t is float:
+            for i in range(n):
+                out[i] = <float>(rng.kiss() >> KISS_F32_SHIFT) * <float>KISS_F32_SCALE
+        else:
+            for i in range(n):
+                out[i] = <double>(rng.kiss() >> KISS_F64_SHIFT) * KISS_F64_SCALE
+
+
+def _fill_normal(
+    KissBitGenerator bit_generator,
+    _kiss_float_t[::1] out,
+    double loc,
+    double scale,
+):
+    """Fill ``out`` with ``loc + scale * N(0, 1)`` draws; an odd tail discards its spare."""
+    cdef CKiss64Random* rng = bit_generator._rng
+    cdef Py_ssize_t i = 0, n = out.shape[0]
+    cdef double z0, z1
+    with nogil:
+        while i + 1 < n:
+            _kiss64_polar_pair(rng, &z0, &z1)
+            out[i] = <_kiss_float_t>(loc + scale * z0)
+            out[i + 1] = <_kiss_float_t>(loc + scale * z1)
+            i += 2
+        if i < n:
+            _kiss64_polar_pair(rng, &z0, &z1)
+            out[i] = <_kiss_float_t>(loc + scale * z0)
+
+
+def _fill_integers(
+    KissBitGenerator bit_generator,
+    _kiss_int_t[::1] out,
+    uint64_t low,
+    uint64_t span,
+):
+    """Fill ``out`` with ``low + U[0, span)`` (two's complement; ``span == 0`` is 2**64)."""
+    cdef CKiss64Random* rng = bit_generator._rng
+    cdef Py_ssize_t i, n = out.shape[0]
+    with nogil:
+        for i in range(n):
+            out[i] = <_kiss_int_t>(low + _kiss64_bounded(rng, span))
+
+
+def _fill_permutation(
+    KissBitGenerator bit_generator,
+    cnp.int64_t[::1] idx,
+    Py_ssize_t k=-1,
+):
+    """
+    Fisher-Yates over ``idx`` in place.
+
+    With ``k >= 0`` only the first ``k`` positions are drawn (partial shuffle),
+    which is all that sampling ``k`` items without replacement needs.
+    """
+    cdef CKiss64Random* rng = bit_generator._rng
+    cdef Py_ssize_t n = idx.shape[0]
+    cdef Py_ssize_t i, j
+    cdef cnp.int64_t tmp
+    with nogil:
+        if k < 0:
+            i = n - 1
+            while i > 0:
+                j = <Py_ssize_t>_kiss64_bounded(rng, <uint64_t>(i + 1))
+                tmp = idx[i]
+                idx[i] = idx[j]
+                idx[j] = tmp
+                i -= 1
+        else:
+            for i in range(min(k, n)):
+                j = i + <Py_ssize_t>_kiss64_bounded(rng, <uint64_t>(n - i))
+                tmp = idx[i]
+                idx[i] = idx[j]
+                idx[j] = tmp
+
+
+def _prepare_out(size, dtype, out):
+    """
+    Resolve ``size``/``out`` into ``(result, flat)`` for the fill kernels.
+
+    ``flat`` is a 1-D view of ``result`` so kernels write in place.  ``out``
+    must be a writeable, C-contiguous ndarray of exactly ``dtype``.
+    """
+    if out is None:
+        result = np.empty(size, dtype=dtype)
+        return result, result.reshape(-1)
+    if not isinstance(out, np.ndarray):
+        raise TypeError(f"out must be a numpy.ndarray; got {type(out).__name__}")
+    if out.dtype != dtype:
+        raise TypeError(
+            f"Supplied output array has dtype {out.dtype}; expected {np.dtype(dtype)}"
+        )
+    if not out.flags.c_contiguous:
+        raise ValueError("Supplied output array must be C-contiguous")
+    if not out.flags.writeable:
+        raise ValueError("Supplied output array is not writeable")
+    if size is not None:
+        shape = (size,) if isinstance(size, int) else tuple(size)
+        if shape != out.shape:
+            raise ValueError(
+                f"size {shape} does not match out.shape {out.shape}"
+            )
+    return out, out.reshape(-1)
+
+
+def _fill_parallel(bit_generator, flat, fill, workers):
+    """
+    Fill ``flat`` block-wise from jump-ahead streams on a thread pool.
+
+    Block ``j`` (``KISS_PARALLEL_BLOCK`` elements) is drawn from
+    ``bit_generator.jumped(j + 1)``, so the result is identical for any
+    ``workers``.  Afterwards the parent is moved past every stream it
+    handed out, keeping later calls disjoint from this one.
+    """
+    workers = operator.index(workers)
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    n = flat.shape[0]
+    n_blocks = max(1, -(-n // KISS_PARALLEL_BLOCK))
+
+    with bit_generator.lock:
+        streams = [bit_generator.jumped(j + 1) for j in range(n_blocks)]
+        bit_generator.advance((n_blocks + 1) * _KISS64_JUMP)
+
+    def _run(j):
+        fill(streams[j], flat[j * KISS_PARALLEL_BLOCK:(j + 1) * KISS_PARALLEL_BLOCK])
+
+    if workers == 1 or n_blocks == 1:
+        for j in range(n_blocks):
+            _run(j)
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, n_blocks)) as pool:
+            # list() re-raises the first worker exception, if any.
+            list(pool.map(_run, range(n_blocks)))
+
 
 # ===========================================================================
 # High-Level Generator (NumPy-Compatible)
@@ -3200,16 +3622,26 @@ cdef class KissGenerator:
         scalar or ndarray
             Random samples
 
+        Notes
+        -----
+        Uniform sampling uses unbiased bounded integers; sampling without
+        replacement runs a partial Fisher-Yates shuffle that only draws
+        ``prod(size)`` positions.
+
         Examples
         --------
         >>> gen = KissGenerator(42)
         >>> gen.choice(10, size=5)
         array([...])
         """
-        if isinstance(a, int):
+        cdef KissBitGenerator bg = self._bit_generator
+        cdef uint64_t draw
+
+        if isinstance(a, (int, np.integer)):
             a = np.arange(a)
 
         a = np.asarray(a)
+        pop = len(a)
 
         if p is not None:
             p = np.asarray(p) / np.sum(p)
@@ -3227,27 +3659,40 @@ cdef class KissGenerator:
             return a[indices].reshape(size)
 
         if size is None:
-            with self.lock:
-                raw = self.bit_generator.random_raw()
-                return a[(raw % len(a))]
+            if pop == 0:
+                raise ValueError("a cannot be empty unless no samples are taken")
+            with bg.lock:
+                draw = _kiss64_bounded(bg._rng, <uint64_t>pop)
+            return a[draw]
 
         if isinstance(size, int):
             size = (size,)
 
         n = int(np.prod(size))
 
-        if not replace and n > len(a):
+        if not replace and n > pop:
             raise ValueError("Cannot sample without replacement: size > population")
 
         if replace:
-            indices = self.integers(0, len(a), size=n)
+            indices = self.integers(0, pop, size=n)
             return a[indices].reshape(size)
-        else:
-            indices = np.arange(len(a))
-            self.shuffle(indices)
-            return a[indices[:n]].reshape(size)
 
-    def integers(self, low, high=None, size=None, dtype=np.int64, endpoint=False):
+        indices = np.arange(pop, dtype=np.int64)
+        with bg.lock:
+            _fill_permutation(bg, indices, n)
+        return a[indices[:n]].reshape(size)
+
+    def integers(
+        self,
+        low,
+        high=None,
+        size=None,
+        dtype=np.int64,
+        endpoint=False,
+        *,
+        out=None,
+        workers=None,
+    ):
         """
         Random integers in [low, high) or [low, high].
 
@@ -3260,62 +3705,95 @@ cdef class KissGenerator:
         size : int or tuple, optional
             Output shape
         dtype : dtype, default=np.int64
-            Data type
+            Integer data type; ``[low, high)`` must fit in it
         endpoint : bool, default=False
             If True, sample from [low, high] instead of [low, high)
+        out : ndarray, optional
+            C-contiguous array of ``dtype`` to fill in place
+        workers : int, optional
+            Fill in parallel from jump-ahead streams (see Notes of
+            :meth:`random`)
 
         Returns
         -------
         int or ndarray
             Random integers
 
+        Raises
+        ------
+        ValueError
+            If low >= high, or the range does not fit in dtype
+        TypeError
+            If dtype is not an integer type
+
+        Notes
+        -----
+        Uses Lemire's nearly divisionless bounded-integer method, which is
+        unbiased for every range (``raw % range`` is not).
+
         Examples
         --------
         >>> gen = KissGenerator(42)
         >>> gen.integers(0, 10, size=5)
         array([...])
         """
+        cdef KissBitGenerator bg = self._bit_generator
+        cdef uint64_t draw
+
         if high is None:
             low, high = 0, low
 
+        low, high = int(low), int(high)
+
         if endpoint:
             high += 1
 
         if low >= high:
             raise ValueError(f"low >= high: {low} >= {high}")
 
-        range_size = high - low
-
-        if size is None:
-            with self.lock:
-                raw = self.bit_generator.random_raw()
-                return low + (raw % range_size)
-
-        if isinstance(size, int):
-            size = (size,)
-
-        n_total = int(np.prod(size))
-        result = np.empty(n_total, dtype=dtype)
-
-        with self.lock:
-            for i in range(n_total):
-                raw = self.bit_generator.random_raw()
-                result[i] = low + (raw % range_size)
-
-        return result.reshape(size)
+        dt = np.dtype(dtype)
+        if dt.kind not in "iu":
+            raise TypeError(f"Unsupported dtype {dt} for integers")
+        info = np.iinfo(dt)
+        if low < info.min or high - 1 > info.max:
+            raise ValueError(f"Range [{low}, {high}) is out of bounds for {dt}")
+
+        # span == 2**64 (full uint64/int64 range) is encoded as 0.
+        span = (high - low) & _MASK64
+
+        if size is None and out is None:
+            with bg.lock:
+                draw = _kiss64_bounded(bg._rng, <uint64_t>span)
+            return low + draw
+
+        result, flat = _prepare_out(size, dt, out)
+        low64 = low & _MASK64
+        if workers is None:
+            with bg.lock:
+                _fill_integers(bg, flat, low64, span)
+        else:
+            _fill_parallel(
+                bg, flat, lambda g, buf: _fill_integers(g, buf, low64, span), workers
+            )
+        return result
 
-    def normal(self, loc=0.0, scale=1.0, size=None):
+    def normal(self, loc=0.0, scale=1.0, size=None, *, out=None, workers=None):
         """
-        Normal distribution (Box-Muller transform).
+        Normal distribution (Marsaglia polar method).
 
         Parameters
         ----------
-        loc : float, default=0.0
+        loc : float or array_like, default=0.0
             Mean
-        scale : float, default=1.0
-            Standard deviation
+        scale : float or array_like, default=1.0
+            Standard deviation (non-negative)
         size : int or tuple, optional
             Output shape
+        out : ndarray, optional
+            C-contiguous float32/float64 array to fill in place
+        workers : int, optional
+            Fill in parallel from jump-ahead streams (see Notes of
+            :meth:`random`)
 
         Returns
         -------
@@ -3324,18 +3802,15 @@ cdef class KissGenerator:
 
         Notes
         -----
-        Uses the Box-Muller transform:
-            z = sqrt(-2 * log(u1)) * cos(2 * pi * u2)
-        where u1, u2 are i.i.d. Uniform(0, 1).
-
-        u1 is clamped away from zero to prevent log(0) = -inf.  Since
-        KissBitGenerator.random() maps [0, 2^64-1] onto [0.0, 1.0) and zero
-        is a valid raw value, u1 == 0.0 is possible (probability 1/2^64).
+        Samples are produced in pairs by the polar method in a nogil loop:
+        draw ``u, v`` uniform on (-1, 1) until ``0 < s = u**2 + v**2 < 1``
+        and return ``u * f, v * f`` with ``f = sqrt(-2 * log(s) / s)``.  No
+        trigonometric calls and no ``log(0)`` are possible.  An odd trailing
+        sample (or a scalar draw) discards the spare, so the generator keeps
+        no cached state and ``get_state`` stays exact.
 
-        The size != None path is fully vectorized in NumPy's C layer.
-        No Python list or scalar boxing is performed, which avoids the
-        GCC -Wstringop-overflow false positives triggered by Python 3.13t's
-        free-threaded Py_INCREF atomic operations.
+        Array-valued ``loc``/``scale`` draw standard normals natively and
+        broadcast with NumPy.
 
         Examples
         --------
@@ -3343,51 +3818,76 @@ cdef class KissGenerator:
         >>> gen.normal(0, 1, size=1000)
         array([...])
         """
-        # Smallest positive normalized float64 — used as log-zero guard.
-        # Denormalized minimum (5e-324) is theoretically smaller but
-        # normalized (2.225e-308) is safer for reproducibility across
-        # platforms that may flush denormals to zero.
-        cdef double _tiny = 2.2250738585072014e-308  # np.finfo(np.float64).tiny
+        if np.ndim(loc) or np.ndim(scale):
+            if np.any(np.asarray(scale) < 0):
+                raise ValueError("scale must be non-negative")
+            if size is None and out is None:
+                size = np.broadcast(loc, scale).shape
+            z = self._normal(0.0, 1.0, size, np.float64, None, workers)
+            return np.add(loc, np.multiply(scale, z), out=out)
 
-        if size is None:
-            # Single scalar sample.
-            u1 = self.random()
-            u2 = self.random()
-            # Guard: clamp to avoid log(0) = -inf.
-            if u1 == 0.0:
-                u1 = _tiny
-            z = np.sqrt(-2.0 * np.log(u1)) * np.cos(2.0 * np.pi * u2)
-            return float(loc + scale * z)
+        dtype = np.float64 if out is None else getattr(out, "dtype", np.float64)
+        return self._normal(loc, scale, size, dtype, out, workers)
 
-        if isinstance(size, int):
-            size = (size,)
+    def standard_normal(self, size=None, dtype=np.float64, out=None, *, workers=None):
+        """
+        Standard normal distribution (mean 0, standard deviation 1).
 
-        n_total = int(np.prod(size))
+        Parameters
+        ----------
+        size : int or tuple, optional
+            Output shape
+        dtype : {np.float64, np.float32}, default=np.float64
+            Output data type
+        out : ndarray, optional
+            C-contiguous array of ``dtype`` to fill in place
+        workers : int, optional
+            Fill in parallel from jump-ahead streams (see Notes of
+            :meth:`random`)
 
-        # Fully vectorized Box-Muller.
-        #
-        # The previous loop-based implementation (samples = []; for ...:
-        # samples.extend([z1, z2])) boxed every z1/z2 as a Python float
-        # and allocated a Python list per iteration.  Under Python 3.13t
-        # free-threaded, each Python object allocation triggers Py_INCREF
-        # via atomic ops, which GCC's IPA analysis incorrectly flags as
-        # -Wstringop-overflow.
-        #
-        # By keeping all arithmetic inside NumPy's C layer we:
-        #   1. Eliminate all Python scalar boxing.
-        #   2. Reduce Python object lifecycle events to two (u1, u2 arrays).
-        #   3. Gain significant performance on large size values.
-        u1 = self.random(n_total)   # float64 ndarray, shape (n_total,)
-        u2 = self.random(n_total)   # float64 ndarray, shape (n_total,)
-
-        # Guard: replace any exact zero with the smallest normal float64.
-        # np.maximum with out= is an in-place operation — no copy.
-        np.maximum(u1, _tiny, out=u1)
-
-        mag = np.sqrt(-2.0 * np.log(u1))          # magnitude
-        angle = 2.0 * np.pi * u2                  # phase
-        result = loc + scale * (mag * np.cos(angle))
-        return result.reshape(size)
+        Returns
+        -------
+        float or ndarray
+            Standard normal samples
+
+        See Also
+        --------
+        normal : Location/scale version
+
+        Examples
+        --------
+        >>> gen = KissGenerator(42)
+        >>> buf = np.empty(1000)
+        >>> _ = gen.standard_normal(out=buf)
+        """
+        return self._normal(0.0, 1.0, size, dtype, out, workers)
+
+    def _normal(self, double loc, double scale, size, dtype, out, workers):
+        """Scalar-parameter normal sampler shared by normal/standard_normal."""
+        cdef KissBitGenerator bg = self._bit_generator
+        cdef double z0, z1
+
+        if scale < 0:
+            raise ValueError(f"scale must be non-negative, got {scale}")
+
+        dt = np.dtype(dtype)
+        if dt != np.float32 and dt != np.float64:
+            raise TypeError(f"Unsupported dtype {dt}; use float32 or float64")
+
+        if size is None and out is None:
+            with bg.lock:
+                _kiss64_polar_pair(bg._rng, &z0, &z1)
+            return loc + scale * z0
+
+        result, flat = _prepare_out(size, dt, out)
+        if workers is None:
+            with bg.lock:
+                _fill_normal(bg, flat, loc, scale)
+        else:
+            _fill_parallel(
+                bg, flat, lambda g, buf: _fill_normal(g, buf, loc, scale), workers
+            )
+        return result
 
     def permutation(self, x, axis=0):
         """
@@ -3429,7 +3929,7 @@ cdef class KissGenerator:
         >>> arr  # Original unchanged
         array([1, 2, 3, 4])
         """
-        if isinstance(x, int):
+        if isinstance(x, (int, np.integer)):
             arr = np.arange(x)
         else:
             arr = np.array(x, copy=True)
@@ -3437,7 +3937,7 @@ cdef class KissGenerator:
         self.shuffle(arr, axis=axis)
         return arr
 
-    def random(self, size=None, dtype=np.float64, out=None):
+    def random(self, size=None, dtype=np.float64, out=None, *, workers=None):
         """
         Random floats in [0, 1).
 
@@ -3445,53 +3945,72 @@ cdef class KissGenerator:
         ----------
         size : int or tuple, optional
             Output shape
-        dtype : dtype, default=np.float64
+        dtype : {np.float64, np.float32}, default=np.float64
             Output data type
         out : ndarray, optional
-            Output array
+            C-contiguous array of ``dtype`` to fill in place; no
+            intermediate array is allocated
+        workers : int, optional
+            If given, fill in parallel on up to ``workers`` threads
 
         Returns
         -------
         float or ndarray
             Random values
 
+        Notes
+        -----
+        With ``workers=None`` (default) values come from this generator's
+        stream in order.  Any integer ``workers`` switches to a block layout:
+        block ``j`` of 65536 elements is drawn from
+        ``bit_generator.jumped(j + 1)`` and the bit generator then moves past
+        all blocks.  The output depends only on the state and ``size``, never
+        on ``workers``, so ``workers=1`` reproduces ``workers=8`` exactly.
+
         Examples
         --------
         >>> gen = KissGenerator(42)
         >>> gen.random(5)
         array([...])
+        >>> buf = np.empty(1_000_000)
+        >>> _ = gen.random(out=buf, workers=4)
         """
-        # ANNOY-RNG-001 (guide 6.15): canonical [0, 1) conversion via the top
-        # mantissa bits and an exact power-of-two scale (never returns 1.0).
-        if size is None:
-            return (self.bit_generator.random_raw() >> KISS_F64_SHIFT) * KISS_F64_SCALE
+        cdef KissBitGenerator bg = self._bit_generator
 
-        raw = self.bit_generator.random_raw(size)
         dt = np.dtype(dtype)
-        if dt == np.float32:
-            # top 24 bits (float32 mantissa) * 2**-24
-            unit = (raw >> np.uint64(40)).astype(np.float32) * np.float32(2.0 ** -24)
-        else:
-            unit = (raw >> np.uint64(KISS_F64_SHIFT)).astype(np.float64) * KISS_F64_SCALE
-            if dt != np.float64:
-                unit = unit.astype(dt)
+        if dt != np.float32 and dt != np.float64:
+            raise TypeError(f"Unsupported dtype {dt}; use float32 or float64")
 
-        if out is None:
-            result = unit
+        # ANNOY-RNG-001 (guide 6.15): canonical [0, 1) conversion via the top
+        # mantissa bits and an exact power-of-two scale (never returns 1.0).
+        if size is None and out is None:
+            with bg.lock:
+                return _kiss64_double(bg._rng)
+
+        result, flat = _prepare_out(size, dt, out)
+        if workers is None:
+            with bg.lock:
+                _fill_random(bg, flat)
         else:
-            out[...] = unit
-            result = out
-
+            _fill_parallel(bg, flat, _fill_random, workers)
         return result
 
-    def shuffle(self, x):
+    def shuffle(self, x, axis=0):
         """
         Shuffle array in-place (Fisher-Yates algorithm).
 
         Parameters
         ----------
-        x : ndarray
+        x : ndarray or mutable sequence
             Array to shuffle
+        axis : int, default=0
+            Axis along which ``x`` is shuffled (ndarray only)
+
+        Notes
+        -----
+        The permutation is drawn by a nogil Fisher-Yates over an index
+        array with unbiased bounded integers, then applied with one
+        gather, so multi-dimensional arrays move whole sub-arrays.
 
         Examples
         --------
@@ -3500,12 +4019,22 @@ cdef class KissGenerator:
         >>> gen.shuffle(arr)
         >>> print(arr)  # shuffled
         """
-        n = len(x)
-        with self.lock:
-            for i in range(n - 1, 0, -1):
-                raw = self.bit_generator.random_raw()
-                j = (raw % (i + 1))
-                x[i], x[j] = x[j], x[i]
+        cdef KissBitGenerator bg = self._bit_generator
+
+        if isinstance(x, np.ndarray):
+            idx = np.arange(x.shape[axis], dtype=np.int64)
+            with bg.lock:
+                _fill_permutation(bg, idx)
+            x[...] = np.take(x, idx, axis=axis)
+            return
+
+        # Mutable sequences (e.g. lists): permute a snapshot and write back.
+        items = list(x)
+        idx = np.arange(len(items), dtype=np.int64)
+        with bg.lock:
+            _fill_permutation(bg, idx)
+        for i, j in enumerate(idx.tolist()):
+            x[i] = items[j]
 
     def uniform(self, low=0.0, high=1.0, size=None):
         """
@@ -0,0 +1,167 @@
+# scikitplot/random/_kiss/tests/test_kiss_native_samplers.py
+#
+# flake8: noqa: D213
+#
+# Authors: The scikit-plots developers
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Tests for jump-ahead streams and the native fill-into-buffer samplers.
+
+`KissBitGenerator.advance(k)` must land exactly where `k` raw draws would;
+`jumped()` must hand out distinct, reproducible streams; and the `out=` /
+`workers=` paths of `KissGenerator` must be bounded, unbiased where it is cheap
+to check, and independent of the worker count.
+"""
+import numpy as np
+import pytest
+
+from scikitplot.random._kiss import kiss_random as K
+
+
+# ===========================================================================
+# Jump-ahead
+# ===========================================================================
+
+@pytest.mark.parametrize("delta", [0, 1, 2, 7, 100, 1000, 4097])
+def test_advance_matches_sequential_draws(delta):
+    stepped, jumped = K.KissBitGenerator(12345), K.KissBitGenerator(12345)
+    stepped.random_raw(3)
+    jumped.random_raw(3)
+    if delta:
+        stepped.random_raw(delta)
+    jumped.advance(delta)
+    np.testing.assert_array_equal(stepped.random_raw(16), jumped.random_raw(16))
+
+
+def test_advance_composes():
+    a, b = K.KissBitGenerator(7), K.KissBitGenerator(7)
+    a.advance(2**70).advance(2**70 + 5)
+    b.advance(2**71 + 5)
+    assert a.get_state()["rng_state"] == b.get_state()["rng_state"]
+
+
+def test_advance_rejects_negative():
+    with pytest.raises(ValueError, match="delta"):
+        K.KissBitGenerator(1).advance(-1)
+
+
+def test_jumped_leaves_parent_and_is_reproducible():
+    bg = K.KissBitGenerator(99)
+    before = bg.get_state()["rng_state"]
+    j1, j2 = bg.jumped(1), bg.jumped(2)
+    assert bg.get_state()["rng_state"] == before
+    assert bg.jumped(1).get_state()["rng_state"] == j1.get_state()["rng_state"]
+    assert not np.array_equal(j1.random_raw(8), j2.random_raw(8))
+    assert bg.jumped(2).get_state()["rng_state"] == bg.jumped(1).jumped(1).get_state()["rng_state"]
+
+
+# ===========================================================================
+# Native samplers
+# ===========================================================================
+
+def test_random_out_fills_in_place_and_matches_allocating_path():
+    buf = np.empty((4, 5))
+    res = K.KissGenerator(3).random(out=buf)
+    assert res is buf
+    np.testing.assert_array_equal(buf, K.KissGenerator(3).random((4, 5)))
+    assert ((buf >= 0.0) & (buf < 1.0)).all()
+
+
+def test_random_float32_and_bad_out():
+    gen = K.KissGenerator(3)
+    assert gen.random(10, dtype=np.float32).dtype == np.float32
+    with pytest.raises(TypeError):
+        gen.random(out=np.empty(4, dtype=np.float32))  # dtype mismatch
+    with pytest.raises(ValueError):
+        gen.random(out=np.empty((4, 4))[:, 0])  # not C-contiguous
+    with pytest.raises(ValueError):
+        gen.random(size=3, out=np.empty(4))
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.uint8, np.int32, np.uint64, np.int64])
+def test_integers_bounds(dtype):
+    info = np.iinfo(dtype)
+    low, high = int(info.min), int(info.max)
+    x = K.KissGenerator(5).integers(low, high, size=2000, dtype=dtype, endpoint=True)
+    assert x.dtype == dtype
+    assert x.min() >= low and x.max() <= high
+
+
+def test_integers_lemire_is_unbiased_for_awkward_range():
+    # 3 * 2**62 does not divide 2**64; modulo reduction would skew the lower
+    # third of the range to twice the probability of the rest.
+    span = 3 * 2**62
+    x = K.KissGenerator(11).integers(0, span, size=60_000, dtype=np.uint64)
+    frac_low = np.mean(x < span // 3)
+    assert abs(frac_low - 1 / 3) < 0.02
+
+
+def test_integers_rejects_out_of_dtype_range():
+    with pytest.raises(ValueError, match="out of bounds"):
+        K.KissGenerator(0).integers(0, 300, size=3, dtype=np.uint8)
+
+
+def test_normal_moments_and_out():
+    gen = K.KissGenerator(2024)
+    buf = np.empty(200_001)  # odd length exercises the discarded spare
+    gen.normal(3.0, 2.0, out=buf)
+    assert abs(buf.mean() - 3.0) < 0.02
+    assert abs(buf.std() - 2.0) < 0.02
+    z = gen.standard_normal(50_000, dtype=np.float32)
+    assert z.dtype == np.float32
+    assert abs(float(np.mean(z**4)) - 3.0) < 0.15  # kurtosis of N(0, 1)
+
+
+def test_normal_broadcasts_array_parameters():
+    out = K.KissGenerator(1).normal([0.0, 100.0], 1.0)
+    assert out.shape == (2,) and out[1] > 50
+
+
+def test_shuffle_axis_and_permutation():
+    gen = K.KissGenerator(8)
+    arr = np.arange(20).reshape(4, 5)
+    gen.shuffle(arr, axis=1)
+    assert sorted(arr[0].tolist()) == list(range(5))
+    assert (arr - arr[:, :1] == arr[0] - arr[0, 0]).all()  # columns moved together
+    perm = gen.permutation(np.arange(12).reshape(3, 4), axis=1)
+    assert sorted(perm[0].tolist()) == [0, 1, 2, 3]
+    lst = list("abcdef")
+    gen.shuffle(lst)
+    assert sorted(lst) == list("abcdef")
+
+
+def test_choice_without_replacement_is_distinct():
+    sample = K.KissGenerator(4).choice(1000, size=50, replace=False)
+    assert len(set(sample.tolist())) == 50
+
+
+# ===========================================================================
+# Parallel fills
+# ===========================================================================
+
+@pytest.mark.parametrize(
+    "draw",
+    [
+        lambda g, w: g.random(200_000, workers=w),
+        lambda g, w: g.standard_normal(150_001, workers=w),
+        lambda g, w: g.integers(-5, 5, size=140_000, dtype=np.int16, workers=w),
+    ],
+)
+def test_parallel_fill_is_independent_of_worker_count(draw):
+    ref = draw(K.KissGenerator(77), 1)
+    np.testing.assert_array_equal(ref, draw(K.KissGenerator(77), 4))
+
+
+def test_parallel_blocks_come_from_jumped_streams():
+    n = 70_000  # two blocks
+    out = K.KissGenerator(5).random(n, workers=2)
+    bg = K.KissBitGenerator(5)
+    np.testing.assert_array_equal(out[:65536], K.KissGenerator(bg.jumped(1)).random(65536))
+    np.testing.assert_array_equal(out[65536:], K.KissGenerator(bg.jumped(2)).random(n - 65536))
+
+
+def test_parallel_calls_advance_parent_past_streams():
+    gen = K.KissGenerator(5)
+    first = gen.random(1000, workers=2)
+    second = gen.random(1000, workers=2)
+    assert not np.array_equal(first, second)
@@ -10,13 +10,21 @@
 """
 Provides utilities for saving result images.
 
-Such as plots and includes decorators for automatically saving plots.
+Such as plots and includes decorators for automatically saving plots, and a
+background pool (:class:`FigureSaver`) that rasterises them off the caller.
 """
 
 from __future__ import annotations
 
+import atexit as _atexit
+import concurrent.futures as _futures
 import contextlib as _contextlib
 import functools as _functools
+import io as _io
+import multiprocessing as _multiprocessing
+import os as _os
+import pickle as _pickle
+import threading as _threading
 
 # import inspect
 # import tempfile
@@ -28,6 +36,7 @@ from typing import TYPE_CHECKING
 import matplotlib as _mpl  # noqa: ICN001
 import matplotlib.pyplot as _plt  # noqa: ICN001
 import numpy as _np  # noqa: ICN001
+from matplotlib.figure import Figure as _Figure
 
 from .. import logger as _logger
 from .._docstrings import _docstring
@@ -191,10 +200,407 @@ class SafeTightLayout:
                 _logger.warning("tight_layout() failed: %s", e)
 
 
+######################################################################
+## background figure saving
+######################################################################
+
+_DEFAULT_SAVEFIG_KWARGS = {"dpi": 150, "bbox_inches": "tight", "pad_inches": 0}
+
+
+class _DetachedFigurePickler(_pickle.Pickler):
+    """
+    Pickler that snapshots figures without their pyplot registration.
+
+    A pyplot-managed figure normally pickles with ``_restore_to_pylab=True``,
+    so unpickling it would create a new pyplot window/manager in the worker.
+    Clearing the flag makes the copy a plain :class:`~matplotlib.figure.Figure`
+    that can be rendered from any thread or process.
+    """
+
+    def reducer_override(self, obj):  # noqa: D102
+        if not isinstance(obj, _Figure):
+            return NotImplemented
+        reduced = obj.__reduce_ex__(_pickle.HIGHEST_PROTOCOL)
+        state = reduced[2]
+        if isinstance(state, dict) and state.get("_restore_to_pylab"):
+            state = {**state, "_restore_to_pylab": False}
+            reduced = (*reduced[:2], state, *reduced[3:])
+        return reduced
+
+
+def _dump_figure(fig) -> bytes:
+    """Serialise ``fig`` into an independent, pyplot-free snapshot."""
+    buffer = _io.BytesIO()
+    _DetachedFigurePickler(buffer, protocol=_pickle.HIGHEST_PROTOCOL).dump(fig)
+    return buffer.getvalue()
+
+
+def _init_agg_worker():
+    """Process-pool initializer: render with the non-interactive Agg backend."""
+    _mpl.use("Agg", force=True)
+
+
+def _render_batch(jobs):
+    """
+    Rasterise a batch of pickled figures.
+
+    Parameters
+    ----------
+    jobs : list of tuple
+        ``(payload, paths, savefig_kwargs)`` per figure; each figure is
+        unpickled once and written to all of its ``paths``.
+
+    Returns
+    -------
+    list
+        Per job, either the list of written paths or the raised exception, so
+        one bad figure does not fail the rest of its batch.
+    """
+    results = []
+    for payload, paths, savefig_kwargs in jobs:
+        try:
+            fig = _pickle.loads(payload)  # noqa: S301
+            for path in paths:
+                fig.savefig(path, **savefig_kwargs)
+            results.append(list(paths))
+        except Exception as e:  # noqa: BLE001
+            results.append(e)
+    return results
+
+
+class FigureSaver:
+    """
+    Bounded background pool that rasterises and writes figures.
+
+    :meth:`submit` pickles a snapshot of the figure in the calling thread
+    (cheap compared with rendering) and returns immediately with a
+    :class:`concurrent.futures.Future`; a worker unpickles the snapshot and
+    calls :meth:`~matplotlib.figure.Figure.savefig`. The caller may keep
+    drawing on, or close, the original figure.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of workers. Defaults to ``min(4, os.cpu_count())``.
+    kind : {'thread', 'process'}, default='thread'
+        ``'thread'`` renders in worker threads of the calling process.
+        ``'process'`` renders in worker processes (spawned, Agg backend) and
+        keeps rasterisation off the caller's GIL; like any spawn-based pool it
+        re-imports ``__main__`` in each worker, so scripts using it need an
+        ``if __name__ == "__main__":`` guard.
+    batch_size : int, default=1
+        Figures per worker task. Jobs are queued per output format
+        (e.g. all PNGs together) and dispatched once ``batch_size`` of them
+        are waiting, or on :meth:`flush`.
+    max_pending : int, optional
+        Maximum number of submitted but unfinished figures; :meth:`submit`
+        blocks beyond it, which bounds the memory held by snapshots.
+        Defaults to ``2 * max_workers * batch_size``.
+    **savefig_kwargs : dict
+        Default keyword arguments for ``savefig``
+        (``dpi=150, bbox_inches='tight', pad_inches=0`` unless overridden).
+
+    See Also
+    --------
+    save_plot_decorator : Accepts ``save_fig_async=True`` or a ``FigureSaver``.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> from scikitplot.utils._matplotlib import FigureSaver
+    >>> with FigureSaver(kind="thread", batch_size=8) as saver:
+    ...     for i in range(3):
+    ...         fig, ax = plt.subplots()
+    ...         ax.plot([0, i])
+    ...         fut = saver.submit(fig, f"plot_{i}.png", formats=("png", "pdf"))
+    ...         plt.close(fig)
+    ...     saver.wait_all()
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        kind: str = "thread",
+        batch_size: int = 1,
+        max_pending: int | None = None,
+        **savefig_kwargs,
+    ):
+        if kind not in ("process", "thread"):
+            raise ValueError(f"kind must be 'process' or 'thread', got {kind!r}.")
+        if max_workers is None:
+            max_workers = min(4, _os.cpu_count() or 1)
+        if max_workers < 1 or batch_size < 1:
+            raise ValueError("max_workers and batch_size must be >= 1.")
+        if max_pending is None:
+            max_pending = 2 * max_workers * batch_size
+        if max_pending < batch_size:
+            raise ValueError(
+                f"max_pending ({max_pending}) must be >= batch_size ({batch_size})."
+            )
+        self.max_workers = max_workers
+        self.kind = kind
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.savefig_kwargs = {**_DEFAULT_SAVEFIG_KWARGS, **savefig_kwargs}
+
+        self._executor = None
+        self._closed = False
+        self._lock = _threading.RLock()
+        self._slots = _threading.BoundedSemaphore(max_pending)
+        self._batches = {}  # format key -> list of (job, future)
+        self._futures = {}  # unfinished futures (dict as an ordered set)
+
+    # -- pool lifecycle --
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.kind == "thread":
+                self._executor = _futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="scikitplot-savefig",
+                )
+            else:
+                self._executor = _futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=_multiprocessing.get_context("spawn"),
+                    initializer=_init_agg_worker,
+                )
+        return self._executor
+
+    def __enter__(self):
+        """__enter__."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Wait for every pending figure, then shut the pool down."""
+        try:
+            if exc_type is None:
+                self.wait_all()
+        finally:
+            self.shutdown(wait=True)
+
+    # -- submission --
+
+    @staticmethod
+    def _target_paths(path, formats):
+        path = _os.fspath(path)
+        if not formats:
+            return [path]
+        root = _os.path.splitext(path)[0]
+        return [f"{root}.{fmt.lstrip('.').lower()}" for fmt in formats]
+
+    def submit(self, fig=None, path=None, *, formats=None, **savefig_kwargs):
+        """
+        Queue ``fig`` for saving to ``path`` and return at once.
+
+        Parameters
+        ----------
+        fig : matplotlib.figure.Figure, optional
+            Figure to save. Defaults to the current pyplot figure.
+        path : str or os.PathLike
+            Output path; its extension selects the format.
+        formats : sequence of str, optional
+            Write one file per format (e.g. ``("png", "svg", "pdf")``) from a
+            single snapshot, replacing the extension of ``path``.
+        **savefig_kwargs : dict
+            Per-figure overrides of the pool's ``savefig`` defaults.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the list of written paths, or raises the error the
+            worker hit while rendering.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool has been shut down.
+        pickle.PicklingError, TypeError, AttributeError
+            If the figure cannot be pickled; nothing is queued in that case.
+        """
+        if path is None:
+            raise ValueError("submit() requires an output path.")
+        if self._closed:
+            raise RuntimeError("cannot submit to a FigureSaver after shutdown().")
+        fig = fig if fig is not None else _plt.gcf()
+        paths = self._target_paths(path, formats)
+        job = (
+            _dump_figure(fig),
+            paths,
+            {**self.savefig_kwargs, **savefig_kwargs},
+        )
+
+        # Back-pressure: never hold more than ``max_pending`` snapshots.  A
+        # partially filled batch could own all slots, so flush before blocking.
+        if not self._slots.acquire(blocking=False):
+            self.flush()
+            self._slots.acquire()
+
+        future = _futures.Future()
+        future.add_done_callback(self._on_done)
+        key = tuple(_os.path.splitext(p)[1].lower() for p in paths)
+        with self._lock:
+            self._futures[future] = None
+            batch = self._batches.setdefault(key, [])
+            batch.append((job, future))
+            if len(batch) >= self.batch_size:
+                self._dispatch(self._batches.pop(key))
+        return future
+
+    def _on_done(self, future):
+        """Free the slot of a finished figure and stop tracking its future."""
+        with self._lock:
+            self._futures.pop(future, None)
+        self._slots.release()
+
+    def _dispatch(self, batch):
+        """Send one batch to the executor and fan its result out to futures."""
+        jobs = [job for job, _ in batch]
+        try:
+            task = self._get_executor().submit(_render_batch, jobs)
+        except Exception as e:  # noqa: BLE001
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        def _resolve(task):
+            try:
+                results = task.result()
+            except Exception as e:  # noqa: BLE001
+                # e.g. BrokenProcessPool: every figure of the batch failed
+                results = [e] * len(batch)
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+        task.add_done_callback(_resolve)
+
+    # -- synchronisation --
+
+    def flush(self):
+        """Dispatch every partially filled batch without waiting for it."""
+        with self._lock:
+            batches, self._batches = list(self._batches.values()), {}
+            for batch in batches:
+                self._dispatch(batch)
+
+    def wait_all(self, timeout: float | None = None) -> None:
+        """
+        Flush, then block until every unfinished figure has been written.
+
+        The pool only tracks figures that are still pending, so results and
+        errors of figures that finished earlier are available only from the
+        futures returned by :meth:`submit`.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait.
+
+        Raises
+        ------
+        TimeoutError
+            If figures are still pending after ``timeout`` seconds.
+        Exception
+            The first rendering error among the awaited figures, after all of
+            them have finished.
+        """
+        with self._lock:
+            pending = list(self._futures)
+        self.flush()
+        _, not_done = _futures.wait(pending, timeout=timeout)
+        if not_done:
+            raise TimeoutError(f"{len(not_done)} figure(s) still pending.")
+        for future in pending:
+            future.result()
+
+    def shutdown(self, wait: bool = True):
+        """Dispatch queued batches and release the workers."""
+        self.flush()
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+
+_default_figure_saver = None
+_default_figure_saver_lock = _threading.Lock()
+
+
+def get_figure_saver() -> FigureSaver:
+    """
+    Return the shared :class:`FigureSaver` used by ``save_fig_async=True``.
+
+    The pool is created on first use as a thread pool with default settings
+    and shut down (after writing every pending figure) at interpreter exit.
+    Use :func:`set_figure_saver` to configure it, e.g. to render in worker
+    processes with ``FigureSaver(kind="process")``.
+    """
+    global _default_figure_saver  # noqa: PLW0603
+    with _default_figure_saver_lock:
+        if _default_figure_saver is None:
+            _default_figure_saver = FigureSaver(kind="thread")
+            _atexit.register(_default_figure_saver.shutdown)
+        return _default_figure_saver
+
+
+def set_figure_saver(saver: FigureSaver | None) -> FigureSaver | None:
+    """
+    Replace the shared :class:`FigureSaver`; returns the previous one.
+
+    The previous saver is not shut down; call its
+    :meth:`~FigureSaver.wait_all` / :meth:`~FigureSaver.shutdown` as needed.
+    Pass ``None`` to fall back to a lazily created default pool.
+    """
+    global _default_figure_saver  # noqa: PLW0603
+    with _default_figure_saver_lock:
+        previous, _default_figure_saver = _default_figure_saver, saver
+    return previous
+
+
 ######################################################################
 ## save_plot_decorator
 ######################################################################
 
+
+def _save_figure(save_path, *, verbose=False):
+    """Save the current figure synchronously, reporting instead of raising."""
+    try:
+        _plt.savefig(save_path, **_DEFAULT_SAVEFIG_KWARGS)
+        if verbose:
+            print(f"[INFO] Plot saved to: {save_path}")  # noqa: T201
+    except Exception as e:  # noqa: BLE001
+        print(f"[ERROR] Failed to save plot: {e}")  # noqa: T201
+
+
+def _save_figure_async(save_path, saver, *, verbose=False):
+    """
+    Queue the current figure on ``saver`` (or the shared pool if True).
+
+    Figures that cannot be pickled are saved synchronously instead.
+    """
+    if not isinstance(saver, FigureSaver):
+        saver = get_figure_saver()
+    try:
+        future = saver.submit(_plt.gcf(), save_path)
+    except Exception as e:  # noqa: BLE001
+        _logger.warning("Background save unavailable (%s); saving inline.", e)
+        _save_figure(save_path, verbose=verbose)
+        return None
+
+    def _report(future):
+        e = future.exception()
+        if e is not None:
+            print(f"[ERROR] Failed to save plot: {e}")  # noqa: T201
+        elif verbose:
+            print(f"[INFO] Plot saved to: {save_path}")  # noqa: T201
+
+    future.add_done_callback(_report)
+    return future
+
+
 # The docstrings here must be generic enough to apply to all relevant methods.
 _docstring.interpd.register(
     _save_plot_decorator_kwargs_doc="""\
@@ -215,6 +621,15 @@ save_fig_filename : str, optional, default=''
     Used by :func:`~scikitplot.utils._matplotlib.save_plot_decorator`.
 
     .. versionadded:: 0.4.0
+save_fig_async : bool or FigureSaver, optional, default=False
+    Hand the figure to a background pool instead of rasterising it inside
+    the call: ``True`` uses the shared pool from
+    :func:`~scikitplot.utils._matplotlib.get_figure_saver`, a
+    :class:`~scikitplot.utils._matplotlib.FigureSaver` uses that pool.
+    Call its ``wait_all()`` to block until the files are written.
+    Used by :func:`~scikitplot.utils._matplotlib.save_plot_decorator`.
+
+    .. versionadded:: 0.5
 overwrite : bool, optional, default=True
     If False and a file exists, auto-increments the filename to avoid overwriting.
 
@@ -323,6 +738,7 @@ def save_plot_decorator(
                 "show_fig",
                 "save_fig",
                 "save_fig_filename",
+                "save_fig_async",
                 "verbose",
             }
             decorator_kwargs = {k: kwargs[k] for k in kwargs if k in decorator_keys}
@@ -364,16 +780,17 @@ def save_plot_decorator(
                     save_path = get_path(
                         **{**local_dkwargs, **kwargs},  # Update by inner func
                     )
-                    try:
-                        # with tempfile.TemporaryDirectory() as tmpdirname:
-                        # with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmpfile:  # tmpfile.name
-                        _plt.savefig(
-                            save_path, dpi=150, bbox_inches="tight", pad_inches=0
+                    save_fig_async = kwargs.get(
+                        "save_fig_async", dkwargs.get("save_fig_async", False)
+                    )
+                    if save_fig_async:
+                        _save_figure_async(
+                            save_path,
+                            save_fig_async,
+                            verbose=kwargs.get("verbose", False),
                         )
-                        if kwargs.get("verbose", False):
-                            print(f"[INFO] Plot saved to: {save_path}")  # noqa: T201
-                    except Exception as e:  # noqa: BLE001
-                        print(f"[ERROR] Failed to save plot: {e}")  # noqa: T201
+                    else:
+                        _save_figure(save_path, verbose=kwargs.get("verbose", False))
                 if show_fig:
                     # Manage the plot window
                     _plt.show()
@@ -19,11 +19,15 @@ save_plot_decorator  No-arg and parameterised usage, show_fig,
                      save_fig path, invalid verbose warning     → TestSavePlotDecorator
 stack                No figs raises, vertical/horizontal,
                      orient aliases, invalid orient raises      → TestStack
+FigureSaver          Thread/process pools, format batching,
+                     flush/wait_all, decorator save_fig_async   → TestFigureSaver
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import tempfile
 import unittest
 import unittest.mock as mock
 import warnings
@@ -43,9 +47,12 @@ import numpy as np
 # --------------------------------------------------------------------------
 
 from .._matplotlib import (  # noqa: E402
+    FigureSaver,
     SafeTightLayout,
+    get_figure_saver,
     safe_tight_layout,
     save_plot_decorator,
+    set_figure_saver,
     stack,
 )
 
@@ -446,3 +453,145 @@ class TestStack(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
+
+
+# ===========================================================================
+# FigureSaver
+# ===========================================================================
+
+class TestFigureSaver(unittest.TestCase):
+    """FigureSaver must write figure snapshots in the background."""
+
+    def setUp(self):
+        _close_all()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+
+    def tearDown(self):
+        _close_all()
+        self._tmp.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmp, name)
+
+    def _make_fig(self, y=(3, 4)):
+        fig, ax = plt.subplots()
+        ax.plot([1, 2], list(y))
+        return fig
+
+    def test_submit_returns_future_with_paths(self):
+        with FigureSaver(kind="thread") as saver:
+            future = saver.submit(self._make_fig(), self._path("a.png"))
+            self.assertEqual(future.result(timeout=30), [self._path("a.png")])
+        self.assertGreater(os.path.getsize(self._path("a.png")), 0)
+
+    def test_multiple_formats_from_one_snapshot(self):
+        with FigureSaver(kind="thread") as saver:
+            future = saver.submit(
+                self._make_fig(), self._path("b.png"), formats=("png", "svg", "pdf")
+            )
+            saver.wait_all()
+        paths = future.result()
+        self.assertEqual(
+            [os.path.basename(p) for p in paths], ["b.png", "b.svg", "b.pdf"]
+        )
+        for p in paths:
+            self.assertTrue(os.path.exists(p))
+
+    def test_batches_wait_for_flush(self):
+        saver = FigureSaver(kind="thread", batch_size=3)
+        try:
+            futures = [
+                saver.submit(self._make_fig(), self._path(f"c{i}.png"))
+                for i in range(2)
+            ]
+            self.assertFalse(any(f.done() for f in futures))  # batch not full yet
+            saver.flush()
+            for f in futures:
+                f.result(timeout=30)
+        finally:
+            saver.shutdown()
+
+    def test_snapshot_is_independent_of_later_changes(self):
+        fig = self._make_fig()
+        n_figs = len(plt.get_fignums())
+        with FigureSaver(kind="thread", batch_size=2) as saver:
+            saver.submit(fig, self._path("d.png"))
+            fig.axes[0].remove()
+            plt.close(fig)
+        self.assertTrue(os.path.exists(self._path("d.png")))
+        # the worker copy is never registered with pyplot
+        self.assertLessEqual(len(plt.get_fignums()), n_figs)
+
+    def test_wait_all_raises_render_error(self):
+        with FigureSaver(kind="thread", batch_size=2) as saver:
+            # the half-filled batch stays pending until wait_all() flushes it
+            saver.submit(self._make_fig(), self._path("e.unknownfmt"))
+            with self.assertRaises(ValueError):
+                saver.wait_all()
+
+    def test_finished_futures_are_released(self):
+        with FigureSaver(kind="thread") as saver:
+            futures = [
+                saver.submit(self._make_fig(), self._path(f"i{i}.png"))
+                for i in range(3)
+            ]
+            saver.wait_all()
+            for f in futures:
+                f.result(timeout=30)
+            self.assertEqual(len(saver._futures), 0)
+
+    def test_submit_after_shutdown_raises(self):
+        saver = FigureSaver(kind="thread")
+        saver.shutdown()
+        with self.assertRaises(RuntimeError):
+            saver.submit(self._make_fig(), self._path("f.png"))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            FigureSaver(kind="gpu")
+        with self.assertRaises(ValueError):
+            FigureSaver(batch_size=4, max_pending=2)
+
+    def test_process_pool(self):
+        with FigureSaver(max_workers=1, kind="process", batch_size=2) as saver:
+            futures = [
+                saver.submit(self._make_fig((i, i + 1)), self._path(f"g{i}.png"))
+                for i in range(3)
+            ]
+            saver.wait_all(timeout=120)
+        paths = [p for f in futures for p in f.result()]
+        self.assertEqual(len(paths), 3)
+        for p in paths:
+            self.assertGreater(os.path.getsize(p), 0)
+
+    def test_decorator_save_fig_async(self):
+        @save_plot_decorator
+        def plot(save_fig, show_fig, save_fig_filename, save_fig_async):
+            fig, ax = plt.subplots()
+            ax.plot([1, 2], [3, 4])
+            return ax
+
+        target = self._path("h.png")
+        with FigureSaver(kind="thread") as saver:
+            with mock.patch("matplotlib.pyplot.savefig") as mock_save:
+                with mock.patch.object(saver, "submit", wraps=saver.submit) as submit:
+                    plot(
+                        save_fig=True,
+                        show_fig=False,
+                        save_fig_filename=target,
+                        save_fig_async=saver,
+                    )
+            mock_save.assert_not_called()  # rendering happened off the call path
+            saver.wait_all()
+        submit.assert_called_once()
+        self.assertTrue(os.path.exists(submit.call_args.args[1]))
+
+    def test_shared_saver_uses_threads(self):
+        previous = set_figure_saver(None)
+        saver = get_figure_saver()
+        try:
+            self.assertEqual(saver.kind, "thread")
+        finally:
+            set_figure_saver(previous)
+            saver.shutdown()